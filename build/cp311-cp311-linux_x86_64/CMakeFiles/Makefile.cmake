@@ -0,0 +1,111 @@
+# CMAKE generated file: DO NOT EDIT!
+# Generated by "Unix Makefiles" Generator, CMake Version 3.25
+
+# The generator used is:
+set(CMAKE_DEPENDS_GENERATOR "Unix Makefiles")
+
+# The top level Makefile was generated from the following files:
+set(CMAKE_MAKEFILE_DEPENDS
+  "CMakeCache.txt"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/scikit_build_core/resources/find_python/FindPackageHandleStandardArgs.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/scikit_build_core/resources/find_python/FindPackageMessage.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/scikit_build_core/resources/find_python/FindPython.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/scikit_build_core/resources/find_python/FindPython/Support.cmake"
+  "/root/package/CMakeLists.txt"
+  "CMakeFiles/3.25.1/CMakeCCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeFortranCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeSystem.cmake"
+  "/root/package/src/CMakeLists.txt"
+  "/root/package/src/sisl/CMakeLists.txt"
+  "/root/package/src/sisl/_core/CMakeLists.txt"
+  "/root/package/src/sisl/geom/CMakeLists.txt"
+  "/root/package/src/sisl/geom/_neighbors/CMakeLists.txt"
+  "/root/package/src/sisl/io/CMakeLists.txt"
+  "/root/package/src/sisl/io/siesta/CMakeLists.txt"
+  "/root/package/src/sisl/physics/CMakeLists.txt"
+  "/root/package/tools/_debug_info.py.conf"
+  "/usr/share/cmake-3.25/Modules/CMakeCInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeCommonLanguageInclude.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeFortranInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeGenericSystem.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeInitializeConfigs.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeLanguageInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeParseImplicitLinkInfo.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakePrintHelpers.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInitialize.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/CMakeCommonCompilerMacros.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-C.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-Fortran.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/FindOpenMP.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPackageHandleStandardArgs.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPackageMessage.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-C.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-Fortran.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/UnixPaths.cmake"
+  )
+
+# The corresponding makefile is:
+set(CMAKE_MAKEFILE_OUTPUTS
+  "Makefile"
+  "CMakeFiles/cmake.check_cache"
+  )
+
+# Byproducts of CMake generate step:
+set(CMAKE_MAKEFILE_PRODUCTS
+  "CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "/root/package/src/sisl/_debug_info.py"
+  "src/sisl/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/_core/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/io/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/io/siesta/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/physics/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/geom/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "src/sisl/geom/_neighbors/CMakeFiles/CMakeDirectoryInformation.cmake"
+  )
+
+# Dependency information for all targets:
+set(CMAKE_DEPEND_INFO_FILES
+  "CMakeFiles/f2py_fortranobject.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/gen_src_sisl__indices.c.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/_indices.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/gen_src_sisl__math_small.c.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/_math_small.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/gen_src_sisl__sparse_grid_ops.c.dir/DependInfo.cmake"
+  "src/sisl/CMakeFiles/_sparse_grid_ops.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/gen_src_sisl__core__lattice.c.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/_lattice.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/gen_src_sisl__core__dtypes.c.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/_dtypes.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/gen_src_sisl__core__sparse.c.dir/DependInfo.cmake"
+  "src/sisl/_core/CMakeFiles/_sparse.dir/DependInfo.cmake"
+  "src/sisl/io/CMakeFiles/gen_src_sisl_io__format.c.dir/DependInfo.cmake"
+  "src/sisl/io/CMakeFiles/_format.dir/DependInfo.cmake"
+  "src/sisl/io/siesta/CMakeFiles/gen_src_sisl_io_siesta__siesta_signature.pyf.dir/DependInfo.cmake"
+  "src/sisl/io/siesta/CMakeFiles/gen_src_sisl_io_siesta__siestamodule.c.dir/DependInfo.cmake"
+  "src/sisl/io/siesta/CMakeFiles/_siesta.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__bloch.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_bloch.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__phase.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_phase.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_utils.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_utils.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_k.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_k.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_dk.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_dk.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_ddk.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_ddk.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_phase.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_phase.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_phase_sc.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_phase_sc.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/gen_src_sisl_physics__matrix_phase3.c.dir/DependInfo.cmake"
+  "src/sisl/physics/CMakeFiles/_matrix_phase3.dir/DependInfo.cmake"
+  "src/sisl/geom/_neighbors/CMakeFiles/gen_src_sisl_geom__neighbors__operations.c.dir/DependInfo.cmake"
+  "src/sisl/geom/_neighbors/CMakeFiles/_operations.dir/DependInfo.cmake"
+  )
@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/f2py/src/fortranobject.c" "CMakeFiles/f2py_fortranobject.dir/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/f2py/src/fortranobject.c.o" "gcc" "CMakeFiles/f2py_fortranobject.dir/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/f2py/src/fortranobject.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/f2py_fortranobject.dir/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/f2py/src/fortranobject.c.o"
+  "CMakeFiles/f2py_fortranobject.dir/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/f2py/src/fortranobject.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/f2py_fortranobject.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
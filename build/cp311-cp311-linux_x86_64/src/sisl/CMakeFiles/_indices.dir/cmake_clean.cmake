@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_indices.dir/_indices.c.o"
+  "CMakeFiles/_indices.dir/_indices.c.o.d"
+  "_indices.cpython-311-x86_64-linux-gnu.so"
+  "_indices.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_indices.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
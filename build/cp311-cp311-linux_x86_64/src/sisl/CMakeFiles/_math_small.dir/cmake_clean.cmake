@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_math_small.dir/_math_small.c.o"
+  "CMakeFiles/_math_small.dir/_math_small.c.o.d"
+  "_math_small.cpython-311-x86_64-linux-gnu.so"
+  "_math_small.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_math_small.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
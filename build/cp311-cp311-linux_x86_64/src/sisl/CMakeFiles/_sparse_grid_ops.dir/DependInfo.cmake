@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/_sparse_grid_ops.c" "src/sisl/CMakeFiles/_sparse_grid_ops.dir/_sparse_grid_ops.c.o" "gcc" "src/sisl/CMakeFiles/_sparse_grid_ops.dir/_sparse_grid_ops.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
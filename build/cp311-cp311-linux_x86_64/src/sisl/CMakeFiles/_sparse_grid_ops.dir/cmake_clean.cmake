@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_sparse_grid_ops.dir/_sparse_grid_ops.c.o"
+  "CMakeFiles/_sparse_grid_ops.dir/_sparse_grid_ops.c.o.d"
+  "_sparse_grid_ops.cpython-311-x86_64-linux-gnu.so"
+  "_sparse_grid_ops.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_sparse_grid_ops.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
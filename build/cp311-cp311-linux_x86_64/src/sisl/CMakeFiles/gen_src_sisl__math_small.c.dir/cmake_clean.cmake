@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl__math_small.c"
+  "_math_small.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl__math_small.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_dtypes.dir/_dtypes.c.o"
+  "CMakeFiles/_dtypes.dir/_dtypes.c.o.d"
+  "_dtypes.cpython-311-x86_64-linux-gnu.so"
+  "_dtypes.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_dtypes.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_lattice.dir/_lattice.c.o"
+  "CMakeFiles/_lattice.dir/_lattice.c.o.d"
+  "_lattice.cpython-311-x86_64-linux-gnu.so"
+  "_lattice.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_lattice.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_sparse.dir/_sparse.c.o"
+  "CMakeFiles/_sparse.dir/_sparse.c.o.d"
+  "_sparse.cpython-311-x86_64-linux-gnu.so"
+  "_sparse.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_sparse.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl__core__dtypes.c"
+  "_dtypes.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl__core__dtypes.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl__core__lattice.c"
+  "_lattice.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl__core__lattice.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
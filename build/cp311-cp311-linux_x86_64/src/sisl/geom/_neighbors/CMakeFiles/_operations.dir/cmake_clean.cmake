@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_operations.dir/_operations.c.o"
+  "CMakeFiles/_operations.dir/_operations.c.o.d"
+  "_operations.cpython-311-x86_64-linux-gnu.so"
+  "_operations.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_operations.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
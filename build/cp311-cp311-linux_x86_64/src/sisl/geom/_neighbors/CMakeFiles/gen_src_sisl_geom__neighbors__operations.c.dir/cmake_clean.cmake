@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl_geom__neighbors__operations.c"
+  "_operations.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl_geom__neighbors__operations.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
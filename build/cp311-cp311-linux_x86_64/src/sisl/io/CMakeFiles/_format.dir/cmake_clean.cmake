@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_format.dir/_format.c.o"
+  "CMakeFiles/_format.dir/_format.c.o.d"
+  "_format.cpython-311-x86_64-linux-gnu.so"
+  "_format.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_format.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
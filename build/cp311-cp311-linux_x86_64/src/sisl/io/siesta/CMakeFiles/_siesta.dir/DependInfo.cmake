@@ -0,0 +1,59 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/_siesta-f2pywrappers2.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_siesta-f2pywrappers2.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/dm_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/dm_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/dm_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/dm_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/gf_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/gf_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/gf_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/gf_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/grid_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/grid_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/grid_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/grid_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/hsx_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/hsx_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/hsx_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/hsx_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/io_m.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/io_m.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/precision.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/precision.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/siesta_sc_off.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/siesta_sc_off.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/sparse_io.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/sparse_io.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/tsde_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/tsde_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/tsde_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/tsde_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/tshs_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/tshs_read.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/tshs_write.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/tshs_write.f90.o"
+  "/root/package/src/sisl/io/siesta/_src/wfsx_read.f90" "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/CMakeFiles/_siesta.dir/_src/wfsx_read.f90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "CYTHON_NO_PYINIT_EXPORT=1"
+  "NPY_NO_DEPRECATED_API=NPY_1_20_API_VERSION"
+  "_siesta_EXPORTS"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "/root/package/src/sisl/_core"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/../../f2py/src"
+  "/root/.pyenv/versions/3.11.7/include/python3.11"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/build/cp311-cp311-linux_x86_64/src/sisl/io/siesta/_siestamodule.c" "src/sisl/io/siesta/CMakeFiles/_siesta.dir/_siestamodule.c.o" "gcc" "src/sisl/io/siesta/CMakeFiles/_siesta.dir/_siestamodule.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
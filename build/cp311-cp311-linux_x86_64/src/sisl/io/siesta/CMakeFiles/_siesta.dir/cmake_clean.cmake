@@ -0,0 +1,29 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_siesta.dir/_siesta-f2pywrappers2.f90.o"
+  "CMakeFiles/_siesta.dir/_siestamodule.c.o"
+  "CMakeFiles/_siesta.dir/_siestamodule.c.o.d"
+  "CMakeFiles/_siesta.dir/_src/dm_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/dm_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/gf_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/gf_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/grid_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/grid_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/hsx_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/hsx_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/io_m.f90.o"
+  "CMakeFiles/_siesta.dir/_src/precision.f90.o"
+  "CMakeFiles/_siesta.dir/_src/siesta_sc_off.f90.o"
+  "CMakeFiles/_siesta.dir/_src/sparse_io.f90.o"
+  "CMakeFiles/_siesta.dir/_src/tsde_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/tsde_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/tshs_read.f90.o"
+  "CMakeFiles/_siesta.dir/_src/tshs_write.f90.o"
+  "CMakeFiles/_siesta.dir/_src/wfsx_read.f90.o"
+  "_siesta.cpython-311-x86_64-linux-gnu.so"
+  "_siesta.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C Fortran)
+  include(CMakeFiles/_siesta.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
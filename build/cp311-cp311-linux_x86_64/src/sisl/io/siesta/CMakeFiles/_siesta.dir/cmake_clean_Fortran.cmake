@@ -0,0 +1,14 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "io_m.mod"
+  "IO_M.mod"
+  "CMakeFiles/_siesta.dir/io_m.mod.stamp"
+
+  "precision.mod"
+  "PRECISION.mod"
+  "CMakeFiles/_siesta.dir/precision.mod.stamp"
+
+  "sparse_io_m.mod"
+  "SPARSE_IO_M.mod"
+  "CMakeFiles/_siesta.dir/sparse_io_m.mod.stamp"
+  )
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl_io_siesta__siesta_signature.pyf"
+  "_siesta_signature.pyf"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl_io_siesta__siesta_signature.pyf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
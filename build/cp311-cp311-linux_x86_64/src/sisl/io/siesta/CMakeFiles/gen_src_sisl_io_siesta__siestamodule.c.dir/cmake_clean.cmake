@@ -0,0 +1,10 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl_io_siesta__siestamodule.c"
+  "_siesta-f2pywrappers2.f90"
+  "_siestamodule.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl_io_siesta__siestamodule.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,28 @@
+!     -*- f90 -*-
+!     This file is autogenerated with f2py (version:2.4.6)
+!     It contains Fortran 90 wrappers to fortran functions.
+
+      
+      subroutine f2pyinitprecision(f2pysetupfunc)
+      use precision, only : r4
+      use precision, only : r8
+      use precision, only : i4
+      use precision, only : i8
+      external f2pysetupfunc
+      call f2pysetupfunc(r4,r8,i4,i8)
+      end subroutine f2pyinitprecision
+
+      
+      subroutine f2pyinitio_m(f2pysetupfunc)
+      use io_m, only : open_file
+      use io_m, only : close_file
+      use io_m, only : open_file_read
+      use io_m, only : open_file_write
+      use io_m, only : rewind_file
+      use io_m, only : iostat_query
+      external f2pysetupfunc
+      call f2pysetupfunc(open_file,close_file,open_file_read,open_file_w&
+     &rite,rewind_file,iostat_query)
+      end subroutine f2pyinitio_m
+
+
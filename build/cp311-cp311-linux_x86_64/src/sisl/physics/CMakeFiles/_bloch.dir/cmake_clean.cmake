@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_bloch.dir/_bloch.c.o"
+  "CMakeFiles/_bloch.dir/_bloch.c.o.d"
+  "_bloch.cpython-311-x86_64-linux-gnu.so"
+  "_bloch.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_bloch.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_ddk.dir/_matrix_ddk.c.o"
+  "CMakeFiles/_matrix_ddk.dir/_matrix_ddk.c.o.d"
+  "_matrix_ddk.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_ddk.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_ddk.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
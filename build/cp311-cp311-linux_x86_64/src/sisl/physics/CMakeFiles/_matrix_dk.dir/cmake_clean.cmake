@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_dk.dir/_matrix_dk.c.o"
+  "CMakeFiles/_matrix_dk.dir/_matrix_dk.c.o.d"
+  "_matrix_dk.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_dk.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_dk.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
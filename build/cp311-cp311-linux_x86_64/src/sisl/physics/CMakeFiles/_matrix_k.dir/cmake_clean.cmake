@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_k.dir/_matrix_k.c.o"
+  "CMakeFiles/_matrix_k.dir/_matrix_k.c.o.d"
+  "_matrix_k.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_k.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_k.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
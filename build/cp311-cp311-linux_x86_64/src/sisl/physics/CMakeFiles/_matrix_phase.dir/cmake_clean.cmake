@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_phase.dir/_matrix_phase.c.o"
+  "CMakeFiles/_matrix_phase.dir/_matrix_phase.c.o.d"
+  "_matrix_phase.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_phase.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_phase.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
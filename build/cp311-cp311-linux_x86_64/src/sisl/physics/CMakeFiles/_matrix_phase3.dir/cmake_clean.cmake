@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_phase3.dir/_matrix_phase3.c.o"
+  "CMakeFiles/_matrix_phase3.dir/_matrix_phase3.c.o.d"
+  "_matrix_phase3.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_phase3.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_phase3.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_phase_sc.dir/_matrix_phase_sc.c.o"
+  "CMakeFiles/_matrix_phase_sc.dir/_matrix_phase_sc.c.o.d"
+  "_matrix_phase_sc.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_phase_sc.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_phase_sc.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
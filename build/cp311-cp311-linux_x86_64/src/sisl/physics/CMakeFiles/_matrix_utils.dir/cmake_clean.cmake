@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_matrix_utils.dir/_matrix_utils.c.o"
+  "CMakeFiles/_matrix_utils.dir/_matrix_utils.c.o.d"
+  "_matrix_utils.cpython-311-x86_64-linux-gnu.so"
+  "_matrix_utils.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_matrix_utils.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
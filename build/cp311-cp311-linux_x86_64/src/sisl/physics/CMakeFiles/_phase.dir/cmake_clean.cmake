@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/_phase.dir/_phase.c.o"
+  "CMakeFiles/_phase.dir/_phase.c.o.d"
+  "_phase.cpython-311-x86_64-linux-gnu.so"
+  "_phase.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/_phase.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl_physics__matrix_dk.c"
+  "_matrix_dk.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl_physics__matrix_dk.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
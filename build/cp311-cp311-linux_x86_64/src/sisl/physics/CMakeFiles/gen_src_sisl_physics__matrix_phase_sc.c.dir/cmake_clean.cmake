@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_src_sisl_physics__matrix_phase_sc.c"
+  "_matrix_phase_sc.c"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_src_sisl_physics__matrix_phase_sc.c.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -9,7 +9,7 @@ cimport numpy as cnp
 from numpy cimport dtype, ndarray
 
 from sisl._core._dtypes cimport inline_sum, int_sp_st, numerics_st, type2dtype
-from sisl._indices cimport in_1d
+from sisl._indices cimport _index_sorted, in_1d
 
 
 @cython.boundscheck(False)
@@ -200,6 +200,266 @@ def fold_csr_matrix_diag(int_sp_st[::1] ptr,
     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def fold_csr_index(const int_sp_st[::1] ptr,
+                   const int_sp_st[::1] ncol,
+                   const int_sp_st[::1] col,
+                   const int_sp_st[::1] fold_ptr,
+                   const int_sp_st[::1] fold_ncol,
+                   const int_sp_st[::1] fold_col,
+                   ):
+    """ Position of each sparse element in its row of the folded matrix (``per_row=1``)
+
+    For the sparse index ``ind`` in row ``r``, the folded element is located
+    at ``fold_ptr[r] + IDX[ind]``.
+    For folded matrices with ``per_row > 1`` the position in the
+    first row of the block is ``IDX[ind] * per_row`` (or ``IDX[ind]`` for
+    the diagonal folding).
+    """
+    # Number of rows
+    cdef int_sp_st nr = ncol.shape[0]
+
+    cdef object dtype = type2dtype[int_sp_st](1)
+    cdef ndarray[int_sp_st, mode='c'] IDX = np.zeros([col.shape[0]], dtype=dtype)
+    cdef int_sp_st[::1] idx = IDX
+
+    cdef int_sp_st r, ind, c
+    cdef const int_sp_st[::1] tmp
+
+    for r in range(nr):
+        tmp = fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]]
+        for ind in range(ptr[r], ptr[r] + ncol[r]):
+            c = col[ind] % nr
+            idx[ind] = _index_sorted(tmp, c)
+
+    return IDX
+
+
+def fold_csr_pattern(ptr, ncol, col, per_row=1, diag=False):
+    """ Folded sparse pattern and the position of each element in the folded rows
+
+    Parameters
+    ----------
+    ptr, ncol, col :
+       the sparse pattern of the (supercell) matrix
+    per_row :
+       number of folded rows (and columns) per row
+    diag :
+       whether only the diagonal of the ``per_row`` blocks are folded,
+       see `fold_csr_matrix_diag`
+
+    Returns
+    -------
+    FOLD_ptr, FOLD_ncol, FOLD_col :
+       the folded sparse pattern
+    IDX :
+       position of each sparse element in the folded row, see `fold_csr_index`
+    """
+    if per_row == 1:
+        fold = fold_csr_matrix(ptr, ncol, col)
+        return fold + (fold_csr_index(ptr, ncol, col, *fold),)
+
+    if diag:
+        fold = fold_csr_matrix_diag(ptr, ncol, col, per_row)
+    else:
+        fold = fold_csr_matrix(ptr, ncol, col, per_row)
+    return fold + (fold_csr_index(ptr, ncol, col, *fold_csr_matrix(ptr, ncol, col)),)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _merge_sort_cols(const int_sp_st[::1] cols, int_sp_st[::1] idx,
+                           int_sp_st[::1] tmp) noexcept nogil:
+    """ Stable (bottom-up merge) sort of `idx` according to ``cols[idx]`` """
+    cdef Py_ssize_t n = idx.shape[0]
+    cdef Py_ssize_t width, lo, mid, hi, i, j, k
+    cdef int_sp_st v
+    cdef int_sp_st[::1] src = idx
+    cdef int_sp_st[::1] dst = tmp[:n]
+
+    if n <= 32:
+        # insertion sort is faster for small rows
+        for i in range(1, n):
+            v = idx[i]
+            j = i - 1
+            while j >= 0 and cols[idx[j]] > cols[v]:
+                idx[j+1] = idx[j]
+                j = j - 1
+            idx[j+1] = v
+        return
+
+    width = 1
+    while width < n:
+        lo = 0
+        while lo < n:
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i = lo
+            j = mid
+            k = lo
+            while i < mid and j < hi:
+                # <= retains the order of equal columns
+                if cols[src[i]] <= cols[src[j]]:
+                    dst[k] = src[i]
+                    i = i + 1
+                else:
+                    dst[k] = src[j]
+                    j = j + 1
+                k = k + 1
+            while i < mid:
+                dst[k] = src[i]
+                i = i + 1
+                k = k + 1
+            while j < hi:
+                dst[k] = src[j]
+                j = j + 1
+                k = k + 1
+            lo = hi
+        src, dst = dst, src
+        width = width * 2
+
+    if &src[0] != &idx[0]:
+        idx[:] = src
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _coo_sort(const int_sp_st[::1] rows,
+              const int_sp_st[::1] cols,
+              int_sp_st[::1] ptr):
+    """ Stable sort of COO indices according to rows (counting sort) and then columns
+
+    `ptr` will be filled with the row pointers of the returned indices.
+    """
+    cdef Py_ssize_t nr = ptr.shape[0] - 1
+    cdef Py_ssize_t nnz = rows.shape[0]
+
+    cdef object dtype = type2dtype[int_sp_st](1)
+    cdef ndarray[int_sp_st, mode='c'] IDX = np.empty([nnz], dtype=dtype)
+    cdef int_sp_st[::1] idx = IDX
+    cdef int_sp_st[::1] pos = np.zeros([nr], dtype=dtype)
+    cdef int_sp_st[::1] tmp
+
+    cdef Py_ssize_t r, ind, nmax
+
+    with nogil:
+        # counting sort of the rows
+        for ind in range(nnz):
+            pos[rows[ind]] += 1
+        ptr[0] = 0
+        nmax = 0
+        for r in range(nr):
+            ptr[r+1] = ptr[r] + pos[r]
+            nmax = max(nmax, pos[r])
+            pos[r] = ptr[r]
+        for ind in range(nnz):
+            r = rows[ind]
+            idx[pos[r]] = ind
+            pos[r] += 1
+
+    tmp = np.empty([nmax], dtype=dtype)
+    with nogil:
+        for r in range(nr):
+            _merge_sort_cols(cols, idx[ptr[r]:ptr[r+1]], tmp)
+
+    return IDX
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _coo_compress(const int_sp_st[::1] ptr,
+                  const int_sp_st[::1] cols,
+                  const int_sp_st[::1] idx,
+                  const numerics_st[:, ::1] data,
+                  const bint sum_duplicates):
+    """ Compress sorted COO elements (see `_coo_sort`) into CSR arrays
+
+    Duplicate elements are either summed, or the last one is retained.
+    """
+    cdef Py_ssize_t nr = ptr.shape[0] - 1
+    cdef Py_ssize_t nnz = idx.shape[0]
+    cdef Py_ssize_t dim = data.shape[1]
+
+    cdef object dtype = type2dtype[int_sp_st](1)
+    cdef ndarray[int_sp_st, mode='c'] NCOL = np.empty([nr], dtype=dtype)
+    cdef ndarray[int_sp_st, mode='c'] COL = np.empty([nnz], dtype=dtype)
+    cdef ndarray[numerics_st, ndim=2, mode='c'] D = np.empty([nnz, dim], dtype=type2dtype[numerics_st](1))
+    cdef int_sp_st[::1] ncol = NCOL
+    cdef int_sp_st[::1] col = COL
+    cdef numerics_st[:, ::1] d = D
+
+    cdef Py_ssize_t r, ind, n, i, s, ix
+    cdef int_sp_st c
+
+    n = 0
+    with nogil:
+        for r in range(nr):
+            s = n
+            for ind in range(ptr[r], ptr[r+1]):
+                i = idx[ind]
+                c = cols[i]
+                if n > s and col[n-1] == c:
+                    # duplicate element
+                    if sum_duplicates:
+                        for ix in range(dim):
+                            d[n-1, ix] = d[n-1, ix] + data[i, ix]
+                    else:
+                        for ix in range(dim):
+                            d[n-1, ix] = data[i, ix]
+                else:
+                    col[n] = c
+                    for ix in range(dim):
+                        d[n, ix] = data[i, ix]
+                    n = n + 1
+            ncol[r] = n - s
+
+    if n < nnz:
+        return NCOL, COL[:n].copy(), D[:n].copy()
+    return NCOL, COL, D
+
+
+def sparse_coo(rows, cols, data, nr: int, duplicates: str = "sum"):
+    """ Convert COO elements into sorted CSR arrays, without any empty elements
+
+    Parameters
+    ----------
+    rows, cols :
+       row and column indices of the elements
+    data :
+       the values with shape ``(len(rows), dim)``
+    nr :
+       number of rows
+    duplicates : {"sum", "last"}
+       how duplicate elements are handled, either summed, or the last
+       one is retained
+
+    Returns
+    -------
+    ptr, ncol, col, D :
+       the CSR arrays
+    """
+    if duplicates not in ("sum", "last"):
+        raise ValueError(f"sparse_coo got unknown duplicates argument: {duplicates}")
+    rows = np.ascontiguousarray(rows, dtype=np.int32)
+    cols = np.ascontiguousarray(cols, dtype=np.int32)
+    data = np.ascontiguousarray(data)
+    if len(rows) > 0 and (rows.min() < 0 or rows.max() >= nr):
+        raise ValueError("sparse_coo got row indices out of bounds")
+
+    ptr = np.empty([nr + 1], dtype=np.int32)
+    idx = _coo_sort(rows, cols, ptr)
+    ncol, col, D = _coo_compress(ptr, cols, idx, data, duplicates == "sum")
+    ptr[0] = 0
+    np.cumsum(ncol, out=ptr[1:])
+    return ptr, ncol, col, D
+
+
 def sparse_dense(M):
     cdef cnp.ndarray dense = np.zeros(M.shape, dtype=M.dtype)
     _sparse_dense(M.ptr, M.ncol, M.col, M._D, dense)
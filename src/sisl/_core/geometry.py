@@ -3862,6 +3862,35 @@ class Geometry(
         truncate_with_nsc:
             if True, only consider atoms within the geometry's auxiliary cell.
 
+        Notes
+        -----
+        This method does not belong on this geometry. It will be removed eventually.
+        """
+        return next(self._orbital_values_chunks(grid_shape, truncate_with_nsc))[1]
+
+    def _orbital_values_chunks(
+        self,
+        grid_shape: tuple[int, int, int],
+        truncate_with_nsc: bool = False,
+        max_memory: Optional[float] = None,
+    ):
+        r"""Calculates orbital values for a given grid, in slabs along the first lattice vector.
+
+        Each slab is returned as a ``(slab, psi_values)`` tuple where ``slab`` is a `slice`
+        of the first grid axis, and ``psi_values`` contains the orbital values of the grid
+        points ``grid[slab]`` (with the grid indices relative to the slab).
+        All slabs share the same auxiliary supercell.
+
+        Parameters
+        ----------
+        grid_shape:
+           the grid shape (i.e. resolution) in which to calculate the orbital values.
+        truncate_with_nsc:
+            if True, only consider atoms within the geometry's auxiliary cell.
+        max_memory:
+            approximate memory (in MB) used for the orbital values of each slab.
+            If None, a single slab with the full grid is returned.
+
         Notes
         -----
         This method does not belong on this geometry. It will be removed eventually.
@@ -3870,10 +3899,6 @@ class Geometry(
         from sisl import Grid
         from sisl._sparse_grid import SparseGridOrbitalBZ
 
-        # In the following we don't care about division
-        # So 1) save error state, 2) turn off divide by 0, 3) calculate, 4) turn on old error state
-        old_err = np.seterr(divide="ignore", invalid="ignore")
-
         # Instead of looping all atoms in the supercell we find the exact atoms
         # and their supercell indices.
         add_R = _a.fulld(3, self.maxR())
@@ -3903,192 +3928,202 @@ class Geometry(
             xyz_to_spherical_cos_phi(rx, ry, rz)
             return rx, ry, rz
 
-        def sphere_grid_index(grid, center, R):
-
-            corners = np.mgrid[-1:2:2, -1:2:2, -1:2:2].T * R + center
-            corners = corners.reshape(-1, 3)
-
-            corners_i = grid.index(corners)
-
-            cmin = corners_i.min(axis=0)
-            cmax = corners_i.max(axis=0) + 1
-            sh = grid.shape
-
-            # direct if-statements are 4-5 times faster than min+max
-            # These subsequent 25 lines are equivalent to:
-            # cmin = np.maximum(0, np.minimum(cmin, sh))
-            # the numpy equivalents are way too slow in this case.
-            if cmin[0] < 0:
-                cmin[0] = 0
-            elif sh[0] < cmin[0]:
-                cmin[0] = sh[0]
-            if cmin[1] < 0:
-                cmin[1] = 0
-            elif sh[1] < cmin[1]:
-                cmin[1] = sh[1]
-            if cmin[2] < 0:
-                cmin[2] = 0
-            elif sh[2] < cmin[2]:
-                cmin[2] = sh[2]
-
-            if cmax[0] < 0:
-                cmax[0] = 0
-            elif sh[0] < cmax[0]:
-                cmax[0] = sh[0]
-            if cmax[1] < 0:
-                cmax[1] = 0
-            elif sh[1] < cmax[1]:
-                cmax[1] = sh[1]
-            if cmax[2] < 0:
-                cmax[2] = 0
-            elif sh[2] < cmax[2]:
-                cmax[2] = sh[2]
-
-            rx = slice(cmin[0], cmax[0])
-            ry = slice(cmin[1], cmax[1])
-            rz = slice(cmin[2], cmax[2])
-
-            indices = np.mgrid[rx, ry, rz].reshape(3, -1).T
-
-            return indices
+        # Initialize a fake grid to compute some quantities related to the grid distribution
+        grid = Grid(grid_shape, geometry=self)
+        sh = _a.arrayi(grid.shape)
 
         # Get the size of the auxiliary supercell needed to store orbital values.
         nsc = abs(ISC).max(axis=0) * 2 + 1
         sp_grid_geom = self.copy()
         sp_grid_geom.set_nsc(nsc)
 
-        # Initialize a fake grid to compute some quantities related to the grid distribution
-        grid = Grid(grid_shape, geometry=self)
-
         # Estimate a top limit on how many values we need to store. We estimate it by expecting
         # each orbital to fill a sphere of radius R, being R the radius of the orbital. We also
         # add a margin of 1 voxel so that we don't underestimate because of rounding.
         dvolume = grid.dvolume
         margin_R = np.linalg.norm(grid.dcell.sum(axis=0))
-        vol = 0.0
-        for atom, indices in self.sub(IA).atoms.iter(species=True):
-            vol += (4 / 3 * np.pi * (atom.R + margin_R) ** 3).sum() * len(indices)
-
-        max_vals = int(vol / dvolume)
-
-        # Array storing all the grid values
-        grid_values = np.zeros(max_vals, dtype=np.float64)
-        # Orbital indices for each orbital that has a nonzero value in the grid.
-        orbital_indices = np.full(max_vals, -1, dtype=np.int32)
-        # For each value, its index of the grid. Even if the grid is 3 dimensional,
-        # we store the raveled index. That is, a single integer representing the position
-        # of the point. One can always unravel the index if needed.
-        grid_indices = np.zeros(max_vals, dtype=np.int32)
-
-        # print(
-        #     f"Estimated memory required:",
-        #     (orbital_indices.size * 32 + grid_values.size * 64 + grid_indices.size * 32) / 8 / 1024 / 1024,
-        #     "MB"
-        # )
-
-        # Temporal variables that will help us keep track of the construction of the arrays.
-        i_value = 0
-        first_orbs = self.firsto
-        isc_off = sp_grid_geom.isc_off
 
-        # Loop over all atoms in the grid-cell
-        for ia, ia_xyz, isc in zip(IA, XYZ, ISC):
-            # Get current atom
+        # Calculate the bounding box (in grid indices) of all atoms, clipped to the grid.
+        # The values of an atom can only be stored within its bounding box.
+        corners = np.mgrid[-1:2:2, -1:2:2, -1:2:2].T.reshape(-1, 3)
+        cmin = np.zeros([len(IA), 3], dtype=np.int32)
+        cmax = np.zeros([len(IA), 3], dtype=np.int32)
+        # estimated number of values per atom (all orbitals)
+        nvals = _a.zerosd(len(IA))
+        for i, ia in enumerate(IA):
             atom = self.atoms[ia]
-
-            # Get the index of the cell where this atom is in the auxiliary supercell
-            index_sc = isc_off[isc[0], isc[1], isc[2]]
-            # And use it to calculate the offset on the orbital index.
-            io_offset = self.no * index_sc
-
-            # Extract maximum R
             R = atom.maxR()
-
             if R <= 0.0:
                 warn(f"Atom '{atom}' does not have a wave-function, skipping atom.")
                 continue
+            corners_i = grid.index(corners * R + XYZ[i])
+            cmin[i] = np.clip(corners_i.min(axis=0), 0, sh)
+            cmax[i] = np.clip(corners_i.max(axis=0) + 1, 0, sh)
+            nvals[i] = (4 / 3 * np.pi * (atom.R + margin_R) ** 3).sum() / dvolume
+
+        # Number of values in the bounding boxes (per plane of the first axis)
+        area = (cmax[:, 1] - cmin[:, 1]) * (cmax[:, 2] - cmin[:, 2]) * self.orbitals[IA]
+        # The number of values for each atom, per plane, using the average
+        # filling of the bounding box
+        nplane = np.maximum(cmax[:, 0] - cmin[:, 0], 1)
+        nvals_plane = np.minimum(nvals / nplane, area)
+
+        # Divide the grid into slabs
+        if max_memory is None:
+            slabs = [slice(0, sh[0])]
+        else:
+            # Accumulate the estimated number of values in each plane
+            plane = _a.zerosd(sh[0] + 1)
+            np.add.at(plane, cmin[:, 0], nvals_plane)
+            np.add.at(plane, cmax[:, 0], -nvals_plane)
+            plane = np.cumsum(plane[:-1])
+
+            # The memory per value is the value, grid- and orbital-index, and
+            # the subsequent conversion to the sparse matrix
+            max_vals = max_memory * 1024**2 / 40
+            slabs = []
+            start, nv = 0, 0.0
+            for i in range(sh[0]):
+                if i > start and nv + plane[i] > max_vals:
+                    slabs.append(slice(start, i))
+                    start, nv = i, 0.0
+                nv += plane[i]
+            slabs.append(slice(start, sh[0]))
 
-            idx = sphere_grid_index(grid, ia_xyz, R)
+        first_orbs = self.firsto
+        isc_off = sp_grid_geom.isc_off
+        nyz = sh[1] * sh[2]
 
-            if len(idx) == 0:
-                continue
+        for slab in slabs:
+            s0, s1 = slab.start, slab.stop
 
-            # Get real-space coordinates for the atom
-            grid_xyz = dot(idx, grid.dcell)
-            # Convert them to spherical coordinates
-            at_r, at_theta, at_cos_phi = xyz2spherical(grid_xyz, ia_xyz)
+            # Atoms with (a part of) their sphere inside the slab
+            lo = np.maximum(cmin[:, 0], s0)
+            hi = np.minimum(cmax[:, 0], s1)
+            atoms_slab = (lo < hi).nonzero()[0]
 
-            del grid_xyz
-            # Merge the three components of spherical coordinates into one array.
-            at_spherical = np.array([at_r, at_theta, at_cos_phi]).T
+            # Upper bound on the number of values in this slab
+            vals = np.minimum(
+                nvals[atoms_slab],
+                (hi - lo)[atoms_slab] * area[atoms_slab],
+            )
+            max_vals = int(vals.sum())
+
+            # Array storing all the grid values
+            grid_values = np.zeros(max_vals, dtype=np.float64)
+            # Orbital indices for each orbital that has a nonzero value in the grid.
+            orbital_indices = np.full(max_vals, -1, dtype=np.int32)
+            # For each value, its index of the grid. Even if the grid is 3 dimensional,
+            # we store the raveled index. That is, a single integer representing the position
+            # of the point. One can always unravel the index if needed.
+            grid_indices = np.zeros(max_vals, dtype=np.int32)
+
+            # In the following we don't care about division
+            # So 1) save error state, 2) turn off divide by 0, 3) calculate, 4) turn on old error state
+            old_err = np.seterr(divide="ignore", invalid="ignore")
+
+            # Temporal variables that will help us keep track of the construction of the arrays.
+            i_value = 0
+
+            # Loop over all atoms in the slab
+            for i in atoms_slab:
+                ia, ia_xyz, isc = IA[i], XYZ[i], ISC[i]
+                # Get current atom
+                atom = self.atoms[ia]
+
+                # Get the index of the cell where this atom is in the auxiliary supercell
+                index_sc = isc_off[isc[0], isc[1], isc[2]]
+                # And use it to calculate the offset on the orbital index.
+                io_offset = self.no * index_sc
+
+                # Extract maximum R
+                R = atom.maxR()
+
+                rx = slice(lo[i], hi[i])
+                ry = slice(cmin[i, 1], cmax[i, 1])
+                rz = slice(cmin[i, 2], cmax[i, 2])
+                idx = np.mgrid[rx, ry, rz].reshape(3, -1).T
+
+                if len(idx) == 0:
+                    continue
 
-            # Filter out points where the distance to the atom is less than its max R.
-            at_nonzero = at_spherical[:, 0] < R
-            idx = idx[at_nonzero]
-            at_spherical = at_spherical[at_nonzero]
+                # Get real-space coordinates for the atom
+                grid_xyz = dot(idx, grid.dcell)
+                # Convert them to spherical coordinates
+                at_r, at_theta, at_cos_phi = xyz2spherical(grid_xyz, ia_xyz)
 
-            if len(idx) == 0:
-                continue
+                del grid_xyz
+                # Merge the three components of spherical coordinates into one array.
+                at_spherical = np.array([at_r, at_theta, at_cos_phi]).T
 
-            # Ravel multi index to save space. That is, convert the 3D grid index
-            # into a single integer. One can always unravel them if needed.
-            idx = (
-                idx[:, 0] * grid.shape[1] * grid.shape[2]
-                + idx[:, 1] * grid.shape[2]
-                + idx[:, 2]
-            )
+                # Filter out points where the distance to the atom is less than its max R.
+                at_nonzero = at_spherical[:, 0] < R
+                idx = idx[at_nonzero]
+                at_spherical = at_spherical[at_nonzero]
 
-            # Loop over the orbitals
-            for io, orb in enumerate(atom.orbitals):
-                # Get the index of this orbital
-                uc_io = first_orbs[ia] + io
+                if len(idx) == 0:
+                    continue
 
-                orb_spherical = at_spherical
-                orb_indices = idx
+                # Ravel multi index to save space. That is, convert the 3D grid index
+                # into a single integer. One can always unravel them if needed.
+                # The index is relative to the start of the slab.
+                idx = (idx[:, 0] - s0) * nyz + idx[:, 1] * sh[2] + idx[:, 2]
 
-                # The orbital's R might not be the maximum R of the atom. In that case,
-                # we don't need to calculate the values for all the grid points that are within
-                # the atom's range.
-                if R - orb.R > 1e-6:
-                    # Check which coordinates are not within this orbital's range (the radius is bigger than orbital radius)
-                    orb_nonzero = orb_spherical[:, 0] < orb.R
+                # Loop over the orbitals
+                for io, orb in enumerate(atom.orbitals):
+                    # Get the index of this orbital
+                    uc_io = first_orbs[ia] + io
 
-                    orb_spherical = orb_spherical[orb_nonzero]
-                    orb_indices = orb_indices[orb_nonzero]
+                    orb_spherical = at_spherical
+                    orb_indices = idx
 
-                # Number of grid values that we are going to compute for this orbital
-                orb_nvals = orb_spherical.shape[0]
+                    # The orbital's R might not be the maximum R of the atom. In that case,
+                    # we don't need to calculate the values for all the grid points that are within
+                    # the atom's range.
+                    if R - orb.R > 1e-6:
+                        # Check which coordinates are not within this orbital's range (the radius is bigger than orbital radius)
+                        orb_nonzero = orb_spherical[:, 0] < orb.R
 
-                # If there are no values to add, go to the next orbital
-                if orb_nvals == 0:
-                    continue
+                        orb_spherical = orb_spherical[orb_nonzero]
+                        orb_indices = orb_indices[orb_nonzero]
 
-                # Compute the psi values for the grid points we are interested in
-                psi = orb.psi_spher(*orb_spherical.T, cos_phi=True)
+                    # Number of grid values that we are going to compute for this orbital
+                    orb_nvals = orb_spherical.shape[0]
 
-                # Update the data structure
-                values_i = slice(i_value, i_value + orb_nvals)
-                grid_values[values_i] = psi
-                grid_indices[values_i] = orb_indices
-                orbital_indices[values_i] = uc_io + io_offset
+                    # If there are no values to add, go to the next orbital
+                    if orb_nvals == 0:
+                        continue
 
-                # Update the index where new values should be stored
-                i_value += orb_nvals
+                    # Compute the psi values for the grid points we are interested in
+                    psi = orb.psi_spher(*orb_spherical.T, cos_phi=True)
 
-        # Reset the error code for division
-        np.seterr(**old_err)
+                    # Update the data structure
+                    values_i = slice(i_value, i_value + orb_nvals)
+                    grid_values[values_i] = psi
+                    grid_indices[values_i] = orb_indices
+                    orbital_indices[values_i] = uc_io + io_offset
 
-        # Cut the arrays to return only the parts that have been filled
-        grid_values = grid_values[:i_value]
-        grid_indices = grid_indices[:i_value]
-        orbital_indices = orbital_indices[:i_value]
+                    # Update the index where new values should be stored
+                    i_value += orb_nvals
 
-        psi_values = csr_matrix(
-            (grid_values, (grid_indices, orbital_indices)),
-            shape=(np.prod(grid.shape), sp_grid_geom.no_s),
-        )
+            # Reset the error code for division
+            np.seterr(**old_err)
+
+            # Cut the arrays to return only the parts that have been filled
+            grid_values = grid_values[:i_value]
+            grid_indices = grid_indices[:i_value]
+            orbital_indices = orbital_indices[:i_value]
 
-        return SparseGridOrbitalBZ(grid.shape, psi_values, geometry=sp_grid_geom)
+            slab_shape = (s1 - s0, sh[1], sh[2])
+            psi_values = csr_matrix(
+                (grid_values, (grid_indices, orbital_indices)),
+                shape=(np.prod(slab_shape), sp_grid_geom.no_s),
+            )
+            del grid_values, grid_indices, orbital_indices
+
+            yield slab, SparseGridOrbitalBZ(
+                slab_shape, psi_values, geometry=sp_grid_geom
+            )
 
     # Create pickling routines
     def __getstate__(self):
@@ -3,9 +3,10 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+import weakref
 from collections import namedtuple
 from collections.abc import Callable
-from functools import partial
+from hashlib import blake2b
 from math import factorial as fact
 from math import pi
 from math import sqrt as msqrt
@@ -22,10 +23,11 @@ try:
 except ImportError:
     from scipy.integrate import cumtrapz as cumulative_trapezoid
 
-from scipy.interpolate import UnivariateSpline
+from scipy.interpolate import CubicSpline
 
 import sisl._array as _a
 from sisl._internal import set_module
+from sisl._math_small import cubic_uniform_eval
 from sisl.constant import a0
 from sisl.messages import warn
 from sisl.shape import Sphere
@@ -448,14 +450,87 @@ def radial_minimize_range(
     return -contains
 
 
+class _RadialTable:
+    r"""Cubic spline interpolation of a radial function tabulated on a uniform grid
+
+    The interpolation is equivalent to
+    ``scipy.interpolate.UnivariateSpline(r, f, k=3, s=0, ext=1)``, i.e. a
+    not-a-knot cubic spline which is zero outside the range of `r`.
+    However, the polynomial coefficients are stored on a uniform grid, so
+    evaluating the spline only requires a direct lookup of the interval.
+    If `r` is not uniformly spaced, the spline is re-sampled on a uniform grid
+    with the smallest spacing in `r`.
+
+    The tables only contain the coefficients, and are therefore cheap to pickle.
+    Tables created with `new` are shared between orbitals with the same radial data.
+
+    Parameters
+    ----------
+    r, f :
+        the radial positions (sorted) and the radial function values at `r`.
+    """
+
+    __slots__ = ("_r0", "_dr", "_c", "__weakref__")
+
+    # The maximum number of points when re-sampling the radial function
+    _max_points = 2**15
+
+    # Tables with the same data are shared
+    _cache = weakref.WeakValueDictionary()
+
+    def __init__(self, r: npt.ArrayLike, f: npt.ArrayLike):
+        r = _a.asarrayd(r)
+        f = _a.asarrayd(f)
+        spline = CubicSpline(r, f, extrapolate=False)
+
+        dr = np.diff(r)
+        if not np.allclose(dr, dr[0], rtol=1e-8, atol=0):
+            n = int(np.ceil((r[-1] - r[0]) / dr.min())) + 1
+            n = min(max(n, len(r)), self._max_points)
+            r = np.linspace(r[0], r[-1], n)
+            spline = CubicSpline(r, spline(r), extrapolate=False)
+
+        self._r0 = r[0]
+        self._dr = (r[-1] - r[0]) / (len(r) - 1)
+        self._c = np.ascontiguousarray(spline.c.T)
+
+    @classmethod
+    def new(cls, r: npt.ArrayLike, f: npt.ArrayLike) -> _RadialTable:
+        """Return a (possibly shared) table for the radial function"""
+        r = _a.asarrayd(r)
+        f = _a.asarrayd(f)
+        key = blake2b(r.tobytes() + f.tobytes(), digest_size=16).digest()
+        table = cls._cache.get(key)
+        if table is None:
+            table = cls(r, f)
+            cls._cache[key] = table
+        return table
+
+    def __getstate__(self):
+        return {"r0": self._r0, "dr": self._dr, "c": self._c}
+
+    def __setstate__(self, d):
+        self._r0 = d["r0"]
+        self._dr = d["dr"]
+        self._c = d["c"]
+
+    def __call__(self, r: npt.ArrayLike, nu: int = 0) -> np.ndarray:
+        """Evaluate the radial function (or its `nu`'th derivative) at `r`"""
+        r = _a.asarrayd(r)
+        f = cubic_uniform_eval(r.ravel(), self._r0, self._dr, self._c, nu)
+        return f.reshape(r.shape)
+
+
 def _set_radial(self, *args, **kwargs) -> None:
     r"""Update the internal radial function used as a :math:`f(|\mathbf r|)`
 
     This can be called in several ways:
 
           set_radial(r, f)
-                which uses ``scipy.interpolate.UnivariateSpline(r, f, k=3, s=0, ext=1, check_finite=False)``
+                which uses a tabulated cubic spline equivalent to
+                ``scipy.interpolate.UnivariateSpline(r, f, k=3, s=0, ext=1, check_finite=False)``
                 to define the interpolation function (see `interp` keyword).
+                The derivatives of the radial function are also available, ``radial(r, 1)``.
                 Here the maximum radius of the orbital is the maximum `r` value,
                 regardless of ``f(r)`` is zero for smaller `r`.
 
@@ -526,13 +601,10 @@ def _set_radial(self, *args, **kwargs) -> None:
         r = r[idx]
         f = f[idx]
 
-        # k = 3 == cubic spline
-        # ext = 1 == return zero outside of bounds.
-        # s, smoothing factor. If 0, smooth through all points
-        # I can see that this function is *much* faster than
-        # interp1d, AND it yields same results with these arguments.
-        interp = partial(UnivariateSpline, k=3, s=0, ext=1, check_finite=False)
-        interp = kwargs.pop("interp", interp)(r, f)
+        # The default is a cubic spline tabulated on a uniform grid
+        # (equivalent to UnivariateSpline(k=3, s=0, ext=1)), the
+        # uniform grid makes evaluations much faster.
+        interp = kwargs.pop("interp", _RadialTable.new)(r, f)
 
         # this will defer the actual R designation (whether it should be set or not)
         self._radial = interp
@@ -833,6 +905,15 @@ class SphericalOrbital(Orbital):
 
     def __getstate__(self):
         """Return the state of this object"""
+        if isinstance(self._radial, _RadialTable):
+            # the table is pickable and need not be re-fitted
+            return {
+                "l": self.l,
+                "radial": self._radial,
+                "R": self.R,
+                "q0": self.q0,
+                "tag": self.tag,
+            }
         # A function is not necessarily pickable, so we store interpolated
         # data which *should* ensure the correct pickable state (to close agreement)
         r = np.linspace(0, self.R, 1000)
@@ -841,7 +922,10 @@ class SphericalOrbital(Orbital):
 
     def __setstate__(self, d):
         """Re-create the state of this object"""
-        self.__init__(d["l"], (d["r"], d["f"]), q0=d["q0"], tag=d["tag"])
+        if "radial" in d:
+            self.__init__(d["l"], d["radial"], q0=d["q0"], tag=d["tag"], R=d["R"])
+        else:
+            self.__init__(d["l"], (d["r"], d["f"]), q0=d["q0"], tag=d["tag"])
 
 
 @set_module("sisl")
@@ -1321,6 +1405,15 @@ class AtomicOrbital(Orbital):
 
     def __getstate__(self):
         """Return the state of this object"""
+        if isinstance(getattr(self.orb, "_radial", None), _RadialTable):
+            # the spherical orbital is pickable without re-fitting
+            return {
+                "name": self.name(),
+                "orb": self.orb,
+                "R": self.R,
+                "q0": self.q0,
+                "tag": self.tag,
+            }
         # A function is not necessarily pickable, so we store interpolated
         # data which *should* ensure the correct pickable state (to close agreement)
         try:
@@ -1334,7 +1427,9 @@ class AtomicOrbital(Orbital):
 
     def __setstate__(self, d):
         """Re-create the state of this object"""
-        if d["r"] is None:
+        if "orb" in d:
+            self.__init__(d["name"], d["orb"], q0=d["q0"], tag=d["tag"], R=d["R"])
+        elif d["r"] is None:
             self.__init__(d["name"], q0=d["q0"], tag=d["tag"])
         else:
             self.__init__(d["name"], (d["r"], d["f"]), q0=d["q0"], tag=d["tag"])
@@ -5,8 +5,10 @@ from __future__ import annotations
 
 from functools import reduce, singledispatchmethod
 from numbers import Integral
+from typing import Literal, Optional, Tuple
 
 import numpy as np
+import numpy.typing as npt
 
 # To speed up the _extend algorithm we limit lookups
 from numpy import all as np_all
@@ -55,7 +57,7 @@ from sisl.messages import SislError, warn
 from sisl.typing import OrSequence, SeqOrScalarFloat, SeqOrScalarInt, SparseMatrix
 from sisl.utils.mathematics import intersect_and_diff_sets
 
-from ._sparse import sparse_dense
+from ._sparse import fold_csr_pattern, sparse_coo, sparse_dense
 
 # Although this re-implements the CSR in scipy.sparse.csr_matrix
 # we use it slightly differently and thus require this new sparse pattern.
@@ -231,7 +233,17 @@ class SparseCSR(NDArrayOperatorsMixin):
 
     # We don't really need slots, but it is useful
     # to keep a good overview of which variables are present
-    __slots__ = ("_shape", "_ns", "_finalized", "_nnz", "ptr", "ncol", "col", "_D")
+    __slots__ = (
+        "_shape",
+        "_ns",
+        "_finalized",
+        "_nnz",
+        "ptr",
+        "ncol",
+        "col",
+        "_D",
+        "_fold",
+    )
 
     def __init__(self, arg1, dim=1, dtype=None, nnzpr: int = 20, nnz=None, **kwargs):
         """Initialize a new sparse CSR matrix"""
@@ -242,6 +254,8 @@ class SparseCSR(NDArrayOperatorsMixin):
         # for the insert row is increased at least by this number
         self._ns = 10
         self._finalized = False
+        # cached folded sparsity patterns (see `_folded`)
+        self._fold = None
 
         if issparse(arg1):
             # This is a sparse matrix
@@ -629,6 +643,46 @@ column indices of the sparse elements
 
         # Signal that we indeed have finalized the data
         self._finalized = sort
+        self._fold = None
+
+    def _folded(self, per_row: int = 1, diag: bool = False):
+        r"""Folded sparsity pattern (supercell columns folded into the primary cell)
+
+        The folded pattern only depends on the sparsity pattern, and not the data.
+        For finalized matrices it is cached, so that repeated calculations
+        (e.g. :math:`\mathbf H(\mathbf k)` for many k-points) only need to
+        add the elements.
+        The cache is discarded whenever the sparsity pattern changes.
+
+        Parameters
+        ----------
+        per_row :
+           number of folded rows (and columns) per row
+        diag :
+           only fold the diagonal of the ``per_row`` blocks
+
+        Returns
+        -------
+        ptr, ncol, col :
+           the folded sparsity pattern
+        idx :
+           position of each sparse element in its folded row
+        """
+        key = (per_row, diag and per_row > 1)
+        if not self._finalized:
+            return fold_csr_pattern(self.ptr, self.ncol, self.col, *key)
+
+        fold = getattr(self, "_fold", None)
+        arrays = (self.ptr, self.ncol, self.col)
+        if fold is None or any(a is not b for a, b in zip(fold[0], arrays)):
+            # the sparsity pattern has been changed (or never been folded)
+            fold = (arrays, {})
+            self._fold = fold
+
+        patterns = fold[1]
+        if key not in patterns:
+            patterns[key] = fold_csr_pattern(*arrays, *key)
+        return patterns[key]
 
     @singledispatchmethod
     def _sanitize(self, idx, axis: int = 0) -> ndarray:
@@ -1667,6 +1721,76 @@ column indices of the sparse elements
         new._D = new._D.astype(dtype, copy=copy)
         return new
 
+    @classmethod
+    def from_coo(
+        cls,
+        rows: npt.ArrayLike,
+        cols: npt.ArrayLike,
+        data: npt.ArrayLike,
+        shape: Tuple[int, ...],
+        duplicates: Literal["sum", "last"] = "sum",
+        dtype=None,
+    ) -> Self:
+        """Create a sparse matrix from coordinate (COO) arrays
+
+        The elements are sorted and compressed in one go, and the returned
+        matrix is finalized. This is much faster than assigning the elements
+        one at a time.
+
+        Parameters
+        ----------
+        rows :
+            row indices of the elements
+        cols :
+            column indices of the elements
+        data :
+            values of the elements, with shape ``(len(rows),)`` or ``(len(rows), dim)``
+        shape :
+            shape of the sparse matrix, a 2-tuple or a 3-tuple (the last
+            being the number of dimensions). For a 2-tuple the number of
+            dimensions is inferred from `data`
+        duplicates :
+            how duplicate elements are handled, either summed, or the last
+            one (in the order of the arrays) is retained
+        dtype : numpy.dtype, optional
+            data-type of the sparse matrix, defaults to the data-type of `data`
+
+        Examples
+        --------
+        >>> spm = SparseCSR.from_coo([0, 1, 1], [1, 0, 0], [1.0, 2.0, 3.0], (2, 2))
+        >>> spm[1, 0]
+        5.0
+        """
+        rows = _a.asarrayi(rows).ravel()
+        cols = _a.asarrayi(cols).ravel()
+        data = np.asarray(data, dtype=dtype)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        if len(shape) == 2:
+            shape = tuple(shape) + data.shape[1:]
+        if not (len(rows) == len(cols) == data.shape[0]):
+            raise ValueError(
+                f"{cls.__name__}.from_coo requires rows, cols and data to have the same length"
+            )
+        if data.shape[1] != shape[2]:
+            data = np.broadcast_to(data, (len(rows), shape[2]))
+        if len(cols) > 0 and (cols.min() < 0 or cols.max() >= shape[1]):
+            raise ValueError(
+                f"{cls.__name__}.from_coo got column indices out of bounds"
+            )
+
+        ptr, ncol, col, D = sparse_coo(rows, cols, data, shape[0], duplicates)
+
+        out = cls(shape, dtype=D.dtype, nnzpr=1, nnz=1)
+        out.ptr = ptr
+        out.ncol = ncol
+        out.col = col
+        out._D = D
+        out._nnz = len(col)
+        # columns are sorted and there are no empty elements
+        out._finalized = True
+        return out
+
     @classmethod
     def fromsp(cls, sparse_matrices: OrSequence[SparseMatrix], dtype=None):
         """Combine multiple single-dimension sparse matrices into one SparseCSR matrix
@@ -2018,6 +2142,7 @@ column indices of the sparse elements
         self._D = state["D"]
         self._nnz = self.ncol.sum()
         self._finalized = state["finalized"]
+        self._fold = None
         if self.finalized:
             self.ptr = _ncol_to_indptr(self.ncol)
         else:
@@ -6,7 +6,7 @@ from __future__ import annotations
 import warnings
 from collections import namedtuple
 from numbers import Integral
-from typing import Optional, Tuple
+from typing import Literal, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -36,10 +36,17 @@ from sisl.messages import SislError, SislWarning, deprecate_argument, progressba
 from sisl.typing import AtomsIndex, CellAxes, Coord, SeqOrScalarFloat
 from sisl.typing._atom import AtomsLike
 from sisl.typing._common import SeqOrScalarInt
+from sisl.utils.mathematics import fnorm
 from sisl.utils.misc import direction
 from sisl.utils.ranges import list2str
 
-from .sparse import SparseCSR, _ncol_to_indptr, _to_coo, issparse, valid_index
+from .sparse import (
+    SparseCSR,
+    _ncol_to_indptr,
+    _to_coo,
+    issparse,
+    valid_index,
+)
 
 __all__ = ["SparseAtom", "SparseOrbital"]
 
@@ -702,17 +709,37 @@ class _SparseGeometry(NDArrayOperatorsMixin):
            ...     self[ia, idx[0]] = 0
            ...     self[ia, idx[1]] = -2.7
 
+           For ``method="neighbors"`` the function is called only once, with
+           all neighbor pairs at once, see `method`.
         na_iR : int, optional
            number of atoms within the sphere for speeding
            up the `iter_block` loop.
-        method : {'rand', str}
-           method used in `Geometry.iter_block`, see there for details
+        method : {'rand', 'neighbors', str}
+           method used in `Geometry.iter_block`, see there for details.
+
+           If ``neighbors`` all neighbor pairs (within ``func.R``) are found with a
+           `~sisl.geom.NeighborFinder` and the sparse matrix is created in one go.
+           This is much faster for large geometries but requires
+           a vectorized `func` taking 5 arguments, this object (``self``),
+           the atom indices ``I``, the neighbor atom indices ``J``, the supercell
+           offsets ``isc`` of the neighbors, and the distances between them.
+           It should return the values for each pair (optionally with a trailing
+           dimension corresponding to `dim`).
+           Functions created with `create_construct` (or the tuple/list variant)
+           are automatically vectorized.
+           Only pairs within the supercell are retained, and when the rows
+           of this object are orbitals, all atoms must only have one orbital.
+
+           >>> def func(self, I, J, isc, dist):
+           ...     return np.where(dist < 0.1, 0.0, -2.7 * np.exp(1.44 - dist))
+           >>> func.R = 1.6
         eta : bool, optional
            whether an ETA will be printed
 
         See Also
         --------
         create_construct : a generic function used to create a generic function which this routine requires
+        sisl.geom.NeighborFinder : finder used for ``method="neighbors"``
         tile : tiling *after* construct is much faster for very large systems
         repeat : repeating *after* construct is much faster for very large systems
         """
@@ -744,6 +771,10 @@ class _SparseGeometry(NDArrayOperatorsMixin):
         except AttributeError:
             R = None
 
+        if method == "neighbors":
+            self._construct_neighbors(func, R)
+            return
+
         iR = self.geometry.iR(na_iR, R=R)
 
         # Create eta-object
@@ -763,6 +794,86 @@ class _SparseGeometry(NDArrayOperatorsMixin):
 
         eta.close()
 
+    def _construct_neighbors(self, func, R: Optional[float]) -> None:
+        """Construct the sparse matrix from all neighbor pairs in one go, see `construct`"""
+        # import here to avoid circular imports
+        from sisl.geom import NeighborFinder
+
+        geom = self.geometry
+        if self.shape[0] != geom.na:
+            raise ValueError(
+                f"{self.__class__.__name__}.construct(method='neighbors') requires all "
+                "atoms to only have one orbital."
+            )
+        if R is None:
+            R = geom.maxR() + 0.001
+        if R <= 0:
+            raise ValueError(
+                f"{self.__class__.__name__}.construct(method='neighbors') requires a "
+                "positive radius, either through func.R or the orbital ranges."
+            )
+
+        # The finder requires atoms inside the unit cell, so we
+        # move atoms along the periodic directions, and correct
+        # the supercell indices afterwards.
+        # Along non-periodic directions the atoms are translated,
+        # and the cell extended, if needed.
+        fxyz = geom.fxyz
+        pbc = geom.pbc
+        shift = np.floor(fxyz).astype(np.int32)
+        shift[:, ~pbc] = 0
+        xyz = geom.xyz - shift @ geom.cell
+        cell = geom.cell.copy()
+        for ax in (~pbc).nonzero()[0]:
+            fmin = fxyz[:, ax].min()
+            xyz -= fmin * cell[ax]
+            cell[ax] *= max(fxyz[:, ax].max() - fmin, 1)
+        uc_geom = geom.copy()
+        uc_geom.xyz[:, :] = xyz
+        uc_geom.set_lattice(geom.lattice.copy(cell))
+
+        # the finder uses a strict inequality, whereas Geometry.close does not
+        neighs = NeighborFinder(uc_geom, R=R + 1e-6, overlap=False).find_neighbors(
+            self_interaction=True
+        )
+        I = neighs.I
+        J = neighs.J
+        isc = neighs.isc + shift[I] - shift[J]
+
+        # Calculate the distances
+        dist = fnorm(geom.xyz[J] + isc @ geom.cell - geom.xyz[I])
+
+        # only retain neighbors within the supercell and the radius
+        idx = np.logical_and(
+            (np.abs(isc) <= geom.nsc // 2).all(1), dist <= R
+        ).nonzero()[0]
+        I = I[idx]
+        J = J[idx]
+        isc = isc[idx]
+        dist = dist[idx]
+
+        if hasattr(func, "params"):
+            # vectorized version of create_construct
+            shell = searchsorted(func.R, dist)
+            values = np.asarray(func.params, dtype=self.dtype)[shell]
+        else:
+            values = func(self, I, J, isc, dist)
+        values = np.asarray(values, dtype=self.dtype).reshape(len(I), -1)
+        values = np.broadcast_to(values, (len(I), self.dim))
+
+        rows = I
+        cols = J + geom.sc_index(isc) * geom.na
+        if self.nnz > 0:
+            # retain existing elements (but the new ones take precedence)
+            old_rows, old_cols, old_values = _to_coo(self._csr)
+            rows = concatenate((old_rows, rows))
+            cols = concatenate((old_cols, cols))
+            values = concatenate((old_values, values))
+
+        self._csr = SparseCSR.from_coo(
+            rows, cols, values, self._csr.shape, duplicates="last"
+        )
+
     @property
     def finalized(self) -> bool:
         """Whether the contained data is finalized and non-used elements have been removed"""
@@ -1085,6 +1196,65 @@ class _SparseGeometry(NDArrayOperatorsMixin):
 
         return p
 
+    @classmethod
+    def fromcoo(
+        cls,
+        geometry: Geometry,
+        rows: npt.ArrayLike,
+        cols: npt.ArrayLike,
+        data: npt.ArrayLike,
+        duplicates: Literal["sum", "last"] = "sum",
+        **kwargs,
+    ) -> Self:
+        r"""Create a sparse model from a preset `Geometry` and coordinate (COO) arrays
+
+        This is much faster than assigning the elements one at a time.
+
+        Parameters
+        ----------
+        geometry :
+           geometry to describe the new sparse geometry
+        rows :
+           row indices of the elements
+        cols :
+           column indices of the elements (in the supercell)
+        data :
+           values of the elements, with shape ``(len(rows),)`` or ``(len(rows), dim)``.
+           For non-orthogonal matrices (``orthogonal=False``) the last
+           dimension is the overlap matrix.
+        duplicates :
+           how duplicate elements are handled, see `SparseCSR.from_coo`
+        **kwargs :
+           any arguments that are directly passed to the `__init__` method
+           of the class.
+
+        See Also
+        --------
+        SparseCSR.from_coo : the underlying conversion
+        fromsp : create the sparse model from `scipy.sparse` matrices
+        """
+        data = np.asarray(data, dtype=kwargs.pop("dtype", None))
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+
+        p = cls(
+            geometry, cls._fromcoo_dim(data.shape[1], **kwargs), data.dtype, 1, **kwargs
+        )
+        if p.dim != data.shape[1]:
+            raise ValueError(
+                f"{cls.__name__}.fromcoo got data with {data.shape[1]} dimensions, "
+                f"the sparse matrix requires {p.dim}"
+            )
+        p._csr = SparseCSR.from_coo(
+            rows, cols, data, p._csr.shape, duplicates=duplicates
+        )
+        return p
+
+    @staticmethod
+    def _fromcoo_dim(dim: int, **kwargs) -> int:
+        """The `dim` argument for the class, given the number of dimensions of the data"""
+        return dim
+
     # numpy dispatch methods (same priority as SparseCSR!)
     __array_priority__ = 14
 
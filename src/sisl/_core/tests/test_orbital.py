@@ -220,6 +220,24 @@ class Test_sphericalorbital:
         assert np.allclose(f_univariate, f_spline)
         assert np.allclose(f_univariate, f_default)
 
+    def test_radial_table(self):
+        r = np.sort(np.random.rand(50)) * 4
+        r[0] = 0
+        for rr in (np.linspace(0, 4, 100), r):
+            f = np.exp(-rr) * np.cos(rr)
+            o = SphericalOrbital(0, (rr, f), R=4.0)
+            spline = interp.UnivariateSpline(rr, f, k=3, s=0, ext=1)
+            R = np.linspace(-0.5, 4.5, 500)
+            # non-uniform grids are re-sampled
+            atol = 1e-12 if rr is not r else 1e-4
+            for nu in range(3):
+                assert np.allclose(o.radial(R, nu), spline(R, nu), atol=atol * 10**nu)
+
+        # tables are shared
+        o1 = SphericalOrbital(1, (r, f))
+        assert o1._radial is o._radial
+        assert AtomicOrbital("2pz", (r, f)).orb._radial is o._radial
+
     def test_same1(self):
         rf = r_f(6)
         o0 = SphericalOrbital(0, rf)
@@ -288,6 +306,17 @@ class Test_sphericalorbital:
         assert o0 != l1
         assert o1 != l0
 
+    def test_pickle_radial(self):
+        import pickle as p
+
+        r = np.linspace(0, 4, 100)
+        o0 = SphericalOrbital(1, (r, np.exp(-r)))
+        o1 = p.loads(p.dumps(o0))
+        assert o0.R == o1.R
+        R = np.linspace(0, 5, 400)
+        assert np.allclose(o0.radial(R), o1.radial(R))
+        assert np.allclose(o0.radial(R, 1), o1.radial(R, 1))
+
     def test_togrid1(self):
         o = SphericalOrbital(1, r_f(6))
         o.toGrid()
@@ -1476,6 +1476,35 @@ def test_pickle():
     assert s.spsame(S)
 
 
+def test_folded_cache():
+    S = SparseCSR((3, 9), dtype=np.int32)
+    S[0, 0] = 1
+    S[0, 3] = 2
+    S[0, 4] = 3
+    S[1, 1] = 4
+    S[2, 8] = 5
+    S.finalize()
+
+    ptr, ncol, col, idx = S._folded()
+    assert np.allclose(ncol, [2, 1, 1])
+    assert np.allclose(col, [0, 1, 1, 2])
+    assert np.allclose(idx, [0, 0, 1, 0, 0])
+    # the pattern is re-used
+    assert S._folded()[2] is col
+    assert S._folded(2)[0] is S._folded(2)[0]
+    assert S._folded(2)[3] is not idx
+
+    # changing the sparsity pattern discards the cache
+    S[1, 5] = 6
+    assert not S.finalized
+    assert np.allclose(S._folded()[1], [2, 2, 1])
+    S.finalize()
+    ptr, ncol, col, idx = S._folded()
+    assert np.allclose(ncol, [2, 2, 1])
+    assert np.allclose(idx, [0, 0, 1, 0, 1, 0])
+    assert S._folded()[2] is col
+
+
 @pytest.mark.parametrize("i", [-1, 10])
 def test_sparse_row_out_of_bounds(i):
     S = SparseCSR((10, 10, 1), dtype=np.int32)
@@ -1572,6 +1601,55 @@ def test_transform_fail():
         csr.transform(matrix=matrix)
 
 
+@pytest.mark.parametrize("duplicates", ["sum", "last"])
+@pytest.mark.parametrize("dtype", [np.int32, np.float64, np.complex128])
+def test_from_coo(duplicates, dtype):
+    rng = np.random.default_rng(1234)
+    # many rows with large columns, forcing both sorting algorithms
+    rows = rng.integers(0, 20, 2000)
+    cols = rng.integers(0, 40, 2000)
+    data = rng.integers(1, 10, (2000, 2)).astype(dtype)
+
+    csr = SparseCSR.from_coo(rows, cols, data, (20, 40), duplicates=duplicates)
+    assert csr.shape == (20, 40, 2)
+    assert csr.dtype == dtype
+    assert csr.finalized
+    assert csr.nnz == len(np.unique(rows * 40 + cols))
+
+    for dim in range(2):
+        if duplicates == "sum":
+            dense = sc.sparse.coo_matrix(
+                (data[:, dim], (rows, cols)), shape=(20, 40)
+            ).toarray()
+        else:
+            dense = np.zeros([20, 40], dtype=dtype)
+            for r, c, d in zip(rows, cols, data[:, dim]):
+                dense[r, c] = d
+        assert np.allclose(csr.tocsr(dim).toarray(), dense)
+
+
+def test_from_coo_broadcast():
+    csr = SparseCSR.from_coo([0, 1, 1], [1, 0, 0], [1.0, 2.0, 3.0], (2, 2, 2))
+    assert csr.nnz == 2
+    assert np.allclose(csr[1, 0], [5, 5])
+    assert np.allclose(csr[0, 1], [1, 1])
+
+    csr = SparseCSR.from_coo([], [], [], (2, 2))
+    assert csr.nnz == 0
+    assert csr.shape == (2, 2, 1)
+
+
+def test_from_coo_fail():
+    with pytest.raises(ValueError):
+        SparseCSR.from_coo([0, 1], [1, 0], [1.0], (2, 2))
+    with pytest.raises(ValueError):
+        SparseCSR.from_coo([0, 2], [1, 0], [1.0, 2.0], (2, 2))
+    with pytest.raises(ValueError):
+        SparseCSR.from_coo([0, 1], [1, 2], [1.0, 2.0], (2, 2))
+    with pytest.raises(ValueError):
+        SparseCSR.from_coo([0, 1], [1, 0], [1.0, 2.0], (2, 2), duplicates="first")
+
+
 @pytest.mark.slow
 def test_fromsp_csr_large():
     csr1 = sc.sparse.random(10000, 10, 0.1, format="csr", random_state=23583)
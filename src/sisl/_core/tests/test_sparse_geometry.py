@@ -109,6 +109,36 @@ class TestSparseAtom:
         with pytest.raises(ValueError):
             s1.construct([[0.1, 1.5], [1]])
 
+    def test_construct_neighbors(self, setup):
+        s1 = SparseAtom(setup.g, 2)
+        s1.construct([[0.1, 1.5], [(1, 2), (3, 4)]])
+        s2 = SparseAtom(setup.g, 2)
+        s2.construct([[0.1, 1.5], [(1, 2), (3, 4)]], method="neighbors")
+        assert s2.finalized
+        assert s1.spsame(s2)
+        assert np.allclose(s1.tocsr(0).toarray(), s2.tocsr(0).toarray())
+        assert np.allclose(s1.tocsr(1).toarray(), s2.tocsr(1).toarray())
+
+    def test_construct_neighbors_func(self, setup):
+        s1 = SparseAtom(setup.g)
+        s1.construct([[0.1, 1.5], [1, 2]])
+
+        def func(self, I, J, isc, dist):
+            return np.where(dist < 0.1, 1, 2)
+
+        func.R = 1.5
+        s2 = SparseAtom(setup.g)
+        # existing elements are retained
+        s2[0, 0] = 3
+        s2[0, setup.g.na] = 3
+        s2.construct(func, method="neighbors")
+        assert s2[0, 0] == 1
+        assert s2[0, setup.g.na] == 3
+        s2[0, setup.g.na] = 0
+        s2.eliminate_zeros()
+        assert s1.spsame(s2)
+        assert np.allclose(s1.tocsr().toarray(), s2.tocsr().toarray())
+
     def test_untile1(self, setup):
         s1 = SparseAtom(setup.g)
         s1.construct([[0.1, 1.5], [1, 2]])
@@ -132,6 +132,14 @@ register_environ_variable(
 )
 
 
+register_environ_variable(
+    "SISL_NUM_THREADS",
+    1,
+    "Number of (OpenMP) threads used in the compiled grid reduction and grid writing routines",
+    process=int,
+)
+
+
 register_environ_variable(
     "SISL_PAR_CHUNKSIZE",
     0.1,
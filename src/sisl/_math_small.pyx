@@ -88,3 +88,52 @@ def xyz_to_spherical_cos_phi(floats_st[::1] x,
                 z[i] = z[i] / R
             else:
                 z[i] = 0.
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def cubic_uniform_eval(const double[::1] x,
+                       const double x0,
+                       const double dx,
+                       const double[:, ::1] c,
+                       const int nu=0):
+    """ Evaluate a piecewise cubic polynomial defined on a uniform grid
+
+    The polynomial in interval ``i`` is
+    ``c[i, 0] t**3 + c[i, 1] t**2 + c[i, 2] t + c[i, 3]`` with ``t = x - x0 - i * dx``.
+    Values outside the intervals are 0.
+
+    Returns the `nu`'th derivative of the polynomial at `x`
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    cdef Py_ssize_t nint = c.shape[0]
+    cdef ndarray[double, mode='c'] Y = np.empty([n], dtype=np.float64)
+    cdef double[::1] y = Y
+    cdef Py_ssize_t i, j
+    cdef double t
+
+    with nogil:
+        for i in range(n):
+            t = (x[i] - x0) / dx
+            # this also removes NaN values
+            if not (t >= 0. and t <= nint):
+                y[i] = 0.
+                continue
+            j = <Py_ssize_t> t
+            if j == nint:
+                j = nint - 1
+            t = x[i] - x0 - j * dx
+            if nu == 0:
+                y[i] = ((c[j, 0] * t + c[j, 1]) * t + c[j, 2]) * t + c[j, 3]
+            elif nu == 1:
+                y[i] = (3 * c[j, 0] * t + 2 * c[j, 1]) * t + c[j, 2]
+            elif nu == 2:
+                y[i] = 6 * c[j, 0] * t + 2 * c[j, 1]
+            elif nu == 3:
+                y[i] = 6 * c[j, 0]
+            else:
+                y[i] = 0.
+
+    return Y
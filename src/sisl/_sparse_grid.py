@@ -7,6 +7,7 @@ import numpy as np
 from scipy.sparse import issparse, spmatrix
 
 from sisl import Grid, Lattice, SparseCSR
+from sisl._environ import get_environ_variable
 from sisl.physics import Overlap
 
 from ._sparse_grid_ops import (
@@ -182,6 +183,7 @@ class Sparse4DGrid:
                     grid_shape=grid_shape,
                     new_axes=new_axes_order,
                     out=out,
+                    num_threads=get_environ_variable("SISL_NUM_THREADS"),
                 )
             elif multi_weights:
                 reduce_grid_matvecs_multiply(
@@ -193,6 +195,7 @@ class Sparse4DGrid:
                     grid_shape=grid_shape,
                     new_axes=new_axes_order,
                     out=out,
+                    num_threads=get_environ_variable("SISL_NUM_THREADS"),
                 )
             else:
                 reduce_grid_matvec_multiply(
@@ -204,6 +207,7 @@ class Sparse4DGrid:
                     grid_shape=grid_shape,
                     new_axes=new_axes_order,
                     out=out,
+                    num_threads=get_environ_variable("SISL_NUM_THREADS"),
                 )
 
         return grid
@@ -456,7 +460,8 @@ class SparseGridOrbitalBZ(Sparse4DGrid):
         if isinstance(weights, SparseCSR):
             weights = weights.copy(dtype=dtype)
         else:
-            weights = weights.astype(dtype)
+            # avoid copying already converted (dense) weights
+            weights = np.ascontiguousarray(weights, dtype=dtype)
 
         reduce_func(
             csr.data[:, 0].astype(dtype),
@@ -470,6 +475,7 @@ class SparseGridOrbitalBZ(Sparse4DGrid):
             grid_shape=grid_shape,
             new_axes=new_axes_order,
             out=out,
+            num_threads=get_environ_variable("SISL_NUM_THREADS"),
         )
 
         return grid
@@ -4,6 +4,7 @@
 import cython
 import cython.cimports.numpy as cnp
 import numpy as np
+from cython.parallel import prange, threadid
 
 from sisl import SparseCSR
 
@@ -12,6 +13,7 @@ from sisl import SparseCSR
 @cython.wraparound(False)
 @cython.cdivision(True)
 @cython.ccall
+@cython.nogil
 @cython.exceptval(check=False)
 def transpose_raveled_index(
     index: cython.int, grid_shape: cnp.int32_t[:], new_order: cnp.int32_t[:]
@@ -96,6 +98,22 @@ def dense_index(shape, ptr: cnp.int32_t[:], col: cnp.int32_t[:]) -> cnp.int32_t[
     return np.asarray(dense_index)
 
 
+@cython.cfunc
+@cython.inline
+@cython.nogil
+@cython.cdivision(True)
+@cython.exceptval(check=False)
+def _ceil_div(a: cython.int, b: cython.int) -> cython.int:
+    """Number of output rows when reducing `a` rows by a factor `b`"""
+    return (a + b - 1) // b
+
+
+def _add_threads(out, out_t) -> None:
+    """Add the per-thread accumulated values to `out`"""
+    out = np.asarray(out)
+    out += np.asarray(out_t).sum(0)
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
@@ -107,6 +125,7 @@ def reduce_grid_sum(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.numeric[:],
+    num_threads: cython.int = 1,
 ):
     """Performs sum over the extra dimension while reducing other dimensions of the grid.
 
@@ -131,28 +150,57 @@ def reduce_grid_sum(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
-    nrows = ptr.shape[0] - 1
 
-    i: cython.int
+    nrows: cython.int = ptr.shape[0] - 1
+
+    row: cython.int
+    orow: cython.int
+    reduced_i: cython.int
     j: cython.int
+    row_value: cython.numeric
 
     need_transpose: cython.bint = new_axes.shape[0] > 1
-
-    for i in range(nrows):
-
-        if need_transpose:
+    nthreads: cython.int = max(num_threads, 1)
+
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.numeric[:, :] = np.zeros(
+            (nthreads, out.shape[0]), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="static"):
             reduced_i = (
-                transpose_raveled_index(i, grid_shape, new_axes) // reduce_factor
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
             )
-        else:
-            reduced_i = i // reduce_factor
 
-        row_value: cython.numeric = 0
-        for j in range(ptr[i], ptr[i + 1]):
-            row_value += data[j]
+            row_value = 0
+            for j in range(ptr[row], ptr[row + 1]):
+                row_value = row_value + data[j]
+
+            out_t[threadid(), reduced_i] += row_value
 
-        out[reduced_i] = out[reduced_i] + row_value
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements.
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="static",
+        ):
+            row_value = 0
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                for j in range(ptr[row], ptr[row + 1]):
+                    row_value = row_value + data[j]
+
+            out[orow] = out[orow] + row_value
 
 
 @cython.boundscheck(False)
@@ -167,6 +215,7 @@ def reduce_grid_matvec_multiply(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.numeric[:],
+    num_threads: cython.int = 1,
 ):
     """Performs a matrix-vector multiplication while reducing other dimensions of the grid.
 
@@ -193,33 +242,57 @@ def reduce_grid_matvec_multiply(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
 
     nrows: cython.int = ptr.shape[0] - 1
 
-    i: cython.int
+    row: cython.int
+    orow: cython.int
     reduced_i: cython.int
     j: cython.int
-    jcol: cython.int
+    row_value: cython.numeric
 
     need_transpose: cython.bint = new_axes.shape[0] > 1
-
-    for i in range(nrows):
-        reduced_i = i // reduce_factor
-
-        if need_transpose:
+    nthreads: cython.int = max(num_threads, 1)
+
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.numeric[:, :] = np.zeros(
+            (nthreads, out.shape[0]), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="static"):
             reduced_i = (
-                transpose_raveled_index(i, grid_shape, new_axes) // reduce_factor
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
             )
-        else:
-            reduced_i = i // reduce_factor
 
-        row_value: cython.numeric = 0
-        for j in range(ptr[i], ptr[i + 1]):
-            jcol = col[j]
-            row_value += data[j] * V[jcol]
+            row_value = 0
+            for j in range(ptr[row], ptr[row + 1]):
+                row_value = row_value + data[j] * V[col[j]]
+
+            out_t[threadid(), reduced_i] += row_value
 
-        out[reduced_i] = out[reduced_i] + row_value
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements.
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="static",
+        ):
+            row_value = 0
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                for j in range(ptr[row], ptr[row + 1]):
+                    row_value = row_value + data[j] * V[col[j]]
+
+            out[orow] = out[orow] + row_value
 
 
 @cython.boundscheck(False)
@@ -234,6 +307,7 @@ def reduce_grid_matvecs_multiply(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.numeric[:, :],
+    num_threads: cython.int = 1,
 ):
     """Performs a matrix-matrix multiplication while reducing other dimensions of the grid.
 
@@ -260,36 +334,486 @@ def reduce_grid_matvecs_multiply(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
 
-    nrows = ptr.shape[0] - 1
-    nvecs = V.shape[1]
+    nrows: cython.int = ptr.shape[0] - 1
+    nvecs: cython.int = V.shape[1]
 
-    i: cython.int
+    row: cython.int
+    orow: cython.int
+    reduced_i: cython.int
+    tid: cython.int
     j: cython.int
+    jcol: cython.int
     ivec: cython.int
 
     need_transpose: cython.bint = new_axes.shape[0] > 1
-
-    row_value: cython.numeric[:] = np.zeros(nvecs, np.asarray(data).dtype)
-
-    for i in range(nrows):
-        if need_transpose:
+    nthreads: cython.int = max(num_threads, 1)
+
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.numeric[:, :, :] = np.zeros(
+            (nthreads, out.shape[0], nvecs), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="static"):
             reduced_i = (
-                transpose_raveled_index(i, grid_shape, new_axes) // reduce_factor
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
             )
-        else:
-            reduced_i = i // reduce_factor
+            tid = threadid()
+
+            for j in range(ptr[row], ptr[row + 1]):
+                jcol = col[j]
+                for ivec in range(nvecs):
+                    out_t[tid, reduced_i, ivec] += data[j] * V[jcol, ivec]
+
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements (which are owned by the thread).
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="static",
+        ):
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                for j in range(ptr[row], ptr[row + 1]):
+                    jcol = col[j]
+                    for ivec in range(nvecs):
+                        out[orow, ivec] += data[j] * V[jcol, ivec]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.cfunc
+@cython.nogil
+@cython.exceptval(check=False)
+def _sc_products_row(
+    row: cython.int,
+    data: cython.floating[:],
+    ptr: cnp.int32_t[:],
+    col: cnp.int32_t[:],
+    coeffs: cython.floating[:, :],
+    uc_ncol: cython.int,
+    data_sc_off: cnp.int32_t[:, :],
+    coeffs_isc_off: cnp.int32_t[:, :, :],
+    force_same_cell: cython.bint,
+) -> cython.floating:
+    """Sum of all products between column pairs of a single row, see `reduce_sc_products`"""
+    # Indices to handle pairs of columns (ij)
+    i: cython.int
+    icol: cython.int
+    uc_icol: cython.int
+    sc_icol: cython.int
+    icol_sc: cython.int
+    ipair_sc: cython.int
+
+    j: cython.int
+    jcol: cython.int
+    uc_jcol: cython.int
+    sc_jcol: cython.int
+    jcol_sc: cython.int
+    jpair_sc: cython.int
+
+    # Index to loop over axes of the grid.
+    iaxis: cython.int
+
+    # Variables that will help managing orbital pairs that are not within the same cell.
+    sc_diff: cython.int[3]
+    inv_sc_diff: cython.int[3]
+    same_cell: cython.bint
 
-        row_value[:] = 0
-        for j in range(ptr[i], ptr[i + 1]):
+    # Initialize the row value.
+    row_value: cython.floating = 0
+    i_row_value: cython.floating
+
+    # For each row, loop over pairs of columns (ij).
+    # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
+    # We do this because it is very easy if orbitals i and j are in the same cell. We also save
+    # some computation if they are not.
+    for i in range(ptr[row], ptr[row + 1]):
+        icol = col[i]
+
+        # Initialize the value for all pairs that we found for i
+        i_row_value = 0
+
+        # Precompute the supercell index of icol (will compare it to that of jcol)
+        icol_sc = icol // uc_ncol
+        # And also its unit cell index
+        uc_icol = icol % uc_ncol
+
+        for j in range(i, ptr[row + 1]):
             jcol = col[j]
 
-            for ivec in range(nvecs):
-                row_value[ivec] = row_value[ivec] + data[j] * V[jcol, ivec]
+            jcol_sc = jcol // uc_ncol
+            # Get the unit cell index of jcol
+            uc_jcol = jcol % uc_ncol
+
+            same_cell = force_same_cell
+            # If same cell interactions are not forced, we need to discover if this pair
+            # of columns is within the same cell.
+            if not force_same_cell:
+                same_cell = icol_sc == jcol_sc
+
+            # If the columns are not in the same cell, we need to
+            # (1) Calculate the supercell offset between icol and jcol
+            # (2) And then calculate the new index for jcol, moving icol to the unit cell
+            # (3) Do the same in the reverse direction (jcol -> icol)
+            if not same_cell:
+                # Calculate the sc offset between both orbitals.
+                for iaxis in range(3):
+                    sc_diff[iaxis] = (
+                        data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
+                    )
+                    # Calculate also the offset in the reverse direction
+                    inv_sc_diff[iaxis] = -sc_diff[iaxis]
+
+                    # If the sc_difference is negative, convert it to positive so that we can
+                    # use it to index the isc_off array (we switched off the handling of negative
+                    # indices in cython with wraparound(False))
+                    if sc_diff[iaxis] < 0:
+                        sc_diff[iaxis] = coeffs_isc_off.shape[iaxis] + sc_diff[iaxis]
+                    elif inv_sc_diff[iaxis] < 0:
+                        inv_sc_diff[iaxis] = (
+                            coeffs_isc_off.shape[iaxis] + inv_sc_diff[iaxis]
+                        )
+
+                # Get the supercell offset index of jcol with respect to icol
+                jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
+                # And use it to calculate the supercell index of the j orbital in this ij pair
+                sc_jcol = jpair_sc * uc_ncol + uc_jcol
+
+                # Do the same for the ji pair
+                ipair_sc = coeffs_isc_off[
+                    inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
+                ]
+                sc_icol = ipair_sc * uc_ncol + uc_icol
+
+            # Add the contribution of this column pair to the row total value. Note that we only
+            # multiply the coefficients by data[j] here. This is because this loop is over all j
+            # that pair with a given i. data[i] is a common factor and therefore we can multiply
+            # after the loop to save operations.
+            if same_cell:
+                if icol == jcol:
+                    i_row_value += coeffs[uc_icol, uc_jcol] * data[j]
+                else:
+                    i_row_value += (
+                        coeffs[uc_icol, uc_jcol] + coeffs[uc_jcol, uc_icol]
+                    ) * data[j]
+            else:
+                i_row_value += (
+                    coeffs[uc_icol, sc_jcol] + coeffs[uc_jcol, sc_icol]
+                ) * data[j]
 
-        for ivec in range(nvecs):
-            out[reduced_i, ivec] = out[reduced_i, ivec] + row_value[ivec]
+        # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
+        # And add the contribution of all ij pairs for this i to the row value.
+        row_value += i_row_value * data[i]
+
+    return row_value
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.cfunc
+@cython.nogil
+@cython.exceptval(check=False)
+def _sc_products_multicoeffs_row(
+    row: cython.int,
+    data: cython.floating[:],
+    ptr: cnp.int32_t[:],
+    col: cnp.int32_t[:],
+    coeffs: cython.floating[:, :, :],
+    uc_ncol: cython.int,
+    data_sc_off: cnp.int32_t[:, :],
+    coeffs_isc_off: cnp.int32_t[:, :, :],
+    force_same_cell: cython.bint,
+    i_row_value: cython.floating[:],
+    out: cython.floating[:],
+) -> cython.void:
+    """Adds the sum of all products between column pairs of a single row to `out`, see `reduce_sc_products_multicoeffs`
+
+    `i_row_value` is a temporary work array.
+    """
+    # Indices to handle pairs of columns (ij)
+    i: cython.int
+    icol: cython.int
+    uc_icol: cython.int
+    sc_icol: cython.int
+    icol_sc: cython.int
+    ipair_sc: cython.int
+
+    j: cython.int
+    jcol: cython.int
+    uc_jcol: cython.int
+    sc_jcol: cython.int
+    jcol_sc: cython.int
+    jpair_sc: cython.int
+
+    # Index to loop over axes of the grid.
+    iaxis: cython.int
+
+    # Variables that will help managing orbital pairs that are not within the same cell.
+    sc_diff: cython.int[3]
+    inv_sc_diff: cython.int[3]
+    same_cell: cython.bint
+
+    # Variables to handle multiple product coefficients
+    ncoeffs: cython.int = coeffs.shape[2]
+    icoeff: cython.int
+
+    # For each row, loop over pairs of columns (ij).
+    # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
+    # We do this because it is very easy if orbitals i and j are in the same cell. We also save
+    # some computation if they are not.
+    for i in range(ptr[row], ptr[row + 1]):
+        icol = col[i]
+
+        # Initialize the value for all pairs that we found for i
+        for icoeff in range(ncoeffs):
+            i_row_value[icoeff] = 0
+
+        # Precompute the supercell index of icol (will compare it to that of jcol)
+        icol_sc = icol // uc_ncol
+        # And also its unit cell index
+        uc_icol = icol % uc_ncol
+
+        for j in range(i, ptr[row + 1]):
+            jcol = col[j]
+
+            jcol_sc = jcol // uc_ncol
+            # Get the unit cell index of jcol
+            uc_jcol = jcol % uc_ncol
+
+            same_cell = force_same_cell
+            # If same cell interactions are not forced, we need to discover if this pair
+            # of columns is within the same cell.
+            if not force_same_cell:
+                same_cell = icol_sc == jcol_sc
+
+            # If the columns are not in the same cell, we need to
+            # (1) Calculate the supercell offset between icol and jcol
+            # (2) And then calculate the new index for jcol, moving icol to the unit cell
+            # (3) Do the same in the reverse direction (jcol -> icol)
+            if not same_cell:
+                # Calculate the sc offset between both orbitals.
+                for iaxis in range(3):
+                    sc_diff[iaxis] = (
+                        data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
+                    )
+                    # Calculate also the offset in the reverse direction
+                    inv_sc_diff[iaxis] = -sc_diff[iaxis]
+
+                    # If the sc_difference is negative, convert it to positive so that we can
+                    # use it to index the isc_off array (we switched off the handling of negative
+                    # indices in cython with wraparound(False))
+                    if sc_diff[iaxis] < 0:
+                        sc_diff[iaxis] = coeffs_isc_off.shape[iaxis] + sc_diff[iaxis]
+                    elif inv_sc_diff[iaxis] < 0:
+                        inv_sc_diff[iaxis] = (
+                            coeffs_isc_off.shape[iaxis] + inv_sc_diff[iaxis]
+                        )
+
+                # Get the supercell offset index of jcol with respect to icol
+                jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
+                # And use it to calculate the supercell index of the j orbital in this ij pair
+                sc_jcol = jpair_sc * uc_ncol + uc_jcol
+
+                # Do the same for the ji pair
+                ipair_sc = coeffs_isc_off[
+                    inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
+                ]
+                sc_icol = ipair_sc * uc_ncol + uc_icol
+
+            # Add the contribution of this column pair to the row total value. Note that we only
+            # multiply the coefficients by data[j] here. This is because this loop is over all j
+            # that pair with a given i. data[i] is a common factor and therefore we can multiply
+            # after the loop to save operations.
+
+            # Do it for all coefficients.
+            for icoeff in range(ncoeffs):
+                if same_cell:
+                    if icol == jcol:
+                        i_row_value[icoeff] += (
+                            coeffs[uc_icol, uc_jcol, icoeff] * data[j]
+                        )
+                    else:
+                        i_row_value[icoeff] += (
+                            coeffs[uc_icol, uc_jcol, icoeff]
+                            + coeffs[uc_jcol, uc_icol, icoeff]
+                        ) * data[j]
+                else:
+                    i_row_value[icoeff] += (
+                        coeffs[uc_icol, sc_jcol, icoeff]
+                        + coeffs[uc_jcol, sc_icol, icoeff]
+                    ) * data[j]
+
+        for icoeff in range(ncoeffs):
+            # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
+            # And add the contribution of all ij pairs for this i to the output.
+            out[icoeff] += i_row_value[icoeff] * data[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.cfunc
+@cython.nogil
+@cython.exceptval(check=False)
+def _sc_products_multicoeffs_sparse_row(
+    row: cython.int,
+    data: cython.floating[:],
+    ptr: cnp.int32_t[:],
+    col: cnp.int32_t[:],
+    coeffs: cython.floating[:, :],
+    dense_idx: cnp.int32_t[:, :],
+    uc_ncol: cython.int,
+    data_sc_off: cnp.int32_t[:, :],
+    coeffs_isc_off: cnp.int32_t[:, :, :],
+    force_same_cell: cython.bint,
+    i_row_value: cython.floating[:],
+    out: cython.floating[:],
+) -> cython.void:
+    """Adds the sum of all products between column pairs of a single row to `out`, see `reduce_sc_products_multicoeffs_sparse_denseindex`
+
+    `i_row_value` is a temporary work array.
+    """
+    # Indices to handle pairs of columns (ij)
+    i: cython.int
+    icol: cython.int
+    uc_icol: cython.int
+    sc_icol: cython.int
+    icol_sc: cython.int
+    ipair_sc: cython.int
+
+    j: cython.int
+    jcol: cython.int
+    uc_jcol: cython.int
+    sc_jcol: cython.int
+    jcol_sc: cython.int
+    jpair_sc: cython.int
+
+    # Index to loop over axes of the grid.
+    iaxis: cython.int
+
+    # Variables that will help managing orbital pairs that are not within the same cell.
+    sc_diff: cython.int[3]
+    inv_sc_diff: cython.int[3]
+    same_cell: cython.bint
+
+    coeff_index: cython.int
+    coeff_index2: cython.int
+
+    # Variables to handle multiple product coefficients
+    ncoeffs: cython.int = coeffs.shape[1]
+    icoeff: cython.int
+
+    # For each row, loop over pairs of columns (ij).
+    # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
+    # We do this because it is very easy if orbitals i and j are in the same cell. We also save
+    # some computation if they are not.
+    for i in range(ptr[row], ptr[row + 1]):
+        icol = col[i]
+
+        # Initialize the value for all pairs that we found for i
+        for icoeff in range(ncoeffs):
+            i_row_value[icoeff] = 0
+
+        # Precompute the supercell index of icol (will compare it to that of jcol)
+        icol_sc = icol // uc_ncol
+        # And also its unit cell index
+        uc_icol = icol % uc_ncol
+
+        for j in range(i, ptr[row + 1]):
+            jcol = col[j]
+
+            jcol_sc = jcol // uc_ncol
+            # Get the unit cell index of jcol
+            uc_jcol = jcol % uc_ncol
+
+            same_cell = force_same_cell
+            # If same cell interactions are not forced, we need to discover if this pair
+            # of columns is within the same cell.
+            if not force_same_cell:
+                same_cell = icol_sc == jcol_sc
+
+            # If the columns are not in the same cell, we need to
+            # (1) Calculate the supercell offset between icol and jcol
+            # (2) And then calculate the new index for jcol, moving icol to the unit cell
+            # (3) Do the same in the reverse direction (jcol -> icol)
+            if not same_cell:
+                # Calculate the sc offset between both orbitals.
+                for iaxis in range(3):
+                    sc_diff[iaxis] = (
+                        data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
+                    )
+                    # Calculate also the offset in the reverse direction
+                    inv_sc_diff[iaxis] = -sc_diff[iaxis]
+
+                    # If the sc_difference is negative, convert it to positive so that we can
+                    # use it to index the isc_off array (we switched off the handling of negative
+                    # indices in cython with wraparound(False))
+                    if sc_diff[iaxis] < 0:
+                        sc_diff[iaxis] = coeffs_isc_off.shape[iaxis] + sc_diff[iaxis]
+                    elif inv_sc_diff[iaxis] < 0:
+                        inv_sc_diff[iaxis] = (
+                            coeffs_isc_off.shape[iaxis] + inv_sc_diff[iaxis]
+                        )
+
+                # Get the supercell offset index of jcol with respect to icol
+                jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
+                # And use it to calculate the supercell index of the j orbital in this ij pair
+                sc_jcol = jpair_sc * uc_ncol + uc_jcol
+
+                # Do the same for the ji pair
+                ipair_sc = coeffs_isc_off[
+                    inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
+                ]
+                sc_icol = ipair_sc * uc_ncol + uc_icol
+
+            # Get the index needed to find the coefficients that we want from the coeffs array.
+            if same_cell:
+                if icol == jcol:
+                    coeff_index = dense_idx[uc_icol, uc_jcol]
+                    coeff_index2 = 0
+                else:
+                    coeff_index = dense_idx[uc_icol, uc_jcol]
+                    coeff_index2 = dense_idx[uc_jcol, uc_icol]
+            else:
+                coeff_index = dense_idx[uc_icol, sc_jcol]
+                coeff_index2 = dense_idx[uc_jcol, sc_icol]
+
+            # If the index for the needed (row, col) element is -1, it means that the element is 0.
+            # Just go to next iteration if all elements that we need are 0. Note that we assume here
+            # that if (row, col) is zero (col, row) is also zero.
+            if coeff_index < 0:
+                continue
+
+            # Add the contribution of this column pair to the row total value. Note that we only
+            # multiply the coefficients by data[j] here. This is because this loop is over all j
+            # that pair with a given i. data[i] is a common factor and therefore we can multiply
+            # after the loop to save operations.
+
+            # Do it for all coefficients.
+            for icoeff in range(ncoeffs):
+                if same_cell and icol == jcol:
+                    i_row_value[icoeff] += coeffs[coeff_index, icoeff] * data[j]
+                else:
+                    i_row_value[icoeff] += (
+                        coeffs[coeff_index, icoeff] + coeffs[coeff_index2, icoeff]
+                    ) * data[j]
+
+        for icoeff in range(ncoeffs):
+            # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
+            # And add the contribution of all ij pairs for this i to the output.
+            out[icoeff] += i_row_value[icoeff] * data[i]
 
 
 @cython.boundscheck(False)
@@ -307,6 +831,7 @@ def reduce_sc_products(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.floating[:],
+    num_threads: cython.int = 1,
 ):
     """For each row, sums all possible products between column pairs.
 
@@ -346,157 +871,87 @@ def reduce_sc_products(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
-    nrows = ptr.shape[0] - 1
+    nrows: cython.int = ptr.shape[0] - 1
 
     # Indices to handle rows
     row: cython.int
+    orow: cython.int
     reduced_row: cython.int
-
-    # Indices to handle pairs of columns (ij)
-    i: cython.int
-    icol: cython.int
-    uc_icol: cython.int
-    sc_icol: cython.int
-    icol_sc: cython.int
-    ipair_sc: cython.int
-
-    j: cython.int
-    jcol: cython.int
-    uc_jcol: cython.int
-    sc_jcol: cython.int
-    jcol_sc: cython.int
-    jpair_sc: cython.int
-
-    # Index to loop over axes of the grid.
+    tid: cython.int
     iaxis: cython.int
 
-    # Variables that will help managing orbital pairs that are not within the same cell.
-    sc_diff: cython.int[3]
-    inv_sc_diff: cython.int[3]
-    force_same_cell: cython.bint
-    same_cell: cython.bint
-
     # Boolean to store whether we should reduce row indices
     grid_reduce: cython.bint = reduce_factor > 1
     # Do we need to transpose while reducing?
-    need_transpose: cython.bint = new_axes.shape[0] > 1
+    need_transpose: cython.bint = grid_reduce and new_axes.shape[0] > 1
+    nthreads: cython.int = max(num_threads, 1)
+
+    row_value: cython.floating
 
     # Calculate the number of cells in each direction that the supercell is built of.
     # This will be useful just to convert negative supercell indices to positive ones.
     # If the number of supercells is 1, we assume that even intercell overlaps
     # (if any) have been stored in the unit cell. This is what SIESTA does for gamma point calculations
     # with nsc <= 3.
-    force_same_cell = True
-    coeffs_nsc = coeffs_isc_off.shape
+    force_same_cell: cython.bint = True
     for iaxis in range(3):
-        if coeffs_nsc[iaxis] != 1:
+        if coeffs_isc_off.shape[iaxis] != 1:
             force_same_cell = False
 
-    # Loop over rows.
-    for row in range(nrows):
-        # Get the potentially reduced index of the output row where we should store the
-        # results for this row.
-        reduced_row = row
-        if grid_reduce:
-
-            if need_transpose:
-                reduced_row = transpose_raveled_index(row, grid_shape, new_axes)
-
-            reduced_row = reduced_row // reduce_factor
-
-        # Get the limits of this row
-        row_start = ptr[row]
-        row_end = ptr[row + 1]
-
-        # Initialize the row value.
-        row_value: cython.floating = 0
-
-        # For each row, loop over pairs of columns (ij).
-        # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
-        # We do this because it is very easy if orbitals i and j are in the same cell. We also save
-        # some computation if they are not.
-        for i in range(row_start, row_end):
-            icol = col[i]
-
-            # Initialize the value for all pairs that we found for i
-            i_row_value: cython.floating = 0
-
-            # Precompute the supercell index of icol (will compare it to that of jcol)
-            icol_sc = icol // uc_ncol
-            # And also its unit cell index
-            uc_icol = icol % uc_ncol
-
-            # Get also the
-            for j in range(i, row_end):
-                jcol = col[j]
-
-                jcol_sc = jcol // uc_ncol
-                # Get the unit cell index of jcol
-                uc_jcol = jcol % uc_ncol
-
-                same_cell = force_same_cell
-                # If same cell interactions are not forced, we need to discover if this pair
-                # of columns is within the same cell.
-                if not force_same_cell:
-                    same_cell = icol_sc == jcol_sc
-
-                # If the columns are not in the same cell, we need to
-                # (1) Calculate the supercell offset between icol and jcol
-                # (2) And then calculate the new index for jcol, moving icol to the unit cell
-                # (3) Do the same in the reverse direction (jcol -> icol)
-                if not same_cell:
-                    # Calculate the sc offset between both orbitals.
-                    for iaxis in range(3):
-                        sc_diff[iaxis] = (
-                            data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
-                        )
-                        # Calculate also the offset in the reverse direction
-                        inv_sc_diff[iaxis] = -sc_diff[iaxis]
-
-                        # If the sc_difference is negative, convert it to positive so that we can
-                        # use it to index the isc_off array (we switched off the handling of negative
-                        # indices in cython with wraparound(False))
-                        if sc_diff[iaxis] < 0:
-                            sc_diff[iaxis] = coeffs_nsc[iaxis] + sc_diff[iaxis]
-                        elif inv_sc_diff[iaxis] < 0:
-                            inv_sc_diff[iaxis] = coeffs_nsc[iaxis] + inv_sc_diff[iaxis]
-
-                    # Get the supercell offset index of jcol with respect to icol
-                    jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
-                    # And use it to calculate the supercell index of the j orbital in this ij pair
-                    sc_jcol = jpair_sc * uc_ncol + uc_jcol
-
-                    # Do the same for the ji pair
-                    ipair_sc = coeffs_isc_off[
-                        inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
-                    ]
-                    sc_icol = ipair_sc * uc_ncol + uc_icol
-
-                # Add the contribution of this column pair to the row total value. Note that we only
-                # multiply the coefficients by data[j] here. This is because this loop is over all j
-                # that pair with a given i. data[i] is a common factor and therefore we can multiply
-                # after the loop to save operations.
-                if same_cell:
-                    if icol == jcol:
-                        i_row_value += coeffs[uc_icol, uc_jcol] * data[j]
-                    else:
-                        i_row_value += (
-                            coeffs[uc_icol, uc_jcol] + coeffs[uc_jcol, uc_icol]
-                        ) * data[j]
-                else:
-                    i_row_value += (
-                        coeffs[uc_icol, sc_jcol] + coeffs[uc_jcol, sc_icol]
-                    ) * data[j]
-
-            # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
-            i_row_value *= data[i]
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.floating[:, :] = np.zeros(
+            (nthreads, out.shape[0]), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="guided"):
+            reduced_row = (
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
+            )
+            out_t[threadid(), reduced_row] += _sc_products_row(
+                row,
+                data,
+                ptr,
+                col,
+                coeffs,
+                uc_ncol,
+                data_sc_off,
+                coeffs_isc_off,
+                force_same_cell,
+            )
 
-            # Add the contribution of all ij pairs for this i to the row value.
-            row_value += i_row_value
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements.
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="guided",
+        ):
+            row_value = 0
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                row_value = row_value + _sc_products_row(
+                    row,
+                    data,
+                    ptr,
+                    col,
+                    coeffs,
+                    uc_ncol,
+                    data_sc_off,
+                    coeffs_isc_off,
+                    force_same_cell,
+                )
 
-        # Store the row value in the output
-        out[reduced_row] = out[reduced_row] + row_value
+            # Store the row value in the output
+            out[orow] = out[orow] + row_value
 
 
 @cython.boundscheck(False)
@@ -514,6 +969,7 @@ def reduce_sc_products_multicoeffs(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.floating[:, :],
+    num_threads: cython.int = 1,
 ):
     """For each row, sums all possible products between column pairs.
 
@@ -552,173 +1008,95 @@ def reduce_sc_products_multicoeffs(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
-    nrows = ptr.shape[0] - 1
+    nrows: cython.int = ptr.shape[0] - 1
 
     # Indices to handle rows
     row: cython.int
+    orow: cython.int
     reduced_row: cython.int
-
-    # Indices to handle pairs of columns (ij)
-    i: cython.int
-    icol: cython.int
-    uc_icol: cython.int
-    sc_icol: cython.int
-    icol_sc: cython.int
-    ipair_sc: cython.int
-
-    j: cython.int
-    jcol: cython.int
-    uc_jcol: cython.int
-    sc_jcol: cython.int
-    jcol_sc: cython.int
-    jpair_sc: cython.int
-
-    # Variables to handle multiple productcoefficients
-    ncoeffs: cython.int = coeffs.shape[2]
-    icoeff: cython.int
-
-    # Temporal storage to build values
-    row_value: cython.floating[:] = np.zeros(ncoeffs, dtype=np.asarray(data).dtype)
-    i_row_value: cython.floating[:] = np.zeros(ncoeffs, dtype=np.asarray(data).dtype)
-
-    # Index to loop over axes of the grid.
+    tid: cython.int
     iaxis: cython.int
 
-    # Variables that will help managing orbital pairs that are not within the same cell.
-    sc_diff: cython.int[3]
-    inv_sc_diff: cython.int[3]
-    force_same_cell: cython.bint
-    same_cell: cython.bint
-
     # Boolean to store whether we should reduce row indices
     grid_reduce: cython.bint = reduce_factor > 1
     # Do we need to transpose while reducing?
-    need_transpose: cython.bint = new_axes.shape[0] > 1
+    need_transpose: cython.bint = grid_reduce and new_axes.shape[0] > 1
+    nthreads: cython.int = max(num_threads, 1)
+
+    # Variables to handle multiple product coefficients
+    ncoeffs: cython.int = coeffs.shape[2]
+
+    # Temporary (per thread) storage to build values
+    i_row_value: cython.floating[:, :] = np.zeros(
+        (nthreads, ncoeffs), dtype=np.asarray(data).dtype
+    )
 
     # Calculate the number of cells in each direction that the supercell is built of.
     # This will be useful just to convert negative supercell indices to positive ones.
     # If the number of supercells is 1, we assume that even intercell overlaps
     # (if any) have been stored in the unit cell. This is what SIESTA does for gamma point calculations
     # with nsc <= 3.
-    force_same_cell = True
-    coeffs_nsc = coeffs_isc_off.shape
+    force_same_cell: cython.bint = True
     for iaxis in range(3):
-        if coeffs_nsc[iaxis] != 1:
+        if coeffs_isc_off.shape[iaxis] != 1:
             force_same_cell = False
 
-    # Loop over rows.
-    for row in range(nrows):
-        # Get the potentially reduced index of the output row where we should store the
-        # results for this row.
-        reduced_row = row
-        if grid_reduce:
-
-            if need_transpose:
-                reduced_row = transpose_raveled_index(row, grid_shape, new_axes)
-
-            reduced_row = reduced_row // reduce_factor
-
-        # Get the limits of this row
-        row_start = ptr[row]
-        row_end = ptr[row + 1]
-
-        # Initialize the row value.
-        row_value[:] = 0
-
-        # For each row, loop over pairs of columns (ij).
-        # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
-        # We do this because it is very easy if orbitals i and j are in the same cell. We also save
-        # some computation if they are not.
-        for i in range(row_start, row_end):
-            icol = col[i]
-            # Initialize the value for all pairs that we found for i
-            i_row_value[:] = 0
-
-            # Precompute the supercell index of icol (will compare it to that of jcol)
-            icol_sc = icol // uc_ncol
-            # And also its unit cell index
-            uc_icol = icol % uc_ncol
-
-            # Get also the
-            for j in range(i, row_end):
-                jcol = col[j]
-
-                jcol_sc = jcol // uc_ncol
-                # Get the unit cell index of jcol
-                uc_jcol = jcol % uc_ncol
-
-                same_cell = force_same_cell
-                # If same cell interactions are not forced, we need to discover if this pair
-                # of columns is within the same cell.
-                if not force_same_cell:
-                    same_cell = icol_sc == jcol_sc
-
-                # If the columns are not in the same cell, we need to
-                # (1) Calculate the supercell offset between icol and jcol
-                # (2) And then calculate the new index for jcol, moving icol to the unit cell
-                # (3) Do the same in the reverse direction (jcol -> icol)
-                if not same_cell:
-                    # Calculate the sc offset between both orbitals.
-                    for iaxis in range(3):
-                        sc_diff[iaxis] = (
-                            data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
-                        )
-                        # Calculate also the offset in the reverse direction
-                        inv_sc_diff[iaxis] = -sc_diff[iaxis]
-
-                        # If the sc_difference is negative, convert it to positive so that we can
-                        # use it to index the isc_off array (we switched off the handling of negative
-                        # indices in cython with wraparound(False))
-                        if sc_diff[iaxis] < 0:
-                            sc_diff[iaxis] = coeffs_nsc[iaxis] + sc_diff[iaxis]
-                        elif inv_sc_diff[iaxis] < 0:
-                            inv_sc_diff[iaxis] = coeffs_nsc[iaxis] + inv_sc_diff[iaxis]
-
-                    # Get the supercell offset index of jcol with respect to icol
-                    jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
-                    # And use it to calculate the supercell index of the j orbital in this ij pair
-                    sc_jcol = jpair_sc * uc_ncol + uc_jcol
-
-                    # Do the same for the ji pair
-                    ipair_sc = coeffs_isc_off[
-                        inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
-                    ]
-                    sc_icol = ipair_sc * uc_ncol + uc_icol
-
-                # Add the contribution of this column pair to the row total value. Note that we only
-                # multiply the coefficients by data[j] here. This is because this loop is over all j
-                # that pair with a given i. data[i] is a common factor and therefore we can multiply
-                # after the loop to save operations.
-
-                # Do it for all coefficients.
-                for icoeff in range(ncoeffs):
-                    if same_cell:
-                        if icol == jcol:
-                            i_row_value[icoeff] += (
-                                coeffs[uc_icol, uc_jcol, icoeff] * data[j]
-                            )
-                        else:
-                            i_row_value[icoeff] += (
-                                coeffs[uc_icol, uc_jcol, icoeff]
-                                + coeffs[uc_jcol, uc_icol, icoeff]
-                            ) * data[j]
-                    else:
-                        i_row_value[icoeff] += (
-                            coeffs[uc_icol, sc_jcol, icoeff]
-                            + coeffs[uc_jcol, sc_icol, icoeff]
-                        ) * data[j]
-
-            for icoeff in range(ncoeffs):
-                # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
-                i_row_value[icoeff] *= data[i]
-
-                # Add the contribution of all ij pairs for this i to the row value.
-                row_value[icoeff] += i_row_value[icoeff]
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.floating[:, :, :] = np.zeros(
+            (nthreads, out.shape[0], ncoeffs), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="guided"):
+            reduced_row = (
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
+            )
+            tid = threadid()
+            _sc_products_multicoeffs_row(
+                row,
+                data,
+                ptr,
+                col,
+                coeffs,
+                uc_ncol,
+                data_sc_off,
+                coeffs_isc_off,
+                force_same_cell,
+                i_row_value[tid],
+                out_t[tid, reduced_row],
+            )
 
-        for icoeff in range(ncoeffs):
-            # Store the row value in the output
-            out[reduced_row, icoeff] = out[reduced_row, icoeff] + row_value[icoeff]
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements (which are owned by the thread).
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="guided",
+        ):
+            tid = threadid()
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                _sc_products_multicoeffs_row(
+                    row,
+                    data,
+                    ptr,
+                    col,
+                    coeffs,
+                    uc_ncol,
+                    data_sc_off,
+                    coeffs_isc_off,
+                    force_same_cell,
+                    i_row_value[tid],
+                    out[orow],
+                )
 
 
 @cython.boundscheck(False)
@@ -736,6 +1114,7 @@ def reduce_sc_products_multicoeffs_sparse_denseindex(
     grid_shape: cnp.int32_t[:],
     new_axes: cnp.int32_t[:],
     out: cython.floating[:, :],
+    num_threads: cython.int = 1,
 ):
     """For each row, sums all possible products between column pairs.
 
@@ -774,27 +1153,23 @@ def reduce_sc_products_multicoeffs_sparse_denseindex(
         If you don't want to transpose, pass an array of shape 0.
     out:
         The array where the output should be stored.
+    num_threads:
+        The number of threads used to loop the rows (OpenMP), see ``SISL_NUM_THREADS``.
     """
-    nrows = ptr.shape[0] - 1
+    nrows: cython.int = ptr.shape[0] - 1
 
     # Indices to handle rows
     row: cython.int
+    orow: cython.int
     reduced_row: cython.int
+    tid: cython.int
+    iaxis: cython.int
 
-    # Indices to handle pairs of columns (ij)
-    i: cython.int
-    icol: cython.int
-    uc_icol: cython.int
-    sc_icol: cython.int
-    icol_sc: cython.int
-    ipair_sc: cython.int
-
-    j: cython.int
-    jcol: cython.int
-    uc_jcol: cython.int
-    sc_jcol: cython.int
-    jcol_sc: cython.int
-    jpair_sc: cython.int
+    # Boolean to store whether we should reduce row indices
+    grid_reduce: cython.bint = reduce_factor > 1
+    # Do we need to transpose while reducing?
+    need_transpose: cython.bint = grid_reduce and new_axes.shape[0] > 1
+    nthreads: cython.int = max(num_threads, 1)
 
     # Extra variables to handle coefficients
     coeffs: cython.floating[:, :] = coeffs_csr.data
@@ -802,166 +1177,77 @@ def reduce_sc_products_multicoeffs_sparse_denseindex(
     dense_idx: cnp.int32_t[:, :] = dense_index(
         coeffs_csr.shape[:2], coeffs_csr.ptr, coeffs_csr.col
     )
-    coeff_index: cython.int
-    coeff_index2: cython.int
 
-    # Variables to handle multiple productcoefficients
+    # Variables to handle multiple product coefficients
     ncoeffs: cython.int = coeffs.shape[1]
-    icoeff: cython.int
-
-    # Temporal storage to build values
-    row_value: cython.floating[:] = np.zeros(ncoeffs, dtype=np.asarray(data).dtype)
-    i_row_value: cython.floating[:] = np.zeros(ncoeffs, dtype=np.asarray(data).dtype)
-
-    # Index to loop over axes of the grid.
-    iaxis: cython.int
 
-    # Variables that will help managing orbital pairs that are not within the same cell.
-    sc_diff: cython.int[3]
-    inv_sc_diff: cython.int[3]
-    force_same_cell: cython.bint
-    same_cell: cython.bint
-
-    # Boolean to store whether we should reduce row indices
-    grid_reduce: cython.bint = reduce_factor > 1
-    # Do we need to transpose while reducing?
-    need_transpose: cython.bint = new_axes.shape[0] > 1
+    # Temporary (per thread) storage to build values
+    i_row_value: cython.floating[:, :] = np.zeros(
+        (nthreads, ncoeffs), dtype=np.asarray(data).dtype
+    )
 
     # Calculate the number of cells in each direction that the supercell is built of.
     # This will be useful just to convert negative supercell indices to positive ones.
     # If the number of supercells is 1, we assume that even intercell overlaps
     # (if any) have been stored in the unit cell. This is what SIESTA does for gamma point calculations
     # with nsc <= 3.
-    force_same_cell = True
-    coeffs_nsc = coeffs_isc_off.shape
+    force_same_cell: cython.bint = True
     for iaxis in range(3):
-        if coeffs_nsc[iaxis] != 1:
+        if coeffs_isc_off.shape[iaxis] != 1:
             force_same_cell = False
 
-    # Loop over rows.
-    for row in range(nrows):
-        # Get the potentially reduced index of the output row where we should store the
-        # results for this row.
-        reduced_row = row
-        if grid_reduce:
-
-            if need_transpose:
-                reduced_row = transpose_raveled_index(row, grid_shape, new_axes)
-
-            reduced_row = reduced_row // reduce_factor
-
-        # Get the limits of this row
-        row_start = ptr[row]
-        row_end = ptr[row + 1]
-
-        # Initialize the row value.
-        row_value[:] = 0
-
-        # For each row, loop over pairs of columns (ij).
-        # We add both ij and ji contributions, therefore we only need to loop over j greater than i.
-        # We do this because it is very easy if orbitals i and j are in the same cell. We also save
-        # some computation if they are not.
-        for i in range(row_start, row_end):
-            icol = col[i]
-            # Initialize the value for all pairs that we found for i
-            i_row_value[:] = 0
-
-            # Precompute the supercell index of icol (will compare it to that of jcol)
-            icol_sc = icol // uc_ncol
-            # And also its unit cell index
-            uc_icol = icol % uc_ncol
-
-            # Get also the
-            for j in range(i, row_end):
-                jcol = col[j]
-
-                jcol_sc = jcol // uc_ncol
-                # Get the unit cell index of jcol
-                uc_jcol = jcol % uc_ncol
-
-                same_cell = force_same_cell
-                # If same cell interactions are not forced, we need to discover if this pair
-                # of columns is within the same cell.
-                if not force_same_cell:
-                    same_cell = icol_sc == jcol_sc
-
-                # If the columns are not in the same cell, we need to
-                # (1) Calculate the supercell offset between icol and jcol
-                # (2) And then calculate the new index for jcol, moving icol to the unit cell
-                # (3) Do the same in the reverse direction (jcol -> icol)
-                if not same_cell:
-                    # Calculate the sc offset between both orbitals.
-                    for iaxis in range(3):
-                        sc_diff[iaxis] = (
-                            data_sc_off[jcol_sc, iaxis] - data_sc_off[icol_sc, iaxis]
-                        )
-                        # Calculate also the offset in the reverse direction
-                        inv_sc_diff[iaxis] = -sc_diff[iaxis]
-
-                        # If the sc_difference is negative, convert it to positive so that we can
-                        # use it to index the isc_off array (we switched off the handling of negative
-                        # indices in cython with wraparound(False))
-                        if sc_diff[iaxis] < 0:
-                            sc_diff[iaxis] = coeffs_nsc[iaxis] + sc_diff[iaxis]
-                        elif inv_sc_diff[iaxis] < 0:
-                            inv_sc_diff[iaxis] = coeffs_nsc[iaxis] + inv_sc_diff[iaxis]
-
-                    # Get the supercell offset index of jcol with respect to icol
-                    jpair_sc = coeffs_isc_off[sc_diff[0], sc_diff[1], sc_diff[2]]
-                    # And use it to calculate the supercell index of the j orbital in this ij pair
-                    sc_jcol = jpair_sc * uc_ncol + uc_jcol
-
-                    # Do the same for the ji pair
-                    ipair_sc = coeffs_isc_off[
-                        inv_sc_diff[0], inv_sc_diff[1], inv_sc_diff[2]
-                    ]
-                    sc_icol = ipair_sc * uc_ncol + uc_icol
-
-                # Get the index needed to find the coefficients that we want from the coeffs array.
-                if same_cell:
-                    if icol == jcol:
-                        coeff_index = dense_idx[uc_icol, uc_jcol]
-                        coeff_index2 = 0
-                    else:
-                        coeff_index = dense_idx[uc_icol, uc_jcol]
-                        coeff_index2 = dense_idx[uc_jcol, uc_icol]
-                else:
-                    coeff_index = dense_idx[uc_icol, sc_jcol]
-                    coeff_index2 = dense_idx[uc_jcol, sc_icol]
-
-                # If the index for the needed (row, col) element is -1, it means that the element is 0.
-                # Just go to next iteration if all elements that we need are 0. Note that we assume here
-                # that if (row, col) is zero (col, row) is also zero.
-                if coeff_index < 0:
-                    continue
-
-                # Add the contribution of this column pair to the row total value. Note that we only
-                # multiply the coefficients by data[j] here. This is because this loop is over all j
-                # that pair with a given i. data[i] is a common factor and therefore we can multiply
-                # after the loop to save operations.
-
-                # Do it for all coefficients.
-                for icoeff in range(ncoeffs):
-                    if same_cell:
-                        if icol == jcol:
-                            i_row_value[icoeff] += coeffs[coeff_index, icoeff] * data[j]
-                        else:
-                            i_row_value[icoeff] += (
-                                coeffs[coeff_index, icoeff]
-                                + coeffs[coeff_index2, icoeff]
-                            ) * data[j]
-                    else:
-                        i_row_value[icoeff] += (
-                            coeffs[coeff_index, icoeff] + coeffs[coeff_index2, icoeff]
-                        ) * data[j]
-
-            for icoeff in range(ncoeffs):
-                # Multiply all the contributions of ij pairs with this i by data[i], as explained inside the j loop.
-                i_row_value[icoeff] *= data[i]
-
-                # Add the contribution of all ij pairs for this i to the row value.
-                row_value[icoeff] += i_row_value[icoeff]
+    if need_transpose:
+        # Several rows (not consecutive) may be reduced into the same output element.
+        # Each thread accumulates in its own copy of the output.
+        out_t: cython.floating[:, :, :] = np.zeros(
+            (nthreads, out.shape[0], ncoeffs), dtype=np.asarray(out).dtype
+        )
+        for row in prange(nrows, nogil=True, num_threads=nthreads, schedule="guided"):
+            reduced_row = (
+                transpose_raveled_index(row, grid_shape, new_axes) // reduce_factor
+            )
+            tid = threadid()
+            _sc_products_multicoeffs_sparse_row(
+                row,
+                data,
+                ptr,
+                col,
+                coeffs,
+                dense_idx,
+                uc_ncol,
+                data_sc_off,
+                coeffs_isc_off,
+                force_same_cell,
+                i_row_value[tid],
+                out_t[tid, reduced_row],
+            )
 
-        for icoeff in range(ncoeffs):
-            # Store the row value in the output
-            out[reduced_row, icoeff] = out[reduced_row, icoeff] + row_value[icoeff]
+        _add_threads(out, out_t)
+
+    else:
+        # Consecutive rows are reduced into the same output element, hence
+        # we parallelize over the output elements (which are owned by the thread).
+        for orow in prange(
+            _ceil_div(nrows, reduce_factor),
+            nogil=True,
+            num_threads=nthreads,
+            schedule="guided",
+        ):
+            tid = threadid()
+            for row in range(
+                orow * reduce_factor, min((orow + 1) * reduce_factor, nrows)
+            ):
+                _sc_products_multicoeffs_sparse_row(
+                    row,
+                    data,
+                    ptr,
+                    col,
+                    coeffs,
+                    dense_idx,
+                    uc_ncol,
+                    data_sc_off,
+                    coeffs_isc_off,
+                    force_same_cell,
+                    i_row_value[tid],
+                    out[orow],
+                )
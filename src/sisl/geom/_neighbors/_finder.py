@@ -287,8 +287,13 @@ class NeighborFinder:
                 ats_xyz = self.geometry.axyz(isc=isc)
                 all_xyz.append(ats_xyz)
 
+            # The auxiliary geometry is the tiled unit cell, shifted such that
+            # all atoms are inside it. This retains the periodicity.
+            self._bins_offset = (self.geometry.nsc // 2) @ self.geometry.cell
             self._bins_geometry = Geometry(
-                np.concatenate(all_xyz), atoms=self.geometry.atoms
+                np.concatenate(all_xyz) + self._bins_offset,
+                atoms=self.geometry.atoms,
+                lattice=self.geometry.cell * self.geometry.nsc.reshape(3, 1),
             )
 
             # Recompute lattice sizes
@@ -478,27 +483,23 @@ class NeighborFinder:
         split_ind: Union[int, np.ndarray],  # (n_queried_atoms, )
     ):
         """Correction to atom and supercell indices when the binning has been done on a tiled geometry"""
-        is_sc_neigh = neighbor_pairs[:, 1] >= self.geometry.na
         pbc = self.geometry.lattice.pbc
 
         invalid = None
-        if not np.any(pbc):
-            invalid = is_sc_neigh
-        else:
-            pbc_neighs = neighbor_pairs.copy()
+        pbc_neighs = neighbor_pairs.copy()
 
-            sc_neigh, uc_neigh = np.divmod(
-                neighbor_pairs[:, 1][is_sc_neigh], self.geometry.na
-            )
-            isc_neigh = self.geometry.sc_off[sc_neigh]
+        # The supercell index of the tiled geometry, plus the
+        # periodic images of the tiled geometry itself
+        sc_neigh, uc_neigh = np.divmod(neighbor_pairs[:, 1], self.geometry.na)
+        isc_neigh = self.geometry.sc_off[sc_neigh]
 
-            pbc_neighs[is_sc_neigh, 1] = uc_neigh
-            pbc_neighs[is_sc_neigh, 2:] = isc_neigh
+        pbc_neighs[:, 1] = uc_neigh
+        pbc_neighs[:, 2:] = neighbor_pairs[:, 2:] * self.geometry.nsc + isc_neigh
 
-            if not np.all(pbc):
-                invalid = pbc_neighs[:, 2:][:, ~pbc].any(axis=1)
+        if not np.all(pbc):
+            invalid = pbc_neighs[:, 2:][:, ~pbc].any(axis=1)
 
-            neighbor_pairs = pbc_neighs
+        neighbor_pairs = pbc_neighs
 
         if invalid is not None:
             neighbor_pairs = neighbor_pairs[~invalid]
@@ -543,8 +544,9 @@ class NeighborFinder:
         thresholds = np.full(self._bins_geometry.na, self._aux_R, dtype=np.float64)
 
         # Get search indices
+        # NOTE: the first atoms in the binned geometry are the unit-cell atoms
         search_indices, isc = self._get_search_indices(
-            self.geometry.fxyz[atoms], cartesian=False
+            self._bins_geometry.fxyz[atoms], cartesian=False
         )
 
         # Get atom counts
@@ -685,9 +687,12 @@ class NeighborFinder:
         thresholds = np.full(self._bins_geometry.na, self._aux_R, dtype=np.float64)
 
         xyz = np.atleast_2d(xyz).astype(float)
+        bins_xyz = xyz
+        if self._R_too_big:
+            bins_xyz = xyz + self._bins_offset
         # Get search indices
         search_indices, isc = self._get_search_indices(
-            xyz.dot(self._bins_geometry.icell.T) % 1, cartesian=False
+            bins_xyz.dot(self._bins_geometry.icell.T) % 1, cartesian=False
         )
 
         # Get atom counts
@@ -703,7 +708,7 @@ class NeighborFinder:
 
         # Find the neighbor pairs
         neighbor_pairs, split_ind = _operations.get_close(
-            xyz,
+            bins_xyz,
             search_indices,
             isc,
             self._heads,
@@ -321,6 +321,25 @@ def test_R_too_big(pbc):
             assert np.all(point_neighs.isc == expected_point_neighs[:, 2:])
 
 
+def test_R_too_big_skewed():
+    """Compare neighbors against Geometry.close when the binning
+    is done on a tiled (non-orthogonal) cell."""
+    lattice = Lattice([[1.5, 0.8, 0], [1.5, -0.8, 0], [0, 0, 10]], nsc=[7, 7, 1])
+    geom = Geometry([[0, 0, 0], [1, 0, 0]], lattice=lattice)
+    R = 2.5
+
+    finder = NeighborFinder(geom, R=R)
+    assert finder._R_too_big
+    neighs = finder.find_neighbors(self_interaction=True)
+
+    found = set(map(tuple, neighs._finder_results.tolist()))
+    expected = set()
+    for ia in geom:
+        for ja in geom.close(ia, R=R - 1e-8):
+            expected.add((ia, ja % geom.na, *geom.a2isc(ja).tolist()))
+    assert found == expected
+
+
 def test_bin_sizes():
     geom = Geometry([[0, 0, 0], [1, 0, 0]], lattice=[2, 10, 10])
 
@@ -0,0 +1,191 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, you can obtain one at https://mozilla.org/MPL/2.0/.
+cimport cython
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.math cimport fabs, floor, isfinite, log10, signbit
+from libc.stdio cimport snprintf
+from libc.stdlib cimport free, malloc, realloc
+
+__all__ = ["format_values"]
+
+# Powers of 10 used for the fast exponential formatting
+cdef double _pow10[309]
+for _i in range(309):
+    _pow10[_i] = float(f"1e{_i}")
+
+# Largest precision of the fast exponential formatting
+# (the scaled mantissa should be exactly representable as an integer)
+cdef enum:
+    MAX_FAST_PRECISION = 12
+
+
+@cython.cdivision(True)
+cdef inline int _format_e(char *buf, double x, int prec) noexcept nogil:
+    """Format `x` as ``printf("%.<prec>e", x)``, returns the number of characters
+
+    If the value cannot be reliably formatted (non-finite, subnormal or very
+    close to a rounding tie) -1 is returned and nothing is written.
+    Requires at least ``prec + 9`` characters in `buf`.
+    """
+    cdef double ax = fabs(x)
+    cdef double scaled, frac
+    cdef long long digits, lim
+    cdef int e, p, i, n = 0
+
+    if not isfinite(x) or (ax != 0. and ax < 1e-290) or ax > 1e290:
+        return -1
+
+    if ax == 0.:
+        digits = 0
+        e = 0
+    else:
+        e = <int> floor(log10(ax))
+        p = prec - e
+        if p >= 0:
+            scaled = ax * _pow10[p]
+        else:
+            scaled = ax / _pow10[-p]
+
+        lim = 1
+        for i in range(prec):
+            lim *= 10
+        # correct for the imprecise log10
+        if scaled < lim:
+            e -= 1
+            scaled *= 10
+        elif scaled >= lim * 10:
+            e += 1
+            scaled /= 10
+
+        frac = scaled - floor(scaled)
+        if fabs(frac - 0.5) < scaled * 1e-15:
+            # too close to a rounding tie, let printf decide
+            return -1
+        digits = <long long> floor(scaled + 0.5)
+        if digits >= lim * 10:
+            digits //= 10
+            e += 1
+
+    if signbit(x):
+        buf[n] = b"-"
+        n += 1
+
+    # write the mantissa digits (backwards)
+    if prec > 0:
+        for i in range(n + prec + 1, n + 1, -1):
+            buf[i] = <char> (48 + digits % 10)
+            digits //= 10
+        buf[n + 1] = b"."
+        buf[n] = <char> (48 + digits)
+        n += prec + 2
+    else:
+        buf[n] = <char> (48 + digits)
+        n += 1
+
+    buf[n] = b"e"
+    if e < 0:
+        buf[n + 1] = b"-"
+        e = -e
+    else:
+        buf[n + 1] = b"+"
+    n += 2
+    if e >= 100:
+        buf[n] = <char> (48 + e // 100)
+        n += 1
+        e %= 100
+    buf[n] = <char> (48 + e // 10)
+    buf[n + 1] = <char> (48 + e % 10)
+    return n + 2
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def format_values(const double[::1] values, bytes fmt, Py_ssize_t ncol=1, Py_ssize_t offset=0):
+    """Format `values` as text using the C format `fmt` with `ncol` values per line
+
+    The formatting does not hold the GIL.
+
+    Parameters
+    ----------
+    values :
+        the values to be formatted
+    fmt :
+        C (``printf``) format for a single value, e.g. ``b"%.5e"``
+    ncol :
+        number of values per line, values on a line are separated by a space
+    offset :
+        the global index of the first value, used to determine the column
+        of the first value. This allows formatting a long array in chunks.
+
+    Returns
+    -------
+    bytes
+        the formatted values, if the last value does not end a line it is
+        followed by a space.
+    """
+    cdef const char *cfmt = fmt
+    cdef Py_ssize_t n = values.shape[0]
+    cdef Py_ssize_t cap = n * 16 + 64
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t col = offset % ncol
+    cdef Py_ssize_t i
+    cdef int ret
+    cdef bint failed = False
+    cdef int prec = -1
+    cdef bytes digits
+    cdef char *buf
+    cdef char *tmp
+
+    # check for the simple exponential format (%.<prec>e)
+    digits = fmt[2 : len(fmt) - 1]
+    if fmt.startswith(b"%.") and fmt.endswith(b"e") and digits.isdigit():
+        prec = int(digits)
+        if prec > MAX_FAST_PRECISION:
+            prec = -1
+        else:
+            cap = n * (prec + 10) + 64
+
+    buf = <char *> malloc(cap)
+
+    if buf == NULL:
+        raise MemoryError("format_values could not allocate the text buffer")
+
+    with nogil:
+        for i in range(n):
+            if prec >= 0 and cap - pos > prec + 10:
+                ret = _format_e(buf + pos, values[i], prec)
+                if ret < 0:
+                    ret = snprintf(buf + pos, cap - pos, cfmt, values[i])
+            else:
+                ret = snprintf(buf + pos, cap - pos, cfmt, values[i])
+            if ret < 0:
+                failed = True
+                break
+            if ret + 1 >= cap - pos:
+                # grow the buffer and redo the formatting
+                cap = cap * 2 + ret + 1
+                tmp = <char *> realloc(buf, cap)
+                if tmp == NULL:
+                    failed = True
+                    break
+                buf = tmp
+                ret = snprintf(buf + pos, cap - pos, cfmt, values[i])
+
+            pos += ret
+            col += 1
+            if col == ncol:
+                buf[pos] = b"\n"
+                col = 0
+            else:
+                buf[pos] = b" "
+            pos += 1
+
+    if failed:
+        free(buf)
+        raise ValueError("format_values could not format the values")
+
+    try:
+        return PyBytes_FromStringAndSize(buf, pos)
+    finally:
+        free(buf)
@@ -3,16 +3,22 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from re import compile as re_compile
 from typing import Optional, Union
 
 import numpy as np
 
 from sisl import Atoms, AtomUnknown, Geometry
+from sisl._environ import get_environ_variable
 from sisl.messages import warn
 
+from ._format import format_values
+
 __all__ = ["starts_with_list", "header_to_dict", "grid_reduce_indices", "parse_order"]
+__all__ += ["read_values", "write_grid_values"]
 __all__ += ["_fill_basis_empty", "_replace_basis"]
 
 
@@ -66,6 +72,131 @@ def grid_reduce_indices(grids, factors, axis=0, out=None):
     return grid
 
 
+def read_values(read, buffersize: int = 2**20) -> Iterator[np.ndarray]:
+    """Parse white-space separated floating point values from text in chunks
+
+    The text is read in chunks of `buffersize` characters, and each chunk
+    is parsed in bulk (C-parsing), thus avoiding creating a Python object for
+    each value. Chunks are split at the last white-space character
+    (space, tab or newline) to ensure values are not split across chunks.
+
+    Parameters
+    ----------
+    read : callable
+        function used to read text, called as ``read(buffersize)``, e.g. ``fh.read``.
+        An empty string signals the end of the text.
+    buffersize :
+        number of characters read per chunk
+
+    Yields
+    ------
+    numpy.ndarray
+        the values of the next chunk (may be empty)
+    """
+    rest = ""
+    while True:
+        block = read(buffersize)
+        if block:
+            # retain the last (possibly incomplete) value for the next block
+            block = rest + block
+            i = max(block.rfind(c) for c in " \t\n\r")
+            if i < 0:
+                rest = block
+                continue
+            block, rest = block[:i], block[i:]
+        elif rest:
+            block, rest = rest, ""
+        else:
+            return
+
+        if block.strip():
+            yield np.fromstring(block, dtype=np.float64, sep=" ")
+        # else numpy parses white-space only strings as [-1.]
+
+
+# python format specifications that are equivalent in C (printf)
+_C_FLOAT_FMT = re_compile(r"^[+ ]?#?0?\d*(\.\d+)?[eEfFgG]$")
+
+
+def write_grid_values(
+    write,
+    values: np.ndarray,
+    fmt: str = ".5e",
+    ncol: int = 1,
+    buffersize: int = 2**16,
+    threads: Optional[int] = None,
+) -> None:
+    """Write the values of a 3D array in C-order as formatted text
+
+    The values are formatted in chunks of planes (along the first axis) by a compiled
+    routine, thus avoiding Python objects for each value.
+    With multiple `threads` the chunks are formatted concurrently while
+    the formatted chunks are written (in order).
+
+    Parameters
+    ----------
+    write : callable
+        function used to write the (string) text, e.g. ``Sile._write``
+    values :
+        the values to write, does not need to be contiguous (e.g. a transposed grid)
+    fmt :
+        the Python format specification of a single value
+    ncol :
+        number of values per line
+    buffersize :
+        (approximate) number of values formatted per chunk
+    threads :
+        number of threads used for formatting, defaults to ``SISL_NUM_THREADS``
+    """
+    values = np.asarray(values)
+    if values.ndim != 3:
+        values = values.reshape(-1, 1, 1)
+    if threads is None:
+        threads = get_environ_variable("SISL_NUM_THREADS")
+
+    if _C_FLOAT_FMT.match(fmt):
+        cfmt = f"%{fmt}".encode()
+
+        def fmt_chunk(chunk, offset):
+            chunk = np.ascontiguousarray(chunk, dtype=np.float64).ravel()
+            return format_values(chunk, cfmt, ncol, offset).decode()
+
+    else:
+        # fall back to python formatting
+        _fmt = "{:" + fmt + "}"
+
+        def fmt_chunk(chunk, offset):
+            out = []
+            for i, v in enumerate(chunk.ravel().tolist(), offset + 1):
+                out.append(_fmt.format(v))
+                out.append(" " if i % ncol else "\n")
+            return "".join(out)
+
+    plane = values[0].size
+    nplanes = max(1, buffersize // max(1, plane))
+    chunks = range(0, values.shape[0], nplanes)
+
+    def fmt_planes(i):
+        return fmt_chunk(values[i : i + nplanes], i * plane)
+
+    if threads > 1 and len(chunks) > 1:
+        # Limit the number of pending chunks to control the memory usage
+        with ThreadPoolExecutor(threads) as executor:
+            pending = deque()
+            for i in chunks:
+                pending.append(executor.submit(fmt_planes, i))
+                if len(pending) > threads:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    else:
+        for i in chunks:
+            write(fmt_planes(i))
+
+    if values.size % ncol != 0:
+        write("\n")
+
+
 def _listify_str(arg):
     if isinstance(arg, str):
         return [arg]
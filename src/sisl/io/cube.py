@@ -3,17 +3,22 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 
+import sisl._array as _a
 from sisl import Atom, Geometry, Grid, Lattice, SislError
 from sisl._internal import set_module
 
 # Import sile objects
 from sisl.io.sile import *
 from sisl.messages import deprecate_argument
+from sisl.typing import CellAxis
 from sisl.unit import unit_convert
+from sisl.utils.misc import direction
 
-from ._help import header_to_dict
+from ._help import header_to_dict, read_values, write_grid_values
 
 __all__ = ["cubeSile"]
 
@@ -165,7 +170,10 @@ class cubeSile(Sile):
             The grid data is assumed to be unit-less, this unit only refers
             to the lattice vectors and atomic coordinates.
         buffersize : int, optional
-           size of the buffer while writing the data, (6144)
+           (approximate) number of values formatted at a time, (65536)
+        threads : int, optional
+           number of threads used to format the data while writing,
+           defaults to ``SISL_NUM_THREADS``
         """
         # Check that we can write to the file
         sile_raise_write(self)
@@ -179,42 +187,19 @@ class cubeSile(Sile):
                 grid.geometry, size=grid.shape, unit=unit, *args, **kwargs
             )
 
-        buffersize = kwargs.get("buffersize", min(6144, grid.grid.size))
-        buffersize += buffersize % 6  # ensure multiple of 6
-
         # A CUBE file contains grid-points aligned like this:
         # for x
         #   for y
         #     for z
         #       write...
-        _fmt1 = "{:" + fmt + "} "
-        _fmt6 = (_fmt1 * 6)[:-1] + "\n"
-        __fmt = _fmt6 * (buffersize // 6)
-
-        if imag:
-            for z in np.nditer(
-                np.asarray(grid.grid.imag, order="C").reshape(-1),
-                flags=["external_loop", "buffered"],
-                op_flags=[["readonly"]],
-                order="C",
-                buffersize=buffersize,
-            ):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + "\n"
-                self._write(__fmt.format(*z.tolist()))
-        else:
-            for z in np.nditer(
-                np.asarray(grid.grid.real, order="C").reshape(-1),
-                flags=["external_loop", "buffered"],
-                op_flags=[["readonly"]],
-                order="C",
-                buffersize=buffersize,
-            ):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + "\n"
-                self._write(__fmt.format(*z.tolist()))
+        write_grid_values(
+            self._write,
+            grid.grid.imag if imag else grid.grid.real,
+            fmt,
+            ncol=6,
+            buffersize=kwargs.get("buffersize", 2**16),
+            threads=kwargs.get("threads"),
+        )
 
         # Add a finishing line to ensure empty ending
         self._write("\n")
@@ -288,19 +273,90 @@ class cubeSile(Sile):
 
         return Geometry(xyz * unit2Ang, atom, lattice=lattice)
 
+    def _r_grid_values(self, shape, axis=None, slab=None, buffersize=None):
+        """Parse the (remaining) grid values of the file into an array of `shape`
+
+        The values are parsed in chunks of text (C-parsing), thus avoiding
+        creating a Python object for each value. If `slab` is given only those
+        indices along `axis` are retained (`shape` is the full shape of the grid).
+        """
+        if buffersize is None:
+            buffersize = 2**20
+
+        strides = np.cumprod([1] + list(shape[:0:-1]))[::-1]
+        size = np.prod(shape)
+
+        if slab is None:
+            out = np.empty(size, dtype=np.float64)
+            keep = None
+        else:
+            shape = list(shape)
+            n = shape[axis]
+            keep = np.zeros(n, dtype=bool)
+            keep[slab] = True
+            stride = strides[axis]
+            shape[axis] = len(slab)
+            out = np.empty(np.prod(shape), dtype=np.float64)
+            if axis == 0:
+                # no need to read beyond the last requested value
+                size = stride * (slab[-1] + 1)
+
+        # offset in the full grid, and offset in the output
+        offset = ioff = 0
+        for values in read_values(self.fh.read, buffersize):
+            values = values[: size - offset]
+            nv = len(values)
+            if keep is not None:
+                idx = np.arange(offset, offset + nv) // stride % n
+                values = values[keep[idx]]
+            out[ioff : ioff + len(values)] = values
+            offset += nv
+            ioff += len(values)
+            if offset >= size:
+                break
+
+        if ioff != out.size:
+            raise SislError(
+                f"{self!s}.read_grid could not read all grid values "
+                f"({ioff} out of {out.size})."
+            )
+        return out.reshape(shape)
+
     @sile_fh_open()
-    def read_grid(self, imag=None) -> Grid:
+    def read_grid(
+        self,
+        imag=None,
+        axis: Optional[CellAxis] = None,
+        slab=None,
+        buffersize: Optional[int] = None,
+    ) -> Grid:
         """Returns `Grid` object from the CUBE file
 
+        The grid values are parsed in chunks of text directly into the grid
+        array. Additionally one may only read a slab of the grid along one lattice
+        direction, which is equivalent to (but much less memory demanding than)
+        ``sile.read_grid(...).sub(slab, axis)``.
+
         Parameters
         ----------
         imag : str or Sile or Grid
             the imaginary part of the grid. If the geometries does not match
             an error will be raised.
+        axis :
+            the lattice direction of `slab`
+        slab : int or array_like or slice, optional
+            only read these indices of the grid along `axis`.
+            Reading a slab along the first lattice vector stops reading
+            the file after the last requested index.
+        buffersize :
+            number of characters parsed at a time, default to 1 MB
         """
         if not imag is None:
             if not isinstance(imag, Grid):
-                imag = Grid.read(imag)
+                if slab is None:
+                    imag = Grid.read(imag)
+                else:
+                    imag = Grid.read(imag, axis=axis, slab=slab)
 
         geom = self.read_geometry()
         if geom is None:
@@ -322,18 +378,49 @@ class cubeSile(Sile):
         for i in range(na):
             self.readline()
 
+        order = idx = None
+        if slab is not None:
+            if axis is None:
+                raise ValueError(
+                    f"{self.__class__.__name__}.read_grid requires axis when reading a slab."
+                )
+            axis = direction(axis)
+            if isinstance(slab, slice):
+                slab = range(*slab.indices(ngrid[axis]))
+            idx = _a.asarrayi(slab).ravel()
+            # values are read in the file order
+            slab, order = np.unique(idx % ngrid[axis], return_inverse=True)
+            if np.array_equal(order, _a.arangei(len(slab))):
+                order = None
+
+        values = self._r_grid_values(ngrid, axis, slab, buffersize)
+        if order is not None:
+            values = np.take(values, order, axis=axis)
+
+        if idx is not None:
+            # down-scale the cell and geometry (equivalent to Grid.sub)
+            cell = lattice.cell.copy()
+            dcell = cell[axis] / ngrid[axis]
+            cell[axis] = dcell * len(idx)
+            lattice = lattice.copy(cell)
+            if geom is None:
+                pass
+            elif len(idx) > 1 and np.allclose(np.diff(idx), 1):
+                # shift the geometry according to what is retained
+                geom = geom.translate(-dcell * idx[0])
+                geom.set_lattice(lattice)
+            else:
+                fxyz = geom.fxyz
+                geom = geom.copy()
+                geom.set_lattice(lattice)
+                geom.xyz[:, :] = fxyz @ lattice.cell
+
+        # Avoid allocating the full grid, the values are assigned directly
         if geom is None:
-            grid = Grid(ngrid, dtype=np.float64, lattice=lattice)
+            grid = Grid([1, 1, 1], dtype=np.float64, lattice=lattice)
         else:
-            grid = Grid(ngrid, dtype=np.float64, geometry=geom)
-        grid.grid = grid.grid.ravel()
-
-        # TODO check performance of this
-        # We are currently doing this to enable reading
-        #  1-column data and 6-column data.
-        lines = [item for sublist in self.fh.readlines() for item in sublist.split()]
-        grid.grid[:] = np.array(lines).astype(grid.dtype, copy=False)
-        grid.grid = grid.grid.reshape(ngrid)
+            grid = Grid([1, 1, 1], dtype=np.float64, geometry=geom)
+        grid.grid = values
 
         if imag is None:
             return grid
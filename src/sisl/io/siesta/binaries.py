@@ -37,9 +37,10 @@ from sisl.physics import BrillouinZone, DensityMatrix, EnergyDensityMatrix, Hami
 from sisl.physics.electron import EigenstateElectron
 from sisl.physics.overlap import Overlap
 from sisl.physics.sparse import SparseOrbitalBZ
+from sisl.typing import CellAxis
 from sisl.unit.siesta import unit_convert
+from sisl.utils.misc import direction
 
-from .._help import grid_reduce_indices
 from ..sile import MissingFermiLevelWarning, SileError, SileWarning, add_sile
 from ._help import *
 from .sile import SileBinSiesta
@@ -2261,9 +2262,65 @@ class _gridSileSiesta(SileBinSiesta):
         self._fortran_check("read_grid_size", "could not read grid sizes.")
         return nspin, mesh
 
-    def read_grid(self, index=0, dtype=np.float64, *args, **kwargs) -> Grid:
+    def _read_grid_memmap(self, nspin: int, mesh) -> Optional[np.ndarray]:
+        """Memory-map the grid values without reading them
+
+        The file is written as sequential unformatted Fortran records, one record
+        per ``grid[:, y, z, spin]`` line. When the record markers are as expected
+        (4-byte markers, native byte order) the values are returned as a read-only
+        `numpy.memmap` of shape ``(nspin, mesh[2], mesh[1], mesh[0])``,
+        otherwise ``None`` is returned.
+        """
+        # the header contains the cell (9 doubles) and the mesh + nspin (4 integers)
+        header = np.dtype(
+            [
+                ("h0", "i4"),
+                ("cell", "f8", 9),
+                ("t0", "i4"),
+                ("h1", "i4"),
+                ("mesh", "i4", 4),
+                ("t1", "i4"),
+            ]
+        )
+        record = np.dtype([("h", "i4"), ("v", "f4", mesh[0]), ("t", "i4")])
+        nrecords = nspin * mesh[2] * mesh[1]
+        try:
+            if self.file.stat().st_size != header.itemsize + nrecords * record.itemsize:
+                return None
+            head = np.fromfile(self.file, dtype=header, count=1)[0]
+        except OSError:
+            return None
+        if not (
+            head["h0"] == head["t0"] == 72
+            and head["h1"] == head["t1"] == 16
+            and np.array_equal(head["mesh"], [*mesh, nspin])
+        ):
+            return None
+        records = np.memmap(
+            self.file,
+            dtype=record,
+            mode="r",
+            offset=header.itemsize,
+            shape=(nspin, mesh[2], mesh[1]),
+        )
+        return records["v"]
+
+    def read_grid(
+        self,
+        index=0,
+        dtype=np.float64,
+        *args,
+        axis: Optional[CellAxis] = None,
+        slab=None,
+        **kwargs,
+    ) -> Grid:
         """Read grid contained in the Grid file
 
+        Only the requested spin components are read from the file.
+        Additionally one may only read a slab of the grid along one lattice
+        direction, which is equivalent to (but much less memory demanding than)
+        ``sile.read_grid(...).sub(slab, axis)``.
+
         Parameters
         ----------
         index : int or str or array_like, optional
@@ -2273,15 +2330,28 @@ class _gridSileSiesta(SileBinSiesta):
            Default to the first component.
         dtype : numpy.float64, optional
            default data-type precision
+        axis :
+           the lattice direction of `slab`
+        slab : int or array_like or slice, optional
+           only read these indices of the grid along `axis`
         spin : optional
            same as `index` argument. `spin` argument has precedence.
+
+        Examples
+        --------
+        Calculate the planar average along the 3rd lattice vector, one
+        slab at a time
+
+        >>> nspin, mesh = sile.read_grid_size()
+        >>> avg = np.concatenate([
+        ...     sile.read_grid(axis=2, slab=slice(i, i + 10)).grid.mean((0, 1))
+        ...     for i in range(0, mesh[2], 10)
+        ... ])
         """
         index = kwargs.get("spin", index)
         # Read the sizes and cell
         nspin, mesh = self.read_grid_size()
         lattice = self.read_lattice()
-        grid = _siesta.read_grid(self.file, nspin, mesh[0], mesh[1], mesh[2])
-        self._fortran_check("read_grid", "could not read grid.")
 
         if isinstance(index, str):
             index = index.lower()
@@ -2301,17 +2371,56 @@ class _gridSileSiesta(SileBinSiesta):
                     f"{self.__class__.__name__}.read_grid got a wrong spin request for the grid values."
                 )
 
-        if isinstance(index, Integral):
-            grid = grid[:, :, :, index]
-        else:
-            grid = grid_reduce_indices(grid, index, axis=-1)
+        if slab is not None:
+            if axis is None:
+                raise ValueError(
+                    f"{self.__class__.__name__}.read_grid requires axis when reading a slab."
+                )
+            axis = direction(axis)
+            if isinstance(slab, slice):
+                slab = range(*slab.indices(mesh[axis]))
+            slab = _a.asarrayi(slab).ravel()
+            # down-scale the cell (equivalent to Grid.sub)
+            cell = lattice.cell.copy()
+            cell[axis] *= len(slab) / mesh[axis]
+            lattice = lattice.copy(cell)
 
         # Simply create the grid (with no information)
         # We will overwrite the actual grid
         g = Grid([1, 1, 1], lattice=lattice)
-        # NOTE: there is no need to swap-axes since the returned array is in F ordering
-        #       and thus the first axis is the fast (x, y, z) is retained
-        g.grid = grid * self.grid_unit
+
+        values = self._read_grid_memmap(nspin, mesh)
+        if values is None:
+            # fall back to reading everything
+            grid = _siesta.read_grid(self.file, nspin, mesh[0], mesh[1], mesh[2])
+            self._fortran_check("read_grid", "could not read grid.")
+            # reverse the axes to follow the file layout
+            values = grid.T
+
+        def component(i):
+            # only the requested spin component (and slab) is read
+            if slab is None:
+                return values[i]
+            # the file layout has reversed axes (z, y, x)
+            # NOTE: np.take would copy the full (non-contiguous) component
+            idx = [slice(None)] * 3
+            idx[2 - axis] = slab
+            return values[i][tuple(idx)]
+
+        if isinstance(index, Integral):
+            grid = np.array(component(index))
+        else:
+            if len(index) > nspin:
+                raise ValueError(
+                    f"{self.__class__.__name__}.read_grid got too many factors for the spin components: {len(index)} > {nspin}"
+                )
+            grid = component(0) * index[0]
+            for i, factor in enumerate(index[1:], start=1):
+                grid += component(i) * factor
+        del values
+
+        # NOTE: transposing the (z, y, x) layout retains the (x, y, z) axes
+        g.grid = grid.T * self.grid_unit
         return g
 
     def write_grid(self, *grids: Grid) -> None:
@@ -3,11 +3,15 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
 import numpy as np
 
 from sisl._array import arrayd, arrayi, asarrayi
 from sisl._core import Atom, AtomicOrbital, Atoms, Geometry, PeriodicTable
-from sisl._help import xml_parse
+from sisl._help import xml_iterparse
 from sisl._internal import set_module
 from sisl.messages import SislWarning, warn
 from sisl.unit.siesta import unit_convert
@@ -21,7 +25,7 @@ from sisl.utils import (
     strmap,
 )
 
-from ..sile import add_sile, get_sile, sile_fh_open
+from ..sile import SileError, add_sile, get_sile, sile_fh_open
 from .sile import SileSiesta
 
 __all__ = ["pdosSileSiesta"]
@@ -43,22 +47,223 @@ class pdosSileSiesta(SileSiesta):
     @sile_fh_open(True)
     def read_fermi_level(self) -> float:
         """Returns the fermi-level"""
-        # Get the element-tree
-        root = xml_parse(self.fh).getroot()
+        # Stream the element-tree, and stop once found
+        for _, elem in xml_iterparse(self.fh):
+            if elem.tag == "fermi_energy":
+                return float(elem.text)
+            elem.clear()
+        warn(
+            f"{self!s}.read_fermi_level could not locate the Fermi-level in the XML tree"
+        )
+        return None
+
+    def _cache_file(self) -> Path:
+        """Path of the binary cache of the PDOS data"""
+        return self.file.with_name(self.file.name + ".npz")
+
+    def _r_data_cache(self):
+        """Read the PDOS data from the binary cache, returns None if not usable"""
+        f = self._cache_file()
+        try:
+            if f.stat().st_mtime < self.file.stat().st_mtime:
+                # the XML file has been updated
+                return None
+            with np.load(f) as npz:
+                if int(npz["version"]) != self._cache_version:
+                    return None
+                data = {key: npz[key] for key in npz.files}
+        except Exception:
+            return None
+        data.pop("version")
+        if np.isnan(data["Ef"]):
+            data["Ef"] = None
+        else:
+            data["Ef"] = float(data["Ef"])
+        return data
 
-        # Try and find the fermi-level
-        Ef = root.find("fermi_energy")
+    def _w_data_cache(self, data) -> None:
+        """Write the PDOS data to the binary cache (next to the XML file)"""
+        f = self._cache_file()
+        Ef = data["Ef"]
         if Ef is None:
-            warn(f"{self!s}.read_data could not locate the Fermi-level in the XML tree")
-        return Ef
+            Ef = np.nan
+        try:
+            # write to a temporary file to never leave a partial cache behind
+            tmp = f.with_name(f.name + ".tmp.npz")
+            np.savez_compressed(
+                tmp, **{**data, "Ef": Ef, "version": self._cache_version}
+            )
+            os.replace(tmp, f)
+        except OSError as e:
+            warn(f"{self!s}.read_data could not write the PDOS cache {f}: {e}")
+
+    # Version of the binary cache layout
+    _cache_version = 1
+
+    def _r_data_xml(self, atoms=None, orbitals=None, Erange=None):
+        """Stream the PDOS data from the XML file
+
+        The tree is parsed incrementally and orbital elements are discarded as soon
+        as their data has been stored. The PDOS is stored in the raw Siesta spin
+        components (per orbital).
+        """
+        if atoms is not None:
+            atoms = set(asarrayi(atoms).ravel().tolist())
+        if orbitals is not None:
+            orbitals = set(asarrayi(orbitals).ravel().tolist())
+
+        nspin = 1
+        no = 0
+        Ef = None
+        E = None
+        Eidx = None
+        D = None
+        xyz = {}
+        # atom index, orbital index, Z, n, l, m, zeta, P
+        info = []
+
+        it = xml_iterparse(self.fh, events=("start", "end"))
+        _, root = next(it)
+        for event, elem in it:
+            if event == "start":
+                continue
+            tag = elem.tag
+            if tag == "orbital":
+                ia = int(elem.get("atom_index")) - 1
+                io = int(elem.get("index")) - 1
+                if (atoms is None or ia in atoms) and (
+                    orbitals is None or io in orbitals
+                ):
+                    if D is None:
+                        # first orbital, now we know the size of the data
+                        if Erange is not None:
+                            Es = E if Ef is None else E - Ef
+                            Eidx = np.logical_and(
+                                Erange[0] <= Es, Es <= Erange[1]
+                            ).nonzero()[0]
+                        if no == 0:
+                            # no size information, grow the data
+                            no = 64
+                        ne = len(E) if Eidx is None else len(Eidx)
+                        D = np.empty([nspin, no, ne], dtype=np.float64)
+                    elif len(info) == D.shape[1]:
+                        D = np.concatenate([D, np.empty_like(D)], axis=1)
+
+                    # it is formed like : spin-1, spin-2 (however already in eV)
+                    DOS = np.fromstring(elem.find("data").text, sep=" ").reshape(
+                        -1, nspin
+                    )
+                    if Eidx is not None:
+                        DOS = DOS[Eidx]
+                    D[:, len(info)] = DOS.T
+
+                    species = elem.get("species")
+                    try:
+                        Z = int(elem.get("Z"))
+                    except Exception:
+                        try:
+                            Z = PeriodicTable().Z(species)
+                        except Exception:
+                            # Unknown
+                            Z = -1
+                    P = elem.get("P") == "true"
+
+                    xyz[ia] = arrayd(elem.get("position").split())
+                    info.append(
+                        (
+                            ia,
+                            io,
+                            Z,
+                            int(elem.get("n")),
+                            int(elem.get("l")),
+                            int(elem.get("m")),
+                            int(elem.get("z")),
+                            P,
+                        )
+                    )
+                # free all processed elements
+                root.clear()
+
+            elif tag == "nspin":
+                nspin = int(elem.text)
+            elif tag == "norbitals":
+                no = int(elem.text)
+                if orbitals is not None:
+                    no = min(no, len(orbitals))
+            elif tag == "fermi_energy":
+                Ef = float(elem.text)
+            elif tag == "energy_values":
+                E = np.fromstring(elem.text, sep=" ")
+                elem.clear()
+
+        if E is None:
+            raise SileError(f"{self!s}.read_data could not find the energy values")
+        if Eidx is not None:
+            E = E[Eidx]
+        elif Erange is not None:
+            # no orbitals found, still reduce the energies
+            Es = E if Ef is None else E - Ef
+            E = E[np.logical_and(Erange[0] <= Es, Es <= Erange[1])]
+
+        no = len(info)
+        if D is None:
+            D = np.empty([nspin, 0, len(E)], dtype=np.float64)
+        elif D.shape[1] != no:
+            D = D[:, :no].copy()
+
+        atom_index = sorted(xyz.keys())
+        return {
+            "E": E,
+            "Ef": Ef,
+            "PDOS": D,
+            "orbital": np.array(info, dtype=np.int32).reshape(-1, 8),
+            "atom_index": arrayi(atom_index),
+            "xyz": arrayd([xyz[ia] for ia in atom_index]).reshape(-1, 3),
+        }
+
+    @staticmethod
+    def _filter_data(data, atoms=None, orbitals=None, Erange=None):
+        """Apply the `read_data` filters on already read data"""
+        info = data["orbital"]
+        keep = np.ones(len(info), dtype=bool)
+        if atoms is not None:
+            keep &= np.isin(info[:, 0], asarrayi(atoms).ravel())
+        if orbitals is not None:
+            keep &= np.isin(info[:, 1], asarrayi(orbitals).ravel())
+        E = data["E"]
+        Ekeep = slice(None)
+        if Erange is not None:
+            Es = E if data["Ef"] is None else E - data["Ef"]
+            Ekeep = np.logical_and(Erange[0] <= Es, Es <= Erange[1])
+        info = info[keep]
+        atom_keep = np.isin(data["atom_index"], info[:, 0])
+        return {
+            "E": E[Ekeep],
+            "Ef": data["Ef"],
+            "PDOS": data["PDOS"][:, keep][..., Ekeep],
+            "orbital": info,
+            "atom_index": data["atom_index"][atom_keep],
+            "xyz": data["xyz"][atom_keep],
+        }
 
     @sile_fh_open(True)
-    def read_data(self, as_dataarray: bool = False):
+    def read_data(
+        self,
+        as_dataarray: bool = False,
+        atoms=None,
+        orbitals=None,
+        Erange: Optional[Tuple[float, float]] = None,
+        cache: bool = False,
+    ):
         r"""Returns data associated with the PDOS file
 
         For spin-polarized calculations the returned values are up/down, orbitals, energy.
         For non-collinear calculations the returned values are sum/x/y/z, orbitals, energy.
 
+        The XML file is parsed incrementally, i.e. the full XML tree is never
+        kept in memory, and the requested orbitals and energies are stored
+        directly in the returned array.
+
         Parameters
         ----------
         as_dataarray: bool, optional
@@ -66,6 +271,19 @@ class pdosSileSiesta(SileSiesta):
            and orbital information as coordinates in the data.
            The geometry, unit and Fermi level are stored as attributes in the
            DataArray.
+        atoms : array_like of int, optional
+           only read the PDOS of these atoms (0-based indices in the file).
+           The returned geometry only contains the read atoms.
+        orbitals : array_like of int, optional
+           only read the PDOS of these orbitals (0-based indices in the file).
+           The returned geometry only contains the read orbitals.
+        Erange : tuple of float, optional
+           only read the PDOS for energies in this (inclusive) range, with
+           respect to the Fermi-level (when present in the file).
+        cache : bool, optional
+           store the (full) data in a compressed binary file next to the XML
+           file (``<file>.npz``), subsequent reads will use the cache as long as it is
+           newer than the XML file. The filters are applied after reading the cache.
 
         Returns
         -------
@@ -78,62 +296,50 @@ class pdosSileSiesta(SileSiesta):
         all : xarray.DataArray
             if `as_dataarray` is True, only this data array is returned, in this case all data can be post-processed using the `xarray` selection routines.
         """
-        # Get the element-tree
-        root = xml_parse(self.fh).getroot()
-
-        # Get number of orbitals
-        nspin = int(root.find("nspin").text)
-        # Try and find the fermi-level
-        Ef = root.find("fermi_energy")
-        E = arrayd(root.find("energy_values").text.split())
+        filters = dict(atoms=atoms, orbitals=orbitals, Erange=Erange)
+        if cache:
+            data = self._r_data_cache()
+            if data is None:
+                data = self._r_data_xml()
+                self._w_data_cache(data)
+            data = self._filter_data(data, **filters)
+        else:
+            data = self._r_data_xml(**filters)
+
+        E = data["E"]
+        Ef = data["Ef"]
+        D = data["PDOS"]
+        info = data["orbital"]
+        nspin = D.shape[0]
         if Ef is None:
             warn(
                 f"{self!s}.read_data could not locate the Fermi-level in the XML tree, using E_F = 0. eV"
             )
         else:
-            Ef = float(Ef.text)
-            E -= Ef
-        ne = len(E)
-
-        # All coordinate, atoms and species data
-        xyz = []
-        atoms = []
-        atom_species = []
-
-        def ensure_size(ia):
-            while len(atom_species) <= ia:
-                atom_species.append(None)
-                xyz.append(None)
-
-        def ensure_size_orb(ia, i):
-            while len(atoms) <= ia:
-                atoms.append([])
-            while len(atoms[ia]) <= i:
-                atoms[ia].append(None)
+            E = E - Ef
 
+        # Convert the Siesta spin components to sum/x/y/z
         if nspin == 4:
-
-            def process(D):
-                tmp = np.empty(D.shape[0], D.dtype)
-                tmp[:] = D[:, 3]
-                D[:, 3] = D[:, 0] - D[:, 1]
-                D[:, 0] = D[:, 0] + D[:, 1]
-                D[:, 1] = D[:, 2]
-                D[:, 2] = tmp[:]
-                return D
-
+            tmp = D[0] - D[1]
+            D[0] += D[1]
+            D[1] = D[2]
+            D[2] = D[3]
+            D[3] = tmp
         elif nspin == 2:
-
-            def process(D):
-                tmp = D[:, 0] + D[:, 1]
-                D[:, 1] = D[:, 0] - D[:, 1]
-                D[:, 0] = tmp
-                return D
-
-        else:
-
-            def process(D):
-                return D
+            tmp = D[0] - D[1]
+            D[0] += D[1]
+            D[1] = tmp
+
+        # Create the atoms, with consecutive orbitals
+        orbs = {ia: {} for ia in data["atom_index"].tolist()}
+        species = {}
+        for ia, io, Z, n, l, m, zeta, P in info.tolist():
+            orbs[ia][io] = AtomicOrbital(n=n, l=l, m=m, zeta=zeta, P=P == 1)
+            species[ia] = Z
+        atoms = Atoms(
+            Atom(species[ia], [o[io] for io in sorted(o)]) for ia, o in orbs.items()
+        )
+        geom = Geometry(data["xyz"] * Bohr2Ang, atoms)
 
         if as_dataarray:
             import xarray as xr
@@ -148,78 +354,22 @@ class pdosSileSiesta(SileSiesta):
             # Dimensions of the PDOS data-array
             dims = ["E", "spin", "n", "l", "m", "zeta", "polarization"]
 
-            shape = (ne, nspin, 1, 1, 1, 1, 1)
+            shape = (len(E), nspin, 1, 1, 1, 1, 1)
 
-            def to(o, DOS):
+            def to(i, DOS):
+                _, _, _, n, l, m, zeta, P = info[i].tolist()
                 # Coordinates for this dataarray
-                coords = [E, spin, [o.n], [o.l], [o.m], [o.zeta], [o.P]]
+                coords = [E, spin, [n], [l], [m], [zeta], [P == 1]]
 
                 return xr.DataArray(
-                    data=process(DOS).reshape(shape),
+                    data=DOS.T.reshape(shape),
                     dims=dims,
                     coords=coords,
                     name="PDOS",
                 )
 
-        else:
-
-            def to(o, DOS):
-                return process(DOS)
-
-        D = []
-
-        for orb in root.findall("orbital"):
-            # Short-hand function to retrieve integers for the attributes
-            def oi(name):
-                return int(orb.get(name))
-
-            # Get indices
-            ia = oi("atom_index") - 1
-            i = oi("index") - 1
-
-            species = orb.get("species")
-
-            # Create the atomic orbital
-            try:
-                Z = oi("Z")
-            except Exception:
-                try:
-                    Z = PeriodicTable().Z(species)
-                except Exception:
-                    # Unknown
-                    Z = -1
-
-            try:
-                P = orb.get("P") == "true"
-            except Exception:
-                P = False
-
-            ensure_size(ia)
-            xyz[ia] = arrayd(orb.get("position").split())
-            atom_species[ia] = Z
-
-            # Construct the atomic orbital
-            O = AtomicOrbital(n=oi("n"), l=oi("l"), m=oi("m"), zeta=oi("z"), P=P)
-
-            # We know that the index is far too high. However,
-            # this ensures a consecutive orbital
-            ensure_size_orb(ia, i)
-            atoms[ia][i] = O
-
-            # it is formed like : spin-1, spin-2 (however already in eV)
-            DOS = arrayd(orb.find("data").text.split()).reshape(-1, nspin)
-
-            D.append(to(O, DOS))
-
-        # Now we need to parse the data
-        # First reduce the atom
-        atoms = [[o for o in a if o] for a in atoms]
-        atoms = Atoms(map(Atom, atom_species, atoms))
-        geom = Geometry(arrayd(xyz) * Bohr2Ang, atoms)
-
-        if as_dataarray:
             # Create a new dimension without coordinates (orbital index)
-            D = xr.concat(D, "orbital")
+            D = xr.concat([to(i, D[:, i]) for i in range(len(info))], "orbital")
             # Add attributes
             D.attrs["geometry"] = geom
             D.attrs["unit"] = "1/eV"
@@ -230,7 +380,6 @@ class pdosSileSiesta(SileSiesta):
 
             return D
 
-        D = np.moveaxis(np.stack(D, axis=0), 2, 0)
         return geom, E, D
 
     @default_ArgumentParser(
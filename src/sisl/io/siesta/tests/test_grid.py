@@ -57,3 +57,31 @@ def test_grid_read_write(sisl_tmp):
         assert np.allclose(grid.shape, grid2.shape)
         assert np.allclose(grid.cell, grid2.cell)
         assert np.allclose(grid.grid * (1 + idx), grid2.grid)
+
+
+@pytest.mark.parametrize("memmap", [True, False])
+def test_grid_read_slab(sisl_tmp, monkeypatch, memmap):
+    path = sisl_tmp("grid_slab.bin")
+    grid = sisl.Grid([4, 5, 6], lattice=sisl.Lattice([2, 3, 4]))
+    grid.grid = np.random.rand(*grid.shape)
+    gridSile = sisl.io.siesta.gridSileSiesta
+
+    sile = gridSile(path)
+    sile.write_grid(grid, grid * 2)
+    if not memmap:
+        monkeypatch.setattr(gridSile, "_read_grid_memmap", lambda *args: None)
+
+    total = sile.read_grid("total")
+    assert np.allclose(grid.grid * 3, total.grid)
+    for axis in (0, 1, 2):
+        for slab in (1, [0, 2], slice(1, None)):
+            grid2 = sile.read_grid("total", axis=axis, slab=slab)
+            if isinstance(slab, slice):
+                slab = range(*slab.indices(grid.shape[axis]))
+            sub = total.sub(slab, axis)
+            assert np.allclose(sub.shape, grid2.shape)
+            assert np.allclose(sub.cell, grid2.cell)
+            assert np.allclose(sub.grid, grid2.grid)
+
+    with pytest.raises(ValueError):
+        sile.read_grid(slab=1)
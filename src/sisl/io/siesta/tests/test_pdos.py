@@ -6,6 +6,8 @@ from __future__ import annotations
 """ pytest test configures """
 
 
+import os
+
 import numpy as np
 import pytest
 
@@ -52,3 +54,56 @@ def test_si_pdos_kgrid_xarray(sisl_files):
     assert X.spin[0] == "sum"
     size = np.prod(X.shape[2:])
     assert size >= X.geometry.no
+
+
+def _write_pdos_xml(f, nspin):
+    # 2 atoms with an s and p shell each
+    orbs = [(ia, l, m) for ia in range(2) for l, m in ((0, 0), (1, -1), (1, 0), (1, 1))]
+    E = np.linspace(-5, 5, 11)
+    D = np.arange(len(orbs) * len(E) * nspin, dtype=np.float64).reshape(
+        len(orbs), len(E), nspin
+    )
+    with open(f, "w") as fh:
+        fh.write('<?xml version="1.0" encoding="UTF-8" ?>\n<pdos>\n')
+        fh.write(f"<nspin>{nspin}</nspin>\n<norbitals>{len(orbs)}</norbitals>\n")
+        fh.write('<fermi_energy units="eV"> 1.0 </fermi_energy>\n')
+        fh.write('<energy_values units="eV">\n')
+        fh.write("\n".join(map(str, E)) + "\n</energy_values>\n")
+        for io, (ia, l, m) in enumerate(orbs):
+            fh.write(
+                f'<orbital index="{io + 1}" atom_index="{ia + 1}" species="C" '
+                f'position="{ia} 0 0" n="2" l="{l}" m="{m}" z="1" P="false" Z="6">\n'
+            )
+            fh.write("<data>\n")
+            fh.write("\n".join(" ".join(map(str, d)) for d in D[io]))
+            fh.write("\n</data>\n</orbital>\n")
+        fh.write("</pdos>\n")
+    return E - 1.0, np.moveaxis(D, 2, 0)
+
+
+@pytest.mark.parametrize("nspin", [1, 2])
+def test_pdos_filter_cache(sisl_tmp, nspin):
+    f = sisl_tmp("filter.PDOS.xml")
+    E, D = _write_pdos_xml(f, nspin)
+    if nspin == 2:
+        D = np.stack([D[0] + D[1], D[0] - D[1]])
+
+    sile = sisl.get_sile(f)
+    assert sile.read_fermi_level() == pytest.approx(1.0)
+    geom, e, pdos = sile.read_data()
+    assert geom.na == 2 and geom.no == 8
+    assert np.allclose(e, E)
+    assert np.allclose(pdos, D)
+
+    idx = np.logical_and(-2 <= E, E <= 2)
+    for cache in [False, True, True]:
+        geom, e, pdos = sile.read_data(atoms=1, Erange=(-2, 2), cache=cache)
+        assert geom.na == 1 and geom.no == 4
+        assert np.allclose(e, E[idx])
+        assert np.allclose(pdos, D[:, 4:][..., idx])
+
+        geom, e, pdos = sile.read_data(orbitals=[0, 5], cache=cache)
+        assert geom.na == 2 and geom.no == 2
+        assert geom.atoms[1].orbitals[0].l == 1
+        assert np.allclose(pdos, D[:, [0, 5]])
+    assert os.path.isfile(f + ".npz")
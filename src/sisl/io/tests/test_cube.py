@@ -122,3 +122,97 @@ def test_imaginary_fail_geometry(sisl_tmp):
     grid2.write(fi, imag=True)
     with pytest.raises(SislError):
         grid.read(fr, imag=fi)
+
+
+@pytest.mark.parametrize("buffersize", [None, 11])
+@pytest.mark.parametrize(
+    "axis, slab", [(0, slice(2, 5)), (1, [4, 1]), (2, -1), ("c", slice(None, None, 3))]
+)
+def test_read_slab(sisl_tmp, buffersize, axis, slab):
+    f = sisl_tmp("GRID.cube")
+    geom = Geometry(
+        np.random.rand(10, 3),
+        np.random.randint(1, 70, 10),
+        lattice=[10, 10, 10, 45, 60, 90],
+    )
+    grid = Grid([10, 11, 12], geometry=geom)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f)
+
+    read = cubeSile(f).read_grid(buffersize=buffersize)
+    assert np.allclose(grid.grid, read.grid)
+
+    read = cubeSile(f).read_grid(axis=axis, slab=slab, buffersize=buffersize)
+    ax = "abc".index(axis) if isinstance(axis, str) else axis
+    sub = grid.sub(np.arange(grid.shape[ax])[slab], ax)
+    assert np.allclose(sub.grid, read.grid)
+    assert np.allclose(sub.cell, read.cell)
+    assert sub.geometry == read.geometry
+
+    with pytest.raises(ValueError):
+        cubeSile(f).read_grid(slab=slab)
+
+
+@pytest.mark.parametrize(
+    "axis, slab", [(0, [-1, 0, 1]), (1, [-3, -2]), (2, [11, 0]), (2, [3, 4, 5])]
+)
+def test_read_slab_wrapped(sisl_tmp, axis, slab):
+    # the geometry is shifted exactly like Grid.sub
+    f = sisl_tmp("GRID.cube")
+    geom = Geometry(
+        np.random.rand(10, 3),
+        np.random.randint(1, 70, 10),
+        lattice=[10, 10, 10, 45, 60, 90],
+    )
+    grid = Grid([10, 11, 12], geometry=geom)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f)
+
+    read = cubeSile(f).read_grid(axis=axis, slab=slab)
+    sub = grid.sub(slab, axis)
+    assert np.allclose(sub.grid, read.grid)
+    assert np.allclose(sub.cell, read.cell)
+    assert np.allclose(sub.geometry.xyz, read.geometry.xyz, atol=1e-4)
+    assert sub.geometry == read.geometry
+
+
+@pytest.mark.parametrize("sep", ["   ", "\t"])
+@pytest.mark.parametrize("buffersize", [5, 6, 7])
+def test_read_padded(sisl_tmp, buffersize, sep):
+    # other codes pad values with multiple spaces (or tabs)
+    f = sisl_tmp("GRID.cube")
+    grid = Grid([3, 4, 5])
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f)
+    with open(f) as fh:
+        lines = fh.readlines()
+    with open(f, "w") as fh:
+        fh.writelines(lines[:7])
+        for line in lines[7:]:
+            fh.write(sep + line.replace(" ", sep))
+
+    read = cubeSile(f).read_grid(buffersize=buffersize)
+    assert np.allclose(grid.grid, read.grid)
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+@pytest.mark.parametrize("fmt", [".5e", ".12e", "12.4e", ".3f", ",.3f"])
+def test_write_fmt(sisl_tmp, fmt, threads):
+    f = sisl_tmp("GRID.cube")
+    grid = Grid([10, 11, 13])
+    grid.grid = np.random.randn(*grid.shape) * 10.0 ** np.random.randint(
+        -20, 20, grid.shape
+    )
+    grid.grid[0, 0, :3] = [0.0, -0.0, 0.125]
+    grid.write(f, fmt=fmt, buffersize=100, threads=threads)
+
+    # compare against python formatting
+    values = [format(v, fmt) for v in grid.grid.ravel().tolist()]
+    lines = [" ".join(values[i : i + 6]) for i in range(0, len(values), 6)]
+    with open(f) as fh:
+        content = fh.readlines()
+    assert [l.rstrip() for l in content[-len(lines) - 1 : -1]] == lines
+
+    if fmt.endswith("e"):
+        read = cubeSile(f).read_grid()
+        assert np.allclose(grid.grid, read.grid, rtol=1e-3, atol=0)
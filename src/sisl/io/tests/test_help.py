@@ -0,0 +1,30 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from __future__ import annotations
+
+from io import StringIO
+
+import numpy as np
+import pytest
+
+from sisl.io._help import read_values
+
+pytestmark = [pytest.mark.io, pytest.mark.generic]
+
+
+@pytest.mark.parametrize("sep", [" ", "\t", "\n", " \t\n "])
+@pytest.mark.parametrize("buffersize", [4, 7, 100])
+def test_read_values(sep, buffersize):
+    values = np.random.rand(20)
+    text = sep + sep.join(f"{v:.8f}" for v in values) + sep
+
+    chunks = list(read_values(StringIO(text).read, buffersize))
+    assert np.allclose(np.concatenate(chunks), values)
+    if buffersize < len(text) // 2:
+        # values are split at any white-space
+        assert len(chunks) > 1
+
+
+def test_read_values_empty():
+    assert len(list(read_values(StringIO("  \t\n ").read, 2))) == 0
@@ -6,11 +6,9 @@ from __future__ import annotations
 """
 Sile object for reading/writing Wannier90 in/output
 """
-from collections import defaultdict
+from typing import Iterator, Optional
 
 import numpy as np
-import scipy.sparse as sps
-from scipy.sparse import lil_matrix
 
 import sisl._array as _a
 from sisl import Geometry, Lattice
@@ -18,7 +16,7 @@ from sisl.messages import deprecate_argument
 from sisl.physics import Hamiltonian
 from sisl.unit import unit_convert
 
-from .._help import parse_order
+from .._help import parse_order, read_values
 from ..sile import *
 
 # Import sile objects
@@ -32,25 +30,47 @@ __all__ = [
 ]
 
 
-def _construct_hamiltonian(geometry: Geometry, Hsc):
-    # Get supercell size
-    nsc = _a.zerosi(3)
-    for isc in Hsc.keys():
-        for i in (0, 1, 2):
-            nsc[i] = max(abs(isc[i]), nsc[i])
+def _construct_hamiltonian(
+    geometry: Geometry,
+    isc: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    data: np.ndarray,
+    nsc_isc: Optional[np.ndarray] = None,
+):
+    """Create the Hamiltonian from COO elements in the supercells `isc`
+
+    Parameters
+    ----------
+    geometry :
+        geometry of the Hamiltonian, the supercell will be updated
+    isc :
+        supercell offsets of the elements, shape ``(len(rows), 3)``
+    rows, cols :
+        unit-cell row and column indices of the elements
+    data :
+        the matrix elements
+    nsc_isc :
+        supercell offsets used for determining the number of supercells,
+        defaults to `isc`
+    """
+    if nsc_isc is None:
+        nsc_isc = isc
 
     # Create the full supercell
-    nsc = nsc * 2 + 1
-    geometry.set_nsc(nsc)
-
-    # Create the big matrix
-    H = []
-    for isc in geometry.lattice.sc_off:
-        H.append(Hsc[tuple(isc)].tocsr())
+    nsc = _a.zerosi(3)
+    if len(nsc_isc) > 0:
+        nsc = np.abs(nsc_isc).max(0)
+    geometry.set_nsc(nsc * 2 + 1)
 
-    H = sps.hstack(H)
+    # Supercell indices are only looked up per unique supercell
+    isc, idx = np.unique(isc.reshape(-1, 3), axis=0, return_inverse=True)
+    if len(isc) > 0:
+        cols = cols + geometry.lattice.sc_index(isc)[idx.ravel()] * geometry.no
 
-    return Hamiltonian.fromsp(geometry, H)
+    # Wannier90 files never contain duplicate elements, but in case
+    # they do, the last one read is used
+    return Hamiltonian.fromcoo(geometry, rows, cols, data, duplicates="last")
 
 
 class winSileWannier90(SileWannier90):
@@ -411,6 +431,39 @@ class centresSileWannier90(SileWannier90):
 
 class hamSileWannier90(SileWannier90):
 
+    def _r_records(
+        self, nrecords: int, size: int, buffersize: int = 2**22
+    ) -> Iterator[np.ndarray]:
+        """Parse `nrecords` records of `size` numbers each from the remaining file
+
+        The file is read in chunks of `buffersize` characters, and each chunk
+        is parsed in bulk. Hence, only the parsed values of a chunk are
+        kept in memory.
+
+        Yields
+        ------
+        numpy.ndarray
+            array of shape ``(n, size)`` with the next ``n`` records
+        """
+        remaining = nrecords * size
+        values = _a.emptyd(0)
+        for block in read_values(self.fh.read, buffersize):
+            if len(values) > 0:
+                block = np.concatenate((values, block))
+            n = min(len(block) // size * size, remaining)
+            if n > 0:
+                yield block[:n].reshape(-1, size)
+            values = block[n:]
+            remaining -= n
+            if remaining <= 0:
+                return
+
+        if remaining > 0:
+            raise ValueError(
+                f"{self.__class__.__name__} could not read all elements, "
+                "the file seems to be incomplete."
+            )
+
     def _r_wigner_seitz_weights(self):
         # Number of Wigner-Seitz degeneracy points
         npts = int(self.readline())
@@ -500,42 +553,42 @@ class tbSileWannier90(hamSileWannier90):
             )
 
         ws = self._r_wigner_seitz_weights()
-
-        # List for holding the Hamiltonian
-        Hsc = defaultdict(lambda: lil_matrix((geometry.no, geometry.no), dtype=dtype))
         is_complex = np.iscomplexobj(dtype(1))
 
-        # Parse hamiltonian matrix elements
-        for w in ws:
-            l = self.readline()  # Skip empty line
-            if not l.strip() == "":
-                raise ValueError(
-                    f"{self.__class__.__name__}"
-                    ".read_hamiltonian unable to parse <>_tb.dat file, due to "
-                    "error in file format."
-                )
-
-            # Get super-cell
-            isc = map(int, self.readline().split())
-
-            # Get Hamiltonian matrix elements
-            Hr = Hsc[tuple(isc)]
-            for _ in range(no**2):
-                l = self.readline().split()
-
-                # Get row and column):
-                r, c = map(int, l[:2])
-
-                # Scale matrix elements
-                if is_complex:
-                    h = float(l[2]) + 1j * float(l[3])
-                else:
-                    h = float(l[2])
-
-                if abs(h) > cutoff:
-                    Hr[r - 1, c - 1] = h * w
+        # Each block is the supercell offset and the matrix elements (r, c, Re, Im)
+        ISC = []
+        isc = []
+        rows = []
+        cols = []
+        data = []
+        iws = 0
+        for block in self._r_records(len(ws), 3 + no**2 * 4):
+            w = ws[iws : iws + len(block)]
+            iws += len(block)
+            block_isc = block[:, :3].astype(np.int32)
+            ISC.append(block_isc)
+
+            block = block[:, 3:].reshape(-1, no**2, 4)
+            if is_complex:
+                h = block[:, :, 2] + 1j * block[:, :, 3]
+            else:
+                h = block[:, :, 2]
 
-        return _construct_hamiltonian(geometry, Hsc)
+            # Scale matrix elements
+            ib, ih = (np.abs(h) > cutoff).nonzero()
+            isc.append(block_isc[ib])
+            rows.append(block[ib, ih, 0].astype(np.int32) - 1)
+            cols.append(block[ib, ih, 1].astype(np.int32) - 1)
+            data.append(h[ib, ih] * w[ib])
+
+        return _construct_hamiltonian(
+            geometry,
+            np.concatenate(isc),
+            np.concatenate(rows),
+            np.concatenate(cols),
+            np.concatenate(data).astype(dtype, copy=False),
+            nsc_isc=np.concatenate(ISC),
+        )
 
 
 class hrSileWannier90(hamSileWannier90):
@@ -588,41 +641,41 @@ class hrSileWannier90(hamSileWannier90):
             )
 
         ws = self._r_wigner_seitz_weights()
-
-        # List for holding the Hamiltonian
-        Hsc = defaultdict(lambda: lil_matrix((geometry.no, geometry.no), dtype=dtype))
         is_complex = np.iscomplexobj(dtype(1))
 
+        # Each line contains: isc[0], isc[1], isc[2], r, c, Re, Im
+        isc = []
+        rows = []
+        cols = []
+        data = []
         iws = -1
-        isc = [0, 0, 0]
-        while True:
-            l = self.readline()
-            if l == "":
-                break
+        for lines in self._r_records(len(ws) * no**2, 7):
+            r = lines[:, 3].astype(np.int32)
+            c = lines[:, 4].astype(np.int32)
 
-            # Split here...
-            l = l.split()
-
-            # Get super-cell, row and column
-            isc[0], isc[1], isc[2], r, c = map(int, l[:5])
-
-            # Update index for degeneracy, if required
-            if r + c == 2:
-                iws += 1
-
-            # Get degeneracy of this element
-            w = ws[iws]
+            # Update index for degeneracy
+            iw = np.cumsum(r + c == 2) + iws
+            iws = iw[-1]
 
-            # Scale matrix elements
             if is_complex:
-                h = float(l[5]) + 1j * float(l[6])
+                h = lines[:, 5] + 1j * lines[:, 6]
             else:
-                h = float(l[5])
-
-            if abs(h) > cutoff:
-                Hsc[tuple(isc)][r - 1, c - 1] = h * w
+                h = lines[:, 5]
 
-        return _construct_hamiltonian(geometry, Hsc)
+            # Scale matrix elements
+            idx = (np.abs(h) > cutoff).nonzero()[0]
+            isc.append(lines[idx, :3].astype(np.int32))
+            rows.append(r[idx] - 1)
+            cols.append(c[idx] - 1)
+            data.append(h[idx] * ws[iw[idx]])
+
+        return _construct_hamiltonian(
+            geometry,
+            np.concatenate(isc),
+            np.concatenate(rows),
+            np.concatenate(cols),
+            np.concatenate(data).astype(dtype, copy=False),
+        )
 
 
 add_sile("win", winSileWannier90, gzip=True)
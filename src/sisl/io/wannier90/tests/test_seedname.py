@@ -6,7 +6,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from sisl import units
+from sisl import Lattice, units
 from sisl.io.wannier90 import *
 
 pytestmark = [pytest.mark.io, pytest.mark.wannier90, pytest.mark.w90]
@@ -102,3 +102,42 @@ def test_seedname_read_lattice(sisl_files):
     lat1 = f.read_lattice(order="tb")
     lat2 = f.read_lattice(order="win")
     assert np.allclose(lat1.cell, lat2.cell)
+
+
+@pytest.mark.parametrize("sep", [" ", "\t"])
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_seedname_read_hr_small(sisl_tmp, dtype, sep):
+    f = sisl_tmp("small_hr.dat")
+    no = 2
+    R = [(-1, 0, 0), (0, 0, 0), (1, 0, 0)]
+    ws = [2, 1, 2]
+    with open(f, "w") as fh:
+        fh.write(" written on test\n")
+        fh.write(f"{no}\n{len(R)}\n")
+        fh.write("    ".join(map(str, ws)) + "\n")
+        for ir, (x, y, z) in enumerate(R):
+            for c in range(1, no + 1):
+                for r in range(1, no + 1):
+                    re = 0.0 if (ir == 0 and r != c) else ir + r + 2 * c
+                    fh.write(
+                        f"{x:5d}{y:5d}{z:5d}{r:5d}{c:5d}{sep}{re:12.6f}{sep}{0.5:12.6f}\n"
+                    )
+
+    H = hrSileWannier90(f).read_hamiltonian(
+        lattice=Lattice(2.0), dtype=dtype, cutoff=1e-5
+    )
+    assert H.dtype == dtype
+    assert np.allclose(H.nsc, [3, 1, 1])
+    im = 0.5j if np.iscomplexobj(dtype(1)) else 0.0
+    for ir, isc in enumerate(R):
+        for c in range(no):
+            for r in range(no):
+                re = 0.0 if (ir == 0 and r != c) else ir + r + 2 * c + 3
+                ref = (re + im) / ws[ir]
+                assert H[r, c, isc] == pytest.approx(ref)
+
+    # the cutoff is applied to the raw (unweighted) elements
+    H = hrSileWannier90(f).read_hamiltonian(lattice=Lattice(2.0), cutoff=4.5)
+    assert np.allclose(H.nsc, [3, 1, 1])
+    assert H[0, 0, (-1, 0, 0)] == 0.0
+    assert H[1, 1, (-1, 0, 0)] == pytest.approx(3.0)
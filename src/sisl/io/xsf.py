@@ -14,6 +14,7 @@ from sisl._internal import set_module
 from sisl.messages import deprecate_argument
 from sisl.utils import str_spec
 
+from ._help import write_grid_values
 from ._multiple import SileBinder, postprocess_tuple
 
 # Import sile objects
@@ -386,7 +387,10 @@ class xsfSile(Sile):
         fmt : str, optional
             floating point format for data (.5e)
         buffersize : int, optional
-            size of the buffer while writing the data, (6144)
+            (approximate) number of values formatted at a time, (65536)
+        threads : int, optional
+            number of threads used to format the data while writing,
+            defaults to ``SISL_NUM_THREADS``
         """
         sile_raise_write(self)
         # for now we do not allow an animation with grid data... should this
@@ -402,7 +406,8 @@ class xsfSile(Sile):
         self.write_geometry(geom)
 
         # Buffer size for writing
-        buffersize = min(kwargs.get("buffersize", 6144), args[0].grid.size)
+        buffersize = kwargs.get("buffersize", 2**16)
+        threads = kwargs.get("threads")
 
         # Format for precision
         fmt = kwargs.get("fmt", ".5e")
@@ -421,6 +426,11 @@ class xsfSile(Sile):
             self._write("  " + _v3.format(*grid.cell[1, :]))
             self._write("  " + _v3.format(*grid.cell[2, :]))
 
+        def write_values(values):
+            write_grid_values(
+                self._write, values, fmt, buffersize=buffersize, threads=threads
+            )
+
         for i, grid in enumerate(args):
             if isinstance(grid, Grid):
                 name = kwargs.get(f"grid{i}", str(i))
@@ -442,16 +452,7 @@ class xsfSile(Sile):
             #   for y
             #     for x
             #       write...
-            _fmt = "{:" + fmt + "}\n"
-            for x in np.nditer(
-                np.asarray(grid.grid.real.T, order="C").reshape(-1),
-                flags=["external_loop", "buffered"],
-                op_flags=[["readonly"]],
-                order="C",
-                buffersize=buffersize,
-            ):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
-
+            write_values(grid.grid.real.T)
             self._write(" END_DATAGRID_3D\n")
 
             # Skip if not complex
@@ -459,15 +460,7 @@ class xsfSile(Sile):
                 continue
             self._write(f" BEGIN_DATAGRID_3D_imag_{name}\n")
             write_cell(grid)
-            for x in np.nditer(
-                np.asarray(grid.grid.imag.T, order="C").reshape(-1),
-                flags=["external_loop", "buffered"],
-                op_flags=[["readonly"]],
-                order="C",
-                buffersize=buffersize,
-            ):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
-
+            write_values(grid.grid.imag.T)
             self._write(" END_DATAGRID_3D\n")
 
         self._write("END_BLOCK_DATAGRID_3D\n")
@@ -23,6 +23,7 @@ like `numpy` and `scipy`.
    svd
    eigs
    eigsh
+   eigsh_window
 
 """
 from .base import *
@@ -7,10 +7,12 @@ from typing import Literal
 
 import numpy as np
 import scipy.linalg as la
+import scipy.sparse as sps
+import scipy.sparse.linalg as ssl
 
-from .base import eigh, svd
+from .base import eigh, eigsh, svd
 
-__all__ = ["signsqrt", "sqrth", "invsqrth", "lowdin"]
+__all__ = ["signsqrt", "sqrth", "invsqrth", "lowdin", "eigsh_window"]
 
 
 def signsqrt(a):
@@ -103,3 +105,113 @@ def lowdin(
     if b is None:
         return a12
     return a12 @ b @ a12
+
+
+def eigsh_window(
+    a,
+    emin: float,
+    emax: float,
+    b=None,
+    n: int = 10,
+    eigvals_only: bool = False,
+    **kwargs,
+):
+    r"""Calculate all eigenvalues (and eigenvectors) of the Hermitian sparse matrix `a` in an energy window
+
+    The eigenvalues in the window :math:`[E_{\min}, E_{\max}]` are found using the
+    shift-invert method (`scipy.sparse.linalg.eigsh`) around the center of the window.
+    The sparse LU factorization of :math:`\mathbf A - \sigma\mathbf B` is only done once,
+    and re-used while the number of calculated eigenvalues is increased until all
+    eigenvalues in the window have been found.
+
+    This is much faster than a dense diagonalization for large sparse matrices when
+    only a small fraction of the eigenvalues are requested.
+
+    Parameters
+    ----------
+    a : scipy.sparse.spmatrix
+       Hermitian sparse matrix
+    emin, emax :
+       the window of eigenvalues to calculate
+    b : scipy.sparse.spmatrix, optional
+       Hermitian positive definite sparse matrix of the generalized eigenvalue problem
+       (overlap matrix)
+    n :
+       initial number of eigenvalues calculated, it will be doubled until all
+       eigenvalues in the window are found.
+    eigvals_only :
+       whether only the eigenvalues are returned
+    **kwargs :
+       passed directly to `scipy.sparse.linalg.eigsh` (e.g. ``tol`` or ``ncv``)
+
+    Returns
+    -------
+    eig : numpy.ndarray
+       the eigenvalues in the window, sorted in ascending order
+    vec : numpy.ndarray
+       the eigenvectors, ``vec[:, i]`` is the eigenvector of ``eig[i]``.
+       Only returned if `eigvals_only` is false.
+    """
+    if emax < emin:
+        raise ValueError(
+            f"eigsh_window: requires emin <= emax, got emin={emin} and emax={emax}"
+        )
+    a = sps.csc_matrix(a)
+    N = a.shape[0]
+    sigma = (emin + emax) / 2
+    width = (emax - emin) / 2
+
+    if b is None:
+        shifted = a - sigma * sps.identity(N, dtype=a.dtype, format="csc")
+    else:
+        b = sps.csc_matrix(b)
+        shifted = a - sigma * b
+
+    # The ARPACK routines can at most calculate N - 2 eigenvalues (complex matrices)
+    nmax = N - 2
+    if nmax < 1:
+        # no sparse solution possible
+        if b is None:
+            eig, vec = eigh(a.toarray())
+        else:
+            eig, vec = eigh(a.toarray(), b.toarray())
+        idx = (np.fabs(eig - sigma) <= width).nonzero()[0]
+        if eigvals_only:
+            return eig[idx]
+        return eig[idx], vec[:, idx]
+
+    # The factorization is only done once
+    lu = ssl.splu(shifted)
+    OPinv = ssl.LinearOperator(a.shape, matvec=lu.solve, dtype=shifted.dtype)
+
+    n = max(1, min(n, nmax))
+    while True:
+        eig, vec = eigsh(a, k=n, M=b, sigma=sigma, OPinv=OPinv, **kwargs)
+        if n >= nmax or np.any(np.fabs(eig - sigma) > width):
+            # We have found eigenvalues outside the window, and since the
+            # shift-invert method finds the eigenvalues closest to sigma
+            # all eigenvalues inside the window have been found.
+            break
+        n = min(n * 2, nmax)
+
+    if n >= nmax and not np.any(np.fabs(eig - sigma) > width):
+        # The window spans (close to) the entire spectrum
+        if b is None:
+            eig, vec = eigh(a.toarray())
+        else:
+            eig, vec = eigh(a.toarray(), b.toarray())
+
+    idx = (np.fabs(eig - sigma) <= width).nonzero()[0]
+    idx = idx[np.argsort(eig[idx])]
+    eig = eig[idx]
+    if eigvals_only:
+        return eig
+    vec = vec[:, idx]
+
+    # Ensure the eigenvectors are normalized (the complex solver does not guarantee it)
+    if b is None:
+        norm = np.einsum("ij,ij->j", vec.conj(), vec).real
+    else:
+        norm = np.einsum("ij,ij->j", vec.conj(), b @ vec).real
+    vec /= np.sqrt(norm)
+    return eig, vec
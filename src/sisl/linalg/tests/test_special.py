@@ -6,8 +6,9 @@ from __future__ import annotations
 import numpy as np
 import pytest
 import scipy.linalg as sl
+import scipy.sparse as sps
 
-from sisl.linalg import invsqrth, lowdin, signsqrt, sqrth
+from sisl.linalg import eigsh_window, invsqrth, lowdin, signsqrt, sqrth
 
 pytestmark = [pytest.mark.linalg]
 
@@ -90,3 +91,37 @@ def test_lowdin(driver):
 
     assert np.allclose(eig, eigL)
     assert not np.allclose(ev, evL)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+@pytest.mark.parametrize("overlap", [False, True])
+def test_eigsh_window(dtype, overlap):
+    N = 100
+    a = sps.random(N, N, density=0.05, random_state=1)
+    if dtype == np.complex128:
+        a = a + 1j * sps.random(N, N, density=0.05, random_state=2)
+    a = (a + a.conj().T) / 2
+    if overlap:
+        b = sps.identity(N) + 0.05 * (abs(a) > 0)
+        eig = sl.eigh(a.toarray(), b.toarray(), eigvals_only=True)
+    else:
+        b = None
+        eig = sl.eigh(a.toarray(), eigvals_only=True)
+
+    e, v = eigsh_window(a, -0.1, 0.2, b, n=2)
+    assert np.allclose(e, eig[(-0.1 <= eig) & (eig <= 0.2)])
+    if b is None:
+        assert np.allclose(a @ v, v * e)
+        assert np.allclose(np.einsum("ij,ij->j", v.conj(), v), 1)
+    else:
+        assert np.allclose(a @ v, (b @ v) * e)
+    assert np.allclose(eigsh_window(a, -0.1, 0.2, b, eigvals_only=True), e)
+
+    # the full spectrum
+    e = eigsh_window(a, eig.min() - 1, eig.max() + 1, b, eigvals_only=True)
+    assert np.allclose(e, eig)
+
+
+def test_eigsh_window_fail():
+    with pytest.raises(ValueError):
+        eigsh_window(sps.identity(10), 1, 0)
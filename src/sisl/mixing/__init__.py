@@ -18,5 +18,6 @@ new methods.
 """
 
 from .base import *
+from .broyden import *
 from .diis import *
 from .linear import *
@@ -10,6 +10,8 @@ from collections.abc import Callable, Iterator, Sequence
 from numbers import Integral
 from typing import Any, Optional, TypeVar, Union
 
+import numpy as np
+
 from sisl._internal import set_module
 
 __all__ = [
@@ -336,6 +338,8 @@ class History:
     def __init__(self, history: int = 2):
         # Create a list of queues
         self._hist = deque(maxlen=history)
+        # Incrementally updated metric matrix, see `gram`
+        self._gram_reset()
 
     def __str__(self) -> str:
         """str of the object"""
@@ -361,6 +365,7 @@ class History:
 
     def __setitem__(self, key: int, value: Any) -> None:
         self._hist[key] = value
+        self.gram_invalidate(key)
 
     def __delitem__(self, key: Union[int, Sequence[int]]) -> None:
         self.clear(key)
@@ -376,7 +381,18 @@ class History:
         *variables :
             each variable will be added to the history of the mixer
         """
+        if self._hist.maxlen == 0:
+            # nothing is stored
+            return
+        if len(self._hist) == self._hist.maxlen:
+            # the oldest element gets evicted
+            self._gram_delete([0])
         self._hist.append(variables)
+        n = len(self._hist)
+        gram = np.zeros([n, n])
+        gram[:-1, :-1] = self._gram
+        self._gram = gram
+        self._gram_known = np.append(self._gram_known, False)
 
     def clear(self, index: Optional[Union[int, Sequence[int]]] = None) -> None:
         r"""Clear variables to the history
@@ -388,6 +404,7 @@ class History:
         """
         if index is None:
             self._hist.clear()
+            self._gram_reset()
             return
 
         if isinstance(index, Integral):
@@ -399,3 +416,75 @@ class History:
 
         for i in index:
             del self._hist[i]
+        self._gram_delete(index)
+
+    def _gram_reset(self) -> None:
+        """Remove all metric matrix elements"""
+        n = len(self._hist)
+        self._gram = np.zeros([n, n])
+        self._gram_known = np.zeros([n], dtype=bool)
+        self._gram_key = None
+
+    def _gram_delete(self, index: Sequence[int]) -> None:
+        """Remove rows/columns of the metric matrix"""
+        self._gram = np.delete(np.delete(self._gram, index, axis=0), index, axis=1)
+        self._gram_known = np.delete(self._gram_known, index)
+
+    def gram_invalidate(
+        self, index: Optional[Union[int, Sequence[int]]] = None
+    ) -> None:
+        r"""Recalculate the metrics of history elements in the next `gram` call
+
+        Parameters
+        ----------
+        index :
+            which indices of the history that have changed, defaults to all
+        """
+        if index is None:
+            self._gram_known[:] = False
+        else:
+            self._gram_known[index] = False
+
+    def gram(self, metric: TypeMetric, index: int = -1) -> np.ndarray:
+        r"""Metric matrix of a variable in the history
+
+        The matrix :math:`\mathbf G_{ij} = \mathrm{metric}(\mathbf v_i, \mathbf v_j)` is
+        stored and updated incrementally, i.e. only the rows and columns of
+        new (or changed) history elements are calculated. Rows of evicted elements
+        are dropped.
+
+        The metric is assumed to be symmetric. Calling with another `metric`
+        (or `index`) will recalculate the full matrix.
+
+        Variables must not be changed in-place after they have been added to
+        the history, since their metrics will not be recalculated. If they are,
+        call `gram_invalidate` for the changed elements.
+
+        Parameters
+        ----------
+        metric :
+            the metric between two variables
+        index :
+            the variable in each history element used in the metric
+
+        Returns
+        -------
+        numpy.ndarray
+            the metric matrix, shape ``(len(self), len(self))``, this is an
+            internal array and should not be changed
+        """
+        if self._gram_key != (metric, index):
+            self.gram_invalidate()
+            self._gram_key = (metric, index)
+
+        hist = self._hist
+        gram = self._gram
+        known = self._gram_known
+        for i in (~known).nonzero()[0]:
+            vi = hist[i][index]
+            # elements that are known, or calculated in this call
+            for j in known.nonzero()[0]:
+                gram[i, j] = gram[j, i] = metric(vi, hist[j][index])
+            gram[i, i] = metric(vi, vi)
+            known[i] = True
+        return gram
@@ -0,0 +1,203 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+import sisl._array as _a
+from sisl._core.sparse import SparseCSR
+from sisl._internal import set_module
+
+from .base import BaseHistoryWeightMixer, T, TypeArgHistory, TypeMetric, TypeWeight
+
+__all__ = ["BroydenMixer"]
+
+
+def _csr(obj: Any) -> Optional[SparseCSR]:
+    """Return the `SparseCSR` of `obj`, or None for non-sparse objects"""
+    if isinstance(obj, SparseCSR):
+        return obj
+    csr = getattr(obj, "_csr", None)
+    if isinstance(csr, SparseCSR):
+        # sparse matrices (e.g. Hamiltonian/DensityMatrix)
+        return csr
+    return None
+
+
+def _data(obj: Any) -> np.ndarray:
+    """Return the (flattened) data buffer of `obj`, without copying it"""
+    csr = _csr(obj)
+    if csr is not None:
+        obj = csr._D
+    # ravel only copies non-contiguous arrays
+    return np.ravel(obj)
+
+
+def _pattern(obj: Any) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Return the sparsity pattern (ptr, ncol, col) of `obj`, or None for non-sparse objects"""
+    csr = _csr(obj)
+    if csr is None:
+        return None
+    return csr.ptr, csr.ncol, csr.col
+
+
+def _same_pattern(a, b) -> bool:
+    """Whether two sparsity patterns (as returned by `_pattern`) have the same layout"""
+    if a is None or b is None:
+        return a is b
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+@set_module("sisl.mixing")
+class BroydenMixer(BaseHistoryWeightMixer):
+    r"""Broyden (Anderson) mixing using the history of residual differences
+
+    This is the *modified Broyden* method (also known as generalized Anderson
+    mixing) which uses the differences between consecutive iterations:
+
+    .. math::
+
+       \Delta\mathbf f_i &= \mathbf f_{i+1} - \mathbf f_i
+       \\
+       \Delta\boldsymbol\delta_i &= \boldsymbol\delta_{i+1} - \boldsymbol\delta_i
+       \\
+       \gamma &= \big[\langle\Delta\boldsymbol\delta_i|\Delta\boldsymbol\delta_j\rangle\big]^{-1}
+          \langle\Delta\boldsymbol\delta_j|\boldsymbol\delta\rangle
+       \\
+       \mathbf f' &= \mathbf f + w\boldsymbol\delta - \sum_i\gamma_i(\Delta\mathbf f_i + w\Delta\boldsymbol\delta_i)
+
+    where :math:`\boldsymbol\delta` is the derivative of the functional.
+    The metric matrix of the differences is updated incrementally in the history,
+    so each step only requires :math:`\mathcal O(N_{\mathrm{history}})` inner products.
+
+    The mixer works directly on the data buffers of the variables. Besides `numpy.ndarray`
+    it accepts `SparseCSR` objects and sparse matrices (e.g. `DensityMatrix`), in which
+    case only the non-zero values are mixed. In that case `f` and `df` must share
+    the same sparsity pattern (and data layout), and the returned object is a copy of `f`
+    with the mixed values. If the sparsity pattern changes between steps, the history is
+    cleared.
+
+    See :cite:`Johnson1988` for more details.
+
+    Parameters
+    ----------
+    weight : float, optional
+       weight used for the derivative of the functional.
+    history : int or History, optional
+       how many difference steps it will use in the estimation of the
+       new functional
+    metric : callable, optional
+       the metric used for the two values, defaults to:
+       ``lambda a, b: a.conj().dot(b).real`` (the values are flattened)
+    """
+
+    __slots__ = ("_metric", "_last", "_pattern")
+
+    def __init__(
+        self,
+        weight: TypeWeight = 0.1,
+        history: TypeArgHistory = 5,
+        metric: Optional[TypeMetric] = None,
+    ):
+        # This will call self.set_history(history)
+        super().__init__(weight, history)
+        if metric is None:
+
+            def metric(a, b):
+                return a.conj().dot(b).real
+
+        self._metric = metric
+        self._last = None
+        self._pattern = None
+
+    def clear(self) -> None:
+        """Remove the history and the last step, i.e. the next step will be a linear mixing"""
+        self.history.clear()
+        self._last = None
+        self._pattern = None
+
+    def coefficients(self, df: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        r"""Calculate the coefficients :math:`\gamma` for the current derivative `df`
+
+        Parameters
+        ----------
+        df :
+           the (flattened) derivative of the current step
+        """
+        hist = self.history
+        n_h = len(hist)
+        if n_h == 0:
+            return _a.emptyd([0])
+        metric = self._metric
+
+        G = hist.gram(metric, -1)
+        RHS = _a.fromiterd(metric(hist[i][-1], df) for i in range(n_h))
+
+        # the differences are often close to linearly dependent
+        return np.linalg.lstsq(G, RHS, rcond=None)[0]
+
+    def __call__(self, f: T, df: T, append: bool = True) -> T:
+        r"""Calculate a new variable :math:`\mathbf f'` using input and output of the functional
+
+        Parameters
+        ----------
+        f : object
+           input variable for the functional
+        df : object
+           derivative of the functional
+        append : bool, optional
+           whether to append the step to the history
+        """
+        x = _data(f)
+        F = _data(df)
+        if x.shape != F.shape:
+            raise ValueError(
+                f"{self.__class__.__name__} requires f and df to have the same number of values"
+            )
+        pattern = _pattern(f)
+        if not _same_pattern(pattern, _pattern(df)):
+            raise ValueError(
+                f"{self.__class__.__name__} requires f and df to have the same sparsity pattern"
+            )
+
+        last = self._last
+        if last is not None and (
+            last[0].shape != x.shape or not _same_pattern(self._pattern, pattern)
+        ):
+            # the size (or layout) of the problem has changed, restart
+            self.clear()
+            last = None
+
+        if append and last is not None:
+            # store the differences to the previous step
+            super().__call__(x - last[0], F - last[1])
+
+        gamma = self.coefficients(F)
+
+        # the returned object
+        out = f.copy()
+        mix = _data(out)
+        w = self.weight
+        mix += w * F
+        if len(gamma) > 0:
+            tmp = np.empty_like(mix)
+            for g, (dx, dF) in zip(gamma, self.history):
+                np.multiply(dx, g, out=tmp)
+                mix -= tmp
+                np.multiply(dF, g * w, out=tmp)
+                mix -= tmp
+
+        # copy the current step to re-usable buffers
+        if last is None:
+            self._last = (x.copy(), F.copy())
+            if pattern is not None:
+                self._pattern = tuple(p.copy() for p in pattern)
+        elif append:
+            np.copyto(last[0], x)
+            np.copyto(last[1], F)
+
+        return out
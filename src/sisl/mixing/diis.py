@@ -50,6 +50,11 @@ class DIISMixer(BaseHistoryWeightMixer):
     Alternatively one can pass a `metric` argument that can pre-process the
     :math:`\boldsymbol\delta` variable.
 
+    The history stores references to the passed variables, and the metric
+    matrix is only calculated for new history elements. Hence the variables
+    should not be changed in-place after they have been passed to the mixer
+    (otherwise call ``mixer.history.gram_invalidate()``).
+
     Parameters
     ----------
     weight : float, optional
@@ -90,20 +95,17 @@ class DIISMixer(BaseHistoryWeightMixer):
             # Externally the coefficients should reflect the weight per previous iteration.
             # The mixing weight is an additional parameter
             return _a.arrayd([1.0]), 100.0
-        elif n_h == 1:
-            return _a.arrayd([1.0]), metric(hist[0][-1], hist[0][-1])
+        # The metric matrix is updated incrementally in the history,
+        # only the metrics of the new elements are calculated
+        gram = hist.gram(metric, -1)
+        if n_h == 1:
+            return _a.arrayd([1.0]), gram[0, 0]
 
         # Initialize the matrix to be solved against
         B = _a.emptyd([n_h + 1, n_h + 1])
 
         # Fill matrix B
-        for i in range(n_h):
-            ei = hist[i][-1]
-            B[i, i] = metric(ei, ei)
-            for j in range(i + 1, n_h):
-                ej = hist[j][-1]
-                B[i, j] = metric(ei, ej)
-                B[j, i] = B[i, j]
+        B[:n_h, :n_h] = gram
 
         # fill the rest of the matrix
         scale = B[:n_h, :n_h].max() - B[:n_h, :n_h].min()
@@ -0,0 +1,75 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import sisl
+from sisl.mixing import BroydenMixer
+
+pytestmark = pytest.mark.mixing
+
+
+@pytest.mark.parametrize("history", [5, 10])
+def test_broyden_mixer(history):
+    def scf(f):
+        return np.cos(f)
+
+    f = np.linspace(0, 7, 1000)
+    mix = BroydenMixer(history=history)
+    s = str(mix)
+
+    dmax = 1
+    i = 0
+    while dmax > 1e-6:
+        i += 1
+        df = scf(f) - f
+        dmax = np.fabs(df).max()
+        f = mix(f, df)
+        assert i < 100
+    assert len(mix.history) == history
+
+
+def test_broyden_mixer_sparse():
+    g = sisl.geom.graphene().tile(2, 0)
+    DM = sisl.DensityMatrix(g)
+    DM.construct([(0.1, 1.44), (0.5, 0.1)])
+    DM.finalize()
+    D = DM._csr._D
+
+    mix = BroydenMixer(0.2, history=4)
+    dmax = 1
+    i = 0
+    while dmax > 1e-8:
+        i += 1
+        df = DM.copy()
+        df._csr._D[:] = np.cos(DM._csr._D) - DM._csr._D
+        dmax = np.fabs(df._csr._D).max()
+        DM = mix(DM, df)
+        assert isinstance(DM, sisl.DensityMatrix)
+        assert i < 100
+    assert np.allclose(DM._csr._D, np.cos(DM._csr._D))
+    # the input matrix is not changed
+    assert not np.allclose(D, DM._csr._D)
+
+
+def test_broyden_mixer_sparse_pattern():
+    A = sisl.SparseCSR((2, 2), dtype=np.float64)
+    A[0, 0] = 1.0
+    A[1, 1] = 2.0
+    B = sisl.SparseCSR((2, 2), dtype=np.float64)
+    B[0, 1] = 1.0
+    B[1, 0] = 2.0
+
+    mix = BroydenMixer()
+    with pytest.raises(ValueError):
+        mix(A, B)
+
+    # a changed pattern restarts the mixing
+    mix(A, A)
+    mix(A, A)
+    assert mix._last is not None
+    mix(B, B)
+    assert len(mix.history) == 0
@@ -3,6 +3,7 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from sisl.mixing import History
@@ -36,3 +37,54 @@ def test_simple():
     assert len(hist) == 3
     hist.clear()
     assert len(hist) == 0
+
+
+def test_gram_incremental():
+    calls = []
+
+    def metric(a, b):
+        calls.append((a, b))
+        return a * b
+
+    hist = History(3)
+    for i in range(1, 4):
+        hist.append(i)
+    assert np.allclose(hist.gram(metric, 0), np.outer([1, 2, 3], [1, 2, 3]))
+    assert len(calls) == 6
+
+    # only the new element is calculated, the evicted one is removed
+    calls.clear()
+    hist.append(4)
+    assert np.allclose(hist.gram(metric, 0), np.outer([2, 3, 4], [2, 3, 4]))
+    assert len(calls) == 3
+
+    calls.clear()
+    hist[0] = (5,)
+    hist.clear(1)
+    assert np.allclose(hist.gram(metric, 0), np.outer([5, 4], [5, 4]))
+    assert len(calls) == 2
+
+    hist.clear()
+    assert hist.gram(metric, 0).shape == (0, 0)
+
+
+def test_gram_invalidate():
+    hist = History(3)
+    for i in range(1, 4):
+        hist.append(np.array([i, 0.0]))
+
+    def metric(a, b):
+        return a.dot(b)
+
+    assert np.allclose(hist.gram(metric, 0), np.outer([1, 2, 3], [1, 2, 3]))
+
+    # in-place changes are not tracked
+    hist[1][0][0] = 5
+    assert np.allclose(hist.gram(metric, 0), np.outer([1, 2, 3], [1, 2, 3]))
+    hist.gram_invalidate(1)
+    assert np.allclose(hist.gram(metric, 0), np.outer([1, 5, 3], [1, 5, 3]))
+
+    hist[0][0][0] = 4
+    hist[2][0][0] = 6
+    hist.gram_invalidate()
+    assert np.allclose(hist.gram(metric, 0), np.outer([4, 5, 6], [4, 5, 6]))
@@ -41,8 +41,10 @@ Physical quantites
    WideBandSE
    SemiInfinite
    RecursiveSI
+   TransferMatrixSI
    RealSpaceSE
    RealSpaceSI
+   CachedSE
 
 
 Bloch's theorem
@@ -8,8 +8,12 @@ from __future__ import annotations
 This module should not expose any methods!
 """
 import operator as op
-from functools import reduce, wraps
+import os
+import shutil
+import tempfile
+from functools import partial, reduce, wraps
 from itertools import zip_longest
+from typing import Union
 
 import numpy as np
 import xarray
@@ -38,7 +42,7 @@ from sisl.utils.misc import allow_kwargs
 from .brillouinzone import BrillouinZone, MonkhorstPack
 
 # We expose the Apply and ParentApply classes
-__all__ = ["BrillouinZoneApply", "BrillouinZoneParentApply"]
+__all__ = ["BrillouinZoneApply", "BrillouinZoneParentApply", "BrillouinZonePool"]
 __all__ += ["MonkhorstPackApply", "MonkhorstPackParentApply"]
 
 
@@ -56,6 +60,286 @@ def _correct_str(orig, insert):
     return f"Apply{{{insert}, {orig[i:]}"
 
 
+class _SharedArrays:
+    """Arrays in shared memory that worker processes can attach to
+
+    The arrays are memory-mapped files, placed in ``/dev/shm`` when available.
+    Worker processes attach to them through `specs`, see `_shared_open`.
+    """
+
+    def __init__(self, arrays):
+        tmp = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        self._dir = tempfile.mkdtemp(prefix="sisl-", dir=tmp)
+        self.specs = []
+        self.arrays = []
+        for i, (shape, dtype) in enumerate(arrays):
+            path = os.path.join(self._dir, f"{i}.bin")
+            dtype = np.dtype(dtype)
+            shape = tuple(shape)
+            self.specs.append((path, dtype, shape))
+            # memmap does not allow 0-sized files
+            if np.prod(shape) * dtype.itemsize == 0:
+                self.arrays.append(np.empty(shape, dtype=dtype))
+            else:
+                self.arrays.append(np.memmap(path, dtype=dtype, mode="w+", shape=shape))
+        self.specs = tuple(self.specs)
+
+    def copy(self):
+        """In-memory copies of the shared arrays"""
+        return [np.array(array) for array in self.arrays]
+
+    def close(self) -> None:
+        """Remove the shared memory"""
+        self.arrays = []
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+# Shared arrays attached in the worker processes, (specs, arrays)
+_pool_shared = (None, None)
+
+
+def _shared_open(specs, mode: str = "r+"):
+    """Attach to the shared arrays from `specs` (cached in the worker process)"""
+    global _pool_shared
+    if _pool_shared[0] != specs:
+        arrays = []
+        for path, dtype, shape in specs:
+            if os.path.isfile(path):
+                arrays.append(np.memmap(path, dtype=dtype, mode=mode, shape=shape))
+            else:
+                arrays.append(np.empty(shape, dtype=dtype))
+        _pool_shared = (specs, tuple(arrays))
+    return _pool_shared[1]
+
+
+def _shared_set(func, specs, unzip, i, k, w):
+    """Store ``func(k, w)`` at index `i` in the shared arrays of `specs`"""
+    arrays = _shared_open(specs)
+    v = func(k, w)
+    if unzip:
+        for array, vi in zip(arrays, v):
+            array[i] = vi
+    else:
+        arrays[0][i] = v
+
+
+def _shared_sum(func, specs, i, k, w):
+    """Add ``func(k, w)`` for all `k` and `w` to index `i` in the shared array of `specs`"""
+    array = _shared_open(specs)[0]
+    for ki, wi in zip(k, w):
+        array[i] += func(ki, wi)
+    return len(k)
+
+
+def _share_csr(parent):
+    """Place the sparse matrix arrays of `parent` in shared memory
+
+    Returns
+    -------
+    object
+        a shallow copy of `parent` *without* the sparse matrix arrays
+    dict
+        the specification of the shared arrays, attach them with `_unshare_csr`
+    _SharedArrays
+        the shared memory holding the arrays
+    """
+    csr = getattr(parent, "_csr", None)
+    if csr is None:
+        return parent, None, None
+
+    attrs = ("ptr", "ncol", "col", "_D")
+    arrays = [getattr(csr, attr) for attr in attrs]
+    shm = _SharedArrays([(array.shape, array.dtype) for array in arrays])
+    for shared, array in zip(shm.arrays, arrays):
+        shared[...] = array
+
+    # Create shallow copies, without the arrays, to minimize pickling
+    stub = csr.__class__.__new__(csr.__class__)
+    stub.__setstate__(
+        {
+            "shape": csr.shape,
+            "ptr": np.empty(0, dtype=csr.ptr.dtype),
+            "ncol": np.empty(0, dtype=csr.ncol.dtype),
+            "col": np.empty(0, dtype=csr.col.dtype),
+            "D": np.empty([0, csr.shape[-1]], dtype=csr.dtype),
+            "finalized": csr.finalized,
+        }
+    )
+    shipped = object.__new__(parent.__class__)
+    shipped.__dict__.update(parent.__dict__)
+    shipped._csr = stub
+
+    return shipped, dict(zip(attrs, shm.specs)), shm
+
+
+def _unshare_csr(parent, specs) -> None:
+    """Attach the shared sparse matrix arrays to `parent`
+
+    The arrays are attached copy-on-write, the Cython routines do not
+    accept read-only arrays. Since the workers only read the arrays they
+    are not copied.
+    """
+    csr = parent._csr
+    for attr, (path, dtype, shape) in specs.items():
+        if os.path.isfile(path):
+            array = np.memmap(path, dtype=dtype, mode="c", shape=shape)
+        else:
+            array = np.empty(shape, dtype=dtype)
+        setattr(csr, attr, array)
+    csr._nnz = int(csr.ncol.sum())
+
+
+# The parent object residing in the worker processes of a `BrillouinZonePool`
+_pool_parent = None
+
+
+def _pool_init(parent, specs=None):
+    """Initializer of the worker processes in a `BrillouinZonePool`"""
+    global _pool_parent
+    if specs is not None:
+        _unshare_csr(parent, specs)
+    _pool_parent = parent
+
+
+def _pool_call(name, args, kwargs, wrap, k, w):
+    """Call method `name` of the parent stored in the worker process"""
+    parent = _pool_parent
+    return wrap(
+        getattr(parent, name)(*args, k=k, **kwargs), parent=parent, k=k, weight=w
+    )
+
+
+@set_module("sisl.physics")
+class BrillouinZonePool:
+    r"""A persistent pool of workers for running `BrillouinZone.apply` methods
+
+    The `parent` object is shipped to the workers *once*, when the pool is
+    created. Subsequent dispatched methods only transfer the k-points, weights
+    and the returned values.
+    This avoids spawning new processes, and pickling `parent`, for
+    every dispatched method.
+
+    Generally this should be created through ``bz.apply.pool``, which
+    also takes care of closing the pool:
+
+    >>> with bz.apply.pool(4) as par:
+    ...     eigs = par.ndarray.eigh()
+    ...     states = par.list.eigenstate()
+
+    Parameters
+    ----------
+    parent :
+        the object shipped to the workers, typically `BrillouinZone.parent`
+    pool :
+        number of processes, if true it will use ``SISL_NUM_PROCS``
+    shared :
+        if true, the sparse matrix arrays of `parent` are placed in shared
+        memory and are accessed read-only by all workers, instead of
+        having a copy per worker.
+    **init :
+        arguments passed to the constructor of `pathos.pools.ProcessPool`
+
+    Notes
+    -----
+    Changes to `parent` after the creation of the pool are *not*
+    reflected in the workers.
+    """
+
+    def __init__(
+        self, parent, pool: Union[int, bool] = True, shared: bool = False, **init
+    ):
+        if isinstance(pool, bool):
+            if pool:
+                pool = get_environ_variable("SISL_NUM_PROCS")
+            else:
+                pool = 1
+        self.parent = parent
+        self.ncpus = max(1, pool)
+        self.shared = shared
+
+        if shared:
+            shipped, specs, self._shared = _share_csr(parent)
+        else:
+            shipped, specs, self._shared = parent, None, None
+
+        import pathos
+
+        # Using a unique id ensures pathos won't hand out this pool
+        # to others.
+        self._pool = pathos.pools.ProcessPool(
+            ncpus=self.ncpus,
+            id=f"{self.__class__.__name__}-{id(self)}",
+            initializer=_pool_init,
+            initargs=(shipped, specs),
+            **init,
+        )
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}{{ncpus: {self.ncpus}}}"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def func(self, method, args, kwargs, wrap, parent):
+        """Return the function to be called for each k-point in the workers"""
+        if getattr(method, "__self__", None) is self.parent:
+            # The workers already have the parent, only ship the name
+            return partial(_pool_call, method.__name__, args, kwargs, wrap)
+
+        def func(k, w):
+            return wrap(method(*args, k=k, **kwargs), parent=parent, k=k, weight=w)
+
+        return func
+
+    def imap(self, func, *args, **kwargs):
+        """Lazily map `func` over `args` using the workers"""
+        return self._pool.imap(func, *args, **kwargs)
+
+    def close(self) -> None:
+        """Close the pool and wait for the workers to finish"""
+        pool = self._pool
+        pool.close()
+        pool.join()
+        pool.clear()
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+
+def _pool_func(pool, method, args, kwargs, wrap, parent):
+    """Return the function to be called for each k-point in `pool`"""
+    if isinstance(pool, BrillouinZonePool):
+        return pool.func(method, args, kwargs, wrap, parent)
+
+    def func(k, w):
+        return wrap(method(*args, k=k, **kwargs), parent=parent, k=k, weight=w)
+
+    return func
+
+
+def _pool_start(pool) -> None:
+    """Prepare a pool for running, persistent pools are already running"""
+    if not isinstance(pool, BrillouinZonePool):
+        pool.restart(True)
+
+
+def _pool_stop(pool) -> None:
+    """Finalize a pool after running, persistent pools are kept alive"""
+    if not isinstance(pool, BrillouinZonePool):
+        pool.close()
+        pool.join()
+
+
+def _pool_shared_output(pool, attrs) -> bool:
+    """Whether the workers in `pool` should return their results in shared memory"""
+    if pool is None:
+        return False
+    return attrs.get("shared", getattr(pool, "shared", False))
+
+
 def _pool_procs(pool, size: int):
     """
     This is still a bit mysterious to me.
@@ -112,7 +396,10 @@ def _pool_procs(pool, size: int):
         else:
             pool = 1
 
-    if isinstance(pool, int):
+    if isinstance(pool, BrillouinZonePool):
+        ncpus = pool.ncpus
+
+    elif isinstance(pool, int):
         if pool <= 1:
             return None, run
 
@@ -134,11 +421,12 @@ def _pool_procs(pool, size: int):
             except Exception:
                 pass
 
-        # we don't know
-        warn(
-            f"{__module__} could not determine number of CPUs from the pool, expecting 2"
-        )
-        ncpus = 2
+        if ncpus is None:
+            # we don't know
+            warn(
+                f"{__name__} could not determine number of CPUs from the pool, expecting 2"
+            )
+            ncpus = 2
 
     if "chunksize" not in run:
         if isinstance(nchunk, float):
@@ -148,9 +436,10 @@ def _pool_procs(pool, size: int):
             nchunk = size // tmp
         run["chunksize"] = nchunk
 
-    # Prepare the pool, just in case it has already been used.
-    pool.terminate()
-    pool.join()
+    if not isinstance(pool, BrillouinZonePool):
+        # Prepare the pool, just in case it has already been used.
+        pool.terminate()
+        pool.join()
 
     return pool, run
 
@@ -220,16 +509,12 @@ class IteratorApply(BrillouinZoneParentApply):
 
             @wraps(method)
             def func(*args, wrap=None, eta=None, **kwargs):
-                pool.restart(True)
+                _pool_start(pool)
                 bz, parent, wrap, eta = self._parse_kwargs(wrap, eta, eta_key=eta_key)
                 k = bz.k
                 w = bz.weight
 
-                def func(k, w):
-                    return wrap(
-                        method(*args, k=k, **kwargs), parent=parent, k=k, weight=w
-                    )
-
+                func = _pool_func(pool, method, args, kwargs, wrap, parent)
                 for ret in pool.imap(func, k, w, **pool_run):
                     eta.update()
                     yield ret
@@ -238,8 +523,7 @@ class IteratorApply(BrillouinZoneParentApply):
                 # unless this generator is the first argument of zip
                 # zip has left-to-right checks of length and stops querying
                 # elements as soon as the left-most one stops.
-                pool.close()
-                pool.join()
+                _pool_stop(pool)
                 eta.close()
 
         return func
@@ -334,6 +618,7 @@ class NDArrayApply(BrillouinZoneParentApply):
     def dispatch(self, method, eta_key="ndarray"):
         """Dispatch the method by one array"""
         pool, pool_run = _pool_procs(self._attrs.get("pool"), len(self._get_object()))
+        shared = _pool_shared_output(pool, self._attrs)
         unzip = self._attrs.get("zip", self._attrs.get("unzip", False))
 
         def _create_v(nk, v):
@@ -383,21 +668,60 @@ class NDArrayApply(BrillouinZoneParentApply):
 
                 return a
 
-        else:
+        elif shared:
 
             @wraps(method)
             def func(*args, wrap=None, eta=None, **kwargs):
-                pool.restart(True)
                 bz, parent, wrap, eta = self._parse_kwargs(wrap, eta, eta_key=eta_key)
                 k = bz.k
                 nk = len(k)
                 w = bz.weight
 
-                def func(k, w):
-                    return wrap(
-                        method(*args, k=k, **kwargs), parent=parent, k=k, weight=w
-                    )
+                # Get first values, to know the shapes of the arrays
+                v = wrap(
+                    method(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0]
+                )
+                eta.update()
+                if unzip:
+                    v = tuple(map(np.asarray, v))
+                else:
+                    v = (np.asarray(v),)
+
+                # The workers write directly into the shared arrays
+                shm = _SharedArrays([((nk, *vi.shape), vi.dtype) for vi in v])
+                for ai, vi in zip(shm.arrays, v):
+                    ai[0] = vi
+                del v
+
+                _pool_start(pool)
+                func = partial(
+                    _shared_set,
+                    _pool_func(pool, method, args, kwargs, wrap, parent),
+                    shm.specs,
+                    unzip,
+                )
+                for _ in pool.imap(func, range(1, nk), k[1:], w[1:], **pool_run):
+                    eta.update()
+                _pool_stop(pool)
+
+                a = shm.copy()
+                shm.close()
+                eta.close()
+                if unzip:
+                    return tuple(a)
+                return a[0]
+
+        else:
 
+            @wraps(method)
+            def func(*args, wrap=None, eta=None, **kwargs):
+                _pool_start(pool)
+                bz, parent, wrap, eta = self._parse_kwargs(wrap, eta, eta_key=eta_key)
+                k = bz.k
+                nk = len(k)
+                w = bz.weight
+
+                func = _pool_func(pool, method, args, kwargs, wrap, parent)
                 it = pool.imap(func, k, w, **pool_run)
                 v = next(it)
                 eta.update()
@@ -414,8 +738,7 @@ class NDArrayApply(BrillouinZoneParentApply):
                         a[i] = v
                         eta.update()
                 del v
-                pool.close()
-                pool.join()
+                _pool_stop(pool)
                 eta.close()
                 return a
 
@@ -430,6 +753,7 @@ class AverageApply(BrillouinZoneParentApply):
     def dispatch(self, method):
         """Dispatch the method by averaging"""
         pool, pool_run = _pool_procs(self._attrs.get("pool"), len(self._get_object()))
+        shared = _pool_shared_output(pool, self._attrs)
 
         if pool is None:
 
@@ -467,21 +791,72 @@ class AverageApply(BrillouinZoneParentApply):
                 eta.close()
                 return v
 
+        elif shared:
+
+            @wraps(method)
+            def func(*args, wrap=None, eta=None, **kwargs):
+                bz, parent, wrap, eta = self._parse_kwargs(wrap, eta, eta_key="average")
+                k = bz.k
+                nk = len(k)
+                w = bz.weight
+
+                def wrap_weight(v, parent=None, k=None, weight=None):
+                    return weight * _asoplist(
+                        wrap(v, parent=parent, k=k, weight=weight)
+                    )
+
+                # Get first values, to know the shape of the arrays
+                avg = wrap_weight(
+                    method(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0]
+                )
+                eta.update()
+
+                _pool_start(pool)
+                func = _pool_func(pool, method, args, kwargs, wrap_weight, parent)
+                if isinstance(avg, np.ndarray):
+                    # Each task sums a chunk of k-points into its own slot
+                    nchunks = max(1, -(-(nk - 1) // pool_run.get("chunksize", 1)))
+                    chunks = np.array_split(_a.arangei(1, nk), nchunks)
+                    shm = _SharedArrays([((nchunks, *avg.shape), avg.dtype)])
+                    func = partial(_shared_sum, func, shm.specs)
+                    run = {**pool_run, "chunksize": 1}
+                    for n in pool.imap(
+                        func,
+                        range(nchunks),
+                        [k[idx] for idx in chunks],
+                        [w[idx] for idx in chunks],
+                        **run,
+                    ):
+                        eta.update(n)
+                    avg += shm.arrays[0].sum(0)
+                    shm.close()
+
+                else:
+                    # only arrays can be reduced in shared memory
+                    for it in pool.imap(func, k[1:], w[1:], **pool_run):
+                        avg += it
+                        eta.update()
+                _pool_stop(pool)
+
+                eta.close()
+                return avg
+
         else:
 
             @wraps(method)
             def func(*args, wrap=None, eta=None, **kwargs):
-                pool.restart(True)
+                _pool_start(pool)
 
                 bz, parent, wrap, eta = self._parse_kwargs(wrap, eta, eta_key="average")
                 k = bz.k
                 w = bz.weight
 
-                def func(k, w):
-                    return w * _asoplist(
-                        wrap(method(*args, k=k, **kwargs), parent=parent, k=k, weight=w)
+                def wrap_weight(v, parent=None, k=None, weight=None):
+                    return weight * _asoplist(
+                        wrap(v, parent=parent, k=k, weight=weight)
                     )
 
+                func = _pool_func(pool, method, args, kwargs, wrap_weight, parent)
                 iret = pool.imap(func, k, w, **pool_run)
                 avg = next(iret)
                 eta.update()
@@ -489,8 +864,7 @@ class AverageApply(BrillouinZoneParentApply):
                     avg += it
                     eta.update()
 
-                pool.close()
-                pool.join()
+                _pool_stop(pool)
 
                 eta.close()
                 return avg
@@ -0,0 +1,269 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+r"""Kernel polynomial method (KPM)
+
+Routines for calculating Chebyshev moments of sparse (generalized) eigenvalue
+problems and the reconstruction of spectral densities from them.
+
+The density of states is expanded in Chebyshev polynomials of the
+scaled matrix :math:`\tilde{\mathbf H} = (\mathbf H - b)/a`, with spectrum in :math:`[-1, 1]`:
+
+.. math::
+   \mathrm{DOS}(E) = \frac{1}{\pi a \sqrt{1-x^2}}
+      \Big[g_0\mu_0 + 2\sum_{n=1}^{N-1} g_n\mu_n T_n(x)\Big],
+   \quad x = (E - b) / a
+
+where :math:`g_n` is the kernel damping the Gibbs oscillations, and the
+moments :math:`\mu_n = \mathrm{Tr}[T_n(\tilde{\mathbf H})]` are estimated
+stochastically with random phase vectors. Only sparse matrix-vector products
+are needed, hence the computational cost scales linearly with the number of
+non-zero elements.
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as scs
+import scipy.sparse.linalg as ssl
+from numpy.polynomial.chebyshev import chebval
+
+__all__ = ["kpm_kernel", "kpm_bounds", "kpm_moments", "kpm_reconstruct"]
+
+
+def kpm_kernel(n: int, kernel: Literal["jackson", "lorentz", "none"] = "jackson"):
+    r"""Damping factors :math:`g_n` for a truncated Chebyshev expansion
+
+    Parameters
+    ----------
+    n :
+        number of moments
+    kernel :
+        the kernel, ``jackson`` yields a Gaussian-like broadening
+        of width :math:`\approx\pi a/n`. ``lorentz`` (with :math:`\lambda=4`)
+        yields a Lorentzian broadening, and ``none`` does not damp (Dirichlet kernel).
+    """
+    kernel = kernel.lower()
+    m = np.arange(n, dtype=np.float64)
+    if kernel == "jackson":
+        q = np.pi / (n + 1)
+        return ((n - m + 1) * np.cos(q * m) + np.sin(q * m) / np.tan(q)) / (n + 1)
+    elif kernel == "lorentz":
+        lam = 4.0
+        return np.sinh(lam * (1 - m / n)) / np.sinh(lam)
+    elif kernel in ("none", "dirichlet"):
+        return np.ones(n)
+    raise ValueError(f"kpm_kernel got unknown kernel {kernel}")
+
+
+def _solver(S):
+    """Return a function solving ``S x = b``, or None for an identity `S`"""
+    if S is None:
+        return None
+    lu = ssl.splu(scs.csc_matrix(S))
+    return lu.solve
+
+
+def kpm_bounds(H, S=None, eps: float = 0.01) -> Tuple[float, float]:
+    r"""Estimate the spectral bounds of the (generalized) eigenvalue problem
+
+    The extremal eigenvalues are calculated using the Lanczos method, and
+    subsequently widened by the fraction `eps` of the spectral width, to ensure
+    the full spectrum is contained.
+
+    Parameters
+    ----------
+    H : scipy.sparse.spmatrix
+        Hermitian matrix
+    S : scipy.sparse.spmatrix, optional
+        overlap matrix (positive definite), if not passed the identity is assumed
+    eps :
+        relative widening of the bounds
+
+    Returns
+    -------
+    emin, emax : float
+        the lower and upper bounds of the eigenvalue spectrum
+    """
+    N = H.shape[0]
+    if N < 32:
+        # small problems are much easier to solve directly
+        if S is None:
+            e = np.linalg.eigvalsh(H.toarray())
+        else:
+            e = np.linalg.eigvals(_solver(S)(H.toarray())).real
+        emin, emax = e.min(), e.max()
+    else:
+        # fixed starting vector for reproducible bounds
+        v0 = np.random.default_rng(0).random(N) - 0.5
+        # The error of the Ritz values are bounded by the residual (tol * |e|)
+        # which is smaller than the widening below.
+        kwargs = dict(k=1, tol=eps, v0=v0, return_eigenvectors=False)
+        if S is not None:
+            kwargs["M"] = S
+        emin = ssl.eigsh(H, which="SA", **kwargs)[0]
+        emax = ssl.eigsh(H, which="LA", **kwargs)[0]
+    # Ensure a finite width (e.g. a flat band)
+    width = max(emax - emin, 1e-3)
+    return emin - eps * width, emax + eps * width
+
+
+def kpm_moments(
+    H,
+    n: int,
+    S=None,
+    bounds: Optional[Tuple[float, float]] = None,
+    n_random: int = 16,
+    local: bool = False,
+    seed=None,
+):
+    r"""Stochastic estimate of the Chebyshev moments of `H` (or :math:`\mathbf S^{-1}\mathbf H`)
+
+    The moments are estimated as
+
+    .. math::
+        \mu_n^i = \frac1R\sum_r \Re\big[r_i^* [T_n(\tilde{\mathbf A}) r]_i\big]
+
+    where :math:`r` are random phase vectors (random signs for real matrices), and
+    :math:`\tilde{\mathbf A}` is the scaled :math:`\mathbf H\mathbf S^{-1}`. With an
+    overlap matrix the local moments correspond to Mulliken populations, i.e. the same as `PDOS`.
+
+    Parameters
+    ----------
+    H : scipy.sparse.spmatrix
+        Hermitian matrix
+    n :
+        number of moments
+    S : scipy.sparse.spmatrix, optional
+        overlap matrix, if not passed the identity is assumed
+    bounds :
+        spectral bounds of the eigenvalue problem, if not passed they will
+        be estimated using `kpm_bounds`
+    n_random :
+        number of random vectors used in the stochastic trace
+    local :
+        whether the moments are calculated per row of `H` (local moments), or
+        only the trace
+    seed :
+        seed (or generator) passed to `numpy.random.default_rng`
+
+    Returns
+    -------
+    mu : numpy.ndarray
+        the moments, with shape ``(n,)`` or ``(H.shape[0], n)`` for `local` moments
+    bounds : tuple of float
+        the spectral bounds used for scaling `H`
+    """
+    if bounds is None:
+        bounds = kpm_bounds(H, S)
+    emin, emax = bounds
+    if emax <= emin:
+        raise ValueError(f"kpm_moments requires emax > emin, got {bounds}")
+    a = (emax - emin) / 2
+    b = (emax + emin) / 2
+
+    H = scs.csr_matrix(H)
+    N = H.shape[0]
+    dtype = np.result_type(H.dtype, np.float64)
+    solve = _solver(S)
+
+    rng = np.random.default_rng(seed)
+    if np.iscomplexobj(np.empty(0, dtype)):
+        r = np.exp(2j * np.pi * rng.random((N, n_random)))
+    else:
+        r = rng.choice([-1.0, 1.0], size=(N, n_random))
+
+    if solve is None:
+
+        def matvec(v):
+            return (H @ v - b * v) / a
+
+    else:
+
+        def matvec(v):
+            return (H @ solve(v) - b * v) / a
+
+    if local:
+        mu = np.empty([N, n], dtype=np.float64)
+
+        def moment(v, i):
+            mu[:, i] = (r.conj() * v).real.sum(1) / n_random
+
+    else:
+        mu = np.empty([n], dtype=np.float64)
+
+        def moment(v, i):
+            mu[i] = np.vdot(r, v).real / n_random
+
+    v0 = r
+    moment(v0, 0)
+    if n == 1:
+        return mu, bounds
+
+    v1 = matvec(v0)
+
+    if not local and solve is None:
+        # For Hermitian matrices we can use the product rules
+        #   T_{2m} = 2 T_m^2 - T_0
+        #   T_{2m+1} = 2 T_{m+1} T_m - T_1
+        # to calculate 2 moments per matrix-vector product
+        moment(v1, 1)
+        mu0, mu1 = mu[0], mu[1]
+        for m in range(1, (n + 1) // 2):
+            mu[2 * m] = 2 * np.vdot(v1, v1).real / n_random - mu0
+            if 2 * m + 1 < n:
+                v0, v1 = v1, 2 * matvec(v1) - v0
+                mu[2 * m + 1] = 2 * np.vdot(v1, v0).real / n_random - mu1
+        return mu, bounds
+
+    moment(v1, 1)
+    for i in range(2, n):
+        v0, v1 = v1, 2 * matvec(v1) - v0
+        moment(v1, i)
+
+    return mu, bounds
+
+
+def kpm_reconstruct(
+    E,
+    mu,
+    bounds: Tuple[float, float],
+    kernel: Literal["jackson", "lorentz", "none"] = "jackson",
+):
+    r"""Reconstruct the spectral density from Chebyshev moments
+
+    Parameters
+    ----------
+    E : array_like
+        energies to evaluate the density at
+    mu : numpy.ndarray
+        the moments, the last dimension is the moment index
+    bounds :
+        the spectral bounds used when calculating `mu`
+    kernel :
+        damping kernel, see `kpm_kernel`
+
+    Returns
+    -------
+    numpy.ndarray
+        the density at `E` with shape ``mu.shape[:-1] + E.shape``.
+        Energies outside the `bounds` yield 0.
+    """
+    E = np.asarray(E, dtype=np.float64)
+    emin, emax = bounds
+    a = (emax - emin) / 2
+    b = (emax + emin) / 2
+
+    mu = np.asarray(mu)
+    n = mu.shape[-1]
+    c = mu * kpm_kernel(n, kernel)
+    c[..., 1:] *= 2
+
+    x = (E - b) / a
+    inside = np.abs(x) < 1
+    xi = np.where(inside, x, 0.0)
+    # move moments to the first axis (required by chebval)
+    DOS = chebval(xi, np.moveaxis(c, -1, 0))
+    DOS /= np.pi * a * np.sqrt(1 - xi**2)
+    return np.where(inside, DOS, 0.0)
@@ -72,8 +72,8 @@ def matrix_ddk(gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st] k, dtyp
 
     else:
         # Default must be something else.
-        dd[:3] = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
-        dd[3:] = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
+        dd[:3] = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, csr._folded())
+        dd[3:] = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, csr._folded())
         dd[0] = dd[0].asformat(format)
         dd[1] = dd[1].asformat(format)
         dd[2] = dd[2].asformat(format)
@@ -99,8 +99,8 @@ def matrix_ddk_nc(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
 
     else:
         # Default must be something else.
-        dd[:3] = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt)
-        dd[3:] = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt)
+        dd[:3] = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt, csr._folded(2))
+        dd[3:] = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt, csr._folded(2))
         dd[0] = dd[0].asformat(format)
         dd[1] = dd[1].asformat(format)
         dd[2] = dd[2].asformat(format)
@@ -144,17 +144,17 @@ def matrix_ddk_diag(gauge, M, const int_sp_st idx, const int_sp_st per_row,
 
     else:
         dxx = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rxx, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
         dyy = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ryy, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
         dzz = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rzz, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
         dzy = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rzy, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
         dxz = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rxz, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
         dyx = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ryx, p_opt,
-        per_row).asformat(format)
+        per_row, csr._folded(per_row, True)).asformat(format)
 
     return dxx, dyy, dzz, dzy, dxz, dyx
 
@@ -174,8 +174,8 @@ def matrix_ddk_so(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
 
     else:
         # Default must be something else.
-        dd[:3] = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt)
-        dd[3:] = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt)
+        dd[:3] = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt, csr._folded(2))
+        dd[3:] = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt, csr._folded(2))
         dd[0] = dd[0].asformat(format)
         dd[1] = dd[1].asformat(format)
         dd[2] = dd[2].asformat(format)
@@ -201,8 +201,8 @@ def matrix_ddk_nambu(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
 
     else:
         # Default must be something else.
-        dd[:3] = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt)
-        dd[3:] = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt)
+        dd[:3] = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, Rd, p_opt, csr._folded(4))
+        dd[3:] = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, Ro, p_opt, csr._folded(4))
         dd[0] = dd[0].asformat(format)
         dd[1] = dd[1].asformat(format)
         dd[2] = dd[2].asformat(format)
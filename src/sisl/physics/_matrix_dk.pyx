@@ -19,7 +19,9 @@ __all__ = [
     "matrik_dk_nc",
     "matrik_dk_diag",
     "matrik_dk_so",
-    "matrix_dk_nambu"
+    "matrix_dk_nambu",
+    "matrix_dk_state_diag",
+    "matrix_dk_state_box",
 ]
 
 
@@ -61,7 +63,7 @@ def matrix_dk(gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st] k, dtype
         return phase3_array(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
 
     # Default must be something else.
-    d1, d2, d3 = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
+    d1, d2, d3 = phase3_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt, csr._folded())
     return d1.asformat(format), d2.asformat(format), d3.asformat(format)
 
 
@@ -75,7 +77,7 @@ def matrix_dk_nc(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
         return phase3_array_nc(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
 
     # Default must be something else.
-    d1, d2, d3 = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
+    d1, d2, d3 = phase3_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt, csr._folded(2))
     return d1.asformat(format), d2.asformat(format), d3.asformat(format)
 
 
@@ -100,9 +102,9 @@ def matrix_dk_diag(gauge, M, const int_sp_st idx, const int_sp_st per_row,
         per_row)
 
     else:
-        x = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phx, p_opt, per_row).asformat(format)
-        y = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phy, p_opt, per_row).asformat(format)
-        z = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phz, p_opt, per_row).asformat(format)
+        x = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phx, p_opt, per_row, csr._folded(per_row, True)).asformat(format)
+        y = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phy, p_opt, per_row, csr._folded(per_row, True)).asformat(format)
+        z = phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phz, p_opt, per_row, csr._folded(per_row, True)).asformat(format)
 
     return x, y, z
 
@@ -117,7 +119,7 @@ def matrix_dk_so(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
         return phase3_array_so(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
 
     # Default must be something else.
-    d1, d2, d3 = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
+    d1, d2, d3 = phase3_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt, csr._folded(2))
     return d1.asformat(format), d2.asformat(format), d3.asformat(format)
 
 
@@ -131,5 +133,194 @@ def matrix_dk_nambu(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
         return phase3_array_nambu(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
 
     # Default must be something else.
-    d1, d2, d3 = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt)
+    d1, d2, d3 = phase3_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, iRs, p_opt, csr._folded(4))
     return d1.asformat(format), d2.asformat(format), d3.asformat(format)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _dk_state_diag(const int_sp_st[::1] ptr,
+                         const int_sp_st[::1] ncol,
+                         const int_sp_st[::1] col,
+                         const double complex[::1] P,
+                         const double complex[::1] S,
+                         const double complex[:, ::1] iRs,
+                         const int_sp_st p_opt,
+                         const double complex[:, ::1] stateT,
+                         const double[::1] energy,
+                         double complex[:, ::1] v) noexcept nogil:
+    cdef Py_ssize_t nr = ptr.shape[0] - 1
+    cdef Py_ssize_t nstate = stateT.shape[1]
+    cdef bint has_S = S.shape[0] > 0
+    cdef Py_ssize_t r, c, ind, iR, s
+    cdef double complex p, o, cw, w, iRx, iRy, iRz
+
+    for r in range(nr):
+        for ind in range(ptr[r], ptr[r] + ncol[r]):
+            c = col[ind] % nr
+            if p_opt == 0:
+                iR = ind
+            else:
+                iR = col[ind] // nr
+            iRx = iRs[iR, 0]
+            iRy = iRs[iR, 1]
+            iRz = iRs[iR, 2]
+            p = P[ind]
+            if has_S:
+                o = S[ind]
+            for s in range(nstate):
+                cw = stateT[r, s].conjugate() * stateT[c, s]
+                if has_S:
+                    w = cw * (p - energy[s] * o)
+                else:
+                    w = cw * p
+                v[s, 0] = v[s, 0] + w * iRx
+                v[s, 1] = v[s, 1] + w * iRy
+                v[s, 2] = v[s, 2] + w * iRz
+
+
+def matrix_dk_state_diag(gauge, M, const int_sp_st idx, const int_sp_st s_idx,
+                         sc, cnp.ndarray[floats_st] k, state, energy):
+    r""" Calculate the expectation values of the k-derivative of a matrix
+
+    Calculates :math:`\langle\psi_i|\partial_{\mathbf k} \mathbf M(\mathbf k)
+    - \epsilon_i \partial_{\mathbf k}\mathbf S(\mathbf k)|\psi_i\rangle`
+    directly from the sparse matrix elements, without forming the derivative
+    matrices.
+    A negative `s_idx` means an orthogonal basis (`energy` is then not used).
+
+    Returns
+    -------
+    numpy.ndarray
+        the Cartesian expectation values, shape ``(3, state.shape[0])``
+    """
+    dtype = np.complex128
+    p_opt, iRs = phase_dk(gauge, M, sc, k, dtype)
+    iRs = np.ascontiguousarray(iRs)
+
+    csr = M._csr
+    P = np.ascontiguousarray(csr._D[:, idx], dtype=dtype)
+    if s_idx < 0:
+        S = np.empty([0], dtype=dtype)
+        energy = np.zeros([state.shape[0]], dtype=np.float64)
+    else:
+        S = np.ascontiguousarray(csr._D[:, s_idx], dtype=dtype)
+        energy = np.ascontiguousarray(np.real(energy), dtype=np.float64)
+
+    # states are accessed per orbital, with contiguous states
+    stateT = np.ascontiguousarray(np.asarray(state).T, dtype=dtype)
+    v = np.zeros([stateT.shape[1], 3], dtype=dtype)
+
+    _dk_state_diag(csr.ptr, csr.ncol, csr.col, P, S, iRs, p_opt, stateT, energy, v)
+
+    return v.T
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _dk_state_box(const int_sp_st[::1] ptr,
+                        const int_sp_st[::1] ncol,
+                        const int_sp_st[::1] col,
+                        const double complex[:, ::1] P,
+                        const double complex[::1] S,
+                        const double complex[:, ::1] iRs,
+                        const int_sp_st p_opt,
+                        const double complex[:, ::1] stateT,
+                        const double[::1] energy,
+                        double complex[:, ::1] v) noexcept nogil:
+    cdef Py_ssize_t nr = ptr.shape[0] - 1
+    cdef Py_ssize_t nstate = stateT.shape[1]
+    cdef bint has_S = S.shape[0] > 0
+    cdef Py_ssize_t r, c, ind, iR, s
+    cdef double complex p00, p01, p10, p11, o, a0, a1, b0, b1, w, iRx, iRy, iRz
+
+    for r in range(nr):
+        for ind in range(ptr[r], ptr[r] + ncol[r]):
+            c = col[ind] % nr
+            if p_opt == 0:
+                iR = ind
+            else:
+                iR = col[ind] // nr
+            iRx = iRs[iR, 0]
+            iRy = iRs[iR, 1]
+            iRz = iRs[iR, 2]
+            p00 = P[ind, 0]
+            p01 = P[ind, 1]
+            p10 = P[ind, 2]
+            p11 = P[ind, 3]
+            if has_S:
+                o = S[ind]
+            for s in range(nstate):
+                a0 = stateT[2 * r, s].conjugate()
+                a1 = stateT[2 * r + 1, s].conjugate()
+                b0 = stateT[2 * c, s]
+                b1 = stateT[2 * c + 1, s]
+                w = a0 * (p00 * b0 + p01 * b1) + a1 * (p10 * b0 + p11 * b1)
+                if has_S:
+                    w = w - energy[s] * o * (a0 * b0 + a1 * b1)
+                v[s, 0] = v[s, 0] + w * iRx
+                v[s, 1] = v[s, 1] + w * iRy
+                v[s, 2] = v[s, 2] + w * iRz
+
+
+def matrix_dk_state_box(kind, gauge, M, const int_sp_st s_idx,
+                        sc, cnp.ndarray[floats_st] k, state, energy):
+    r""" Calculate the expectation values of the k-derivative of a spin-box matrix
+
+    Same as `matrix_dk_state_diag` but for the spin-box matrices (`kind` in nc, so),
+    the states have 2 components per orbital.
+
+    Returns
+    -------
+    numpy.ndarray
+        the Cartesian expectation values, shape ``(3, state.shape[0])``
+    """
+    dtype = np.complex128
+    p_opt, iRs = phase_dk(gauge, M, sc, k, dtype)
+    iRs = np.ascontiguousarray(iRs)
+
+    csr = M._csr
+    D = csr._D
+    # The spin-box elements [00, 01, 10, 11], see matrix_box_* in _matrix_utils
+    P = np.empty([D.shape[0], 4], dtype=dtype)
+    if kind == "nc":
+        if np.iscomplexobj(D):
+            P[:, 0] = D[:, 0]
+            P[:, 1] = D[:, 2]
+            P[:, 2] = D[:, 2].conj()
+            P[:, 3] = D[:, 1]
+        else:
+            P[:, 0] = D[:, 0]
+            P[:, 1] = D[:, 2] + 1j * D[:, 3]
+            P[:, 2] = D[:, 2] - 1j * D[:, 3]
+            P[:, 3] = D[:, 1]
+    elif kind == "so":
+        if np.iscomplexobj(D):
+            P[:, 0] = D[:, 0]
+            P[:, 1] = D[:, 2]
+            P[:, 2] = D[:, 3]
+            P[:, 3] = D[:, 1]
+        else:
+            P[:, 0] = D[:, 0] + 1j * D[:, 4]
+            P[:, 1] = D[:, 2] + 1j * D[:, 3]
+            P[:, 2] = D[:, 6] + 1j * D[:, 7]
+            P[:, 3] = D[:, 1] + 1j * D[:, 5]
+    else:
+        raise ValueError(f"matrix_dk_state_box: unknown kind {kind} must be in [nc, so]")
+
+    if s_idx < 0:
+        S = np.empty([0], dtype=dtype)
+        energy = np.zeros([state.shape[0]], dtype=np.float64)
+    else:
+        S = np.ascontiguousarray(D[:, s_idx], dtype=dtype)
+        energy = np.ascontiguousarray(np.real(energy), dtype=np.float64)
+
+    # states are accessed per orbital, with contiguous states
+    stateT = np.ascontiguousarray(np.asarray(state).T, dtype=dtype)
+    v = np.zeros([stateT.shape[1], 3], dtype=dtype)
+
+    _dk_state_box(csr.ptr, csr.ncol, csr.col, P, S, iRs, p_opt, stateT, energy, v)
+
+    return v.T
@@ -6,6 +6,8 @@ cimport cython
 import numpy as np
 cimport numpy as cnp
 
+from scipy.sparse import csr_matrix
+
 from sisl._core._dtypes cimport floats_st, int_sp_st
 from ._common import comply_gauge
 from ._matrix_phase import *
@@ -15,6 +17,9 @@ from ._phase cimport is_gamma
 
 __all__ = [
     "matrix_k",
+    "matrix_k_batch",
+    "matrix_k_multi",
+    "matrix_k_box_diag",
     "matrix_k_nc",
     "matrix_k_so",
     "matrix_k_diag",
@@ -47,6 +52,132 @@ def phase_dk(gauge, M, sc, cnp.ndarray[floats_st] K, dtype):
 
     return p_opt, phases
 
+def phase_k_batch(gauge, M, sc, cnp.ndarray[floats_st, ndim=2] K, dtype):
+    """ Same as `phase_dk` for several k-points, the phases has a leading k dimension """
+    gauge = comply_gauge(gauge)
+
+    if np.all(np.fabs(K) <= 0.0000001):
+        # no - phases required
+        p_opt = -1
+        phases = np.ones([1, 1], dtype=dtype)
+
+    elif gauge == "atomic":
+        M.finalize()
+        rij = M.Rij()._csr._D
+        phases = np.exp(1j * np.dot(np.dot(K, sc.rcell), rij.T))
+        phases = np.ascontiguousarray(phases, dtype=dtype)
+        p_opt = 0
+
+    elif gauge == "lattice":
+        phases = np.exp((2j * np.pi) * np.dot(K, sc.sc_off.T))
+        phases = np.ascontiguousarray(phases, dtype=dtype)
+        p_opt = 1
+
+    else:
+        raise ValueError("phase_k: gauge must be in [lattice, atomic]")
+
+    return p_opt, phases
+
+
+def matrix_k_batch(gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st, ndim=2] K, dtype, format):
+    """ Same as `matrix_k` but for several k-points (rows of `K`)
+
+    The sparse pattern is only traversed once for all k-points.
+    For dense formats, an array of shape ``(nk, no, no)`` is returned.
+    Otherwise a list of sparse matrices is returned, these all have the same
+    sparse pattern (each with their own copy of ``indices`` and ``indptr``)
+    and their data arrays are rows of a single ``(nk, nnz)`` array.
+    """
+    # Use the k-point furthest away from Gamma to decide the data-type
+    dtype = phase_dtype(K[np.argmax(np.fabs(K).sum(1))], M.dtype, dtype)
+    p_opt, phases = phase_k_batch(gauge, M, sc, K, dtype)
+
+    cdef int_sp_st udx = idx
+    # Check that the dimension *works*
+    cdef int_sp_st shapem1 = M.shape[-1]
+    if idx < 0:
+        udx += shapem1
+    if udx < 0 or shapem1 <= udx:
+        d = shapem1
+        raise ValueError(f"matrix_k: unknown index specification {idx} must be in 0:{d}")
+
+    csr = M._csr
+    nk = K.shape[0]
+
+    if format in ("array", "matrix", "dense"):
+        V = phase_array_batch(csr.ptr, csr.ncol, csr.col, csr._D, udx, phases, p_opt)
+        if p_opt == -1 and nk > 1:
+            # Gamma-point only calculates the first matrix
+            V = np.repeat(V, nk, axis=0)
+        return V
+
+    V, V_COL, V_PTR = phase_csr_batch(csr.ptr, csr.ncol, csr.col, csr._D, udx, phases, p_opt, csr._folded())
+    if p_opt == -1 and nk > 1:
+        V = np.repeat(V, nk, axis=0)
+    nr = V_PTR.shape[0] - 1
+    # each matrix gets its own indices, in-place operations (e.g. sort_indices)
+    # on one matrix should not change the others
+    return [csr_matrix((v, V_COL.copy(), V_PTR.copy()), shape=(nr, nr)).asformat(format) for v in V]
+
+
+def matrix_k_multi(gauge, M, idx, sc, cnp.ndarray[floats_st] k, dtype, format):
+    """ Same as `matrix_k` but for several indices (e.g. matrix and overlap) at once
+
+    The phases are only calculated once, and the sparse pattern is only traversed once.
+    A tuple of matrices is returned, one per index in `idx`.
+    Sparse matrices have the same sparse pattern (each with their own copy
+    of ``indices`` and ``indptr``).
+    """
+    dtype = phase_dtype(k, M.dtype, dtype)
+    p_opt, phases = phase_dk(gauge, M, sc, k, dtype)
+
+    csr = M._csr
+
+    # Check that the dimensions *works*
+    shapem1 = M.shape[-1]
+    udx = np.array(idx, dtype=csr.ptr.dtype).ravel()
+    udx[udx < 0] += shapem1
+    if np.any(udx < 0) or np.any(shapem1 <= udx):
+        raise ValueError(f"matrix_k_multi: unknown index specification {idx} must be in 0:{shapem1}")
+
+    if format in ("array", "matrix", "dense"):
+        return tuple(phase_array_multi(csr.ptr, csr.ncol, csr.col, csr._D, udx, phases, p_opt))
+
+    V, V_COL, V_PTR = phase_csr_multi(csr.ptr, csr.ncol, csr.col, csr._D, udx, phases, p_opt, csr._folded())
+    nr = V_PTR.shape[0] - 1
+    return tuple(csr_matrix((v, V_COL.copy(), V_PTR.copy()), shape=(nr, nr)).asformat(format) for v in V)
+
+
+def matrix_k_box_diag(kind, gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st] k, dtype, format):
+    """ Spin-box matrix (`kind` in nc, so, nambu) and the diagonal matrix of index `idx` (e.g. overlap)
+
+    The phases are shared between the two matrices.
+    """
+    dtype = phase_dtype(k, M.dtype, dtype, True)
+    p_opt, phases = phase_dk(gauge, M, sc, k, dtype)
+
+    csr = M._csr
+    cdef int_sp_st per_row = 2
+    if kind == "nc":
+        phase_csr_box, phase_array_box = phase_csr_nc, phase_array_nc
+    elif kind == "so":
+        phase_csr_box, phase_array_box = phase_csr_so, phase_array_so
+    elif kind == "nambu":
+        phase_csr_box, phase_array_box = phase_csr_nambu, phase_array_nambu
+        per_row = 4
+    else:
+        raise ValueError(f"matrix_k_box_diag: unknown kind {kind} must be in [nc, so, nambu]")
+
+    if format in ("array", "matrix", "dense"):
+        return (phase_array_box(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt),
+                phase_array_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, per_row))
+
+    return (phase_csr_box(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt,
+                          csr._folded(per_row)).asformat(format),
+            phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt,
+                           per_row, csr._folded(per_row, True)).asformat(format))
+
+
 def matrix_k(gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st] k, dtype, format):
     dtype = phase_dtype(k, M.dtype, dtype)
     p_opt, phases = phase_dk(gauge, M, sc, k, dtype)
@@ -78,7 +209,7 @@ def matrix_k(gauge, M, const int_sp_st idx, sc, cnp.ndarray[floats_st] k, dtype,
     if format in ("array", "matrix", "dense"):
         return phase_array(csr.ptr, csr.ncol, csr.col, csr._D, udx, phases, p_opt)
 
-    return phase_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt).asformat(format)
+    return phase_csr(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, csr._folded()).asformat(format)
 
 
 def matrix_k_nc(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
@@ -102,7 +233,7 @@ def matrix_k_nc(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
     if format in ("array", "matrix", "dense"):
         return phase_array_nc(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
 
-    return phase_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt).asformat(format)
+    return phase_csr_nc(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, csr._folded(2)).asformat(format)
 
 
 def matrix_k_diag(gauge, M, const int_sp_st idx, const int_sp_st per_row,
@@ -131,7 +262,7 @@ def matrix_k_diag(gauge, M, const int_sp_st idx, const int_sp_st per_row,
         per_row)
 
     return phase_csr_diag(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt,
-    per_row).asformat(format)
+    per_row, csr._folded(per_row, True)).asformat(format)
 
 
 def matrix_k_so(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
@@ -155,7 +286,7 @@ def matrix_k_so(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
     if format in ("array", "matrix", "dense"):
         return phase_array_so(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
 
-    return phase_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt).asformat(format)
+    return phase_csr_so(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, csr._folded(2)).asformat(format)
 
 
 def matrix_k_nambu(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
@@ -179,4 +310,4 @@ def matrix_k_nambu(gauge, M, sc, cnp.ndarray[floats_st] k, dtype, format):
     if format in ("array", "matrix", "dense"):
         return phase_array_nambu(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
 
-    return phase_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt).asformat(format)
+    return phase_csr_nambu(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, csr._folded(4)).asformat(format)
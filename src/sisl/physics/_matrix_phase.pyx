@@ -10,9 +10,7 @@ cimport numpy as cnp
 
 from scipy.sparse import csr_matrix
 
-from sisl._indices cimport _index_sorted
-
-from sisl._core._sparse import fold_csr_matrix, fold_csr_matrix_diag
+from sisl._core._sparse import fold_csr_pattern
 
 from sisl._core._dtypes cimport (
     complexs_st,
@@ -42,6 +40,10 @@ from ._matrix_utils cimport (
 __all__ = [
     "phase_csr",
     "phase_array",
+    "phase_csr_batch",
+    "phase_array_batch",
+    "phase_csr_multi",
+    "phase_array_multi",
     "phase_csr_nc",
     "phase_array_nc",
     "phase_csr_diag",
@@ -83,14 +85,16 @@ def phase_csr(const int_sp_st[::1] ptr,
               floatcomplexs_st[:, ::1] D,
               const int_sp_st idx,
               const phases_st[::1] phases,
-              const int_sp_st p_opt):
+              const int_sp_st p_opt,
+              fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
-    cdef int_sp_st[::1] tmp
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     # This may fail, when floatcomplexs_st is complex, but phases_st is float
     cdef object dtype = type2dtype[phases_st](1)
@@ -99,38 +103,30 @@ def phase_csr(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, ind, s, s_idx, c
+    cdef int_sp_st r, ind, s, s_idx
 
     with nogil:
         if p_opt == -1:
             for r in range(nr):
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = col[ind] % nr
-
-                    tmp = v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
                     v[v_ptr[r] + s_idx] += <phases_st> D[ind, idx]
 
         elif p_opt == 0:
             for r in range(nr):
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = col[ind] % nr
-
-                    tmp = v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
                     v[v_ptr[r] + s_idx] += <phases_st> (D[ind, idx] * phases[ind])
 
         else:
             for r in range(nr):
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = col[ind] % nr
                     s = col[ind] / nr
 
-                    tmp = v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
                     v[v_ptr[r] + s_idx] += <phases_st> (D[ind, idx] * phases[s])
 
-    return csr_matrix((V, V_COL, V_PTR), shape=(nr, nr))
+    return csr_matrix((V, V_COL.copy(), V_PTR.copy()), shape=(nr, nr))
 
 
 def phase_array(const int_sp_st[::1] ptr,
@@ -174,6 +170,247 @@ def phase_array(const int_sp_st[::1] ptr,
     return V
 
 
+def phase_csr_batch(const int_sp_st[::1] ptr,
+                    const int_sp_st[::1] ncol,
+                    const int_sp_st[::1] col,
+                    floatcomplexs_st[:, ::1] D,
+                    const int_sp_st idx,
+                    const phases_st[:, ::1] phases,
+                    const int_sp_st p_opt,
+                    fold=None):
+    """ Same as `phase_csr` but for several k-points at once (first dimension of `phases`)
+
+    The sparse pattern is only traversed once, and the returned
+    data array has shape ``(nk, nnz)`` sharing the returned sparse pattern.
+
+    Returns
+    -------
+    V :
+       data array ``(nk, nnz)``
+    V_COL :
+       column indices of the folded matrix
+    V_PTR :
+       row pointers of the folded matrix
+    """
+
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
+    cdef int_sp_st[::1] v_ptr = V_PTR
+    cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
+
+    cdef int_sp_st nk = phases.shape[0]
+    cdef object dtype = type2dtype[phases_st](1)
+    cdef cnp.ndarray[phases_st, ndim=2, mode='c'] V = np.zeros([nk, v_col.shape[0]], dtype=dtype)
+    cdef phases_st[:, ::1] v = V
+
+    # Local columns
+    cdef int_sp_st nr = ncol.shape[0]
+    cdef int_sp_st r, ind, s, s_idx, ik
+    cdef phases_st d
+
+    with nogil:
+        if p_opt == -1:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    d = <phases_st> D[ind, idx]
+                    for ik in range(nk):
+                        v[ik, s_idx] += d
+
+        elif p_opt == 0:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    for ik in range(nk):
+                        v[ik, s_idx] += <phases_st> (D[ind, idx] * phases[ik, ind])
+
+        else:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s = col[ind] / nr
+
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    for ik in range(nk):
+                        v[ik, s_idx] += <phases_st> (D[ind, idx] * phases[ik, s])
+
+    return V, V_COL.copy(), V_PTR.copy()
+
+
+def phase_array_batch(const int_sp_st[::1] ptr,
+                      const int_sp_st[::1] ncol,
+                      const int_sp_st[::1] col,
+                      floatcomplexs_st[:, ::1] D,
+                      const int_sp_st idx,
+                      const phases_st[:, ::1] phases,
+                      const int_sp_st p_opt):
+    """ Same as `phase_array` but for several k-points at once (first dimension of `phases`)
+
+    The returned array has shape ``(nk, nr, nr)``.
+    """
+
+    cdef int_sp_st nr = ncol.shape[0]
+    cdef int_sp_st nk = phases.shape[0]
+
+    cdef object dtype = type2dtype[phases_st](1)
+    cdef cnp.ndarray[phases_st, ndim=3, mode='c'] V = np.zeros([nk, nr, nr], dtype=dtype)
+    cdef phases_st[:, :, ::1] v = V
+
+    # Local columns
+    cdef int_sp_st r, ind, s, c, ik
+    cdef phases_st d
+
+    with nogil:
+        if p_opt == -1:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    d = <phases_st> D[ind, idx]
+                    for ik in range(nk):
+                        v[ik, r, c] += d
+
+        elif p_opt == 0:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    for ik in range(nk):
+                        v[ik, r, c] += <phases_st> (D[ind, idx] * phases[ik, ind])
+
+        else:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    s = col[ind] / nr
+                    for ik in range(nk):
+                        v[ik, r, c] += <phases_st> (D[ind, idx] * phases[ik, s])
+
+    return V
+
+
+def phase_csr_multi(const int_sp_st[::1] ptr,
+                    const int_sp_st[::1] ncol,
+                    const int_sp_st[::1] col,
+                    floatcomplexs_st[:, ::1] D,
+                    const int_sp_st[::1] idx,
+                    const phases_st[::1] phases,
+                    const int_sp_st p_opt,
+                    fold=None):
+    """ Same as `phase_csr` but for several indices of `D` at once (e.g. matrix and overlap)
+
+    The sparse pattern is only traversed once, and the phases are shared.
+
+    Returns
+    -------
+    V :
+       data array ``(len(idx), nnz)``
+    V_COL :
+       column indices of the folded matrix
+    V_PTR :
+       row pointers of the folded matrix
+    """
+
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
+    cdef int_sp_st[::1] v_ptr = V_PTR
+    cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
+
+    cdef int_sp_st ni = idx.shape[0]
+    cdef object dtype = type2dtype[phases_st](1)
+    cdef cnp.ndarray[phases_st, ndim=2, mode='c'] V = np.zeros([ni, v_col.shape[0]], dtype=dtype)
+    cdef phases_st[:, ::1] v = V
+
+    # Local columns
+    cdef int_sp_st nr = ncol.shape[0]
+    cdef int_sp_st r, ind, s, s_idx, ii
+    cdef phases_st ph
+
+    with nogil:
+        if p_opt == -1:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    for ii in range(ni):
+                        v[ii, s_idx] += <phases_st> D[ind, idx[ii]]
+
+        elif p_opt == 0:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    ph = phases[ind]
+                    for ii in range(ni):
+                        v[ii, s_idx] += <phases_st> (D[ind, idx[ii]] * ph)
+
+        else:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    s = col[ind] / nr
+                    s_idx = v_ptr[r] + v_idx[ind]
+                    ph = phases[s]
+                    for ii in range(ni):
+                        v[ii, s_idx] += <phases_st> (D[ind, idx[ii]] * ph)
+
+    return V, V_COL.copy(), V_PTR.copy()
+
+
+def phase_array_multi(const int_sp_st[::1] ptr,
+                      const int_sp_st[::1] ncol,
+                      const int_sp_st[::1] col,
+                      floatcomplexs_st[:, ::1] D,
+                      const int_sp_st[::1] idx,
+                      const phases_st[::1] phases,
+                      const int_sp_st p_opt):
+    """ Same as `phase_array` but for several indices of `D` at once (e.g. matrix and overlap)
+
+    Returns
+    -------
+    V :
+       dense array ``(len(idx), nr, nr)``
+    """
+
+    cdef int_sp_st nr = ncol.shape[0]
+    cdef int_sp_st ni = idx.shape[0]
+
+    cdef object dtype = type2dtype[phases_st](1)
+    cdef cnp.ndarray[phases_st, ndim=3, mode='c'] V = np.zeros([ni, nr, nr], dtype=dtype)
+    cdef phases_st[:, :, ::1] v = V
+
+    # Local columns
+    cdef int_sp_st r, ind, s, c, ii
+    cdef phases_st ph
+
+    with nogil:
+        if p_opt == -1:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    for ii in range(ni):
+                        v[ii, r, c] += <phases_st> D[ind, idx[ii]]
+
+        elif p_opt == 0:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    ph = phases[ind]
+                    for ii in range(ni):
+                        v[ii, r, c] += <phases_st> (D[ind, idx[ii]] * ph)
+
+        else:
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    s = col[ind] / nr
+                    ph = phases[s]
+                    for ii in range(ni):
+                        v[ii, r, c] += <phases_st> (D[ind, idx[ii]] * ph)
+
+    return V
+
+
 def phase_csr_diag(const int_sp_st[::1] ptr,
                    const int_sp_st[::1] ncol,
                    const int_sp_st[::1] col,
@@ -181,14 +418,16 @@ def phase_csr_diag(const int_sp_st[::1] ptr,
                    const int_sp_st idx,
                    const complexs_st[::1] phases,
                    const int_sp_st p_opt,
-                   const int_sp_st per_row):
+                   const int_sp_st per_row,
+                   fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix_diag(ptr, ncol, col, per_row)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, per_row, True)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
-    cdef int_sp_st[::1] tmp
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] V = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -196,7 +435,7 @@ def phase_csr_diag(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, s_idx, c, ic
+    cdef int_sp_st r, rr, ind, s, s_idx, ic
 
     cdef complexs_st d
 
@@ -205,10 +444,7 @@ def phase_csr_diag(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * per_row
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * per_row
-
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
 
                     d = <complexs_st> D[ind, idx]
                     for ic in range(per_row):
@@ -218,10 +454,7 @@ def phase_csr_diag(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * per_row
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * per_row
-
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
 
                     d = phases[ind] * D[ind, idx]
                     for ic in range(per_row):
@@ -231,18 +464,16 @@ def phase_csr_diag(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * per_row
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * per_row
                     s = col[ind] / nr
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind]
 
                     d = phases[s] * D[ind, idx]
                     for ic in range(per_row):
                         v[v_ptr[rr+ic] + s_idx] += d
 
     nr = nr * per_row
-    return csr_matrix((V, V_COL, V_PTR), shape=(nr, nr))
+    return csr_matrix((V, V_COL.copy(), V_PTR.copy()), shape=(nr, nr))
 
 
 def phase_array_diag(const int_sp_st[::1] ptr,
@@ -303,14 +534,16 @@ def phase_csr_nc(const int_sp_st[::1] ptr,
                  const int_sp_st[::1] col,
                  floatcomplexs_st[:, ::1] D,
                  const complexs_st[::1] phases,
-                 const int_sp_st p_opt):
+                 const int_sp_st p_opt,
+                 fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 2)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 2)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
-    cdef int_sp_st[::1] tmp
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] V = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -318,7 +551,7 @@ def phase_csr_nc(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, s_idx, c
+    cdef int_sp_st r, rr, ind, s, s_idx
 
     cdef complexs_st ph
     cdef f_matrix_box_nc func
@@ -336,10 +569,7 @@ def phase_csr_nc(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
-
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -349,11 +579,9 @@ def phase_csr_nc(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     ph = phases[ind]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -363,19 +591,17 @@ def phase_csr_nc(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     s = col[ind] / nr
                     ph = phases[s]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
                     matrix_add_csr_nc(v_ptr, rr, s_idx, v, M)
 
     nr = nr * 2
-    return csr_matrix((V, V_COL, V_PTR), shape=(nr, nr))
+    return csr_matrix((V, V_COL.copy(), V_PTR.copy()), shape=(nr, nr))
 
 
 def phase_array_nc(const int_sp_st[::1] ptr,
@@ -448,14 +674,16 @@ def phase_csr_so(const int_sp_st[::1] ptr,
                  const int_sp_st[::1] col,
                  floatcomplexs_st[:, ::1] D,
                  const complexs_st[::1] phases,
-                 const int_sp_st p_opt):
+                 const int_sp_st p_opt,
+                 fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 2)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 2)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
-    cdef int_sp_st[::1] tmp
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] V = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -463,7 +691,7 @@ def phase_csr_so(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, s_idx, c
+    cdef int_sp_st r, rr, ind, s, s_idx
 
     cdef complexs_st ph
     cdef f_matrix_box_so func
@@ -481,10 +709,7 @@ def phase_csr_so(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
-
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -494,11 +719,9 @@ def phase_csr_so(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     ph = phases[ind]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -508,19 +731,17 @@ def phase_csr_so(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     s = col[ind] / nr
                     ph = phases[s]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
                     func(d, ph, M)
                     matrix_add_csr_nc(v_ptr, rr, s_idx, v, M)
 
     nr = nr * 2
-    return csr_matrix((V, V_COL, V_PTR), shape=(nr, nr))
+    return csr_matrix((V, V_COL.copy(), V_PTR.copy()), shape=(nr, nr))
 
 
 def phase_array_so(const int_sp_st[::1] ptr,
@@ -592,14 +813,16 @@ def phase_csr_nambu(const int_sp_st[::1] ptr,
                     const int_sp_st[::1] col,
                     floatcomplexs_st[:, ::1] D,
                     const complexs_st[::1] phases,
-                    const int_sp_st p_opt):
+                    const int_sp_st p_opt,
+                    fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 4)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 4)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
-    cdef int_sp_st[::1] tmp
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] V = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -607,7 +830,7 @@ def phase_csr_nambu(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, s_idx, c
+    cdef int_sp_st r, rr, ind, s, s_idx
 
     cdef complexs_st ph
     cdef f_matrix_box_nambu func
@@ -625,10 +848,7 @@ def phase_csr_nambu(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 4
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 4
-
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 4
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -638,11 +858,9 @@ def phase_csr_nambu(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 4
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 4
                     ph = phases[ind]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 4
 
                     d = &D[ind, 0]
                     func(d, ph, M)
@@ -652,19 +870,17 @@ def phase_csr_nambu(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 4
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 4
                     s = col[ind] / nr
                     ph = phases[s]
 
-                    tmp = v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]]
-                    s_idx = _index_sorted(tmp, c)
+                    s_idx = v_idx[ind] * 4
 
                     d = &D[ind, 0]
                     func(d, ph, M)
                     matrix_add_csr_nambu(v_ptr, rr, s_idx, v, M)
 
     nr = nr * 4
-    return csr_matrix((V, V_COL, V_PTR), shape=(nr, nr))
+    return csr_matrix((V, V_COL.copy(), V_PTR.copy()), shape=(nr, nr))
 
 
 def phase_array_nambu(const int_sp_st[::1] ptr,
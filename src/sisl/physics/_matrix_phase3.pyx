@@ -10,9 +10,7 @@ cimport numpy as cnp
 
 from scipy.sparse import csr_matrix
 
-from sisl._indices cimport _index_sorted
-
-from sisl._core._sparse import fold_csr_matrix
+from sisl._core._sparse import fold_csr_pattern
 
 from sisl._core._dtypes cimport (
     complexs_st,
@@ -63,13 +61,16 @@ def phase3_csr(const int_sp_st[::1] ptr,
                floatcomplexs_st[:, ::1] D,
                const int_sp_st idx,
                const phases_st[:, ::1] phases,
-               const int_sp_st p_opt):
+               const int_sp_st p_opt,
+               fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     # This may fail, when floatcomplexs_st is complex, but phases_st is float
     cdef object dtype = type2dtype[phases_st](1)
@@ -82,7 +83,7 @@ def phase3_csr(const int_sp_st[::1] ptr,
 
     # Local columns
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, ind, s, s_idx, c
+    cdef int_sp_st r, ind, s, s_idx
 
     cdef floatcomplexs_st d
 
@@ -90,8 +91,7 @@ def phase3_csr(const int_sp_st[::1] ptr,
         if p_opt == 0:
             for r in range(nr):
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = col[ind] % nr
-                    s_idx = _index_sorted(v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]], c)
+                    s_idx = v_idx[ind]
                     d = D[ind, idx]
                     vx[v_ptr[r] + s_idx] += <phases_st> (d * phases[ind, 0])
                     vy[v_ptr[r] + s_idx] += <phases_st> (d * phases[ind, 1])
@@ -100,14 +100,15 @@ def phase3_csr(const int_sp_st[::1] ptr,
         else:
             for r in range(nr):
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = col[ind] % nr
                     s = col[ind] / nr
-                    s_idx = _index_sorted(v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]], c)
+                    s_idx = v_idx[ind]
                     d = D[ind, idx]
                     vx[v_ptr[r] + s_idx] += <phases_st> (d * phases[s, 0])
                     vy[v_ptr[r] + s_idx] += <phases_st> (d * phases[s, 1])
                     vz[v_ptr[r] + s_idx] += <phases_st> (d * phases[s, 2])
 
+    V_COL = V_COL.copy()
+    V_PTR = V_PTR.copy()
     return csr_matrix((Vx, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vy, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vz, V_COL, V_PTR), shape=(nr, nr))
 
 
@@ -167,13 +168,16 @@ def phase3_csr_nc(const int_sp_st[::1] ptr,
                   const int_sp_st[::1] col,
                   floatcomplexs_st[:, ::1] D,
                   const complexs_st[:, ::1] phases,
-                  const int_sp_st p_opt):
+                  const int_sp_st p_opt,
+                  fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 2)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 2)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] Vx = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -186,7 +190,7 @@ def phase3_csr_nc(const int_sp_st[::1] ptr,
 
     # Local columns (not in NC form)
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, c
+    cdef int_sp_st r, rr, ind, s
     cdef int_sp_st s_idx
     cdef floatcomplexs_st *d
     cdef f_matrix_box_nc func
@@ -202,8 +206,7 @@ def phase3_csr_nc(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
 
@@ -223,10 +226,9 @@ def phase3_csr_nc(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     s = col[ind] / nr
 
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
 
@@ -243,6 +245,8 @@ def phase3_csr_nc(const int_sp_st[::1] ptr,
                     matrix_add_csr_nc(v_ptr, rr, s_idx, vz, M)
 
     nr = nr * 2
+    V_COL = V_COL.copy()
+    V_PTR = V_PTR.copy()
     return csr_matrix((Vx, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vy, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vz, V_COL, V_PTR), shape=(nr, nr))
 
 
@@ -330,13 +334,16 @@ def phase3_csr_so(const int_sp_st[::1] ptr,
                   const int_sp_st[::1] col,
                   floatcomplexs_st[:, ::1] D,
                   const complexs_st[:, ::1] phases,
-                  const int_sp_st p_opt):
+                  const int_sp_st p_opt,
+                  fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 2)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 2)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] Vx = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -349,7 +356,7 @@ def phase3_csr_so(const int_sp_st[::1] ptr,
 
     # Local columns (not in NC form)
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, c
+    cdef int_sp_st r, rr, ind, s
     cdef int_sp_st s_idx
     cdef f_matrix_box_so func
     cdef floatcomplexs_st *d
@@ -365,8 +372,7 @@ def phase3_csr_so(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
 
@@ -386,10 +392,9 @@ def phase3_csr_so(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 2
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 2
                     s = col[ind] / nr
 
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 2
 
                     d = &D[ind, 0]
 
@@ -406,6 +411,8 @@ def phase3_csr_so(const int_sp_st[::1] ptr,
                     matrix_add_csr_nc(v_ptr, rr, s_idx, vz, M)
 
     nr = nr * 2
+    V_COL = V_COL.copy()
+    V_PTR = V_PTR.copy()
     return csr_matrix((Vx, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vy, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vz, V_COL, V_PTR), shape=(nr, nr))
 
 
@@ -488,13 +495,16 @@ def phase3_csr_nambu(const int_sp_st[::1] ptr,
                      const int_sp_st[::1] col,
                      floatcomplexs_st[:, ::1] D,
                      const complexs_st[:, ::1] phases,
-                     const int_sp_st p_opt):
+                     const int_sp_st p_opt,
+                     fold=None):
 
-    # Now create the folded sparse elements
-    V_PTR, V_NCOL, V_COL = fold_csr_matrix(ptr, ncol, col, 4)
+    # Now create the folded sparse elements (if not already done)
+    if fold is None:
+        fold = fold_csr_pattern(ptr, ncol, col, 4)
+    V_PTR, V_NCOL, V_COL, V_IDX = fold
     cdef int_sp_st[::1] v_ptr = V_PTR
-    cdef int_sp_st[::1] v_ncol = V_NCOL
     cdef int_sp_st[::1] v_col = V_COL
+    cdef const int_sp_st[::1] v_idx = V_IDX
 
     cdef object dtype = type2dtype[complexs_st](1)
     cdef cnp.ndarray[complexs_st, mode='c'] Vx = np.zeros([v_col.shape[0]], dtype=dtype)
@@ -507,7 +517,7 @@ def phase3_csr_nambu(const int_sp_st[::1] ptr,
 
     # Local columns (not in NC form)
     cdef int_sp_st nr = ncol.shape[0]
-    cdef int_sp_st r, rr, ind, s, c
+    cdef int_sp_st r, rr, ind, s
     cdef int_sp_st s_idx
     cdef f_matrix_box_nambu func
     cdef floatcomplexs_st *d
@@ -523,8 +533,7 @@ def phase3_csr_nambu(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 4
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 4
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 4
 
                     d = &D[ind, 0]
 
@@ -544,10 +553,9 @@ def phase3_csr_nambu(const int_sp_st[::1] ptr,
             for r in range(nr):
                 rr = r * 4
                 for ind in range(ptr[r], ptr[r] + ncol[r]):
-                    c = (col[ind] % nr) * 4
                     s = col[ind] / nr
 
-                    s_idx = _index_sorted(v_col[v_ptr[rr]:v_ptr[rr] + v_ncol[rr]], c)
+                    s_idx = v_idx[ind] * 4
 
                     d = &D[ind, 0]
 
@@ -564,6 +572,8 @@ def phase3_csr_nambu(const int_sp_st[::1] ptr,
                     matrix_add_csr_nambu(v_ptr, rr, s_idx, vz, M)
 
     nr = nr * 4
+    V_COL = V_COL.copy()
+    V_PTR = V_PTR.copy()
     return csr_matrix((Vx, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vy, V_COL, V_PTR), shape=(nr, nr)), csr_matrix((Vz, V_COL, V_PTR), shape=(nr, nr))
 
 
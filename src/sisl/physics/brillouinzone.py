@@ -130,6 +130,29 @@ The ``Pool`` should implement some standard methods that are
 existing in the ``pathos`` enviroment such as ``Pool.restart`` and ``Pool.terminate``
 and ``imap`` and ``uimap`` methods. See the ``pathos`` documentation for details.
 
+Each of the above calls will start a new pool of workers, and ship
+the parent object to them, on every dispatched method.
+When calling many methods on the same parent one should rather use
+a persistent pool, which only ships the parent once:
+
+>>> with mp.apply.pool(4) as par:
+...     eigs = par.ndarray.eigh()
+...     states = par.list.eigenstate()
+
+The persistent pool is closed when exiting the context manager.
+Note that changes to the parent object made while the pool is alive
+are not seen by the workers.
+
+For methods returning large arrays (e.g. eigenvectors), transferring
+the results from the workers may dominate. With ``shared=True`` the
+``array`` and ``average`` methods let the workers write the results
+directly into shared memory:
+
+>>> with mp.apply.pool(4, shared=True) as par:
+...     eigs, vecs = par.renew(zip=True).array.eigh(eigvals_only=False)
+
+This can also be used for non-persistent pools with ``mp.apply.renew(pool=4, shared=True)``.
+
 Finally, the performance of the parallel pools are generally very dependent
 on the chunksize of the jobs. By default the chunksize is controlled by
 ``SISL_PAR_CHUNKSIZE``, and playing with this can heavily impact performance.
@@ -154,7 +177,7 @@ from numpy import argsort, dot, pi
 import sisl._array as _a
 from sisl._core.lattice import Lattice
 from sisl._core.quaternion import Quaternion
-from sisl._dispatcher import ClassDispatcher
+from sisl._dispatcher import ClassDispatcher, ObjectDispatcher
 from sisl._internal import set_module
 from sisl._math_small import cross3, dot3
 from sisl.messages import SislError, deprecate_argument, info, warn
@@ -202,6 +225,56 @@ class BrillouinZoneDispatcher(ClassDispatcher):
     pass
 
 
+class BrillouinZoneObjectDispatcher(ObjectDispatcher):
+    r"""Instance dispatcher for `BrillouinZone.apply`
+
+    Adds the possibility of running the dispatched methods on a persistent
+    pool of workers, see `pool`.
+    """
+
+    def pool(self, pool: Union[int, bool] = True, shared: bool = False, **init):
+        r"""Run all dispatched methods on a persistent pool of workers
+
+        The parent of the Brillouin zone is shipped to the workers only once,
+        and subsequent calls only transfer k-points and the returned values.
+        The pool is closed when leaving the context manager.
+
+        Parameters
+        ----------
+        pool :
+           number of processes, if true it will use ``SISL_NUM_PROCS``
+        shared :
+           if true, the sparse matrix arrays of the parent are placed in shared memory
+           (not copied to each worker), and the ``array`` and ``average``
+           methods collect the results in shared memory, instead of
+           transferring them from the workers.
+        **init :
+           arguments passed to the constructor of `pathos.pools.ProcessPool`
+
+        Examples
+        --------
+        >>> with bz.apply.pool(4) as par:
+        ...     eigs = par.ndarray.eigh()
+        ...     es = par.list.eigenstate()
+
+        See Also
+        --------
+        BrillouinZonePool : the used pool of workers
+        """
+        from ._brillouinzone_apply import BrillouinZonePool
+
+        return self.renew(
+            pool=BrillouinZonePool(self._obj.parent, pool, shared=shared, **init)
+        )
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        from ._brillouinzone_apply import BrillouinZonePool
+
+        pool = self._attrs.get("pool")
+        if isinstance(pool, BrillouinZonePool):
+            pool.close()
+
+
 @set_module("sisl.physics")
 def linspace_bz(bz, stop=None, jumps=None, jump_dk: float = 0.05):
     r"""Convert points from a BZ object into a linear spacing of maximum value `stop`
@@ -282,6 +355,7 @@ class BrillouinZone:
 
     apply = BrillouinZoneDispatcher(
         "apply",
+        instance_dispatcher=BrillouinZoneObjectDispatcher,
         # Do not allow class dispatching
         type_dispatcher=None,
         obj_getattr=lambda obj, key: getattr(obj.parent, key),
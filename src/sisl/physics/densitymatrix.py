@@ -140,7 +140,8 @@ class _densitymatrix(SparseOrbitalBZSpin):
         spinor=None,
         atol: float = 1e-7,
         eta: Optional[bool] = False,
-        method: Literal["pre-compute", "direct"] = "pre-compute",
+        method: Literal["pre-compute", "chunked", "direct"] = "pre-compute",
+        max_memory: float = 1024,
         **kwargs,
     ):
         r"""Expand the density matrix to the charge density on a grid
@@ -185,12 +186,23 @@ class _densitymatrix(SparseOrbitalBZSpin):
            It determines if the orbital values are computed on the fly (direct) or they are all pre-computed
            on the grid at the beginning (pre-compute).
            Pre computing orbitals results in a faster computation, but it requires more memory.
+           The chunked method pre-computes the orbital values in slabs of the grid (along the first
+           lattice vector), one slab at a time. This is almost as fast as pre-compute, while the
+           memory is bounded by `max_memory`.
+        max_memory:
+           approximate memory (in MB) used for the orbital values of each slab, only used for
+           ``method="chunked"``.
 
         Notes
         -----
 
         The `method` argument may change at will since this is an experimental feature.
         """
+        if method not in ("pre-compute", "chunked", "direct"):
+            raise ValueError(
+                f"{self.__class__.__name__}.density got unknown method {method!r}"
+            )
+
         # Translate the density matrix to have all the unit cell atoms actually inside
         # the unit cell, since this will facilitate things greatly and it gives the
         # same result.
@@ -206,6 +218,18 @@ class _densitymatrix(SparseOrbitalBZSpin):
             if not np.all(uc_dm.nsc == psi_values.geometry.nsc):
                 uc_dm.set_nsc(psi_values.geometry.nsc)
 
+        elif method == "chunked":
+            # Compute orbital values on the grid, slab by slab.
+            # All slabs share the same auxiliary supercell, hence we only need
+            # the first to correct the nsc (see above).
+            psi_chunks = uc_dm.geometry._orbital_values_chunks(
+                grid.shape, max_memory=max_memory
+            )
+            psi_chunk = next(psi_chunks)
+            nsc = psi_chunk[1].geometry.nsc
+            if not np.all(uc_dm.nsc == nsc):
+                uc_dm.set_nsc(nsc)
+
         # Get the DM components with which we want to compute the density
         csr = uc_dm._csr
         if self.spin.kind > Spin.POLARIZED:
@@ -282,7 +306,22 @@ class _densitymatrix(SparseOrbitalBZSpin):
                     " method. Try using method='direct', which is slower but requires much"
                     " less memory."
                 )
-        elif method == "direct":
+        elif method == "chunked":
+            # The slabs are along the first axis, hence the slab of the grid
+            # is contiguous in memory
+            slab, psi_values = psi_chunk
+            del psi_chunk
+            # convert the weights once, instead of for each slab
+            DM = csrDM.toarray(order="C")
+            del csrDM
+            while psi_values is not None:
+                psi_values.reduce_orbital_products(
+                    DM, uc_dm.lattice, out=grid.grid[slab], **kwargs
+                )
+                # release the orbital values before calculating the next slab
+                psi_values = None
+                slab, psi_values = next(psi_chunks, (None, None))
+        else:
             self._density_direct(grid, csrDM, atol=atol, eta=eta)
 
     def _density_direct(
@@ -966,6 +1005,10 @@ class DensityMatrix(_densitymatrix):
         ----------
         k :
            the k-point to setup the density matrix at
+           Several k-points (shape ``(nk, 3)``) returns the matrices for all k-points,
+           stacked in an array of shape ``(nk, no, no)`` for dense formats, or as a list
+           of sparse matrices (with the same sparsity pattern).
+           A single k-point of shape ``(1, 3)`` returns a single matrix.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
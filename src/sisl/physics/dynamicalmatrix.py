@@ -89,6 +89,10 @@ class DynamicalMatrix(SparseOrbitalBZ):
         ----------
         k :
            the k-point to setup the dynamical matrix at
+           Several k-points (shape ``(nk, 3)``) returns the matrices for all k-points,
+           stacked in an array of shape ``(nk, no, no)`` for dense formats, or as a list
+           of sparse matrices (with the same sparsity pattern).
+           A single k-point of shape ``(1, 3)`` returns a single matrix.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
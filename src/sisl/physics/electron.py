@@ -19,6 +19,7 @@ One may also plot real-space wavefunctions.
    ahc
    shc
    wavefunction
+   wavefunction_density
    spin_moment
    spin_contamination
 
@@ -111,7 +112,7 @@ __all__ = ["DOS", "PDOS", "COP"]
 __all__ += ["spin_moment", "spin_contamination"]
 __all__ += ["berry_phase"]
 __all__ += ["ahc", "shc", "conductivity"]
-__all__ += ["wavefunction"]
+__all__ += ["wavefunction", "wavefunction_density"]
 __all__ += ["CoefficientElectron", "StateElectron", "StateCElectron"]
 __all__ += ["EigenvalueElectron", "EigenvectorElectron", "EigenstateElectron"]
 
@@ -1312,78 +1313,18 @@ def berry_phase(
     return ret
 
 
-@set_module("sisl.physics.electron")
-def wavefunction(
-    v, grid, geometry=None, k=None, spinor=0, spin: Optional[Spin] = None, eta=None
+def _wavefunction_coefficients(
+    v, grid, geometry, k, spinor, spin: Optional[Spin], sum_states: bool
 ):
-    r"""Add the wave-function (`Orbital.psi`) component of each orbital to the grid
-
-    This routine calculates the real-space wave-function components in the
-    specified grid.
-
-    This is an *in-place* operation that *adds* to the current values in the grid.
-
-    It may be instructive to check that an eigenstate is normalized:
-
-    >>> grid = Grid(...)
-    >>> wavefunction(state, grid)
-    >>> (np.absolute(grid.grid) ** 2).sum() * grid.dvolume == 1.
-
-    Note: To calculate :math:`\psi(\mathbf r)` in a unit-cell different from the
-    originating geometry, simply pass a grid with a unit-cell smaller than the originating
-    supercell.
-
-    The wavefunctions are calculated in real-space via:
-
-    .. math::
-       \psi(\mathbf r) = \sum_i\phi_i(\mathbf r) |\psi\rangle_i \exp(i\mathbf k\cdot\mathbf R)
-
-    While for non-colinear/spin-orbit calculations the wavefunctions are determined from the
-    spinor component (`spinor`)
-
-    .. math::
-       \psi_{\alpha/\beta}(\mathbf r) = \sum_i\phi_i(\mathbf r) |\psi_{\alpha/\beta}\rangle_i \exp(i\mathbf k\cdot \mathbf R)
-
-    where ``spinor in [0, 1]`` determines :math:`\alpha` or :math:`\beta`, respectively.
-
-    Notes
-    -----
-    Currently this method only works for `v` being coefficients of the ``gauge="lattice"`` method. In case
-    you are passing a `v` with the incorrect gauge you will find a phase-shift according to:
-
-    .. math::
-        \tilde v_j = e^{i\mathbf k\cdot\mathbf r_j} v_j
+    """Parse the coefficients for `wavefunction` and friends
 
-    where :math:`j` is the orbital index and :math:`\mathbf r_j` is the orbital position.
-
-
-    Parameters
-    ----------
-    v : array_like
-       coefficients for the orbital expansion on the real-space grid.
-       If `v` is a complex array then the `grid` *must* be complex as well. The coefficients
-       must be using the *lattice* gauge.
-    grid : Grid
-       grid on which the wavefunction will be plotted.
-       If multiple eigenstates are in this object, they will be summed.
-    geometry : Geometry, optional
-       geometry where the orbitals are defined. This geometry's orbital count must match
-       the number of elements in `v`.
-       If this is ``None`` the geometry associated with `grid` will be used instead.
-    k : array_like, optional
-       k-point associated with wavefunction, by default the inherent k-point used
-       to calculate the eigenstate will be used (generally shouldn't be used unless the `EigenstateElectron` object
-       has not been created via :meth:`~.Hamiltonian.eigenstate`).
-    spinor : int, optional
-       the spinor for non-colinear/spin-orbit calculations. This is only used if the
-       eigenstate object has been created from a parent object with a `Spin` object
-       contained, *and* if the spin-configuration is non-colinear or spin-orbit coupling.
-       Default to the first spinor component.
-    spin :
-       specification of the spin configuration of the orbital coefficients. This only has
-       influence for non-colinear wavefunctions where `spinor` choice is important.
-    eta : bool, optional
-       Display a console progressbar.
+    Returns
+    -------
+    v : numpy.ndarray
+        2D coefficients, one row per state (for the chosen `spinor`)
+    geometry : Geometry
+    k : numpy.ndarray
+    has_k : bool
     """
     # Decipher v from State type
     if isinstance(v, State):
@@ -1416,33 +1357,36 @@ def wavefunction(
             "Translating all into the primary unit cell could disable this information"
         )
 
-    # In case the user has passed several vectors we sum them to plot the summed state
-    if v.ndim == 2:
-        if v.shape[0] > 1:
-            info(
-                f"wavefunction: summing {v.shape[0]} different state coefficients, will continue silently!"
-            )
-        v = v.sum(0)
+    v = np.asarray(v)
+    if v.ndim == 1:
+        v = v.reshape(1, -1)
+    elif sum_states and v.shape[0] > 1:
+        # In case the user has passed several vectors we sum them to plot the summed state
+        info(
+            f"wavefunction: summing {v.shape[0]} different state coefficients, will continue silently!"
+        )
+        v = v.sum(0, keepdims=True)
 
+    nstates, no = v.shape
     if spin is None:
-        if len(v) // 2 == geometry.no:
+        if no // 2 == geometry.no:
             # the input corresponds to a non-collinear calculation
-            v = v.reshape(-1, 2)[:, spinor]
+            v = v.reshape(nstates, -1, 2)[:, :, spinor]
             info(
                 "wavefunction: assumes the input wavefunction coefficients to originate from a non-colinear calculation!"
             )
-        elif len(v) // 4 == geometry.no:
+        elif no // 4 == geometry.no:
             # the input corresponds to a NAMBU calculation
-            v = v.reshape(-1, 4)[:, spinor]
+            v = v.reshape(nstates, -1, 4)[:, :, spinor]
             info(
                 "wavefunction: assumes the input wavefunction coefficients to originatefrom a nambu calculation!"
             )
 
     elif spin.kind > Spin.POLARIZED:
         # For non-colinear+nambu cases the user selects the spinor component.
-        v = v.reshape(-1, spin.spinor)[:, spinor]
+        v = v.reshape(nstates, -1, spin.spinor)[:, :, spinor]
 
-    if len(v) != geometry.no:
+    if v.shape[1] != geometry.no:
         raise ValueError(
             "wavefunction: require wavefunction coefficients corresponding to number of orbitals in the geometry."
         )
@@ -1454,21 +1398,54 @@ def wavefunction(
     if has_k:
         info("wavefunction: k != Gamma is currently untested!")
 
-    # Check that input/grid makes sense.
-    # If the coefficients are complex valued, then the grid *has* to be
-    # complex valued.
-    # Likewise if a k-point has been passed.
-    is_complex = np.iscomplexobj(v) or has_k
-    if is_complex and not np.iscomplexobj(grid.grid):
-        raise SislError(
-            "wavefunction: input coefficients are complex, while grid only contains real."
-        )
+    return v, geometry, k, has_k
 
-    if is_complex:
-        psi_init = _a.zerosz
-    else:
-        psi_init = _a.zerosd
 
+def _wavefunction_pbc(grid: Grid, geometry: Geometry):
+    """Periodic directions used when plotting the orbitals of `geometry` on `grid`"""
+    return [
+        bc == BC.PERIODIC or geometry.nsc[i] > 1
+        for i, bc in enumerate(grid.lattice.boundary_condition[:, 0])
+    ]
+
+
+def _wavefunction_set_geometry(grid: Grid, geometry: Geometry) -> None:
+    """Attach the atoms of `geometry` in the `grid` unit-cell if it does not have a `Geometry`"""
+    if grid.geometry is not None:
+        return
+    # In case this grid does not have a Geometry associated
+    # We can *perhaps* easily attach a geometry with the given
+    # atoms in the unit-cell
+    lattice = grid.lattice.copy()
+    # Create the actual geometry that encompass the grid
+    ia, xyz, _ = geometry.within_inf(
+        lattice, periodic=_wavefunction_pbc(grid, geometry)
+    )
+    if len(ia) > 0:
+        grid.set_geometry(Geometry(xyz, geometry.atoms[ia], lattice=lattice))
+
+
+def _wavefunction_atoms(grid: Grid, geometry: Geometry, eta=None):
+    """Yield the basis orbital values of all atoms (in the supercell) overlapping `grid`
+
+    The basis values are independent on the coefficients, and can thus be
+    reused for any number of states.
+
+    Yields
+    ------
+    box : tuple of slice
+        the part of the grid containing the atom
+    shape : numpy.ndarray
+        the shape of `box`
+    idx : numpy.ndarray
+        raveled indices in `box` within the atom's orbital range
+    phi : numpy.ndarray
+        orbital values at `idx`, with shape ``(len(idx), atom.no)``
+    io : numpy.ndarray
+        orbital indices of the atom
+    isc : numpy.ndarray
+        supercell index of the atom
+    """
     # Extract sub variables used throughout the loop
     shape = _a.asarrayi(grid.shape)
     dcell = grid.dcell
@@ -1479,10 +1456,6 @@ def wavefunction(
     # supercell.
     geom_shape = geometry.cell @ ic_shape.T
 
-    # In the following we don't care about division
-    # So 1) save error state, 2) turn off divide by 0, 3) calculate, 4) turn on old error state
-    old_err = np.seterr(divide="ignore", invalid="ignore")
-
     addouter = add.outer
 
     def idx2spherical(ix, iy, iz, offset, dc, R):
@@ -1497,15 +1470,13 @@ def wavefunction(
             addouter(ix * dc[0, 2], iy * dc[1, 2]), iz * dc[2, 2] - offset[2]
         ).ravel()
 
-        # Total size of the indices
-        n = rx.shape[0]
         # Reduce our arrays to where the radius is "fine"
         idx = indices_le(rx**2 + ry**2 + rz**2, R**2)
         rx = rx[idx]
         ry = ry[idx]
         rz = rz[idx]
         xyz_to_spherical_cos_phi(rx, ry, rz)
-        return n, idx, rx, ry, rz
+        return idx, rx, ry, rz
 
     # Figure out the max-min indices with a spacing of 1 radian
     # calculate based on the minimum length of the grid-spacing
@@ -1563,22 +1534,6 @@ def wavefunction(
 
     arangei = _a.arangei
 
-    # In case this grid does not have a Geometry associated
-    # We can *perhaps* easily attach a geometry with the given
-    # atoms in the unit-cell
-    lattice = grid.lattice.copy()
-
-    # Find the periodic directions
-    pbc = [
-        bc == BC.PERIODIC or geometry.nsc[i] > 1
-        for i, bc in enumerate(grid.lattice.boundary_condition[:, 0])
-    ]
-    if grid.geometry is None:
-        # Create the actual geometry that encompass the grid
-        ia, xyz, _ = geometry.within_inf(lattice, periodic=pbc)
-        if len(ia) > 0:
-            grid.set_geometry(Geometry(xyz, geometry.atoms[ia], lattice=lattice))
-
     # Instead of looping all atoms in the supercell we find the exact atoms
     # and their supercell indices.
     # plus some tolerance
@@ -1588,141 +1543,356 @@ def wavefunction(
     # For extremely skewed lattices this will be way too much, hence we make
     # them square.
 
-    o = lattice.to.Cuboid(orthogonal=True)
+    o = grid.lattice.to.Cuboid(orthogonal=True)
     lattice = Lattice(o._v + np.diag(2 * add_R), origin=o.origin - add_R)
 
     # Retrieve all atoms within the grid supercell
     # (and the neighbors that connect into the cell)
     # Note that we cannot pass the "moved" origin because then ISC would be wrong
-    IA, XYZ, ISC = geometry.within_inf(lattice, periodic=pbc)
+    IA, XYZ, ISC = geometry.within_inf(
+        lattice, periodic=_wavefunction_pbc(grid, geometry)
+    )
     # We need to revert the grid supercell origin as that is not subtracted in the `within_inf` returned
     # coordinates (and the below loop expects positions with respect to the origin of the plotting
     # grid).
     XYZ -= grid.lattice.origin
 
-    phk = k * 2 * np.pi
-    phase = 1
-
     # Retrieve progressbar
     eta = progressbar(len(IA), "wavefunction", "atom", eta)
 
-    # Loop over all atoms in the grid-cell
-    for ia, xyz, isc in zip(IA, XYZ, ISC):
-        # Get current atom
-        atom = geometry.atoms[ia]
+    # In the following we don't care about division
+    # So 1) save error state, 2) turn off divide by 0, 3) calculate, 4) turn on old error state
+    old_err = np.seterr(divide="ignore", invalid="ignore")
 
-        # Extract maximum R
-        R = atom.maxR()
-        if R <= 0.0:
-            warn(
-                f"wavefunction: Atom '{atom}' does not have a wave-function, skipping atom."
+    try:
+        # Loop over all atoms in the grid-cell
+        for ia, xyz, isc in zip(IA, XYZ, ISC):
+            # Get current atom
+            atom = geometry.atoms[ia]
+
+            # Extract maximum R
+            R = atom.maxR()
+            if R <= 0.0:
+                warn(
+                    f"wavefunction: Atom '{atom}' does not have a wave-function, skipping atom."
+                )
+                eta.update()
+                continue
+
+            # Get indices in the supercell grid
+            idx = (isc.reshape(3, 1) * geom_shape).sum(0)
+            idxm = floor(idx_mm[ia, 0, :] + idx).astype(int32)
+            idxM = ceil(idx_mm[ia, 1, :] + idx).astype(int32) + 1
+
+            # Fast check whether we can skip this point
+            if (
+                idxm[0] >= shape[0]
+                or idxm[1] >= shape[1]
+                or idxm[2] >= shape[2]
+                or idxM[0] <= 0
+                or idxM[1] <= 0
+                or idxM[2] <= 0
+            ):
+                eta.update()
+                continue
+
+            # Truncate values
+            idxm = np.maximum(idxm, 0)
+            idxM = np.minimum(idxM, shape)
+
+            # Now idxm/M contains min/max indices used
+            # Convert to spherical coordinates
+            idx, r, theta, phi = idx2spherical(
+                arangei(idxm[0], idxM[0]),
+                arangei(idxm[1], idxM[1]),
+                arangei(idxm[2], idxM[2]),
+                xyz,
+                dcell,
+                R,
+            )
+
+            # Orbitals on this atom
+            io = geometry.a2o(ia, all=True)
+
+            # The orbital values (orbitals with a smaller range are zero outside)
+            psi = zeros([len(idx), atom.no])
+
+            # Loop on orbitals on this atom, grouped by radius
+            jo = 0
+            for os in atom.iter(True):
+                # Get the radius of orbitals (os)
+                oR = os[0].R
+
+                if oR <= 0.0:
+                    warn(
+                        f"wavefunction: Orbital(s) '{os}' does not have a wave-function, skipping orbital!"
+                    )
+                    # Skip these orbitals
+                    jo += len(os)
+                    continue
+
+                # Downsize to the correct indices
+                if R - oR < 1e-6:
+                    idx1 = slice(None)
+                    r1 = r
+                    theta1 = theta
+                    phi1 = phi
+                else:
+                    idx1 = indices_le(r, oR)
+                    # Reduce arrays
+                    r1 = r[idx1]
+                    theta1 = theta[idx1]
+                    phi1 = phi[idx1]
+
+                # Loop orbitals with the same radius
+                for o in os:
+                    # Evaluate psi component of the orbital
+                    psi[idx1, jo] = o.psi_spher(r1, theta1, phi1, cos_phi=True)
+                    jo += 1
+
+            yield (
+                tuple(slice(m, M) for m, M in zip(idxm, idxM)),
+                idxM - idxm,
+                idx,
+                psi,
+                io,
+                isc,
             )
-            eta.update()
-            continue
 
-        # Get indices in the supercell grid
-        idx = (isc.reshape(3, 1) * geom_shape).sum(0)
-        idxm = floor(idx_mm[ia, 0, :] + idx).astype(int32)
-        idxM = ceil(idx_mm[ia, 1, :] + idx).astype(int32) + 1
-
-        # Fast check whether we can skip this point
-        if (
-            idxm[0] >= shape[0]
-            or idxm[1] >= shape[1]
-            or idxm[2] >= shape[2]
-            or idxM[0] <= 0
-            or idxM[1] <= 0
-            or idxM[2] <= 0
-        ):
+            # Step progressbar
             eta.update()
-            continue
 
-        # Truncate values
-        if idxm[0] < 0:
-            idxm[0] = 0
-        if idxM[0] > shape[0]:
-            idxM[0] = shape[0]
-        if idxm[1] < 0:
-            idxm[1] = 0
-        if idxM[1] > shape[1]:
-            idxM[1] = shape[1]
-        if idxm[2] < 0:
-            idxm[2] = 0
-        if idxM[2] > shape[2]:
-            idxM[2] = shape[2]
-
-        # Now idxm/M contains min/max indices used
-        # Convert to spherical coordinates
-        n, idx, r, theta, phi = idx2spherical(
-            arangei(idxm[0], idxM[0]),
-            arangei(idxm[1], idxM[1]),
-            arangei(idxm[2], idxM[2]),
-            xyz,
-            dcell,
-            R,
-        )
+    finally:
+        eta.close()
+
+        # Reset the error code for division
+        np.seterr(**old_err)
+
 
-        # Get initial orbital
-        io = geometry.a2o(ia)
+def _wavefunction_add(v, grids, grid: Grid, geometry: Geometry, k, has_k: bool, eta):
+    """Add the wavefunctions of all states in `v` to the arrays in `grids`
 
+    The basis orbital values are calculated once per atom and used for all states.
+    """
+    phk = k * 2 * np.pi
+    for box, shape, idx, phi, io, isc in _wavefunction_atoms(grid, geometry, eta):
+        c = v[:, io]
         if has_k:
-            phase = exp(1j * phk.dot(isc))
+            c = c * exp(1j * phk.dot(isc))
 
-        # Allocate a temporary array where we add the psi elements
-        psi = psi_init(n)
+        # Calculate all states on the atom at once
+        psi = zeros([len(v), shape.prod()], dtype=np.result_type(c, phi))
+        psi[:, idx] = c @ phi.T
+        psi.shape = (-1, *shape)
+        for out, psi_state in zip(grids, psi):
+            out[box] += psi_state
 
-        # Loop on orbitals on this atom, grouped by radius
-        for os in atom.iter(True):
-            # Get the radius of orbitals (os)
-            oR = os[0].R
 
-            if oR <= 0.0:
-                warn(
-                    f"wavefunction: Orbital(s) '{os}' does not have a wave-function, skipping orbital!"
-                )
-                # Skip these orbitals
-                io += len(os)
-                continue
+@set_module("sisl.physics.electron")
+def wavefunction(
+    v, grid, geometry=None, k=None, spinor=0, spin: Optional[Spin] = None, eta=None
+):
+    r"""Add the wave-function (`Orbital.psi`) component of each orbital to the grid
 
-            # Downsize to the correct indices
-            if R - oR < 1e-6:
-                idx1 = idx
-                r1 = r
-                theta1 = theta
-                phi1 = phi
-            else:
-                idx1 = indices_le(r, oR)
-                # Reduce arrays
-                r1 = r[idx1]
-                theta1 = theta[idx1]
-                phi1 = phi[idx1]
-                idx1 = idx[idx1]
-
-            # Loop orbitals with the same radius
-            for o in os:
-                # Evaluate psi component of the wavefunction and add it for this atom
-                psi[idx1] += o.psi_spher(r1, theta1, phi1, cos_phi=True) * (
-                    v[io] * phase
+    This routine calculates the real-space wave-function components in the
+    specified grid.
+
+    This is an *in-place* operation that *adds* to the current values in the grid.
+
+    It may be instructive to check that an eigenstate is normalized:
+
+    >>> grid = Grid(...)
+    >>> wavefunction(state, grid)
+    >>> (np.absolute(grid.grid) ** 2).sum() * grid.dvolume == 1.
+
+    Multiple states can be calculated at once, one grid per state. This is much faster than
+    calculating them one by one, since the orbital values are only calculated once:
+
+    >>> grids = [Grid(...) for _ in range(len(state))]
+    >>> wavefunction(state, grids)
+
+    Note: To calculate :math:`\psi(\mathbf r)` in a unit-cell different from the
+    originating geometry, simply pass a grid with a unit-cell smaller than the originating
+    supercell.
+
+    The wavefunctions are calculated in real-space via:
+
+    .. math::
+       \psi(\mathbf r) = \sum_i\phi_i(\mathbf r) |\psi\rangle_i \exp(i\mathbf k\cdot\mathbf R)
+
+    While for non-colinear/spin-orbit calculations the wavefunctions are determined from the
+    spinor component (`spinor`)
+
+    .. math::
+       \psi_{\alpha/\beta}(\mathbf r) = \sum_i\phi_i(\mathbf r) |\psi_{\alpha/\beta}\rangle_i \exp(i\mathbf k\cdot \mathbf R)
+
+    where ``spinor in [0, 1]`` determines :math:`\alpha` or :math:`\beta`, respectively.
+
+    Notes
+    -----
+    Currently this method only works for `v` being coefficients of the ``gauge="lattice"`` method. In case
+    you are passing a `v` with the incorrect gauge you will find a phase-shift according to:
+
+    .. math::
+        \tilde v_j = e^{i\mathbf k\cdot\mathbf r_j} v_j
+
+    where :math:`j` is the orbital index and :math:`\mathbf r_j` is the orbital position.
+
+
+    Parameters
+    ----------
+    v : array_like
+       coefficients for the orbital expansion on the real-space grid.
+       If `v` is a complex array then the `grid` *must* be complex as well. The coefficients
+       must be using the *lattice* gauge.
+    grid : Grid or list of Grid
+       grid on which the wavefunction will be plotted.
+       If multiple eigenstates are in this object, they will be summed.
+       If a list of grids, each state will be plotted on its corresponding grid
+       (the number of states and grids must be the same).
+    geometry : Geometry, optional
+       geometry where the orbitals are defined. This geometry's orbital count must match
+       the number of elements in `v`.
+       If this is ``None`` the geometry associated with `grid` will be used instead.
+    k : array_like, optional
+       k-point associated with wavefunction, by default the inherent k-point used
+       to calculate the eigenstate will be used (generally shouldn't be used unless the `EigenstateElectron` object
+       has not been created via :meth:`~.Hamiltonian.eigenstate`).
+    spinor : int, optional
+       the spinor for non-colinear/spin-orbit calculations. This is only used if the
+       eigenstate object has been created from a parent object with a `Spin` object
+       contained, *and* if the spin-configuration is non-colinear or spin-orbit coupling.
+       Default to the first spinor component.
+    spin :
+       specification of the spin configuration of the orbital coefficients. This only has
+       influence for non-colinear wavefunctions where `spinor` choice is important.
+    eta : bool, optional
+       Display a console progressbar.
+
+    See Also
+    --------
+    wavefunction_density : the (weighted) sum of the wavefunction densities of many states
+    """
+    if isinstance(grid, Grid):
+        grids = [grid]
+    else:
+        grids = list(grid)
+        grid = grids[0]
+        for g in grids[1:]:
+            if g != grid:
+                raise ValueError(
+                    "wavefunction: requires all grids to have the same shape."
                 )
-                io += 1
 
-        # Clean-up
-        del idx1, r1, theta1, phi1, idx, r, theta, phi
+    v, geometry, k, has_k = _wavefunction_coefficients(
+        v, grid, geometry, k, spinor, spin, sum_states=len(grids) == 1
+    )
+    if len(v) != len(grids):
+        raise ValueError(
+            f"wavefunction: the number of states ({len(v)}) and grids ({len(grids)}) must be the same."
+        )
+
+    # Check that input/grid makes sense.
+    # If the coefficients are complex valued, then the grid *has* to be
+    # complex valued.
+    # Likewise if a k-point has been passed.
+    is_complex = np.iscomplexobj(v) or has_k
+    for g in grids:
+        if is_complex and not np.iscomplexobj(g.grid):
+            raise SislError(
+                "wavefunction: input coefficients are complex, while grid only contains real."
+            )
+        _wavefunction_set_geometry(g, geometry)
 
-        # Convert to correct shape and add the current atom contribution to the wavefunction
-        psi = psi.reshape(idxM - idxm)
-        grid.grid[idxm[0] : idxM[0], idxm[1] : idxM[1], idxm[2] : idxM[2]] += psi
+    _wavefunction_add(v, [g.grid for g in grids], grid, geometry, k, has_k, eta)
 
-        # Clean-up
-        del psi
 
-        # Step progressbar
-        eta.update()
+@set_module("sisl.physics.electron")
+def wavefunction_density(
+    v,
+    grid,
+    weight=None,
+    geometry=None,
+    k=None,
+    spinor=0,
+    spin: Optional[Spin] = None,
+    eta=None,
+    batch_size: int = 16,
+):
+    r"""Add the (weighted) wavefunction densities :math:`\sum_n w_n|\psi_n(\mathbf r)|^2` to the grid
 
-    eta.close()
+    This is an *in-place* operation that *adds* to the current values in the grid.
+    The wavefunctions are calculated in batches of states, and the orbital values
+    are only calculated once per batch. This is much faster than calculating the
+    wavefunctions of each state separately.
 
-    # Reset the error code for division
-    np.seterr(**old_err)
+    For instance, the local density of states in an energy window may be calculated by:
+
+    >>> es = H.eigenstate().sub(lambda es: (-1 < es.eig) & (es.eig < 0))
+    >>> wavefunction_density(es, grid)
+
+    or the contribution to the electron density from the occupied states:
+
+    >>> es = H.eigenstate()
+    >>> wavefunction_density(es, grid, weight=es.occupation())
+
+    See `wavefunction` for details on the calculated wavefunctions.
+
+    Parameters
+    ----------
+    v : array_like
+       coefficients for the orbital expansion on the real-space grid, one state per row.
+       The coefficients must be using the *lattice* gauge.
+    grid : Grid
+       grid on which the wavefunction densities will be added.
+    weight : array_like, optional
+       weight of each state, defaults to 1 for all states.
+    geometry : Geometry, optional
+       geometry where the orbitals are defined. This geometry's orbital count must match
+       the number of elements in `v`.
+       If this is ``None`` the geometry associated with `grid` will be used instead.
+    k : array_like, optional
+       k-point associated with wavefunction, see `wavefunction`
+    spinor : int, optional
+       the spinor for non-colinear/spin-orbit calculations, see `wavefunction`
+    spin :
+       specification of the spin configuration of the orbital coefficients, see `wavefunction`
+    eta : bool, optional
+       Display a console progressbar.
+    batch_size :
+       number of states calculated at the same time. The memory requirement
+       is `batch_size` times the size of the grid.
+    """
+    v, geometry, k, has_k = _wavefunction_coefficients(
+        v, grid, geometry, k, spinor, spin, sum_states=False
+    )
+    if weight is None:
+        weight = np.ones(len(v))
+    else:
+        weight = _a.asarrayd(weight).ravel()
+        if len(weight) != len(v):
+            raise ValueError(
+                f"wavefunction_density: the number of states ({len(v)}) and weights ({len(weight)}) must be the same."
+            )
+    _wavefunction_set_geometry(grid, geometry)
+
+    if np.iscomplexobj(v) or has_k:
+        dtype = np.complex128
+    else:
+        dtype = np.float64
+
+    batch_size = max(1, min(batch_size, len(v)))
+    psi = empty([batch_size, *grid.shape], dtype=dtype)
+    for i in range(0, len(v), batch_size):
+        states = slice(i, i + batch_size)
+        psi_batch = psi[: len(v[states])]
+        psi_batch.fill(0)
+        _wavefunction_add(v[states], psi_batch, grid, geometry, k, has_k, eta)
+        for w, psi_state in zip(weight[states], psi_batch):
+            if dtype == np.float64:
+                grid.grid += w * psi_state**2
+            else:
+                grid.grid += w * (psi_state.real**2 + psi_state.imag**2)
 
 
 class _electron_State:
@@ -1743,6 +1913,8 @@ class _electron_State:
 
         When ``self.parent`` is a Hamiltonian this will return :math:`\mathbf S(\mathbf k)` for the
         :math:`\mathbf k`-point these eigenstates originate from.
+        If the overlap matrix was created when calculating the eigenstates
+        (see `Hamiltonian.eigenstate`) it will be re-used.
 
         Parameters
         ----------
@@ -1755,6 +1927,15 @@ class _electron_State:
         if isinstance(self.parent, SparseOrbitalBZSpin):
             # Calculate the overlap matrix
             if not self.parent.orthogonal:
+                Sk = self.info.get("Sk", None)
+                if Sk is not None and "sc" not in format:
+                    # re-use (a copy of) the overlap matrix from the eigenvalue problem
+                    if format in ("array", "matrix", "dense"):
+                        if issparse(Sk):
+                            return Sk.toarray().astype(self.dtype, copy=False)
+                        return Sk.astype(self.dtype)
+                    return csr_matrix(Sk, dtype=self.dtype, copy=True).asformat(format)
+
                 opt = {
                     "k": self.info.get("k", (0, 0, 0)),
                     "dtype": self.dtype,
@@ -1828,20 +2009,25 @@ class _electron_State:
         """
         return spin_moment(self.state, self.Sk(), projection=projection)
 
+    def _wavefunction_geometry(self):
+        """The geometry defining the orbitals of the coefficients"""
+        if isinstance(self.parent, Geometry):
+            return self.parent
+        return getattr(self.parent, "geometry", None)
+
     def wavefunction(self, grid, spinor=0, eta=None):
         r"""Expand the coefficients as the wavefunction on `grid` *as-is*
 
         See `~sisl.physics.electron.wavefunction` for argument details, the arguments not present
         in this method are automatically passed from this object.
+        If `grid` is a list of grids, each state is expanded on its corresponding grid.
         """
         spin = getattr(self.parent, "spin", None)
+        geometry = self._wavefunction_geometry()
 
-        if isinstance(self.parent, Geometry):
-            geometry = self.parent
-        else:
-            geometry = getattr(self.parent, "geometry", None)
-
-        if not isinstance(grid, Grid):
+        if isinstance(grid, (list, tuple)) and all(isinstance(g, Grid) for g in grid):
+            pass
+        elif not isinstance(grid, Grid):
             # probably the grid is a Real, or a tuple that denotes the shape
             # at least this makes it easier to parse
             grid = Grid(grid, geometry=geometry, dtype=self.dtype)
@@ -1856,6 +2042,43 @@ class _electron_State:
             self.state, grid, geometry=geometry, k=k, spinor=spinor, spin=spin, eta=eta
         )
 
+    def wavefunction_density(
+        self, grid, weight=None, spinor=0, eta=None, batch_size: int = 16
+    ):
+        r"""Add the (weighted) densities of the wavefunctions :math:`\sum_n w_n|\psi_n(\mathbf r)|^2` to `grid`
+
+        See `~sisl.physics.electron.wavefunction_density` for argument details, the arguments not present
+        in this method are automatically passed from this object.
+
+        Examples
+        --------
+        The electron density of the occupied states
+
+        >>> es = H.eigenstate()
+        >>> grid = Grid(0.1, geometry=H.geometry)
+        >>> es.wavefunction_density(grid, weight=es.occupation())
+        """
+        spin = getattr(self.parent, "spin", None)
+        geometry = self._wavefunction_geometry()
+
+        # Ensure we are dealing with the lattice gauge
+        self.change_gauge("lattice")
+
+        # Retrieve k
+        k = self.info.get("k", _a.zerosd(3))
+
+        wavefunction_density(
+            self.state,
+            grid,
+            weight=weight,
+            geometry=geometry,
+            k=k,
+            spinor=spinor,
+            spin=spin,
+            eta=eta,
+            batch_size=batch_size,
+        )
+
 
 @set_module("sisl.physics.electron")
 class CoefficientElectron(Coefficient):
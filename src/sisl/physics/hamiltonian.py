@@ -10,6 +10,7 @@ from sisl._internal import set_module
 from sisl.typing import GaugeType, KPoint
 
 from ._common import comply_gauge
+from ._kpm import kpm_moments, kpm_reconstruct
 from .distribution import get_distribution
 from .electron import EigenstateElectron, EigenvalueElectron
 from .sparse import SparseOrbitalBZSpin
@@ -95,6 +96,7 @@ class Hamiltonian(SparseOrbitalBZSpin):
     def _reset(self):
         super()._reset()
         self.Hk = self.Pk
+        self.HSk = self.PSk
         self.dHk = self.dPk
         self.ddHk = self.ddPk
 
@@ -138,6 +140,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
         ----------
         k :
            the k-point to setup the Hamiltonian at
+           Several k-points (shape ``(nk, 3)``) returns the matrices for all k-points,
+           stacked in an array of shape ``(nk, no, no)`` for dense formats, or as a list
+           of sparse matrices (with the same sparsity pattern).
+           A single k-point of shape ``(1, 3)`` returns a single matrix.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -169,6 +175,53 @@ class Hamiltonian(SparseOrbitalBZSpin):
         """
         pass
 
+    def HSk(
+        self,
+        k: KPoint = (0, 0, 0),
+        dtype=None,
+        gauge: GaugeType = "lattice",
+        format="csr",
+        *args,
+        **kwargs,
+    ):
+        r"""Setup the Hamiltonian and the overlap matrix for a given k-point
+
+        This is equivalent to ``(self.Hk(k, ...), self.Sk(k, ...))``, however, both
+        matrices are created simultaneously using the same phases, and the sparse
+        elements are only traversed once.
+
+        Parameters
+        ----------
+        k :
+           the k-point to setup the matrices at
+        dtype : numpy.dtype , optional
+           the data type of the returned matrices. Do NOT request non-complex
+           data-type for non-Gamma k.
+           The default data-type is `numpy.complex128`
+        gauge :
+           the chosen gauge, ``lattice`` for lattice vector gauge, and ``atomic`` for atomic distance
+           gauge.
+        format : {'csr', 'array', 'dense', 'coo', ...}
+           the returned format of the matrices, see `Hk` for details.
+        spin : int, optional
+           if the Hamiltonian is a spin polarized one can extract the specific spin direction
+           matrix by passing an integer (0 or 1). If the Hamiltonian is not `Spin.POLARIZED`
+           this keyword is ignored.
+
+        See Also
+        --------
+        Hk : Hamiltonian at `k`
+        Sk : overlap matrix at `k`
+
+        Returns
+        -------
+        H : numpy.ndarray or scipy.sparse.*_matrix
+            the Hamiltonian matrix at :math:`\mathbf k`.
+        S : numpy.ndarray or scipy.sparse.*_matrix
+            the overlap matrix at :math:`\mathbf k`.
+        """
+        pass
+
     def dHk(
         self,
         k: KPoint = (0, 0, 0),
@@ -347,6 +400,12 @@ class Hamiltonian(SparseOrbitalBZSpin):
         sparse : bool, optional
             if ``True``, `eigsh` will be called, else `eigh` will be
             called (default).
+        window : tuple of float, optional
+            only calculate the eigenvalues in ``[Emin, Emax]``
+            using the sparse shift-invert solver (implies ``sparse=True``),
+            see `eigsh` for details.
+            This is useful for large systems where only a few states are needed,
+            e.g. ``window=(-0.5, 0.5)`` around the Fermi level (at 0).
         format : str, optional
             see `eigh` for details, this will be passed to the EigenstateElectron
             instance to be used in subsequent calls, may speed up post-processing.
@@ -364,7 +423,7 @@ class Hamiltonian(SparseOrbitalBZSpin):
         """
         gauge = comply_gauge(gauge)
         format = kwargs.pop("format", None)
-        if kwargs.pop("sparse", False):
+        if kwargs.pop("sparse", False) or "window" in kwargs:
             e = self.eigsh(k, gauge=gauge, eigvals_only=True, **kwargs)
         else:
             e = self.eigh(k, gauge=gauge, eigvals_only=True, **kwargs)
@@ -388,6 +447,12 @@ class Hamiltonian(SparseOrbitalBZSpin):
         sparse : bool, optional
             if ``True``, `eigsh` will be called, else `eigh` will be
             called (default).
+        window : tuple of float, optional
+            only calculate the eigenstates with eigenvalues in ``[Emin, Emax]``
+            using the sparse shift-invert solver (implies ``sparse=True``),
+            see `eigsh` for details.
+            This is useful for large systems where only a few states are needed,
+            e.g. ``window=(-0.5, 0.5)`` around the Fermi level (at 0).
         format : str, optional
             see `eigh` for details, this will be passed to the EigenstateElectron
             instance to be used in subsequent calls, may speed up post-processing.
@@ -405,19 +470,150 @@ class Hamiltonian(SparseOrbitalBZSpin):
         """
         gauge = comply_gauge(gauge)
         format = kwargs.pop("format", None)
-        if kwargs.pop("sparse", False):
-            e, v = self.eigsh(k, gauge=gauge, eigvals_only=False, **kwargs)
-        else:
-            e, v = self.eigh(k, gauge=gauge, eigvals_only=False, **kwargs)
+        sparse = kwargs.pop("sparse", False)
+        # The overlap matrix is retained for post-processing of the states
+        (e, v), S = self._eigh(k, gauge, False, sparse=sparse, _keep_S=True, **kwargs)
         info = {"k": k, "gauge": gauge}
         for name in ("spin",):
             if name in kwargs:
                 info[name] = kwargs[name]
         if not format is None:
             info["format"] = format
+        if S is not None:
+            info["Sk"] = S
         # Since eigh returns the eigenvectors [:, i] we have to transpose
         return EigenstateElectron(v.T, e, self, **info)
 
+    def _kpm_moments(self, k, gauge, n_moments, local, **kwargs):
+        """Chebyshev moments of the Hamiltonian at `k`, see `DOS_kpm`"""
+        gauge = comply_gauge(gauge)
+        bounds = kwargs.pop("bounds", None)
+        n_random = kwargs.pop("n_random", 16)
+        seed = kwargs.pop("seed", None)
+        k = _a.asarrayd(k)
+        if (
+            np.allclose(k, 0)
+            and self.spin.is_diagonal
+            and not np.iscomplexobj(np.empty(0, self.dtype))
+        ):
+            # At the Gamma-point we can do real arithmetic
+            kwargs.setdefault("dtype", np.float64)
+        if self.orthogonal:
+            H, S = self.Hk(k, gauge=gauge, format="csr", **kwargs), None
+        else:
+            H, S = self.HSk(k, gauge=gauge, format="csr", **kwargs)
+        return kpm_moments(
+            H, n_moments, S, bounds=bounds, n_random=n_random, local=local, seed=seed
+        )
+
+    def DOS_kpm(
+        self,
+        E,
+        k: KPoint = (0, 0, 0),
+        gauge: GaugeType = "lattice",
+        n_moments: int = 256,
+        kernel: str = "jackson",
+        **kwargs,
+    ):
+        r"""Density of states at `k` using the kernel polynomial method (KPM)
+
+        The DOS is expanded in Chebyshev polynomials whose moments are estimated
+        stochastically using sparse matrix-vector products only. Hence the cost scales
+        linearly with the number of non-zero elements, and no eigenvalue decomposition
+        is needed. This is useful for large systems where `eigh` is prohibitive.
+
+        The energy resolution is determined by the number of moments, with the Jackson
+        kernel the states are broadened by approximately :math:`\pi\Delta E / (2N)`
+        where :math:`\Delta E` is the width of the spectrum and :math:`N` is `n_moments`.
+        For non-orthogonal basis sets the generalized eigenvalue problem is solved through
+        a sparse LU decomposition of the overlap matrix.
+
+        Averaging over the Brillouin zone is done with ``bz.apply.average.DOS_kpm(E)``.
+
+        Parameters
+        ----------
+        E : array_like
+            energies to calculate the DOS at
+        k :
+            the k-point at which to evaluate the DOS
+        gauge :
+            the gauge used for the Hamiltonian
+        n_moments :
+            number of Chebyshev moments
+        kernel : {"jackson", "lorentz", "none"}
+            the kernel used to damp Gibbs oscillations
+        n_random : int, optional
+            number of random vectors used in the stochastic trace (default 16).
+            The stochastic error decreases as :math:`1/\sqrt{N_r N_{\mathrm{orb}}}`
+        bounds : tuple of float, optional
+            bounds of the eigenvalue spectrum, if not passed, they are estimated using
+            the Lanczos method.
+            When averaging over k-points it may be beneficial to pass the bounds.
+        seed : optional
+            seed for the random vectors
+        spin : int, optional
+            the spin-component to calculate the DOS for (only for `Spin.POLARIZED`)
+
+        See Also
+        --------
+        PDOS_kpm : the orbital resolved DOS using KPM
+        ~sisl.physics.electron.DOS : the DOS calculated from eigenvalues
+
+        Returns
+        -------
+        numpy.ndarray
+            DOS calculated at energies, has same length as `E`
+        """
+        mu, bounds = self._kpm_moments(k, gauge, n_moments, False, **kwargs)
+        return kpm_reconstruct(E, mu, bounds, kernel)
+
+    def PDOS_kpm(
+        self,
+        E,
+        k: KPoint = (0, 0, 0),
+        gauge: GaugeType = "lattice",
+        n_moments: int = 256,
+        kernel: str = "jackson",
+        **kwargs,
+    ):
+        r"""Projected (local) density of states at `k` using the kernel polynomial method (KPM)
+
+        The PDOS equals the Mulliken projected density of states, as calculated
+        by `~sisl.physics.electron.PDOS` (total component), see `DOS_kpm` for details on
+        the method.
+        Note that the stochastic error is larger than for the total DOS.
+
+        Parameters
+        ----------
+        E : array_like
+            energies to calculate the PDOS at
+        k :
+            the k-point at which to evaluate the PDOS
+        gauge :
+            the gauge used for the Hamiltonian
+        n_moments :
+            number of Chebyshev moments
+        kernel : {"jackson", "lorentz", "none"}
+            the kernel used to damp Gibbs oscillations
+        **kwargs :
+            see `DOS_kpm` for the remaining arguments
+
+        See Also
+        --------
+        DOS_kpm : the total DOS using KPM
+        ~sisl.physics.electron.PDOS : the PDOS calculated from eigenstates
+
+        Returns
+        -------
+        numpy.ndarray
+            projected DOS calculated at energies, has dimension ``(self.no, len(E))``.
+            For non-colinear calculations the spin-components are summed.
+        """
+        mu, bounds = self._kpm_moments(k, gauge, n_moments, True, **kwargs)
+        # sum spin-components of each orbital
+        mu = mu.reshape(self.no, -1, mu.shape[-1]).sum(1)
+        return kpm_reconstruct(E, mu, bounds, kernel)
+
     @staticmethod
     def read(sile, *args, **kwargs):
         """Reads Hamiltonian from `Sile` using `read_hamiltonian`.
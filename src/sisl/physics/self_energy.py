@@ -3,7 +3,13 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Literal, Optional, Sequence, Tuple, Union
+from uuid import uuid4
 
 import numpy as np
 from numpy import abs as _abs
@@ -22,7 +28,7 @@ import sisl._array as _a
 from sisl._core.sparse_geometry import _SparseGeometry
 from sisl._help import array_replace
 from sisl._internal import set_module
-from sisl.linalg import inv, linalg_info, solve
+from sisl.linalg import eig_destroy, inv, linalg_info, solve
 from sisl.linalg.base import _compute_lwork
 from sisl.messages import deprecate_argument, deprecation, warn
 from sisl.physics.bloch import Bloch
@@ -32,8 +38,65 @@ from sisl.utils.mathematics import fnorm
 
 __all__ = ["SelfEnergy"]
 __all__ += ["WideBandSE"]
-__all__ += ["SemiInfinite", "RecursiveSI"]
+__all__ += ["SemiInfinite", "RecursiveSI", "TransferMatrixSI"]
 __all__ += ["RealSpaceSE", "RealSpaceSI"]
+__all__ += ["CachedSE"]
+
+
+def _k_average_threads(func, bz, bloch: Bloch, threads: int, **kwargs) -> np.ndarray:
+    r"""Weighted average of `func` over the k-points in `bz` using multiple threads
+
+    The linear algebra routines release the GIL, so the k-points
+    are distributed over `threads` threads, each accumulating
+    its own sum (no locking required). The Bloch unfolding
+    buffer is allocated once per thread.
+
+    Parameters
+    ----------
+    func : callable
+        function returning the matrix at a given k-point, called as ``func(k=k, **kwargs)``
+    bz : BrillouinZone
+        the k-points and weights
+    bloch :
+        Bloch expansion of the matrices returned by `func`
+    threads :
+        number of threads used
+    """
+    k = bz.k
+    w = bz.weight
+
+    def accumulate(idx):
+        buffer = None
+        G = None
+        for i in idx:
+            if len(bloch) > 1:
+                k_unfold = bloch.unfold_points(k[i])
+                for j, kj in enumerate(k_unfold):
+                    M = func(k=kj, **kwargs)
+                    if buffer is None:
+                        buffer = empty(
+                            (len(k_unfold),) + M.shape,
+                            dtype=np.result_type(M.dtype, np.complex64),
+                        )
+                    buffer[j] = M
+                M = bloch.unfold(buffer, k_unfold)
+            else:
+                M = func(k=k[i], **kwargs)
+
+            if G is None:
+                G = M * w[i]
+            else:
+                G += np.multiply(M, w[i], out=M)
+        return G
+
+    # interleaved distribution of k-points
+    idx = [_a.arangei(t, len(k), threads) for t in range(min(threads, len(k)))]
+    with ThreadPoolExecutor(len(idx)) as executor:
+        Gs = list(executor.map(accumulate, idx))
+    G = Gs[0]
+    for Gt in Gs[1:]:
+        G += Gt
+    return G
 
 
 @set_module("sisl.physics")
@@ -333,12 +396,150 @@ class RecursiveSI(SemiInfinite):
         r"""Dimension of the self-energy"""
         return len(self.spgeom0)
 
+    def _recursive_batched(
+        self,
+        E: np.ndarray,
+        k: np.ndarray,
+        dtype: np.dtype,
+        atol: float,
+        bulk: bool,
+        method: str,
+        **kwargs,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Lopez-Sancho recursion for many energies at a single k-point
+
+        The k-dependent matrices are only calculated once, and all energies
+        are iterated simultaneously using stacked linear solves.
+        Energies are removed from the stack as soon as they have converged,
+        hence the cost of each energy is equivalent to a single energy calculation.
+
+        Parameters
+        ----------
+        E :
+           1D array of energies, zero imaginary parts are replaced by ``1j * self.eta``
+        k :
+           k-point
+        dtype :
+           data-type of the matrices
+        atol :
+           convergence criteria for the recursion
+        bulk :
+           whether the surface Green function is initialized with the bulk matrix
+        method :
+           name of the calling method, used in error messages
+
+        Returns
+        -------
+        SmH0 : numpy.ndarray
+            :math:`E\mathbf S_0 - \mathbf H_0` for all energies
+        GB : numpy.ndarray
+            the converged bulk matrices
+        GS : numpy.ndarray
+            the converged surface matrices (without sign changes)
+        """
+        E = np.where(E.imag == 0.0, E.real + 1j * self.eta, E)[:, None, None]
+
+        sp0 = self.spgeom0
+        sp1 = self.spgeom1
+
+        # These are the only k-dependent matrices
+        S0 = sp0.Sk(k, dtype=dtype, format="array")
+        P0 = sp0.Pk(k, dtype=dtype, format="array", **kwargs)
+        SmH0 = (S0 * E - P0).astype(dtype, copy=False)
+        del S0, P0
+        n = SmH0.shape[-1]
+
+        P = sp1.Pk(k, dtype=dtype, format="array", **kwargs)
+        if sp1.orthogonal:
+            alpha = np.broadcast_to(P, SmH0.shape)
+            beta = np.broadcast_to(conjugate(P.T), SmH0.shape)
+        else:
+            S = sp1.Sk(k, dtype=dtype, format="array")
+            alpha = P - S * E
+            beta = conjugate(P.T) - conjugate(S.T) * E
+            del S
+        del P
+
+        # The converged bulk and surface matrices
+        GB = SmH0.copy()
+        if bulk:
+            GS = SmH0.copy()
+        else:
+            GS = zeros_like(SmH0)
+
+        # The stacked numpy solver only pays off for small matrices where
+        # the call overhead dominates, otherwise LAPACK is called directly.
+        gesv = linalg_info("gesv", dtype)
+
+        def stacked_solve(A, B):
+            if n <= 16:
+                try:
+                    return np.linalg.solve(A, B)
+                except np.linalg.LinAlgError:
+                    info = 1
+            else:
+                X = empty_like(B)
+                for i in range(len(A)):
+                    _, _, X[i], info = gesv(A[i], B[i])
+                    if info != 0:
+                        break
+                else:
+                    return X
+            raise ValueError(
+                f"{self.__class__.__name__}.{method} could not solve G x = B system!"
+            )
+
+        # Energies are iterated in blocks to keep the working arrays
+        # in cache (each block holds approximately 2**16 elements).
+        nblock = max(1, 2**16 // n**2)
+        for start in range(0, len(E), nblock):
+            block = slice(start, start + nblock)
+            # Working arrays only contain the non-converged energies
+            gb = GB[block].copy()
+            gs = GS[block].copy()
+            a = alpha[block]
+            b = beta[block]
+            idx = _a.arangei(start, start + len(gb))
+
+            while len(idx) > 0:
+                # solve both alpha/beta at the same time
+                tab = stacked_solve(gb, np.concatenate((a, b), axis=-1))
+
+                # Both halves in one product (larger matrix products are faster)
+                atab = matmul(a, tab)
+                btab = matmul(b, tab)
+                del tab
+
+                # Update bulk Green function
+                subtract(gb, atab[:, :, n:], out=gb)
+                subtract(gb, btab[:, :, :n], out=gb)
+                # Update surface self-energy
+                subtract(gs, atab[:, :, n:], out=gs)
+
+                # Update forward/backward
+                a = atab[:, :, :n]
+                b = btab[:, :, n:]
+
+                # Convergence criteria, per energy
+                conv = _abs(a).max(axis=(1, 2)) < atol
+                if conv.any():
+                    GB[idx[conv]] = gb[conv]
+                    GS[idx[conv]] = gs[conv]
+                    conv = ~conv
+                    idx = idx[conv]
+                    gb = gb[conv]
+                    gs = gs[conv]
+                    a = a[conv]
+                    b = b[conv]
+
+        return SmH0, GB, GS
+
     @deprecate_argument(
         "eps", "atol", "eps argument is deprecated in favor of atol", "0.15", "0.17"
     )
     def green(
         self,
-        E: complex,
+        E: Union[complex, Sequence[complex]],
         k: KPoint = (0, 0, 0),
         dtype: np.dtype = np.complex128,
         atol: float = 1e-14,
@@ -349,7 +550,10 @@ class RecursiveSI(SemiInfinite):
         Parameters
         ----------
         E :
-          energy at which the calculation will take place
+          energy at which the calculation will take place.
+          For an array of energies all energies are calculated simultaneously
+          (the k-dependent matrices are only calculated once), and the returned
+          matrices will have the energy dimension(s) prepended.
         k :
           k-point at which the Green function should be evaluated.
           the k-point should be in units of the reciprocal lattice vectors.
@@ -368,6 +572,19 @@ class RecursiveSI(SemiInfinite):
         # Get k-point
         k = _a.asarrayd(k)
 
+        if np.ndim(E) > 0:
+            E = np.asarray(E)
+            _, GB, _ = self._recursive_batched(
+                E.ravel(), k, dtype, atol, False, "green", **kwargs
+            )
+            try:
+                G = np.linalg.inv(GB)
+            except np.linalg.LinAlgError:
+                raise ValueError(
+                    f"{self.__class__.__name__}.green could not compute the inverse."
+                )
+            return G.reshape(E.shape + G.shape[1:])
+
         if E.imag == 0.0:
             E = E.real + 1j * self.eta
 
@@ -451,7 +668,7 @@ class RecursiveSI(SemiInfinite):
     )
     def self_energy(
         self,
-        E: complex,
+        E: Union[complex, Sequence[complex]],
         k: KPoint = (0, 0, 0),
         dtype: np.dtype = np.complex128,
         atol: float = 1e-14,
@@ -463,7 +680,10 @@ class RecursiveSI(SemiInfinite):
         Parameters
         ----------
         E :
-          energy at which the calculation will take place
+          energy at which the calculation will take place.
+          For an array of energies all energies are calculated simultaneously
+          (the k-dependent matrices are only calculated once), and the returned
+          matrices will have the energy dimension(s) prepended.
         k :
           k-point at which the self-energy should be evaluated.
           the k-point should be in units of the reciprocal lattice vectors.
@@ -485,6 +705,15 @@ class RecursiveSI(SemiInfinite):
         # Get k-point
         k = _a.asarrayd(k)
 
+        if np.ndim(E) > 0:
+            E = np.asarray(E)
+            _, _, GS = self._recursive_batched(
+                E.ravel(), k, dtype, atol, bulk, "self_energy", **kwargs
+            )
+            if not bulk:
+                GS = np.negative(GS, out=GS)
+            return GS.reshape(E.shape + GS.shape[1:])
+
         if E.imag == 0.0:
             E = E.real + 1j * self.eta
 
@@ -566,7 +795,7 @@ class RecursiveSI(SemiInfinite):
     )
     def self_energy_lr(
         self,
-        E: complex,
+        E: Union[complex, Sequence[complex]],
         k: KPoint = (0, 0, 0),
         dtype: np.dtype = np.complex128,
         atol: float = 1e-14,
@@ -582,6 +811,9 @@ class RecursiveSI(SemiInfinite):
         ----------
         E :
           energy at which the calculation will take place, if complex, the hosting ``eta`` won't be used.
+          For an array of energies all energies are calculated simultaneously
+          (the k-dependent matrices are only calculated once), and the returned
+          matrices will have the energy dimension(s) prepended.
         k :
           k-point at which the self-energy should be evaluated.
           the k-point should be in units of the reciprocal lattice vectors.
@@ -602,12 +834,30 @@ class RecursiveSI(SemiInfinite):
         right : numpy.ndarray
             the right self-energy
         """
-        if E.imag == 0.0:
-            E = E.real + 1j * self.eta
-
         # Get k-point
         k = _a.asarrayd(k)
 
+        if np.ndim(E) > 0:
+            E = np.asarray(E)
+            SmH0, GB, GS = self._recursive_batched(
+                E.ravel(), k, dtype, atol, bulk, "self_energy_lr", **kwargs
+            )
+            shape = E.shape + GS.shape[1:]
+            if bulk:
+                other = GB - GS + SmH0
+            else:
+                other = GS - GB + SmH0
+                GS = np.negative(GS, out=GS)
+            del GB, SmH0
+            if self.semi_inf_dir == 1:
+                # GS is the "right" self-energy
+                return other.reshape(shape), GS.reshape(shape)
+            # GS is the "left" self-energy
+            return GS.reshape(shape), other.reshape(shape)
+
+        if E.imag == 0.0:
+            E = E.real + 1j * self.eta
+
         sp0 = self.spgeom0
         sp1 = self.spgeom1
 
@@ -689,6 +939,256 @@ class RecursiveSI(SemiInfinite):
         )
 
 
+@set_module("sisl.physics")
+class TransferMatrixSI(RecursiveSI):
+    r"""Self-energy object using the eigenmodes of the transfer matrix
+
+    The Bloch modes, :math:`\psi_{j+1} = \lambda \psi_j`, of the semi-infinite
+    chain are solutions of the quadratic eigenvalue problem
+
+    .. math::
+        \big[\mathbf K_{-1} + \lambda \mathbf K_0 + \lambda^2 \mathbf K_1\big]\mathbf u = 0,
+        \quad \mathbf K_i = \mathbf H_i - E \mathbf S_i
+
+    which is solved as a generalized eigenvalue problem of twice the size.
+    The :math:`n` modes decaying into the semi-infinite direction (:math:`|\lambda|<1`)
+    define the Bloch matrix :math:`\mathbf F = \mathbf U\boldsymbol\Lambda\mathbf U^{-1}`
+    and the self-energy is :math:`\boldsymbol\Sigma = \mathbf K_1 \mathbf F`.
+
+    Contrary to `RecursiveSI` the cost does not depend on the convergence of an
+    iterative procedure, which is beneficial for small values of :math:`\eta` and
+    energies close to band edges. The methods and arguments are the same as for `RecursiveSI`
+    (the ``atol`` argument is accepted, but not used).
+
+    Parameters
+    ----------
+    spgeom :
+       any sparse geometry matrix which may return matrices
+    infinite :
+       axis specification for the semi-infinite direction (`+A`/`-A`/`+B`/`-B`/`+C`/`-C`)
+    eta :
+       the default imaginary part (:math:`\eta`) of the self-energy calculation
+    """
+
+    def _matrices(
+        self, E, k: np.ndarray, dtype: np.dtype, **kwargs
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return :math:`E\mathbf S_0 - \mathbf H_0` and the couplings along and opposite to the semi-infinite direction
+
+        The returned matrices have the energy dimension prepended.
+        """
+        E = np.asarray(E).reshape(-1)
+        E = np.where(E.imag == 0.0, E.real + 1j * self.eta, E)[:, None, None]
+
+        sp0 = self.spgeom0
+        sp1 = self.spgeom1
+
+        SmH0 = sp0.Sk(k, dtype=dtype, format="array") * E - sp0.Pk(
+            k, dtype=dtype, format="array", **kwargs
+        )
+        P = sp1.Pk(k, dtype=dtype, format="array", **kwargs)
+        if sp1.orthogonal:
+            Kp = np.broadcast_to(P, SmH0.shape)
+            Km = np.broadcast_to(conjugate(P.T), SmH0.shape)
+        else:
+            S = sp1.Sk(k, dtype=dtype, format="array")
+            Kp = P - S * E
+            Km = conjugate(P.T) - conjugate(S.T) * E
+        return SmH0, Kp, Km
+
+    def _bloch_matrix(
+        self, SmH0: np.ndarray, Kp: np.ndarray, Km: np.ndarray, method: str
+    ) -> np.ndarray:
+        r"""Bloch matrix :math:`\mathbf F` of the modes decaying along the coupling `Kp`
+
+        I.e. :math:`\psi_{j+1} = \mathbf F\psi_j` where :math:`j+1` is the cell coupled via `Kp`.
+        """
+        n = SmH0.shape[0]
+        I = eye(n, dtype=SmH0.dtype)
+        Z = zeros_like(SmH0)
+        # linearized quadratic eigenvalue problem:
+        #   A [u, lambda u] = lambda B [u, lambda u]
+        A = np.block([[Z, I], [-Km, SmH0]])
+        B = np.block([[I, Z], [Z, Kp]])
+        w, v = eig_destroy(A, B, homogeneous_eigvals=True)
+
+        # |lambda|, a singular Kp results in infinite eigenvalues
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lam = _abs(w[0]) / _abs(w[1])
+        idx = np.argsort(lam)[:n]
+        if not lam[idx[-1]] < 1:
+            raise ValueError(
+                f"{self.__class__.__name__}.{method} could not separate decaying "
+                "modes, is eta too small?"
+            )
+
+        U = v[:n, idx]
+        # F = (Lambda U) U^-1
+        try:
+            return solve(U.T, v[n:, idx].T).T
+        except np.linalg.LinAlgError:
+            raise ValueError(
+                f"{self.__class__.__name__}.{method} could not invert the decaying modes."
+            )
+
+    def _self_energies(
+        self, E, k: KPoint, dtype: np.dtype, method: str, lr: bool, **kwargs
+    ):
+        """Yield the surface matrices and the self-energies for all energies"""
+        k = _a.asarrayd(k)
+        SmH0, Kp, Km = self._matrices(E, k, dtype, **kwargs)
+        for i in range(len(SmH0)):
+            # self-energy of the semi-infinite direction
+            SE = Kp[i] @ self._bloch_matrix(SmH0[i], Kp[i], Km[i], method)
+            if lr:
+                # self-energy of the opposite direction
+                SE_opposite = Km[i] @ self._bloch_matrix(SmH0[i], Km[i], Kp[i], method)
+                yield SmH0[i], SE, SE_opposite
+            else:
+                yield SmH0[i], SE
+
+    @staticmethod
+    def _reshape(E, M: np.ndarray) -> np.ndarray:
+        """Reshape stacked matrices to the shape of `E`"""
+        return M.reshape(np.shape(E) + M.shape[1:])
+
+    def green(
+        self,
+        E: Union[complex, Sequence[complex]],
+        k: KPoint = (0, 0, 0),
+        dtype: np.dtype = np.complex128,
+        **kwargs,
+    ) -> np.ndarray:
+        r"""Return a dense matrix with the bulk Green function at energy `E` and k-point `k` (default Gamma).
+
+        Parameters
+        ----------
+        E :
+          energy at which the calculation will take place.
+          For an array of energies the returned matrices will have the
+          energy dimension(s) prepended.
+        k :
+          k-point at which the Green function should be evaluated.
+          the k-point should be in units of the reciprocal lattice vectors.
+        dtype :
+          the resulting data type.
+        **kwargs : dict, optional
+           arguments passed directly to the ``self.parent.Pk`` method (not ``self.parent.Sk``), for instance ``spin``
+
+        Returns
+        -------
+        numpy.ndarray
+            the bulk Green function
+        """
+        kwargs.pop("atol", None)
+        G = np.stack(
+            [
+                inv(SmH0 - SE - SE_opposite)
+                for SmH0, SE, SE_opposite in self._self_energies(
+                    E, k, dtype, "green", True, **kwargs
+                )
+            ]
+        ).astype(dtype, copy=False)
+        return self._reshape(E, G)
+
+    def self_energy(
+        self,
+        E: Union[complex, Sequence[complex]],
+        k: KPoint = (0, 0, 0),
+        dtype: np.dtype = np.complex128,
+        bulk: bool = False,
+        **kwargs,
+    ) -> np.ndarray:
+        r"""Return a dense matrix with the self-energy at energy `E` and k-point `k` (default Gamma).
+
+        Parameters
+        ----------
+        E :
+          energy at which the calculation will take place.
+          For an array of energies the returned matrices will have the
+          energy dimension(s) prepended.
+        k :
+          k-point at which the self-energy should be evaluated.
+          the k-point should be in units of the reciprocal lattice vectors.
+        dtype :
+          the resulting data type
+        bulk :
+          if true, :math:`E\cdot \mathbf S - \mathbf H -\boldsymbol\Sigma` is returned, else
+          :math:`\boldsymbol\Sigma` is returned (default).
+        **kwargs : dict, optional
+           arguments passed directly to the ``self.parent.Pk`` method (not ``self.parent.Sk``), for instance ``spin``
+
+        Returns
+        -------
+        numpy.ndarray
+            the self-energy corresponding to the semi-infinite direction
+        """
+        kwargs.pop("atol", None)
+        SE = np.stack(
+            [
+                SmH0 - SE if bulk else SE
+                for SmH0, SE in self._self_energies(
+                    E, k, dtype, "self_energy", False, **kwargs
+                )
+            ]
+        ).astype(dtype, copy=False)
+        return self._reshape(E, SE)
+
+    def self_energy_lr(
+        self,
+        E: Union[complex, Sequence[complex]],
+        k: KPoint = (0, 0, 0),
+        dtype: np.dtype = np.complex128,
+        bulk: bool = False,
+        **kwargs,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""Return two dense matrices with the left/right self-energy at energy `E` and k-point `k` (default Gamma).
+
+        Note calculating the LR self-energies simultaneously requires that their chemical potentials are the same.
+        I.e. only when the reference energy is equivalent in the left/right schemes does this make sense.
+
+        Parameters
+        ----------
+        E :
+          energy at which the calculation will take place, if complex, the hosting ``eta`` won't be used.
+          For an array of energies the returned matrices will have the
+          energy dimension(s) prepended.
+        k :
+          k-point at which the self-energy should be evaluated.
+          the k-point should be in units of the reciprocal lattice vectors.
+        dtype :
+          the resulting data type.
+        bulk :
+          if true, :math:`E\cdot \mathbf S - \mathbf H -\boldsymbol\Sigma` is returned, else
+          :math:`\boldsymbol\Sigma` is returned (default).
+        **kwargs : dict, optional
+           arguments passed directly to the ``self.parent.Pk`` method (not ``self.parent.Sk``), for instance ``spin``
+
+        Returns
+        -------
+        left : numpy.ndarray
+            the left self-energy
+        right : numpy.ndarray
+            the right self-energy
+        """
+        kwargs.pop("atol", None)
+        left = []
+        right = []
+        for SmH0, SE, SE_opposite in self._self_energies(
+            E, k, dtype, "self_energy_lr", True, **kwargs
+        ):
+            if bulk:
+                SE = SmH0 - SE
+                SE_opposite = SmH0 - SE_opposite
+            if self.semi_inf_dir == 1:
+                SE, SE_opposite = SE_opposite, SE
+            left.append(SE)
+            right.append(SE_opposite)
+        left = np.stack(left).astype(dtype, copy=False)
+        right = np.stack(right).astype(dtype, copy=False)
+        return self._reshape(E, left), self._reshape(E, right)
+
+
 @set_module("sisl.physics")
 class RealSpaceSE(SelfEnergy):
     r"""Bulk real-space self-energy (or Green function) for a given physical object with periodicity
@@ -699,7 +1199,7 @@ class RealSpaceSE(SelfEnergy):
         \boldsymbol\Sigma^\mathcal{R}(E) = \mathbf S^\mathcal{R} (E+i\eta) - \mathbf H^\mathcal{R}
              - \Big[\sum_{\mathbf k} \mathbf G_{\mathbf k}(E)\Big]^{-1}
 
-    The method actually used is relying on `RecursiveSI` and `~sisl.physics.Bloch` objects.
+    The method actually used is relying on `RecursiveSI` (or `TransferMatrixSI`) and `~sisl.physics.Bloch` objects.
 
     Parameters
     ----------
@@ -728,6 +1228,8 @@ class RealSpaceSE(SelfEnergy):
     trs : bool, optional
         whether time-reversal symmetry is used in the `BrillouinZone` integration, default
         to true.
+    semi_infinite : SemiInfinite, optional
+        the class used for calculating the semi-infinite self-energies, default to `RecursiveSI`.
 
     Examples
     --------
@@ -798,6 +1300,8 @@ class RealSpaceSE(SelfEnergy):
             "eta": eta,
             # The BrillouinZone used for integration
             "bz": None,
+            # The semi-infinite self-energy method
+            "semi_infinite": RecursiveSI,
         }
         self.setup(**options)
 
@@ -841,6 +1345,9 @@ class RealSpaceSE(SelfEnergy):
         trs : bool, optional
             whether time-reversal symmetry is used in the `BrillouinZone` integration, default
             to true.
+        semi_infinite : SemiInfinite, optional
+            the class used for calculating the semi-infinite self-energies, default to `RecursiveSI`.
+            `TransferMatrixSI` may be used for small values of :math:`\eta`.
         """
         self._options.update(options)
 
@@ -988,7 +1495,9 @@ class RealSpaceSE(SelfEnergy):
         self._calc = {
             # The below algorithm requires the direction to be negative
             # if changed, B, C should be reversed below
-            "SE": RecursiveSI(self.parent, "-" + "ABC"[s_ax], eta=self._options["eta"]),
+            "SE": self._options["semi_infinite"](
+                self.parent, "-" + "ABC"[s_ax], eta=self._options["eta"]
+            ),
             # Used to calculate the real-space self-energy
             "P0": P0.Pk,
             "S0": P0.Sk,
@@ -1099,6 +1608,7 @@ class RealSpaceSE(SelfEnergy):
         dtype: np.dtype = np.complex128,
         *,
         apply_kwargs=None,
+        threads: int = 1,
         **kwargs,
     ) -> np.ndarray:
         r"""Calculate the real-space Green function
@@ -1119,6 +1629,11 @@ class RealSpaceSE(SelfEnergy):
           the resulting data type.
         apply_kwargs : dict, optional
            keyword arguments passed directly to ``bz.apply.renew(**apply_kwargs)``.
+           Can not be used together with multiple `threads`.
+        threads :
+           number of threads used for the k-point integration.
+           With more than 1 thread the k-points are distributed among threads, otherwise
+           ``bz.apply`` is used.
         **kwargs : dict, optional
            arguments passed directly to the ``self.parent.Pk`` method (not ``self.parent.Sk``), for instance ``spin``
         """
@@ -1138,6 +1653,10 @@ class RealSpaceSE(SelfEnergy):
 
         if apply_kwargs is None:
             apply_kwargs = {}
+        elif threads > 1:
+            raise ValueError(
+                f"{self.__class__.__name__}.green cannot use apply_kwargs together with threads > 1"
+            )
 
         # Used axes
         s_ax = self._semi_axis
@@ -1317,9 +1836,21 @@ class RealSpaceSE(SelfEnergy):
         no = len(self.parent)
 
         # calculate the Green function
-        G = bz.apply.renew(**apply_kwargs).average(_func_bloch)(
-            dtype=dtype, no=no, tile=tile, idx0=idx0
-        )
+        if threads > 1:
+            G = _k_average_threads(
+                _calc_green,
+                bz,
+                bloch,
+                threads,
+                dtype=dtype,
+                no=no,
+                tile=tile,
+                idx0=idx0,
+            )
+        else:
+            G = bz.apply.renew(**apply_kwargs).average(_func_bloch)(
+                dtype=dtype, no=no, tile=tile, idx0=idx0
+            )
         if not bloch.finalize:
             bloch.unfold_finalize(G)
 
@@ -1853,7 +2384,13 @@ class RealSpaceSI(SelfEnergy):
         ).toarray() - inv(G, True)
 
     def green(
-        self, E: complex, k: KPoint = (0, 0, 0), dtype=np.complex128, **kwargs
+        self,
+        E: complex,
+        k: KPoint = (0, 0, 0),
+        dtype=np.complex128,
+        *,
+        threads: int = 1,
+        **kwargs,
     ) -> np.ndarray:
         r"""Calculate the real-space Green function
 
@@ -1871,6 +2408,10 @@ class RealSpaceSI(SelfEnergy):
            I.e. this would correspond to a circular real-space Green function
         dtype :
           the resulting data type.
+        threads :
+           number of threads used for the k-point integration.
+           With more than 1 thread the k-points are distributed among threads, otherwise
+           ``bz.apply`` is used.
         **kwargs : dict, optional
            arguments passed directly to the ``self.surface.Pk`` method (not ``self.surface.Sk``), for instance ``spin``
         """
@@ -1985,9 +2526,20 @@ class RealSpaceSI(SelfEnergy):
             _func_bloch = _calc_green
 
         # calculate the Green function
-        G = bz.apply.average(_func_bloch)(
-            dtype=dtype, surf_orbs=self._surface_orbs, semi_bulk=opt["semi_bulk"]
-        )
+        if threads > 1:
+            G = _k_average_threads(
+                _calc_green,
+                bz,
+                bloch,
+                threads,
+                dtype=dtype,
+                surf_orbs=self._surface_orbs,
+                semi_bulk=opt["semi_bulk"],
+            )
+        else:
+            G = bz.apply.average(_func_bloch)(
+                dtype=dtype, surf_orbs=self._surface_orbs, semi_bulk=opt["semi_bulk"]
+            )
 
         if not bloch.finalize:
             bloch.unfold_finalize(G)
@@ -2004,3 +2556,222 @@ class RealSpaceSI(SelfEnergy):
     def clear(self) -> None:
         """Clears the internal arrays created in `setup`"""
         del self._calc
+
+
+@set_module("sisl.physics")
+class CachedSE(SelfEnergy):
+    r"""Caching of calculated self-energies (and Green functions) of another self-energy object
+
+    Results are stored in a least-recently-used memory cache, and optionally
+    on disk (one ``.npy`` file per calculation) so that subsequent runs
+    can reuse the results.
+    The calculations are keyed by the energy, k-point and all additional
+    arguments (``spin``, ``dtype``, ``bulk``, ...). Energies and
+    k-points are quantised on a grid with spacing `atol`, i.e. values that
+    round to the same grid point share the calculation. Note that values closer
+    than `atol` may still round to neighbouring grid points.
+
+    Parameters
+    ----------
+    se :
+       the self-energy object that calculates the self-energies.
+    path :
+       directory for storing the calculated self-energies on disk.
+       The directory should only be used for a single self-energy object since
+       the stored files are *not* checked for consistency with `se`.
+       Files are named ``self_energy-*.npy`` and ``green-*.npy``.
+       If not given, only the memory cache will be used.
+    maxsize :
+       maximum number of calculations kept in memory
+    atol :
+       grid spacing used for quantising energies and k-points in the keys
+
+    Examples
+    --------
+    >>> se = CachedSE(RecursiveSI(H, "-A"), "left_se")
+    >>> se.self_energy(0.1, k=[0, 0.5, 0]) # calculated
+    >>> se.self_energy(0.1, k=[0, 0.5, 0]) # from the memory cache
+
+    Subsequent runs will read the self-energies from the directory ``left_se``.
+    """
+
+    def __init__(
+        self,
+        se: SelfEnergy,
+        path: Optional[Union[str, Path]] = None,
+        maxsize: int = 128,
+        atol: float = 1e-8,
+    ):
+        self._se = se
+        if path is not None:
+            path = Path(path)
+            path.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.maxsize = maxsize
+        self.atol = atol
+        self._cache = OrderedDict()
+
+    def __len__(self) -> int:
+        r"""Dimension of the self-energy"""
+        return len(self._se)
+
+    def __str__(self) -> str:
+        """Representation of the CachedSE model"""
+        return "{0}{{cached: {1}, path: {2},\n {3}\n}}".format(
+            self.__class__.__name__,
+            len(self._cache),
+            self.path,
+            str(self._se).replace("\n", "\n "),
+        )
+
+    def __getattr__(self, attr):
+        """Overload attributes from the hosting object"""
+        if attr == "_se":
+            raise AttributeError(attr)
+        return getattr(self._se, attr)
+
+    def _key(self, method: str, E: complex, k: np.ndarray, kwargs) -> str:
+        """Create a unique key for the calculation (with quantised energy and k-point)"""
+        E = complex(E)
+        if E.imag == 0.0:
+            # the object adds its own eta
+            E = complex(E.real, getattr(self._se, "eta", 0.0))
+        Ek = np.round(np.array([E.real, E.imag, *k]) / self.atol).astype(np.int64)
+        args = []
+        for key, value in sorted(kwargs.items()):
+            if key == "dtype":
+                value = np.dtype(value).str
+            args.append(f"{key}={value!r}")
+        return f"{method}|{Ek.tolist()}|{','.join(args)}"
+
+    def _file(self, key: str) -> Path:
+        """Disk file storing the calculation corresponding to `key`"""
+        method = key.split("|", 1)[0]
+        return (
+            self.path
+            / f"{method}-{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.npy"
+        )
+
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        """Retrieve a calculation from the memory or disk cache"""
+        try:
+            M = self._cache[key]
+            self._cache.move_to_end(key)
+            return M
+        except KeyError:
+            pass
+
+        if self.path is not None:
+            try:
+                M = np.load(self._file(key))
+            except (OSError, ValueError):
+                # not present, or a corrupt file
+                return None
+            self._put(key, M, disk=False)
+            return M
+        return None
+
+    def _put(self, key: str, M: np.ndarray, disk: bool = True) -> None:
+        """Store a calculation in the memory (and disk) cache"""
+        if self.maxsize > 0:
+            self._cache[key] = M
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        if disk and self.path is not None:
+            # Write to a temporary file and move it in place, this
+            # ensures that concurrent runs never read partial files.
+            file = self._file(key)
+            tmp = file.with_name(f"{file.stem}.{uuid4().hex}.tmp.npy")
+            np.save(tmp, M)
+            os.replace(tmp, file)
+
+    def _cached(self, method: str, E, k: KPoint, kwargs) -> np.ndarray:
+        """Return the cached (or calculated) result of `method`"""
+        k = _a.asarrayd(k)
+        func = getattr(self._se, method)
+
+        if np.ndim(E) == 0:
+            key = self._key(method, E, k, kwargs)
+            M = self._get(key)
+            if M is None:
+                M = func(E, k=k, **kwargs)
+                self._put(key, M)
+            return M.copy()
+
+        # Only calculate the missing energies (simultaneously)
+        E = np.asarray(E)
+        keys = [self._key(method, e, k, kwargs) for e in E.ravel()]
+        Ms = [self._get(key) for key in keys]
+        missing = [i for i, M in enumerate(Ms) if M is None]
+        if missing:
+            calc = func(E.ravel()[missing], k=k, **kwargs)
+            for i, M in zip(missing, calc):
+                # do not retain the full calculation through views
+                M = M.copy()
+                self._put(keys[i], M)
+                Ms[i] = M
+        Ms = np.stack(Ms)
+        return Ms.reshape(E.shape + Ms.shape[1:])
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all cached calculations from memory, and optionally also from the disk
+
+        Parameters
+        ----------
+        disk :
+           also remove the files stored on disk
+        """
+        self._cache.clear()
+        if disk and self.path is not None:
+            # only remove files written by this class (including stale temporary files)
+            for method in ("self_energy", "green"):
+                for file in self.path.glob(f"{method}-*.npy"):
+                    file.unlink(missing_ok=True)
+
+    def self_energy(
+        self,
+        E: Union[complex, Sequence[complex]],
+        k: KPoint = (0, 0, 0),
+        **kwargs,
+    ) -> np.ndarray:
+        r"""Return the self-energy, either from the cache, or by calculating it
+
+        Parameters
+        ----------
+        E :
+          energy at which the calculation will take place.
+          An array of energies is only allowed if the underlying
+          self-energy object accepts arrays of energies, only the missing
+          energies will be calculated.
+        k :
+          k-point at which the self-energy should be evaluated.
+        **kwargs : dict, optional
+          arguments passed directly to the ``self_energy`` method of the
+          underlying self-energy object. They are part of the cache key.
+        """
+        return self._cached("self_energy", E, k, kwargs)
+
+    def green(
+        self,
+        E: Union[complex, Sequence[complex]],
+        k: KPoint = (0, 0, 0),
+        **kwargs,
+    ) -> np.ndarray:
+        r"""Return the Green function, either from the cache, or by calculating it
+
+        Parameters
+        ----------
+        E :
+          energy at which the calculation will take place.
+          An array of energies is only allowed if the underlying
+          self-energy object accepts arrays of energies, only the missing
+          energies will be calculated.
+        k :
+          k-point at which the Green function should be evaluated.
+        **kwargs : dict, optional
+          arguments passed directly to the ``green`` method of the
+          underlying self-energy object. They are part of the cache key.
+        """
+        return self._cached("green", E, k, kwargs)
@@ -44,8 +44,19 @@ from ._matrix_dk import (
     matrix_dk_nambu,
     matrix_dk_nc,
     matrix_dk_so,
+    matrix_dk_state_box,
+    matrix_dk_state_diag,
+)
+from ._matrix_k import (
+    matrix_k,
+    matrix_k_batch,
+    matrix_k_box_diag,
+    matrix_k_diag,
+    matrix_k_multi,
+    matrix_k_nambu,
+    matrix_k_nc,
+    matrix_k_so,
 )
-from ._matrix_k import matrix_k, matrix_k_diag, matrix_k_nambu, matrix_k_nc, matrix_k_so
 from .spin import Spin
 
 __all__ = ["SparseOrbitalBZ", "SparseOrbitalBZSpin"]
@@ -55,6 +66,27 @@ __all__ = ["SparseOrbitalBZ", "SparseOrbitalBZSpin"]
 warnings.filterwarnings("ignore", category=SparseEfficiencyWarning, module=__name__)
 
 
+def _is_batch_k(k: np.ndarray) -> bool:
+    """Whether `k` contains several k-points
+
+    A single k-point passed as a 2D array (shape ``(1, 3)``) is *not*
+    a batch, and returns a single matrix.
+    """
+    return k.ndim == 2 and len(k) > 1
+
+
+def _batch_k(func, k, format: str = "csr", **kwargs):
+    """Call `func` for each k-point in `k` and collect the matrices
+
+    Dense formats are stacked into a single array with the k-points
+    in the first dimension, otherwise a list of matrices is returned.
+    """
+    Mk = [func(ki, format=format, **kwargs) for ki in k]
+    if format in ("array", "matrix", "dense"):
+        return np.stack(Mk)
+    return Mk
+
+
 def _get_spin(
     M,
     spin: Spin,
@@ -484,6 +516,13 @@ class SparseOrbitalBZ(SparseOrbital):
 
         return p
 
+    @staticmethod
+    def _fromcoo_dim(dim: int, **kwargs) -> int:
+        # the overlap is the last dimension of the data
+        if kwargs.get("orthogonal", True):
+            return dim
+        return dim - 1
+
     def iter_orbitals(self, atoms: AtomsIndex = None, local: bool = False):
         r"""Iterations of the orbital space in the geometry, two indices from loop
 
@@ -536,7 +575,15 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            if format.startswith("sc"):
+                return _batch_k(
+                    self._Pk, k, dtype=dtype, gauge=gauge, format=format, _dim=_dim
+                )
+            k = np.ascontiguousarray(k)
+            return matrix_k_batch(gauge, self, _dim, self.lattice, k, dtype, format)
+        k = k.ravel()
         return matrix_k(gauge, self, _dim, self.lattice, k, dtype, format)
 
     def _dPk(
@@ -583,6 +630,47 @@ class SparseOrbitalBZ(SparseOrbital):
         k = _a.asarrayd(k).ravel()
         return matrix_ddk(gauge, self, _dim, self.lattice, k, dtype, format)
 
+    def _dPk_state(
+        self,
+        state,
+        energy=None,
+        k: KPoint = (0, 0, 0),
+        gauge: GaugeType = "lattice",
+        _dim=0,
+    ) -> np.ndarray:
+        r"""Expectation values of the matrix differentiated with respect to `k` for a set of states
+
+        The diagonal elements :math:`\langle\psi_i|\partial_{\mathbf k}\mathbf P(\mathbf k)
+        - \epsilon_i\partial_{\mathbf k}\mathbf S(\mathbf k)|\psi_i\rangle` are calculated
+        directly from the sparse matrix, without constructing the derivative matrices.
+
+        Parameters
+        ----------
+        state : numpy.ndarray
+           the states, with shape ``(nstate, self.no)``
+        energy : numpy.ndarray, optional
+           the eigenvalues of the states, only used for non-orthogonal basis sets
+        k :
+           k-point (default is Gamma point)
+        gauge :
+           chosen gauge
+
+        Returns
+        -------
+        numpy.ndarray
+            the expectation values with shape ``(3, nstate)``
+        """
+        k = _a.asarrayd(k).ravel()
+        state = np.atleast_2d(state)
+        s_idx = -1 if self.orthogonal else self.S_idx
+        if s_idx >= 0 and energy is None:
+            raise ValueError(
+                f"{self.__class__.__name__}._dPk_state requires the energies for non-orthogonal basis sets"
+            )
+        return matrix_dk_state_diag(
+            gauge, self, _dim, s_idx, self.lattice, k, state, energy
+        )
+
     def Sk(
         self,
         k: KPoint = (0, 0, 0),
@@ -617,6 +705,10 @@ class SparseOrbitalBZ(SparseOrbital):
         ----------
         k :
            the k-point to setup the overlap at (default Gamma point)
+           Several k-points (shape ``(nk, 3)``) returns the matrices for all k-points,
+           stacked in an array of shape ``(nk, no, no)`` for dense formats, or as a list
+           of sparse matrices (with the same sparsity pattern).
+           A single k-point of shape ``(1, 3)`` returns a single matrix.
         dtype : numpy.dtype, optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -653,6 +745,11 @@ class SparseOrbitalBZ(SparseOrbital):
         **kwargs,
     ):
         r"""For an orthogonal case we always return the identity matrix"""
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(
+                self._Sk_diagonal, k, dtype=dtype, gauge=gauge, format=format
+            )
         if dtype is None:
             dtype = np.float64
         nr = len(self)
@@ -695,6 +792,69 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         return self._Pk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
 
+    def PSk(
+        self,
+        k: KPoint = (0, 0, 0),
+        dtype=None,
+        gauge: GaugeType = "lattice",
+        format: str = "csr",
+        **kwargs,
+    ):
+        r"""Setup the matrix and the overlap matrix for a given k-point
+
+        This is equivalent to ``(self.Pk(k, ...), self.Sk(k, ...))``, however, both
+        matrices are created simultaneously using the same phases, and the sparse
+        elements are only traversed once.
+        The two sparse matrices will share the same sparsity pattern.
+
+        Parameters
+        ----------
+        k :
+           the k-point to setup the matrices at (default Gamma point)
+        dtype : numpy.dtype, optional
+           the data type of the returned matrices. Do NOT request non-complex
+           data-type for non-Gamma k.
+           The default data-type is `numpy.complex128`
+        gauge :
+           the chosen gauge
+        format : {"csr", "array", "matrix", "coo", ...}
+           the returned format of the matrices, see `Sk` for details.
+        **kwargs :
+           additional arguments passed to `Pk` (e.g. ``spin``)
+
+        See Also
+        --------
+        Pk : the matrix at `k`
+        Sk : the overlap matrix at `k`
+
+        Returns
+        -------
+        P : numpy.ndarray or scipy.sparse.*_matrix
+            the matrix at :math:`\mathbf k`
+        S : numpy.ndarray or scipy.sparse.*_matrix
+            the overlap matrix at :math:`\mathbf k`
+        """
+        k = _a.asarrayd(k)
+        if self.orthogonal or _is_batch_k(k) or format.startswith("sc"):
+            return (
+                self.Pk(k, dtype=dtype, gauge=gauge, format=format, **kwargs),
+                self.Sk(k, dtype=dtype, gauge=gauge, format=format),
+            )
+        return self._PSk(k.ravel(), dtype=dtype, gauge=gauge, format=format, **kwargs)
+
+    def _PSk(
+        self,
+        k: KPoint = (0, 0, 0),
+        dtype=None,
+        gauge: GaugeType = "lattice",
+        format: str = "csr",
+        _dim=0,
+    ):
+        r"""Matrix and overlap matrix at `k`, see `PSk`"""
+        return matrix_k_multi(
+            gauge, self, [_dim, self.S_idx], self.lattice, k, dtype, format
+        )
+
     def dSk(
         self,
         k: KPoint = (0, 0, 0),
@@ -936,13 +1096,13 @@ class SparseOrbitalBZ(SparseOrbital):
         All subsequent arguments gets passed directly to `scipy.linalg.eig`
         """
         dtype = kwargs.pop("dtype", None)
-        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array")
         if self.orthogonal:
+            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array")
             if eigvals_only:
                 return lin.eigvals_destroy(P, **kwargs)
             return lin.eig_destroy(P, **kwargs)
 
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format="array")
+        P, S = self.PSk(k=k, dtype=dtype, gauge=gauge, format="array")
         if eigvals_only:
             return lin.eigvals_destroy(P, S, **kwargs)
         return lin.eig_destroy(P, S, **kwargs)
@@ -961,13 +1121,7 @@ class SparseOrbitalBZ(SparseOrbital):
 
         All subsequent arguments gets passed directly to `scipy.linalg.eigh`
         """
-        dtype = kwargs.pop("dtype", None)
-        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array")
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
-
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format="array")
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        return self._eigh(k, gauge, eigvals_only, **kwargs)[0]
 
     def eigsh(
         self,
@@ -975,6 +1129,7 @@ class SparseOrbitalBZ(SparseOrbital):
         n: int = 1,
         gauge: GaugeType = "lattice",
         eigvals_only: bool = True,
+        window: Optional[Tuple[float, float]] = None,
         **kwargs,
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         r"""Calculates a subset of eigenvalues of the physical quantity using sparse matrices
@@ -989,6 +1144,12 @@ class SparseOrbitalBZ(SparseOrbital):
         n :
             number of eigenvalues to calculate.
             Defaults to the `n` smallest magnitude eigevalues.
+        window :
+            calculate *all* eigenvalues in the window ``[Emin, Emax]`` using the
+            shift-invert method around the center of the window, see `sisl.linalg.eigsh_window`.
+            The sparse LU factorization of the shifted matrix is done once and re-used.
+            In this case `n` is the initial number of calculated eigenvalues, which
+            is increased until the window is complete.
         **kwargs:
             arguments passed directly to `scipy.sparse.linalg.eigsh`.
 
@@ -998,16 +1159,87 @@ class SparseOrbitalBZ(SparseOrbital):
         Playing around with a small test example before doing large scale calculations
         is adviced!
         """
-        # We always request the smallest eigenvalues...
-        kwargs.update({"which": kwargs.get("which", "SM")})
+        return self._eigh(
+            k, gauge, eigvals_only, sparse=True, n=n, window=window, **kwargs
+        )[0]
 
+    def _eigh(
+        self,
+        k: KPoint,
+        gauge: GaugeType,
+        eigvals_only: bool,
+        sparse: bool = False,
+        n: int = 1,
+        window: Optional[Tuple[float, float]] = None,
+        _opt=None,
+        _keep_S: bool = False,
+        **kwargs,
+    ):
+        r"""Solution of the eigenvalue problem (`eigh` or `eigsh`) *and* the used overlap matrix
+
+        The overlap matrix is created together with the matrix (see `PSk`) and
+        returned (sparse for the sparse solvers, otherwise dense), so it may be re-used
+        when post-processing the eigenstates. For orthogonal matrices the overlap matrix
+        is ``None``.
+
+        Parameters
+        ----------
+        sparse :
+           whether to use `eigsh` (calculating `n` eigenvalues) or `eigh`
+        window :
+           only calculate the eigenvalues in this window (using `eigsh_window`)
+        _opt : dict, optional
+           additional arguments passed to `Pk`/`PSk`
+        _keep_S :
+           whether the overlap matrix should be returned for the dense
+           solver, otherwise it is overwritten by the solver
+           and ``None`` is returned for the overlap matrix.
+        """
         dtype = kwargs.pop("dtype", None)
+        if _opt is None:
+            _opt = {}
+
+        if window is not None:
+            if self.orthogonal:
+                P, S = self.Pk(k=k, dtype=dtype, gauge=gauge, **_opt), None
+            else:
+                P, S = self.PSk(k=k, dtype=dtype, gauge=gauge, **_opt)
+            # a small initial n is inefficient, since it is doubled until the window is complete
+            e = lin.eigsh_window(
+                P, *window, b=S, n=max(n, 10), eigvals_only=eigvals_only, **kwargs
+            )
+            return e, S
+
+        if sparse:
+            # We always request the smallest eigenvalues...
+            kwargs.update({"which": kwargs.get("which", "SM")})
+            if self.orthogonal:
+                P = self.Pk(k=k, dtype=dtype, gauge=gauge, **_opt)
+                return (
+                    lin.eigsh(P, k=n, return_eigenvectors=not eigvals_only, **kwargs),
+                    None,
+                )
+            P, S = self.PSk(k=k, dtype=dtype, gauge=gauge, **_opt)
+            return (
+                lin.eigsh(P, M=S, k=n, return_eigenvectors=not eigvals_only, **kwargs),
+                S,
+            )
 
-        P = self.Pk(k=k, dtype=dtype, gauge=gauge)
         if self.orthogonal:
-            return lin.eigsh(P, k=n, return_eigenvectors=not eigvals_only, **kwargs)
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge)
-        return lin.eigsh(P, M=S, k=n, return_eigenvectors=not eigvals_only, **kwargs)
+            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array", **_opt)
+            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs), None
+
+        P, S = self.PSk(k=k, dtype=dtype, gauge=gauge, format="array", **_opt)
+        if not _keep_S:
+            return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs), None
+
+        # the overlap matrix is retained
+        return (
+            lin.eigh_destroy(
+                P, S, overwrite_b=False, eigvals_only=eigvals_only, **kwargs
+            ),
+            S,
+        )
 
     def astype(self, dtype, copy: bool = True) -> Self:
         """Convert the stored data-type to something else
@@ -1566,7 +1798,12 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(
+                self._Pk_non_colinear, k, dtype=dtype, gauge=gauge, format=format
+            )
+        k = k.ravel()
         return matrix_k_nc(gauge, self, self.lattice, k, dtype, format)
 
     def _Pk_spin_orbit(
@@ -1587,7 +1824,12 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(
+                self._Pk_spin_orbit, k, dtype=dtype, gauge=gauge, format=format
+            )
+        k = k.ravel()
         return matrix_k_so(gauge, self, self.lattice, k, dtype, format)
 
     def _Pk_nambu(
@@ -1608,7 +1850,10 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(self._Pk_nambu, k, dtype=dtype, gauge=gauge, format=format)
+        k = k.ravel()
         return matrix_k_nambu(gauge, self, self.lattice, k, dtype, format)
 
     def _dPk_unpolarized(
@@ -1654,6 +1899,55 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         """
         return self._dPk(k, dtype=dtype, gauge=gauge, format=format, _dim=spin)
 
+    def _dPk_state(
+        self,
+        state,
+        energy=None,
+        k: KPoint = (0, 0, 0),
+        gauge: GaugeType = "lattice",
+        spin=0,
+    ) -> np.ndarray:
+        r"""Expectation values of the matrix differentiated with respect to `k` for a set of states
+
+        See `SparseOrbitalBZ._dPk_state`. Nambu matrices are not supported.
+
+        Parameters
+        ----------
+        state : numpy.ndarray
+           the states, with shape ``(nstate, self.no)``, or ``(nstate, 2 * self.no)``
+           for non-collinear and spin-orbit matrices
+        energy : numpy.ndarray, optional
+           the eigenvalues of the states, only used for non-orthogonal basis sets
+        k :
+           k-point (default is Gamma point)
+        gauge :
+           chosen gauge
+        spin : int, optional
+           the spin-index of the quantity
+        """
+        if self.spin.is_diagonal:
+            if self.spin.is_unpolarized:
+                spin = 0
+            return super()._dPk_state(state, energy, k=k, gauge=gauge, _dim=spin)
+
+        if self.spin.is_nambu:
+            raise ValueError(
+                f"{self.__class__.__name__}._dPk_state does not support Nambu matrices, "
+                "use dPk to calculate the full derivative matrices instead."
+            )
+
+        k = _a.asarrayd(k).ravel()
+        state = np.atleast_2d(state)
+        s_idx = -1 if self.orthogonal else self.S_idx
+        if s_idx >= 0 and energy is None:
+            raise ValueError(
+                f"{self.__class__.__name__}._dPk_state requires the energies for non-orthogonal basis sets"
+            )
+        kind = "nc" if self.spin.is_noncolinear else "so"
+        return matrix_dk_state_box(
+            kind, gauge, self, s_idx, self.lattice, k, state, energy
+        )
+
     def _dPk_non_colinear(
         self,
         k: KPoint = (0, 0, 0),
@@ -1818,7 +2112,12 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(
+                self._Sk_non_colinear, k, dtype=dtype, gauge=gauge, format=format
+            )
+        k = k.ravel()
         return matrix_k_diag(gauge, self, self.S_idx, 2, self.lattice, k, dtype, format)
 
     def _Sk_nambu(
@@ -1839,9 +2138,41 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge :
            chosen gauge
         """
-        k = _a.asarrayd(k).ravel()
+        k = _a.asarrayd(k)
+        if _is_batch_k(k):
+            return _batch_k(self._Sk_nambu, k, dtype=dtype, gauge=gauge, format=format)
+        k = k.ravel()
         return matrix_k_diag(gauge, self, self.S_idx, 4, self.lattice, k, dtype, format)
 
+    def _PSk(
+        self,
+        k: KPoint = (0, 0, 0),
+        dtype=None,
+        gauge: GaugeType = "lattice",
+        format: str = "csr",
+        spin=0,
+    ):
+        r"""Matrix and overlap matrix at `k`, see `PSk`
+
+        Parameters
+        ----------
+        spin : int, optional
+           the spin-index of the quantity, only used for `Spin.POLARIZED` matrices
+        """
+        if self.spin.is_polarized:
+            return super()._PSk(k, dtype=dtype, gauge=gauge, format=format, _dim=spin)
+        elif self.spin.is_unpolarized:
+            return super()._PSk(k, dtype=dtype, gauge=gauge, format=format)
+        elif self.spin.is_noncolinear:
+            kind = "nc"
+        elif self.spin.is_spinorbit:
+            kind = "so"
+        else:
+            kind = "nambu"
+        return matrix_k_box_diag(
+            kind, gauge, self, self.S_idx, self.lattice, k, dtype, format
+        )
+
     def _dSk_non_colinear(
         self,
         k: KPoint = (0, 0, 0),
@@ -1908,20 +2239,16 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
         """
-        spin = kwargs.pop("spin", 0)
+        opt = self._spin_opt(kwargs)
         dtype = kwargs.pop("dtype", None)
 
-        if self.spin.kind == Spin.POLARIZED:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format="array")
-        else:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array")
-
         if self.orthogonal:
+            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array", **opt)
             if eigvals_only:
                 return lin.eigvals_destroy(P, **kwargs)
             return lin.eig_destroy(P, **kwargs)
 
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format="array")
+        P, S = self.PSk(k=k, dtype=dtype, gauge=gauge, format="array", **opt)
         if eigvals_only:
             return lin.eigvals_destroy(P, S, **kwargs)
         return lin.eig_destroy(P, S, **kwargs)
@@ -1946,19 +2273,7 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
         """
-        spin = kwargs.pop("spin", 0)
-        dtype = kwargs.pop("dtype", None)
-
-        if self.spin.kind == Spin.POLARIZED:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format="array")
-        else:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format="array")
-
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
-
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format="array")
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        return self._eigh(k, gauge, eigvals_only, **kwargs)[0]
 
     def eigsh(
         self,
@@ -1966,6 +2281,7 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         n: int = 1,
         gauge: GaugeType = "lattice",
         eigvals_only: bool = True,
+        window: Optional[Tuple[float, float]] = None,
         **kwargs,
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         r"""Calculates a subset of eigenvalues of the physical quantity using sparse matrices
@@ -1980,6 +2296,12 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         n :
            number of eigenvalues to calculate
            Defaults to the `n` smallest magnitude eigevalues.
+        window :
+           calculate *all* eigenvalues in the window ``[Emin, Emax]`` using the
+           shift-invert method around the center of the window, see `sisl.linalg.eigsh_window`.
+           The sparse LU factorization of the shifted matrix is done once and re-used.
+           In this case `n` is the initial number of calculated eigenvalues, which
+           is increased until the window is complete.
         spin : int, optional
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
@@ -1992,19 +2314,32 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         Playing around with a small test example before doing large scale calculations
         is adviced!
         """
-        # We always request the smallest eigenvalues...
-        spin = kwargs.pop("spin", 0)
-        dtype = kwargs.pop("dtype", None)
-        kwargs.update({"which": kwargs.get("which", "SM")})
+        return self._eigh(
+            k, gauge, eigvals_only, sparse=True, n=n, window=window, **kwargs
+        )[0]
 
+    def _spin_opt(self, kwargs) -> dict:
+        """Pop ``spin`` from `kwargs` and return the arguments for `Pk` (only accepted by polarized matrices)"""
+        spin = kwargs.pop("spin", 0)
         if self.spin.kind == Spin.POLARIZED:
-            P = self.Pk(k=k, dtype=dtype, spin=spin, gauge=gauge)
-        else:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge)
-        if self.orthogonal:
-            return lin.eigsh(P, k=n, return_eigenvectors=not eigvals_only, **kwargs)
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge)
-        return lin.eigsh(P, M=S, k=n, return_eigenvectors=not eigvals_only, **kwargs)
+            return {"spin": spin}
+        return {}
+
+    def _eigh(
+        self,
+        k: KPoint,
+        gauge: GaugeType,
+        eigvals_only: bool,
+        sparse: bool = False,
+        n: int = 1,
+        **kwargs,
+    ):
+        r"""Solution of the eigenvalue problem (`eigh` or `eigsh`) *and* the used overlap matrix
+
+        See `SparseOrbitalBZ._eigh`, additionally handles the ``spin`` argument.
+        """
+        opt = self._spin_opt(kwargs)
+        return super()._eigh(k, gauge, eigvals_only, sparse, n, _opt=opt, **kwargs)
 
     @deprecate_argument(
         "hermitian",
@@ -34,7 +34,7 @@ def _inner(v1, v2):
 
 
 @set_module("sisl.physics")
-def degenerate_decouple(state, M):
+def degenerate_decouple(state, M, degenerate=None):
     r""" Return `vec` decoupled via matrix `M`
 
     The decoupling algorithm is this recursive algorithm starting from :math:`i=0`:
@@ -55,13 +55,39 @@ def degenerate_decouple(state, M):
        state.
     M : numpy.ndarray
        matrix to project to before disentangling the states
+    degenerate : list of array_like, optional
+       groups of degenerate state indices (e.g. from `StateC.degenerate`), each group
+       is decoupled separately and the other states are left untouched.
+       Groups of equal size are decoupled together (stacked eigenvalue problems).
     """
     if isinstance(state, State):
-        state.state = degenerate_decouple(state.state, M)
-    else:
+        state.state = degenerate_decouple(state.state, M, degenerate)
+    elif degenerate is None:
         # since M may be a sparse matrix, we cannot use __matmul__
         p = np.conj(state) @ (M @ state.T)
         state = eigh_destroy(p)[1].T @ state
+    else:
+        degenerate = [_a.asarrayi(deg).ravel() for deg in degenerate]
+        if len(degenerate) == 0:
+            return state
+        state = state.copy()
+        idx = np.concatenate(degenerate)
+        # a single product for all degenerate states
+        # we cannot use __matmul__ since M may be sparse
+        Mstate = (M @ state[idx].T).T
+
+        # position of each group in idx
+        sizes = _a.fromiteri(map(len, degenerate))
+        offsets = np.cumsum(sizes) - sizes
+        for size in np.unique(sizes):
+            # all groups of this size, shape (ngroup, size)
+            groups = (offsets[sizes == size].reshape(-1, 1) + np.arange(size)).ravel()
+            sub = state[idx[groups]].reshape(-1, size, state.shape[1])
+            p = np.conj(sub) @ Mstate[groups].reshape(sub.shape).transpose(0, 2, 1)
+            u = np.linalg.eigh(p)[1]
+            state[idx[groups]] = (u.transpose(0, 2, 1) @ sub).reshape(
+                -1, state.shape[1]
+            )
     return state
 
 
@@ -1060,6 +1086,8 @@ state coefficients
 
         # Update gauge value
         self.info["gauge"] = gauge
+        # A retained overlap matrix is gauge dependent
+        self.info.pop("Sk", None)
 
         # Check that we can do a gauge transformation
         k = _a.asarrayd(self.info.get("k", [0.0, 0.0, 0.0]))
@@ -1144,6 +1172,11 @@ _dM_Operator = Callable[
 ]
 
 
+def _dM_identity(M, d=None):
+    """Default operator for `StateC.derivative`, returns the matrix as is"""
+    return M
+
+
 # Although the StateC could inherit from both Coefficient and State
 # there are problems with __slots__ and multiple inheritance schemes.
 # I.e. we are forced to do *one* inheritance, which we choose to be State.
@@ -1225,7 +1258,7 @@ coefficients assigned to each state
         order: Literal[1, 2] = 1,
         matrix: bool = False,
         axes: CartesianAxes = "xyz",
-        operator: _dM_Operator = lambda M, d=None: M,
+        operator: _dM_Operator = _dM_identity,
     ):
         r"""Calculate the derivative with respect to :math:`\mathbf k` for a set of states up to a given order
 
@@ -1374,6 +1407,17 @@ coefficients assigned to each state
 
         add_keys(opt, "gauge", "format")
 
+        if order == 1 and not matrix and operator is _dM_identity:
+            # Only the diagonal elements are requested, these can be calculated
+            # directly from the sparse matrix elements (without forming dPk/dSk)
+            dPk_state = getattr(parent, "_dPk_state", None)
+            spin = getattr(parent, "spin", None)
+            if dPk_state is not None and (spin is None or not spin.is_nambu):
+                kwargs = {"k": opt["k"]}
+                add_keys(kwargs, "gauge", "spin")
+                v = dPk_state(self.state, self.c, **kwargs)
+                return v[list(axes_d)].astype(opt["dtype"], copy=False)
+
         # Initialize variables
         ddPk = dSk = ddSk = None
 
@@ -1420,179 +1464,74 @@ coefficients assigned to each state
         cstate = np.conj(state)
         stateT = state.T
 
-        # We split everything up into orthogonal and non-orthogonal
-        # This reduces if-checks
+        # A non-orthogonal basis substitutes the matrix M by M - e_i S,
+        # with e_i the energy of the left state.
+        def expectation(M, full):
+            if full:
+                return cstate @ (M @ stateT)
+            return einsum("ij,ji->i", cstate, M @ stateT)
+
         if is_orthogonal:
 
-            if matrix or order > 1:
-                # calculate the full matrix
-                v = np.empty([nd, nstate, nstate], dtype=opt["dtype"])
-                for i in range(nd):
-                    v[i] = cstate @ dPk[i] @ state.T
+            def expectation_S(M, S, full):
+                return expectation(M, full)
 
-                if matrix:
-                    ret = (v,)
-                else:
-                    ret = (np.diagonal(v, axis1=1, axis2=2).copy(),)
+        else:
 
-            else:
-                # calculate projections on states
-                v = np.empty([nd, nstate], dtype=opt["dtype"])
-
-                for i in range(nd):
-                    v[i] = einsum("ij,ji->i", cstate, dPk[i] @ state.T)
-
-                ret = (v,)
-
-            if order > 1:
-                # Now calculate the 2nd order corrections
-                # loop energies
-
-                if matrix:
-                    vv = np.empty([ndd, nstate, nstate], dtype=opt["dtype"])
-                    for s, e in enumerate(energy):
-                        de = e - energy
-                        # add factor 2 here
-                        np.divide(2, de, where=(de != 0), out=de)
-
-                        # we will use this multiple times
-                        absv = np.absolute(v[:, s])
-
-                        # calculate 2nd derivative
-                        for i in range(nd):
-                            ## xx, for instance
-                            vv[i, s] = cstate[s] @ ddPk[i] @ stateT - de * absv[i] ** 2
-
-                        for i in range(nd, ndd):
-                            # this will be 3, 4, 5
-                            # or 2
-                            # or []
-                            # yz
-                            i0 = (i + 1) % nd
-                            i1 = (i + 2) % nd
-                            vv[i, s] = (
-                                cstate[s] @ ddPk[i] @ stateT - de * absv[i0] * absv[i1]
-                            )
+            def expectation_S(M, S, full):
+                if full:
+                    return expectation(M, True) - energy.reshape(-1, 1) * expectation(
+                        S, True
+                    )
+                return expectation(M, False) - energy * expectation(S, False)
+
+        # the full matrix is required for the 2nd order corrections
+        full = matrix or order > 1
+        if full:
+            v = np.empty([nd, nstate, nstate], dtype=opt["dtype"])
+        else:
+            v = np.empty([nd, nstate], dtype=opt["dtype"])
+        for i in range(nd):
+            v[i] = expectation_S(dPk[i], None if is_orthogonal else dSk[i], full)
 
-                else:
-                    vv = np.empty([ndd, nstate], dtype=opt["dtype"])
-                    for s, e in enumerate(energy):
-                        de = e - energy
-                        # add factor 2 here
-                        np.divide(2, de, where=(de != 0), out=de)
-
-                        # we will use this multiple times
-                        absv = np.absolute(v[:, s])
-
-                        # calculate 2nd derivative
-                        for i in range(nd):
-                            ## xx, for instance
-                            vv[i, s] = (
-                                cstate[s] @ ddPk[i] @ state[s] - de @ absv[i] ** 2
-                            )
-
-                        for i in range(nd, ndd):
-                            # this will be 3, 4, 5
-                            # or 2
-                            # or []
-                            # yz
-                            i0 = (i + 1) % nd
-                            i1 = (i + 2) % nd
-                            vv[i, s] = cstate[s] @ ddPk[i] @ state[s] - de @ (
-                                absv[i0] * absv[i1]
-                            )
-
-                ret += (vv,)
+        if matrix or not full:
+            ret = (v,)
         else:
-            # non-orthogonal basis set
+            ret = (np.diagonal(v, axis1=1, axis2=2).copy(),)
 
-            if matrix or order > 1:
-                # calculate the full matrix
-                v = np.empty([nd, nstate, nstate], dtype=opt["dtype"])
-                for i in range(nd):
-                    for s, e in enumerate(energy):
-                        v[i, s] = cstate[s] @ (dPk[i] - e * dSk[i]) @ stateT
+        if order > 1:
+            # Now calculate the 2nd order corrections for all states at once
+            # de[i, j] = 2 / (e_i - e_j), zero for degenerate states
+            de = np.subtract.outer(energy, energy)
+            np.divide(2, de, where=(de != 0), out=de)
 
-                if matrix:
-                    ret = (v,)
-                else:
-                    # diagonal of nd removes axis0 and axis1 and appends a new
-                    # axis to the end, this is not what we want
-                    ret = (np.diagonal(v, axis1=1, axis2=2).copy(),)
+            absv = np.absolute(v)
 
+            if matrix:
+                vv = np.empty([ndd, nstate, nstate], dtype=opt["dtype"])
             else:
-                # calculate diagonal components on states
-                v = np.empty([nd, nstate], dtype=opt["dtype"])
-                for i in range(nd):
-                    for s, e in enumerate(energy):
-                        v[i, s] = cstate[s] @ (dPk[i] - e * dSk[i]) @ state[s]
-
-                ret = (v,)
-
-            if order > 1:
-                # Now calculate the 2nd order corrections
-                # loop energies
-
-                if matrix:
-                    vv = np.empty([ndd, nstate, nstate], dtype=opt["dtype"])
-                    for s, e in enumerate(energy):
-                        de = e - energy
-                        # add factor 2 here
-                        np.divide(2, de, where=(de != 0), out=de)
-
-                        # we will use this multiple times
-                        absv = np.absolute(v[:, s])
-
-                        # calculate 2nd derivative
-                        for i in range(nd):
-                            ## xx, for instance
-                            vv[i, s] = (
-                                cstate[s] @ (ddPk[i] - e * ddSk[i]) @ stateT
-                                - de * absv[i] ** 2
-                            )
-
-                        for i in range(nd, ndd):
-                            # this will be 3, 4, 5
-                            # or 2
-                            # or []
-                            # yz
-                            i0 = (i + 1) % nd
-                            i1 = (i + 2) % nd
-                            vv[i, s] = (
-                                cstate[s] @ (ddPk[i] - e * ddSk[i]) @ stateT
-                                - de * absv[i0] * absv[i1]
-                            )
+                vv = np.empty([ndd, nstate], dtype=opt["dtype"])
 
+            for i in range(ndd):
+                if i < nd:
+                    # xx, for instance
+                    i0 = i1 = i
                 else:
-                    vv = np.empty([ndd, nstate], dtype=opt["dtype"])
-                    for s, e in enumerate(energy):
-                        de = e - energy
-                        # add factor 2 here
-                        np.divide(2, de, where=(de != 0), out=de)
-
-                        # we will use this multiple times
-                        absv = np.absolute(v[:, s])
-
-                        # calculate 2nd derivative
-                        for i in range(nd):
-                            ## xx, for instance
-                            vv[i, s] = (
-                                cstate[s] @ (ddPk[i] - e * ddSk[i]) @ state[s]
-                                - de @ absv[i] ** 2
-                            )
-
-                        for i in range(nd, ndd):
-                            # this will be 3, 4, 5
-                            # or 2
-                            # or []
-                            # yz
-                            i0 = (i + 1) % nd
-                            i1 = (i + 2) % nd
-                            vv[i, s] = cstate[s] @ (ddPk[i] - e * ddSk[i]) @ state[
-                                s
-                            ] - de @ (absv[i0] * absv[i1])
-
-                ret += (vv,)
+                    # this will be 3, 4, 5
+                    # or 2
+                    # or []
+                    # yz
+                    i0 = (i + 1) % nd
+                    i1 = (i + 2) % nd
+                corr = de * absv[i0] * absv[i1]
+                if not matrix:
+                    corr = corr.sum(1)
+                vv[i] = (
+                    expectation_S(ddPk[i], None if is_orthogonal else ddSk[i], matrix)
+                    - corr
+                )
+
+            ret += (vv,)
 
         if len(ret) == 1:
             return ret[0]
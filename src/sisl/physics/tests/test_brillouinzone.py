@@ -536,6 +536,74 @@ class TestMonkhorstPack:
             for v1, v2 in zip(papply[method](), apply[method]()):
                 assert np.allclose(v1, v2)
 
+    def test_bz_parallel_pathos_persistent(self):
+        pytest.importorskip("pathos", reason="pathos not available")
+        import os
+
+        from sisl import BrillouinZonePool, Hamiltonian, geom
+
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+
+        bz = MonkhorstPack(H, [2, 2, 2], trs=False)
+
+        def wrap_pid(v):
+            return os.getpid()
+
+        with bz.apply.pool(2) as par:
+            assert isinstance(par._attrs["pool"], BrillouinZonePool)
+            for method in ("iter", "average", "sum", "array", "list", "oplist"):
+                for v1, v2 in zip(par[method].eigh(), bz.apply[method].eigh()):
+                    assert np.allclose(v1, v2)
+
+            # the same workers are re-used between the calls (which worker
+            # handles a k-point is not deterministic)
+            pids = set()
+            for _ in range(3):
+                pids.update(par.list.eigh(wrap=wrap_pid))
+            assert len(pids) <= 2
+            assert os.getpid() not in pids
+
+    @pytest.mark.parametrize("persistent", [True, False])
+    def test_bz_parallel_pathos_shared(self, persistent):
+        pytest.importorskip("pathos", reason="pathos not available")
+        from sisl import Hamiltonian, geom
+
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+
+        bz = MonkhorstPack(H, [3, 3, 1], trs=False)
+        eig, vec = bz.apply.renew(zip=True).array.eigh(eigvals_only=False)
+        avg = bz.apply.average.eigh()
+
+        if persistent:
+            par = bz.apply.pool(2, shared=True)
+        else:
+            par = bz.apply.renew(pool=2, shared=True)
+
+        with par:
+            assert np.allclose(par.array.eigh(), eig)
+            peig, pvec = par.renew(zip=True).array.eigh(eigvals_only=False)
+            assert np.allclose(peig, eig)
+            assert np.allclose(np.abs(pvec), np.abs(vec))
+            assert np.allclose(par.average.eigh(), avg)
+
+            # non-arrays are reduced in the regular way
+            def wrap(eig):
+                return [eig, eig]
+
+            pavg = par.average.eigh(wrap=wrap)
+            assert np.allclose(pavg[0], avg)
+            assert np.allclose(pavg[1], avg)
+
+            # the workers can use the (shared) sparse matrix
+            def wrap_nnz(eig, parent):
+                return parent.Hk(format="csr").nnz
+
+            assert np.all(par.array.eigh(wrap=wrap_nnz) == H.Hk(format="csr").nnz)
+
     def test_as_single(self):
         from sisl import Hamiltonian, geom
 
@@ -88,7 +88,7 @@ def setup():
 
 @pytest.fixture(
     scope="module",
-    params=["direct", "pre-compute"],
+    params=["direct", "pre-compute", "chunked"],
 )
 def density_method(request):
     return request.param
@@ -261,6 +261,39 @@ class TestDensityMatrix:
         D.density(grid, Spin.Y, method=density_method)
         D.density(grid, Spin.Z, method=density_method)
 
+    @pytest.mark.parametrize("max_memory", [1e-3, 0.05, 1024])
+    def test_rho_chunked(self, setup, max_memory):
+        D = setup.D.copy()
+        D.construct(setup.func)
+        ref = Grid(0.2, geometry=setup.D.geometry)
+        D.density(ref, method="pre-compute")
+        grid = Grid(0.2, geometry=setup.D.geometry)
+        D.density(grid, method="chunked", max_memory=max_memory)
+        assert np.allclose(grid.grid, ref.grid)
+
+        slabs = [
+            slab
+            for slab, _ in D.geometry._orbital_values_chunks(
+                grid.shape, max_memory=max_memory
+            )
+        ]
+        assert slabs[0].start == 0
+        assert slabs[-1].stop == grid.shape[0]
+        if max_memory < 1:
+            assert len(slabs) > 1
+
+    def test_rho_unknown_method(self, setup, monkeypatch):
+        D = setup.D.copy()
+        D.construct(setup.func)
+        grid = Grid(0.2, geometry=setup.D.geometry)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the method should be checked first")
+
+        monkeypatch.setattr(D, "translate2uc", fail)
+        with pytest.raises(ValueError):
+            D.density(grid, method="unknown")
+
     @pytest.mark.filterwarnings("ignore", message="*non-Hermitian on-site")
     def test_orbital_momentum(self):
         bond = 1.42
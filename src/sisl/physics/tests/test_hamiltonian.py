@@ -157,6 +157,29 @@ class TestHamiltonian:
         assert setup.H.nnz == len(setup.H) * 4
         setup.H.empty()
 
+    def test_set_construct_neighbors(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (1.0, 0.1)], method="neighbors")
+        assert H.H[0, 0] == 1.0
+        assert H.H[1, 0] == 0.1
+        assert H.H[0, 1] == 0.1
+        assert H.nnz == len(H) * 4
+
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((1.0, 2.0), (0.1, 0.2))], method="neighbors")
+        assert HS.H[1, 0] == 0.1
+        assert HS.S[0, 0] == 2.0
+        assert HS.S[0, 1] == 0.2
+        assert HS.nnz == len(HS) * 4
+
+    def test_set_construct_neighbors_multiple_orbitals(self):
+        g = Geometry(
+            [[0] * 3], Atom(1, [1.5, 1.5]), lattice=Lattice(1.0, nsc=[3, 3, 1])
+        )
+        H = Hamiltonian(g)
+        with pytest.raises(ValueError):
+            H.construct([(0.1, 1.5), (1.0, 0.1)], method="neighbors")
+
     @pytest.mark.slow
     def test_set5(self, setup):
         # Test of HUGE construct
@@ -265,6 +288,215 @@ class TestHamiltonian:
         assert np.allclose(csr, arr)
         assert np.allclose(csr, coo)
 
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    @pytest.mark.parametrize("gauge", ["cell", "atom"])
+    @pytest.mark.parametrize(
+        "spin", ["unpolarized", "polarized", "non-collinear", "spin-orbit", "nambu"]
+    )
+    @pytest.mark.parametrize("format", ["csr", "array", "coo", "sc:csr"])
+    def test_Hk_batch(self, setup, orthogonal, gauge, spin, format):
+        H = Hamiltonian(setup.g, spin=spin, orthogonal=orthogonal)
+        t0 = np.random.rand(H.shape[-1])
+        t1 = np.random.rand(H.shape[-1])
+        H.construct([(0.1, 1.5), (t0, t1)])
+        k = [[0, 0, 0], [0.15, 0.25, 0.35], [-0.1, 0.2, 0]]
+
+        def toarray(M):
+            if issparse(M):
+                return M.toarray()
+            return M
+
+        for attr, kwargs in [("Hk", {"gauge": gauge}), ("Sk", {})]:
+            Mk = getattr(H, attr)
+            batch = Mk(k, format=format, **kwargs)
+            assert len(batch) == len(k)
+            for ik, ki in enumerate(k):
+                assert np.allclose(
+                    toarray(batch[ik]), toarray(Mk(ki, format=format, **kwargs))
+                )
+
+    def test_Hk_batch_gamma(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (1.0, 0.1)])
+        k = np.zeros([3, 3])
+        Hk = H.Hk(k, format="array")
+        assert Hk.shape == (3, 2, 2)
+        assert Hk.dtype == H.Hk(format="array").dtype
+        assert np.allclose(Hk, H.Hk(format="array"))
+
+        # the sparse matrices have the same sparsity pattern, but
+        # do not share the index arrays
+        k[1:, 0] = 0.25
+        Hk = H.Hk(k)
+        assert Hk[0].dtype == np.complex128
+        assert np.array_equal(Hk[0].indices, Hk[1].indices)
+        assert np.array_equal(Hk[0].indptr, Hk[2].indptr)
+        assert not np.shares_memory(Hk[0].indices, Hk[1].indices)
+        assert not np.shares_memory(Hk[0].indptr, Hk[2].indptr)
+        ref = [M.toarray() for M in Hk]
+        Hk[0].indices[:] = 0
+        for M, r in zip(Hk[1:], ref[1:]):
+            assert np.allclose(M.toarray(), r)
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    @pytest.mark.parametrize("spin", ["unpolarized", "non-collinear"])
+    @pytest.mark.parametrize("format", ["csr", "array", "sc:csr"])
+    def test_Hk_single_k_2d(self, setup, orthogonal, spin, format):
+        # a single k-point in a 2D array is not a batch
+        H = Hamiltonian(setup.g, spin=spin, orthogonal=orthogonal)
+        t0 = np.random.rand(H.shape[-1])
+        t1 = np.random.rand(H.shape[-1])
+        H.construct([(0.1, 1.5), (t0, t1)])
+        k = [0.15, 0.25, 0.35]
+        for attr in ["Hk", "Sk"]:
+            Mk = getattr(H, attr)
+            M = Mk([k], format=format)
+            assert not isinstance(M, list)
+            assert M.ndim == 2
+            if issparse(M):
+                M = M.toarray()
+            ref = Mk(k, format=format)
+            if issparse(ref):
+                ref = ref.toarray()
+            assert np.allclose(M, ref)
+
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.1, 0.2, 0]])
+    @pytest.mark.parametrize("gauge", ["lattice", "atomic"])
+    @pytest.mark.parametrize("format", ["csr", "array"])
+    @pytest.mark.parametrize(
+        "spin", ["unpolarized", "polarized", "non-colinear", "spin-orbit", "nambu"]
+    )
+    def test_HSk(self, setup, k, gauge, format, spin):
+        H = Hamiltonian(setup.g, spin=spin, orthogonal=False)
+        n = H.spin.size(H.dtype)
+        H.construct([(0.1, 1.5), (np.arange(n + 1) + 1, np.arange(n + 1) * 0.1)])
+        opt = {"spin": 1} if spin == "polarized" else {}
+        Hk, Sk = H.HSk(k, gauge=gauge, format=format, **opt)
+        Hk0 = H.Hk(k, gauge=gauge, format=format, **opt)
+        Sk0 = H.Sk(k, gauge=gauge, format=format)
+        if format == "csr":
+            # the matrices do not share the index arrays
+            assert not np.shares_memory(Hk.indices, Sk.indices)
+            assert not np.shares_memory(Hk.indptr, Sk.indptr)
+            Hk, Sk, Hk0, Sk0 = (m.toarray() for m in (Hk, Sk, Hk0, Sk0))
+        assert Hk.dtype == Hk0.dtype
+        assert Sk.dtype == Sk0.dtype
+        assert np.allclose(Hk, Hk0)
+        assert np.allclose(Sk, Sk0)
+
+    def test_HSk_orthogonal(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (1.0, 0.1)])
+        Hk, Sk = H.HSk([0.1, 0.2, 0], format="array")
+        assert np.allclose(Hk, H.Hk([0.1, 0.2, 0], format="array"))
+        assert np.allclose(Sk, np.eye(len(H)))
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_eigenstate_retain_Sk(self, setup, sparse):
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((1.0, 2.0), (0.1, 0.2))])
+        HS = HS.tile(3, 0).tile(3, 1)
+        k = [0.1, 0.2, 0]
+        opt = {"sparse": True, "n": 2, "sigma": 0.0} if sparse else {}
+        es = HS.eigenstate(k, **opt)
+        assert "Sk" in es.info
+        assert np.allclose(es.Sk().toarray(), HS.Sk(k).toarray())
+        assert np.allclose(es.Sk(format="array"), HS.Sk(k, format="array"))
+        assert np.allclose(es.norm2(), 1)
+
+        # the returned overlap matrix is a copy, with the dtype of the states
+        for format in ("csr", "array"):
+            S = es.Sk(format=format)
+            assert S.dtype == es.dtype
+            S *= 2
+        assert np.allclose(es.Sk().toarray(), HS.Sk(k).toarray())
+
+        # changing the gauge discards the overlap matrix
+        es.change_gauge("atomic")
+        assert "Sk" not in es.info
+        assert np.allclose(
+            es.Sk(format="array"), HS.Sk(k, gauge="atomic", format="array")
+        )
+        assert np.allclose(es.norm2(), 1)
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    def test_eigenstate_window(self, setup, orthogonal):
+        H = setup.H if orthogonal else setup.HS
+        H = H.copy()
+        if orthogonal:
+            H.construct([(0.1, 1.5), (0.1, 1.0)])
+        else:
+            H.construct([(0.1, 1.5), ((0.1, 1.0), (1.0, 0.1))])
+        H = H.tile(6, 0).tile(6, 1)
+        k = [0.1, 0.2, 0]
+        eig = H.eigh(k)
+        ref = eig[(-1 <= eig) & (eig <= 0.5)]
+        assert 0 < len(ref) < len(H)
+
+        es = H.eigenstate(k, window=(-1, 0.5))
+        assert len(es) == len(ref)
+        assert np.allclose(es.eig, ref)
+        assert np.allclose(es.norm2(), 1)
+        assert np.allclose(H.eigenvalue(k, window=(-1, 0.5)).eig, ref)
+        assert np.allclose(H.eigsh(k, window=(-1, 0.5)), ref)
+
+        bz = MonkhorstPack(H, [2, 2, 1])
+        eigs = bz.apply.list.eigenvalue(window=(-1, 0.5), wrap=lambda e: e.eig)
+        assert len(eigs) == len(bz)
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.1, 0.2, 0]])
+    def test_DOS_kpm(self, setup, orthogonal, k):
+        H = setup.H if orthogonal else setup.HS
+        H = H.copy()
+        if orthogonal:
+            H.construct([(0.1, 1.5), (0.1, 1.0)])
+        else:
+            H.construct([(0.1, 1.5), ((0.1, 1.0), (1.0, 0.1))])
+        H = H.tile(10, 0).tile(10, 1)
+        E = np.linspace(-4, 4, 401)
+        DOS = H.DOS_kpm(E, k, n_moments=256, n_random=32, seed=1)
+        PDOS = H.PDOS_kpm(E, k, n_moments=256, n_random=32, seed=1)
+        assert PDOS.shape == (H.no, len(E))
+        assert np.allclose(PDOS.sum(0), DOS)
+
+        # compare the integrated DOS
+        eig = H.eigh(k)
+        ref = (eig.reshape(1, -1) <= E.reshape(-1, 1)).sum(1)
+        dE = E[1] - E[0]
+        IDOS = np.cumsum(DOS) * dE
+        assert abs(IDOS[-1] - len(H)) < 0.01 * len(H)
+        assert np.abs(IDOS - ref).mean() < 0.02 * len(H)
+
+    def test_DOS_kpm_bz(self, setup):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((0.1, 1.0), (1.0, 0.1))])
+        H = H.tile(4, 0).tile(4, 1)
+        E = np.linspace(-5, 5, 401)
+        bz = MonkhorstPack(H, [2, 2, 1])
+        DOS = bz.apply.average.DOS_kpm(E, n_moments=64, bounds=(-5, 5))
+        assert DOS.shape == E.shape
+        assert abs(DOS.sum() * (E[1] - E[0]) - len(H)) < 0.01 * len(H)
+
+    def test_Hk_fold_cache(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (1.0, 0.1)])
+        H.finalize()
+        k = [0.1, 0.2, 0]
+        Hk = H.Hk(k)
+        # the returned matrices do not share the cached pattern
+        Hk.indices[:] = 0
+        assert np.allclose(H.Hk(k).toarray(), H.copy().Hk(k).toarray())
+        assert not np.allclose(H.Hk(k).toarray(), Hk.toarray())
+
+        # changing the sparsity pattern must be reflected
+        H[0, 3] = 0.5
+        Hk = H.Hk(k, format="array")
+        H.finalize()
+        assert np.allclose(H.Hk(k, format="array"), Hk)
+        assert np.allclose(H.Hk(k).toarray(), Hk)
+        assert np.allclose(H.dHk(k)[0].toarray(), H.dHk(k, format="array")[0])
+
     @pytest.mark.parametrize("orthogonal", [True, False])
     @pytest.mark.parametrize("gauge", ["cell", "atom"])
     @pytest.mark.parametrize(
@@ -361,6 +593,30 @@ class TestHamiltonian:
         h = Hamiltonian.fromsp(H.geometry.copy(), H.tocsr(0), H.tocsr(1))
         assert H.spsame(h)
 
+    def test_fromcoo(self, setup):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ([1.0, 1.0], [0.1, 0])])
+        rows, cols = H.nonzero()
+        data = np.array([H._csr[r, c] for r, c in zip(rows, cols)])
+        h = Hamiltonian.fromcoo(H.geometry.copy(), rows, cols, data, orthogonal=False)
+        assert H.spsame(h)
+        assert not h.orthogonal
+        assert np.allclose(H.Hk().toarray(), h.Hk().toarray())
+        assert np.allclose(H.Sk().toarray(), h.Sk().toarray())
+
+        # summing duplicates
+        h = Hamiltonian.fromcoo(
+            H.geometry.copy(),
+            np.tile(rows, 2),
+            np.tile(cols, 2),
+            np.tile(data[:, 0], 2),
+        )
+        assert h.orthogonal
+        assert np.allclose(H.Hk().toarray() * 2, h.Hk().toarray())
+
+        with pytest.raises(ValueError):
+            Hamiltonian.fromcoo(H.geometry, rows, cols, data[:, :1], orthogonal=False)
+
     def test_op1(self, setup):
         g = Geometry([[i, 0, 0] for i in range(100)], Atom(6, R=1.01), lattice=[100])
         H = Hamiltonian(g, dtype=np.int32)
@@ -847,6 +1103,56 @@ class TestHamiltonian:
         v = es.derivative(1)
         assert np.allclose(v1, v)
 
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    @pytest.mark.parametrize("gauge", ["lattice", "atomic"])
+    def test_derivative_diagonal_sparse(self, setup, orthogonal, gauge):
+        # the diagonal derivatives are calculated directly from the sparse elements
+        R = [0.1, 1.5]
+        if orthogonal:
+            param = [(1.0, 0.5), (0.1, 0.2)]
+        else:
+            param = [(1.0, 0.5, 1.0), (0.1, 0.2, 0.1)]
+        g = setup.g.tile(2, 0).tile(2, 1)
+        H = Hamiltonian(g, spin="polarized", orthogonal=orthogonal)
+        H.construct((R, param))
+
+        k = [0.1, 0.2, 0.3]
+        for spin in [0, 1]:
+            es = H.eigenstate(k, spin=spin, gauge=gauge)
+            v = es.derivative(1)
+            vm = es.derivative(1, matrix=True)
+            assert v.shape == (3, len(es))
+            assert np.allclose(v, np.diagonal(vm, axis1=1, axis2=2))
+            assert np.allclose(es.derivative(1, axes="yz"), v[1:])
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    @pytest.mark.parametrize("gauge", ["lattice", "atomic"])
+    @pytest.mark.parametrize("spin", ["non-colinear", "spin-orbit"])
+    @pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+    def test_derivative_diagonal_sparse_box(
+        self, setup, orthogonal, gauge, spin, dtype
+    ):
+        g = setup.g.tile(2, 0).tile(2, 1)
+        H = Hamiltonian(g, spin=spin, orthogonal=orthogonal, dtype=dtype)
+        n = H.shape[-1]
+        H.construct(
+            [(0.1, 1.5), (np.random.rand(n) + 1.0, np.random.rand(n) * 0.1 + 0.1)]
+        )
+        H = (H + H.transpose(conjugate=True)) / 2
+
+        k = [0.1, 0.2, 0.3]
+        es = H.eigenstate(k, gauge=gauge)
+        v = H._dPk_state(es.state, es.c, k=k, gauge=gauge)
+        assert v.shape == (3, len(es))
+        vm = es.derivative(1, matrix=True)
+        assert np.allclose(v, np.diagonal(vm, axis1=1, axis2=2))
+        assert np.allclose(es.derivative(1), v)
+
+    def test_derivative_diagonal_sparse_nambu(self, setup):
+        H = Hamiltonian(setup.g, spin="nambu")
+        with pytest.raises(ValueError):
+            H._dPk_state(np.zeros([1, H.no * 4]), [0.0])
+
     def test_berry_phase(self, setup):
         R, param = [0.1, 1.5], [1.0, 0.1]
         g = setup.g.tile(2, 0).tile(2, 1).tile(2, 2)
@@ -2235,6 +2541,36 @@ def test_wavefunction_eta():
     ES.sub(0).wavefunction(grid, eta=True)
 
 
+def test_wavefunction_multiple():
+    N = 50
+    o1 = SphericalOrbital(0, (np.linspace(0, 2, N), np.exp(-np.linspace(0, 5, N))))
+    G = Geometry([[1] * 3, [2] * 3], Atom(6, o1), lattice=[4, 4, 4])
+    H = Hamiltonian(G, spin=Spin("nc"))
+    R, param = [0.1, 1.5], [[0.0, 0.0, 0.1, -0.1], [1.0, 1.0, 0.1, -0.1]]
+    H.construct([R, param])
+    ES = H.eigenstate(k=[0.1, 0, 0])
+    lattice = Lattice([2, 2, 2], origin=[-1] * 3)
+
+    grids = [Grid(0.2, dtype=np.complex128, lattice=lattice) for _ in ES]
+    ES.wavefunction(grids, spinor=1)
+    for i, grid in enumerate(grids):
+        ref = Grid(0.2, dtype=np.complex128, lattice=lattice)
+        ES.sub(i).wavefunction(ref, spinor=1)
+        assert np.allclose(grid.grid, ref.grid)
+
+    # Weighted sum of densities
+    weight = np.arange(len(ES))
+    dens = Grid(0.2, lattice=lattice)
+    ES.wavefunction_density(dens, weight=weight, spinor=1, batch_size=3)
+    ref = sum(w * np.absolute(g.grid) ** 2 for w, g in zip(weight, grids))
+    assert np.allclose(dens.grid, ref)
+
+    with pytest.raises(ValueError):
+        ES.wavefunction(grids[1:])
+    with pytest.raises(ValueError):
+        ES.wavefunction_density(dens, weight=weight[1:])
+
+
 def test_hamiltonian_fromsp_overlap():
     G = Geometry([[1] * 3, [2] * 3], Atom(6), lattice=[4, 4, 4])
     H = Hamiltonian(G, spin=Spin("nc"), orthogonal=False)
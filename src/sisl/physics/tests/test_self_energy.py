@@ -3,6 +3,8 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 import pytest
 from scipy.sparse import SparseEfficiencyWarning
@@ -12,6 +14,7 @@ from sisl import (
     Atom,
     Bloch,
     BrillouinZone,
+    CachedSE,
     Geometry,
     Hamiltonian,
     Lattice,
@@ -19,6 +22,7 @@ from sisl import (
     RealSpaceSI,
     RecursiveSI,
     SemiInfinite,
+    TransferMatrixSI,
     WideBandSE,
 )
 
@@ -185,6 +189,106 @@ def test_sancho_green(setup):
     assert np.allclose(SL.green(E, k), SR.green(E, k))
 
 
+@pytest.mark.parametrize("orthogonal", [True, False])
+@pytest.mark.parametrize("bulk", [True, False])
+def test_sancho_energies(setup, orthogonal, bulk):
+    H = setup.H if orthogonal else setup.HS
+    SL = RecursiveSI(H, "-A")
+    SR = RecursiveSI(H, "+A")
+
+    E = np.array([-1.0, 0.1 + 1e-3j, 2.5, 7.2])
+    k = [0, 0.13, 0]
+
+    se = SL.self_energy(E, k, bulk=bulk)
+    assert se.shape == (len(E), len(SL), len(SL))
+    G = SR.green(E, k)
+    LR = SR.self_energy_lr(E.reshape(2, 2), k, bulk=bulk)
+    assert LR[0].shape == (2, 2, len(SL), len(SL))
+    for i, e in enumerate(E):
+        assert np.allclose(se[i], SL.self_energy(e, k, bulk=bulk))
+        assert np.allclose(G[i], SR.green(e, k))
+        for lr, lr_e in zip(LR, SR.self_energy_lr(e, k, bulk=bulk)):
+            assert np.allclose(lr.reshape(-1, len(SL), len(SL))[i], lr_e)
+
+
+@pytest.mark.parametrize("orthogonal", [True, False])
+@pytest.mark.parametrize("semi", ["-A", "+A", "+B"])
+def test_transfer_matrix(setup, orthogonal, semi):
+    H = setup.H if orthogonal else setup.HS
+    R = RecursiveSI(H, semi)
+    T = TransferMatrixSI(H, semi)
+
+    E = np.array([0.1, -2.0 + 1e-3j])
+    k = [0, 0.13, 0] if semi.endswith("A") else [0.2, 0, 0]
+    for bulk in [True, False]:
+        assert np.allclose(
+            R.self_energy(E, k, bulk=bulk), T.self_energy(E, k, bulk=bulk)
+        )
+        assert np.allclose(
+            R.self_energy(0.1, k, bulk=bulk), T.self_energy(0.1, k, bulk=bulk)
+        )
+        for r, t in zip(
+            R.self_energy_lr(E, k, bulk=bulk), T.self_energy_lr(E, k, bulk=bulk)
+        ):
+            assert np.allclose(r, t)
+    assert np.allclose(R.green(E, k), T.green(E, k))
+
+
+def test_real_space_transfer_matrix(setup):
+    RSE = RealSpaceSE(setup.HS, 0, 1, (2, 3, 1), dk=50, semi_infinite=TransferMatrixSI)
+    ref = RealSpaceSE(setup.HS, 0, 1, (2, 3, 1), dk=50)
+    assert np.allclose(RSE.green(0.1), ref.green(0.1))
+
+
+def test_cached_se(setup, sisl_tmp):
+    class CountSE(RecursiveSI):
+        calls = 0
+
+        def self_energy(self, E, *args, **kwargs):
+            CountSE.calls += np.size(E)
+            return super().self_energy(E, *args, **kwargs)
+
+    path = sisl_tmp("cached_se")
+    SE = CountSE(setup.HS, "-A")
+    se = CachedSE(SE, path, maxsize=2)
+    k = [0, 0.13, 0]
+
+    E = np.array([0.1, 0.2, 0.3])
+    ref = SE.self_energy(E, k)
+    CountSE.calls = 0
+
+    assert np.allclose(se.self_energy(0.1, k), ref[0])
+    assert CountSE.calls == 1
+    # from memory, same quantised energy
+    assert np.allclose(se.self_energy(0.1 + 1e-12, k), ref[0])
+    assert CountSE.calls == 1
+    # other arguments are part of the key
+    se.self_energy(0.1, k, bulk=True)
+    assert CountSE.calls == 2
+    # arrays only calculate the missing energies
+    assert np.allclose(se.self_energy(E, k), ref)
+    assert CountSE.calls == 4
+    assert np.allclose(se.broadening_matrix(0.3, k), SE.se2broadening(ref[2]))
+    assert CountSE.calls == 4
+
+    # everything is read from disk
+    se.clear()
+    assert np.allclose(se.self_energy(E, k), ref)
+    assert CountSE.calls == 4
+    se = CachedSE(SE, path)
+    assert np.allclose(se.self_energy(0.2, k), ref[1])
+    assert CountSE.calls == 4
+
+    # unrelated files are not removed
+    other = Path(path) / "other.npy"
+    np.save(other, ref)
+    se.clear(disk=True)
+    assert other.is_file()
+    assert len(list(other.parent.glob("*.npy"))) == 1
+    se.self_energy(0.2, k)
+    assert CountSE.calls == 5
+
+
 def test_wideband_1(setup):
     SE = WideBandSE(10, 1e-2)
     se = SE.self_energy()
@@ -320,6 +424,22 @@ def test_real_space_HS_SE_unfold_with_k():
         assert not np.allclose(SE1, SE2)
 
 
+@pytest.mark.parametrize("unfold", [1, 2])
+def test_real_space_threads(setup, unfold):
+    RSE = RealSpaceSE(setup.HS, 0, 1, (2, 3 * unfold, 1), dk=50)
+    G = RSE.green(0.1)
+    assert np.allclose(G, RSE.green(0.1, threads=3))
+    with pytest.raises(ValueError):
+        RSE.green(0.1, apply_kwargs={}, threads=3)
+
+    semi = RecursiveSI(setup.HS, "-B")
+    surf = setup.HS.tile(2, 1)
+    surf.set_nsc(b=1)
+    RSI = RealSpaceSI(semi, surf, 0, (unfold, 1, 1), dk=50)
+    G = RSI.green(0.1)
+    assert np.allclose(G, RSI.green(0.1, threads=3))
+
+
 def test_real_space_SE_fail_k_trs():
     sq = Geometry([0] * 3, Atom(1, 1.01), [1])
     sq.set_nsc([3] * 3)
@@ -443,3 +443,28 @@ def test_cstate_norm():
     state = StateC(ar(10, 10), ar(10)).normalize()
     assert len(state) == 10
     assert np.allclose(state.norm(), 1)
+
+
+def test_degenerate_decouple_groups():
+    from sisl.physics import degenerate_decouple
+
+    rng = np.random.default_rng(42)
+    state = rng.random((8, 8)) + 1j * rng.random((8, 8))
+    M = rng.random((8, 8))
+    M = M + M.T
+    degenerate = [[0, 3], [5, 1], [2, 4, 7]]
+
+    dstate = degenerate_decouple(state, M, degenerate)
+    assert np.allclose(dstate[6], state[6])
+    for deg in degenerate:
+        # decoupled states are eigenstates of M in the degenerate sub-space
+        p = dstate[deg].conj() @ M @ dstate[deg].T
+        assert np.allclose(p, np.diag(np.diag(p)))
+        ref = degenerate_decouple(state[deg], M)
+        assert np.allclose(np.diag(p), np.diag(ref.conj() @ M @ ref.T))
+        # and spans the same sub-space
+        assert np.allclose(dstate[deg].T @ dstate[deg].conj(), ref.T @ ref.conj())
+
+    cstate = StateC(state, np.zeros(8))
+    degenerate_decouple(cstate, M, degenerate)
+    assert np.allclose(cstate.state, dstate)
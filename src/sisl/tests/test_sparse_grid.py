@@ -6,6 +6,7 @@ import pytest
 
 import sisl
 from sisl import Grid
+from sisl._environ import sisl_environ
 from sisl._sparse_grid_ops import transpose_raveled_index
 
 
@@ -32,6 +33,13 @@ def psi_values(geometry, grid_shape):
     return geometry._orbital_values(grid_shape)
 
 
+@pytest.fixture(params=[1, 3])
+def num_threads(request):
+    # The threaded reductions should give the same results
+    with sisl_environ(SISL_NUM_THREADS=request.param):
+        yield request.param
+
+
 @pytest.fixture
 def H(geometry):
     H = sisl.Hamiltonian(geometry)
@@ -97,7 +105,7 @@ def test_wavefunction_correct(H, grid_shape, psi_values, k):
     ["k", "ncoeffs"],
     [[(0, 0, 0), 1], [(0, 0, 0), 2], [(0.25, 0, 0), 1], [(0.25, 0, 0), 2]],
 )
-def test_onthefly_reduction(geometry, psi_values, k, ncoeffs):
+def test_onthefly_reduction(geometry, psi_values, k, ncoeffs, num_threads):
     """Checks that the on the fly reduction produces the same
     results as computing the whole grid and then reducing."""
 
@@ -249,7 +257,9 @@ def test_orbital_products_periodic(geometry):
 
 
 @pytest.mark.parametrize("ncoeffs", [1, 2])
-def test_orbital_products_onthefly_reduction(geometry, psi_values, ncoeffs):
+def test_orbital_products_onthefly_reduction(
+    geometry, psi_values, ncoeffs, num_threads
+):
     """Checks that the on the fly reduction produces the same
     results as computing the whole grid and then reducing."""
 